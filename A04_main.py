@@ -1,5 +1,6 @@
 # REQUIREMENT - add import statements
 from user_interface.client_lookup_window import ClientLookupWindow
+from user_interface.queued_logging import start_queue_logging
 
 # GIVEN:
 from PySide6.QtWidgets import QApplication
@@ -8,6 +9,9 @@ from PySide6.QtWidgets import QApplication
 if __name__ == "__main__":
     import sys
 
+    # Write the log file from a background thread so that logging does not block loading
+    start_queue_logging()
+
     app = QApplication(sys.argv)
     mainWindow = ClientLookupWindow()
     mainWindow.show()
@@ -6,12 +6,28 @@ Date: 10/09/2024
 
 from abc import ABC
 from patterns.observer.subject import Subject
+from patterns.observer.event_bus import AccountEvent, LOW_BALANCE, LARGE_TRANSACTION
 from patterns.strategy.service_charge_strategy import ServiceChargeStrategy
 
 class BankAccount(Subject, ABC):
+    __slots__ = ("_account_number", "_client_number", "_balance", "date_created", "service_charge_strategy")
+
     LOW_BALANCE_LEVEL = 50.00
     LARGE_TRANSACTION_THRESHOLD = 10000.00
 
+    # The hooks below are class attributes, so each one applies to every BankAccount in the
+    # process, including accounts created by tests and batch jobs. Whoever sets one clears
+    # it when done, as ClientLookupWindow does when it closes.
+
+    # Optional TransactionJournal that records every balance update
+    transaction_journal = None
+
+    # Optional TransactionLedger that keeps every balance update in memory for queries
+    transaction_ledger = None
+
+    # Optional EventBus that delivers low balance and large transaction events to subscribers
+    event_bus = None
+
     def __init__(self, account_number: int, client_number: int, balance: float, date_created: str, service_charge_strategy: ServiceChargeStrategy):
         super().__init__()
         if not isinstance(account_number, int) or not isinstance(client_number, int):
@@ -36,10 +52,44 @@ class BankAccount(Subject, ABC):
 
     def update_balance(self, amount: float):
         self._balance += amount
+        if self.transaction_journal is not None:
+            self.transaction_journal.append(self._account_number, amount, self._balance)
+        if self.transaction_ledger is not None:
+            self.transaction_ledger.append(self._account_number, amount, self._balance)
         if self._balance < self.LOW_BALANCE_LEVEL:
-            self.notify(f"Low balance warning: ${self.balance:.2f} on account {self._account_number}.")
+            self._raise_event(LOW_BALANCE, amount)
         if abs(amount) > self.LARGE_TRANSACTION_THRESHOLD:
-            self.notify(f"Large transaction: ${amount:.2f} on account {self._account_number}.")
+            self._raise_event(LARGE_TRANSACTION, amount)
+
+    def update_balance_batch(self, amounts: list[float]):
+        """
+        Applies several amounts that have already been validated, recording each one,
+        then raises the events of the batch together: one low balance event if the final
+        balance is low and one large transaction event for each large amount.
+        """
+        for amount in amounts:
+            self._balance += amount
+            if self.transaction_journal is not None:
+                self.transaction_journal.append(self._account_number, amount, self._balance)
+            if self.transaction_ledger is not None:
+                self.transaction_ledger.append(self._account_number, amount, self._balance)
+        if amounts and self._balance < self.LOW_BALANCE_LEVEL:
+            self._raise_event(LOW_BALANCE, amounts[-1])
+        for amount in amounts:
+            if abs(amount) > self.LARGE_TRANSACTION_THRESHOLD:
+                self._raise_event(LARGE_TRANSACTION, amount)
+
+    def _raise_event(self, event_type: str, amount: float):
+        """Sends an event to the event bus and to the account's observers, if anyone listens."""
+        event_bus = self.event_bus
+        subscribed = event_bus is not None and event_bus.has_subscribers(self._client_number, event_type)
+        if not subscribed and not self._observers:
+            return
+        event = AccountEvent(event_type, self._client_number, self._account_number, amount, self._balance)
+        if subscribed:
+            event_bus.publish(event)
+        if self._observers:
+            self.notify(event.message)
 
     def deposit(self, amount: float):
         if amount <= 0:
@@ -0,0 +1,121 @@
+"""
+Description: Defines the CentsAccount mixin and the chequing, savings and investment
+accounts that keep their balance as a whole number of cents instead of a float.
+Author: Sukhtab Singh Warya
+Date: 18/10/2026
+"""
+
+from bank_account.bank_account import BankAccount
+from bank_account.chequing_account import ChequingAccount
+from bank_account.savings_account import SavingsAccount
+from bank_account.investment_account import InvestmentAccount
+from patterns.observer.event_bus import LOW_BALANCE, LARGE_TRANSACTION
+from utility.money import to_cents
+
+
+class CentsAccount:
+    """
+    Keeps a bank account's balance as integer cents, so that any number of deposits and
+    withdrawals leaves the balance exact. Amounts are converted to cents once, when they
+    are passed to deposit, withdraw or update_balance, and balances are converted back
+    to dollars only when they are read through balance or _balance, which is how files,
+    the journal and the user interface see them. Service charges are calculated in
+    cents by the strategies' calculate_service_charges_cents.
+
+    Listed before the account class it applies to:
+
+        class CentsSavingsAccount(CentsAccount, SavingsAccount)
+    """
+
+    __slots__ = ()
+
+    # The balance slot of BankAccount, which holds the cents of these accounts
+    _cents = BankAccount.__dict__["_balance"]
+
+    LOW_BALANCE_CENTS = to_cents(BankAccount.LOW_BALANCE_LEVEL)
+    LARGE_TRANSACTION_CENTS = to_cents(BankAccount.LARGE_TRANSACTION_THRESHOLD)
+
+    @property
+    def cents(self) -> int:
+        """Return the balance in cents."""
+        return self._cents
+
+    @property
+    def balance(self) -> float:
+        return self._cents / 100
+
+    @property
+    def _balance(self) -> float:
+        return self._cents / 100
+
+    @_balance.setter
+    def _balance(self, value: float) -> None:
+        self._cents = to_cents(value)
+
+    def update_balance(self, amount: float):
+        self.update_cents(to_cents(amount))
+
+    def update_cents(self, amount: int):
+        """Adds a signed amount of cents to the balance and raises the events it causes."""
+        self._cents += amount
+        if self.transaction_journal is not None:
+            self.transaction_journal.append(self._account_number, amount / 100, self._cents / 100)
+        if self.transaction_ledger is not None:
+            self.transaction_ledger.append(self._account_number, amount / 100, self._cents / 100)
+        if self._cents < self.LOW_BALANCE_CENTS:
+            self._raise_event(LOW_BALANCE, amount / 100)
+        if abs(amount) > self.LARGE_TRANSACTION_CENTS:
+            self._raise_event(LARGE_TRANSACTION, amount / 100)
+
+    def update_balance_batch(self, amounts: list[float]):
+        self.update_cents_batch([to_cents(amount) for amount in amounts])
+
+    def update_cents_batch(self, amounts: list[int]):
+        """Applies several validated amounts of cents, raising their events as update_balance_batch does."""
+        for amount in amounts:
+            self._cents += amount
+            if self.transaction_journal is not None:
+                self.transaction_journal.append(self._account_number, amount / 100, self._cents / 100)
+            if self.transaction_ledger is not None:
+                self.transaction_ledger.append(self._account_number, amount / 100, self._cents / 100)
+        if amounts and self._cents < self.LOW_BALANCE_CENTS:
+            self._raise_event(LOW_BALANCE, amounts[-1] / 100)
+        for amount in amounts:
+            if abs(amount) > self.LARGE_TRANSACTION_CENTS:
+                self._raise_event(LARGE_TRANSACTION, amount / 100)
+
+    def deposit(self, amount: float):
+        if amount <= 0:
+            raise ValueError(f"Deposit amount: ${amount:.2f} must be positive.")
+        self.update_cents(to_cents(amount))
+
+    def withdraw(self, amount: float):
+        if amount <= 0:
+            raise ValueError(f"Withdrawal amount: ${amount:.2f} must be positive.")
+        cents = to_cents(amount)
+        if cents > self._cents:
+            raise ValueError(f"Withdrawal amount: ${amount:.2f} must not exceed the account balance: ${self.balance:.2f}")
+        self.update_cents(-cents)
+
+    def calculate_service_charges(self):
+        if not self.service_charge_strategy:
+            return 0.0
+        return self.service_charge_strategy.calculate_service_charges_cents(self._cents) / 100
+
+
+class CentsChequingAccount(CentsAccount, ChequingAccount):
+    """A ChequingAccount whose balance is kept in cents."""
+    __slots__ = ()
+
+    def get_service_charges(self):
+        return self.service_charge_strategy.calculate_service_charges_cents(self._cents) / 100
+
+
+class CentsSavingsAccount(CentsAccount, SavingsAccount):
+    """A SavingsAccount whose balance is kept in cents."""
+    __slots__ = ()
+
+
+class CentsInvestmentAccount(CentsAccount, InvestmentAccount):
+    """An InvestmentAccount whose balance is kept in cents."""
+    __slots__ = ()
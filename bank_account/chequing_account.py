@@ -11,6 +11,8 @@ from patterns.strategy.service_charge_strategy import OverdraftStrategy
 class ChequingAccount(BankAccount):
     """Class representing a Chequing Account that extends BankAccount."""
 
+    __slots__ = ("_overdraft_limit", "_overdraft_rate")
+
     BASE_SERVICE_CHARGE = 0.50
 
     def __init__(self, account_number, client_number, balance, date_created, overdraft_limit=-100, overdraft_rate=0.05):
@@ -59,3 +61,11 @@ class ChequingAccount(BankAccount):
         """Calculate the service charges for the Chequing Account using OverdraftStrategy."""
         # Use the overdraft strategy to calculate the service charges
         return self.service_charge_strategy.calculate_service_charges(self.balance)
+
+    @classmethod
+    def get_service_charges_batch(cls, balances, overdraft_limit=-100):
+        """
+        Calculate the service charges of many chequing accounts with the same overdraft limit
+        in one OverdraftStrategy batch call.
+        """
+        return OverdraftStrategy(overdraft_limit, cls.BASE_SERVICE_CHARGE).calculate_service_charges_batch(balances)
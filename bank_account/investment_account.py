@@ -8,7 +8,14 @@ from bank_account.bank_account import BankAccount
 from patterns.strategy.management_fee_strategy import ManagementFeeStrategy
 from datetime import date, timedelta
 
+try:
+    import numpy
+except ImportError:
+    numpy = None
+
 class InvestmentAccount(BankAccount):
+    __slots__ = ("management_fee", "_management_fee_strategy")
+
     BASE_SERVICE_CHARGE = 10.00
 
     def __init__(self, account_number, client_number, balance, date_created, management_fee, service_charge_strategy):
@@ -43,3 +50,18 @@ class InvestmentAccount(BankAccount):
             fee_str = f"${self.management_fee:.2f}"
         return (f"Account Number: {self.account_number} Balance: ${self.balance:.2f}\n"
                 f"Date Created: {self.date_created} Management Fee: {fee_str} Account Type: Investment")
+
+    @classmethod
+    def get_service_charges_batch(cls, dates_created, management_fee: float):
+        """
+        Calculate the service charges of many investment accounts with the same management
+        fee in one array operation. dates_created holds the creation date of each account,
+        as dates or a datetime64 array.
+        """
+        ten_years_ago = date.today() - timedelta(days=10 * 365.25)
+        if numpy is None:
+            return [cls.BASE_SERVICE_CHARGE if created <= ten_years_ago else cls.BASE_SERVICE_CHARGE + management_fee
+                    for created in dates_created]
+        dates = numpy.asarray(dates_created, dtype="datetime64[D]")
+        return numpy.where(dates <= numpy.datetime64(ten_years_ago, "D"),
+                           cls.BASE_SERVICE_CHARGE, cls.BASE_SERVICE_CHARGE + management_fee)
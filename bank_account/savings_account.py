@@ -7,11 +7,18 @@ Date: 06/10/2024
 from bank_account.bank_account import BankAccount
 from datetime import date
 
+try:
+    import numpy
+except ImportError:
+    numpy = None
+
 class SavingsAccount(BankAccount):
     """
     The SavingsAccount class represents a savings account for a banking client, allowing deposits
     and occasional withdrawals, and includes service charge calculations based on balance.
     """
+
+    __slots__ = ("minimum_balance",)
     
     BASE_SERVICE_CHARGE = 10.00  # Define a base service charge
     SERVICE_CHARGE_PREMIUM = 2.00  # Premium multiplier for lower balances
@@ -60,3 +67,22 @@ class SavingsAccount(BankAccount):
             return self.BASE_SERVICE_CHARGE  # Standard charge when above minimum balance
         else:
             return self.BASE_SERVICE_CHARGE * self.SERVICE_CHARGE_PREMIUM  # Higher charge when below minimum balance
+
+    @classmethod
+    def get_service_charges_batch(cls, balances, minimum_balance: float = 50.00):
+        """
+        Calculates the service charges of many savings accounts with the same minimum
+        balance in one array operation.
+
+        Parameters:
+        balances: A sequence or array of account balances.
+        minimum_balance (float): The minimum balance shared by the accounts.
+
+        Returns:
+        The service charges, as a NumPy array, or a list without NumPy.
+        """
+        premium_charge = cls.BASE_SERVICE_CHARGE * cls.SERVICE_CHARGE_PREMIUM
+        if numpy is None:
+            return [cls.BASE_SERVICE_CHARGE if balance >= minimum_balance else premium_charge for balance in balances]
+        balances = numpy.asarray(balances, dtype=float)
+        return numpy.where(balances >= minimum_balance, cls.BASE_SERVICE_CHARGE, premium_charge)
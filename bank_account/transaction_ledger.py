@@ -0,0 +1,168 @@
+"""
+Description: Defines the TransactionLedger class, an in-memory record of every deposit
+and withdrawal applied to each bank account, with range queries by date and by amount.
+Author: Sukhtab Singh Warya
+Date: 18/10/2026
+"""
+
+import time
+from array import array
+from bisect import bisect_left, bisect_right
+from datetime import datetime
+from typing import Iterator, NamedTuple
+
+
+class LedgerEntry(NamedTuple):
+    """A transaction as recorded in a ledger."""
+    timestamp: datetime
+    kind: str
+    amount: float
+    balance: float
+
+
+class AccountLedger:
+    """
+    The append-only transactions of one account, kept in parallel arrays of 8-byte
+    values: the signed amount, the POSIX timestamp and the resulting balance, 24 bytes
+    per transaction. The kind is the sign of the amount, as in the TransactionJournal.
+
+    Timestamps never decrease, so date ranges are found by bisection: an explicit
+    timestamp earlier than the last entry's is rejected, and an entry timed by the clock
+    after the clock was set back gets the previous entry's timestamp. Amount ranges
+    use an index of entry positions sorted by amount, built by the first amount query
+    and rebuilt by the first amount query after new transactions are appended.
+    """
+
+    __slots__ = ("_amounts", "_timestamps", "_balances", "_amount_order", "_sorted_amounts")
+
+    def __init__(self):
+        """Initializes an empty ledger."""
+        self._amounts = array("d")
+        self._timestamps = array("d")
+        self._balances = array("d")
+        self._amount_order: array | None = None
+        self._sorted_amounts: array | None = None
+
+    def __len__(self) -> int:
+        return len(self._amounts)
+
+    def __getitem__(self, position: int) -> LedgerEntry:
+        amount = self._amounts[position]
+        return LedgerEntry(datetime.fromtimestamp(self._timestamps[position]),
+                           "deposit" if amount >= 0 else "withdraw", amount, self._balances[position])
+
+    def __iter__(self) -> Iterator[LedgerEntry]:
+        return (self[position] for position in range(len(self)))
+
+    @property
+    def nbytes(self) -> int:
+        """Return the bytes held by the ledger's arrays, including the amount index."""
+        arrays = [self._amounts, self._timestamps, self._balances, self._amount_order, self._sorted_amounts]
+        return sum(values.buffer_info()[1] * values.itemsize for values in arrays if values is not None)
+
+    def append(self, amount: float, balance: float, timestamp: float = None) -> None:
+        """
+        Records a transaction.
+        Args:
+            amount (float): The signed amount; positive for a deposit, negative for a withdrawal.
+            balance (float): The balance of the account after the transaction.
+            timestamp (float): POSIX timestamp of the transaction, the current time by default.
+        Raises:
+            ValueError: If timestamp is earlier than the last recorded transaction.
+        """
+        last = self._timestamps[-1] if self._timestamps else None
+        if timestamp is None:
+            timestamp = time.time() if last is None else max(time.time(), last)
+        elif last is not None and timestamp < last:
+            raise ValueError("Transaction timestamp is earlier than the last recorded transaction.")
+        self._amounts.append(amount)
+        self._timestamps.append(timestamp)
+        self._balances.append(balance)
+        self._amount_order = None
+
+    def between(self, start: datetime, end: datetime) -> list[LedgerEntry]:
+        """
+        Returns the transactions made from start up to, but not including, end.
+        Args:
+            start (datetime): The first moment included.
+            end (datetime): The first moment excluded.
+        Returns:
+            list[LedgerEntry]: The transactions, oldest first.
+        """
+        first = bisect_left(self._timestamps, start.timestamp())
+        last = bisect_left(self._timestamps, end.timestamp(), first)
+        return [self[position] for position in range(first, last)]
+
+    def amounts_between(self, low: float, high: float) -> list[LedgerEntry]:
+        """
+        Returns the transactions whose signed amount is from low to high inclusive;
+        withdrawals have negative amounts.
+        Args:
+            low (float): The smallest amount included.
+            high (float): The largest amount included.
+        Returns:
+            list[LedgerEntry]: The transactions, oldest first.
+        """
+        if self._amount_order is None:
+            self._index_amounts()
+        first = bisect_left(self._sorted_amounts, low)
+        last = bisect_right(self._sorted_amounts, high, first)
+        return [self[position] for position in sorted(self._amount_order[first:last])]
+
+    def _index_amounts(self) -> None:
+        """Sorts the entry positions by amount."""
+        amounts = self._amounts
+        self._amount_order = array("l", sorted(range(len(amounts)), key=amounts.__getitem__))
+        self._sorted_amounts = array("d", (amounts[position] for position in self._amount_order))
+
+
+class TransactionLedger:
+    """
+    The AccountLedger of every account that has had a transaction. Set as
+    BankAccount.transaction_ledger, it records each balance update:
+
+        BankAccount.transaction_ledger = ledger = TransactionLedger()
+        account.withdraw(300.0)
+        ledger.for_account(account.account_number).between(start_of_month, end_of_month)
+    """
+
+    def __init__(self):
+        """Initializes a ledger without transactions."""
+        self._accounts: dict[int, AccountLedger] = {}
+
+    def __len__(self) -> int:
+        """Return the number of transactions recorded across all accounts."""
+        return sum(len(account) for account in self._accounts.values())
+
+    def __contains__(self, account_number: int) -> bool:
+        return account_number in self._accounts
+
+    @property
+    def nbytes(self) -> int:
+        """Return the bytes held by the arrays of every account's ledger."""
+        return sum(account.nbytes for account in self._accounts.values())
+
+    def append(self, account_number: int, amount: float, balance: float, timestamp: float = None) -> None:
+        """
+        Records a transaction.
+        Args:
+            account_number (int): The account the transaction was applied to.
+            amount (float): The signed amount; positive for a deposit, negative for a withdrawal.
+            balance (float): The balance of the account after the transaction.
+            timestamp (float): POSIX timestamp of the transaction, the current time by default.
+        """
+        account = self._accounts.get(account_number)
+        if account is None:
+            account = self._accounts[account_number] = AccountLedger()
+        account.append(amount, balance, timestamp)
+
+    def for_account(self, account_number: int) -> AccountLedger:
+        """
+        Returns the ledger of an account.
+        Args:
+            account_number (int): The account.
+        Returns:
+            AccountLedger: The account's transactions; empty if it has none.
+        """
+        account = self._accounts.get(account_number)
+        return account if account is not None else AccountLedger()
@@ -0,0 +1,60 @@
+"""
+Description: Measures with tracemalloc the memory held by bank account and client objects.
+Author: Sukhtab Singh Warya
+Date: 18/10/2026
+Usage: From the project root execute the following command:
+    python benchmarks/bench_account_memory.py [accounts]
+"""
+
+import gc
+import os
+import sys
+import tracemalloc
+
+# Allow the benchmark to be run from the project root or the benchmarks directory.
+sys.path.append(os.path.dirname(os.path.dirname(os.path.abspath(__file__))))
+
+from benchmarks.bench_account_store import make_account
+from bank_account import ChequingAccount, SavingsAccount, InvestmentAccount
+from client.client import Client
+
+DEFAULT_ACCOUNTS = 1_000_000
+
+# One client for every five accounts
+ACCOUNTS_PER_CLIENT = 5
+
+
+def bytes_per_object(build, count: int) -> float:
+    """Returns the bytes left allocated by build(), which creates count objects, per object."""
+    gc.collect()
+    tracemalloc.start()
+    before = tracemalloc.get_traced_memory()[0]
+    objects = build()
+    gc.collect()
+    allocated = tracemalloc.get_traced_memory()[0] - before
+    tracemalloc.stop()
+    del objects
+    return allocated / count
+
+
+def main() -> None:
+    count = int(sys.argv[1]) if len(sys.argv) > 1 else DEFAULT_ACCOUNTS
+    Client.set_email_validation_mode("offline")
+
+    print(f"{count:,} accounts, {count // ACCOUNTS_PER_CLIENT:,} clients (bytes include the list holding them)")
+    accounts = bytes_per_object(lambda: [make_account(number) for number in range(count)], count)
+    print(f"{'accounts (mixed):':22}{accounts:7.1f} bytes/account")
+    for account_type in (ChequingAccount, SavingsAccount, InvestmentAccount):
+        kind = (ChequingAccount, SavingsAccount, InvestmentAccount).index(account_type)
+        per_type = bytes_per_object(lambda: [make_account(number) for number in range(kind, count, 3)],
+                                    len(range(kind, count, 3)))
+        print(f"{account_type.__name__ + ':':22}{per_type:7.1f} bytes/account")
+
+    clients = count // ACCOUNTS_PER_CLIENT
+    per_client = bytes_per_object(lambda: [Client(1000 + number, "First", "Last", "client@pixell.com")
+                                           for number in range(clients)], clients)
+    print(f"{'clients:':22}{per_client:7.1f} bytes/client")
+
+
+if __name__ == "__main__":
+    main()
@@ -0,0 +1,80 @@
+"""
+Description: Compares the memory and whole-book scan time of bank account objects with
+the same accounts kept in an AccountStore.
+Author: Sukhtab Singh Warya
+Date: 18/10/2026
+Usage: From the project root execute the following command:
+    python benchmarks/bench_account_store.py [accounts]
+"""
+
+import gc
+import os
+import sys
+import time
+import tracemalloc
+from datetime import date
+
+# Allow the benchmark to be run from the project root or the benchmarks directory.
+sys.path.append(os.path.dirname(os.path.dirname(os.path.abspath(__file__))))
+
+from bank_account import ChequingAccount, SavingsAccount, InvestmentAccount
+from user_interface import account_store
+from user_interface.account_store import AccountStore
+
+DEFAULT_ACCOUNTS = 200_000
+
+
+def make_account(number: int):
+    """Returns an account of each type in turn."""
+    balance = float(number % 30000)
+    created = date(2023, 1 + number % 12, 1 + number % 28)
+    kind = number % 3
+    if kind == 0:
+        return ChequingAccount(20000 + number, 1000 + number % 5000, balance, created, -100.0, 0.035)
+    if kind == 1:
+        return SavingsAccount(20000 + number, 1000 + number % 5000, balance, created, 50.0, None)
+    return InvestmentAccount(20000 + number, 1000 + number % 5000, balance, created, 2.55, None)
+
+
+def measure(build):
+    """Returns what build() returns and the bytes it left allocated."""
+    gc.collect()
+    tracemalloc.start()
+    before = tracemalloc.get_traced_memory()[0]
+    result = build()
+    gc.collect()
+    allocated = tracemalloc.get_traced_memory()[0] - before
+    tracemalloc.stop()
+    return result, allocated
+
+
+def best_time(scan, repeat: int = 5) -> float:
+    """Returns the best time of several runs of scan()."""
+    best = None
+    for _ in range(repeat):
+        start = time.perf_counter()
+        scan()
+        elapsed = time.perf_counter() - start
+        best = elapsed if best is None else min(best, elapsed)
+    return best
+
+
+def main() -> None:
+    count = int(sys.argv[1]) if len(sys.argv) > 1 else DEFAULT_ACCOUNTS
+
+    accounts, object_bytes = measure(lambda: {number: make_account(number) for number in range(count)})
+    print(f"{count:,} accounts")
+    print(f"objects:            {object_bytes / count:7.1f} bytes/account, "
+          f"scan {best_time(lambda: sum(account._balance for account in accounts.values())) * 1000:8.2f} ms")
+
+    backends = [False] + ([True] if account_store.numpy is not None else [])
+    for use_numpy in backends:
+        store, store_bytes = measure(lambda: AccountStore(accounts.values(), use_numpy=use_numpy))
+        store._rebuild_index()
+        name = "store (numpy):" if use_numpy else "store (array):"
+        print(f"{name:20}{store_bytes / count:7.1f} bytes/account, "
+              f"scan {best_time(store.total_balance) * 1000:8.2f} ms")
+
+
+if __name__ == "__main__":
+    main()
@@ -0,0 +1,62 @@
+"""
+Description: Times a month-end billing run over generated accounts, persisted to a
+generated accounts.csv, with one process and with a process pool.
+Author: Sukhtab Singh Warya
+Date: 18/10/2026
+Usage: From the project root execute the following command:
+    python benchmarks/bench_billing_run.py [accounts] [workers]
+"""
+
+import csv
+import os
+import shutil
+import sys
+import tempfile
+
+# Allow the benchmark to be run from the project root or the benchmarks directory.
+sys.path.append(os.path.dirname(os.path.dirname(os.path.abspath(__file__))))
+
+from benchmarks.bench_account_store import make_account
+from user_interface import manage_data
+from user_interface.account_listing import AccountListing
+from user_interface.billing_run import run_billing
+
+DEFAULT_ACCOUNTS = 200_000
+FIELDS = ["account_number", "client_number", "balance", "date_created", "account_type",
+          "overdraft_limit", "overdraft_rate", "minimum_balance", "management_fee"]
+
+
+def write_accounts(path: str, accounts) -> None:
+    """Writes the accounts to an accounts file."""
+    with open(path, "w", newline="") as file:
+        writer = csv.writer(file)
+        writer.writerow(FIELDS)
+        for account in accounts:
+            writer.writerow([account.account_number, account.client_number, account.balance, account.date_created,
+                             type(account).__name__, getattr(account, "overdraft_limit", "Null"),
+                             getattr(account, "overdraft_rate", "Null"), getattr(account, "minimum_balance", "Null"),
+                             getattr(account, "management_fee", "Null")])
+
+
+def main() -> None:
+    count = int(sys.argv[1]) if len(sys.argv) > 1 else DEFAULT_ACCOUNTS
+    workers = int(sys.argv[2]) if len(sys.argv) > 2 else max(2, os.cpu_count() or 1)
+    directory = tempfile.mkdtemp()
+    accounts_path = os.path.join(directory, "accounts.csv")
+    try:
+        print(f"{count:,} accounts, {os.cpu_count()} CPUs")
+        for run_workers in (1, workers):
+            accounts = AccountListing((account.account_number, account) for account in map(make_account, range(count)))
+            write_accounts(accounts_path, accounts.values())
+            report = run_billing(accounts, "benchmark",
+                                 lambda balances: manage_data.write_balances(balances, accounts_path=accounts_path),
+                                 os.path.join(directory, "billing.checkpoint"), workers=run_workers,
+                                 partitions=4 * run_workers)
+            print(f"{run_workers} worker(s): {report.elapsed:6.2f} s, {report.accounts_per_second:10,.0f} accounts/s, "
+                  f"{report.accounts_charged:,} charged, {report.accounts_rejected:,} rejected")
+    finally:
+        shutil.rmtree(directory)
+
+
+if __name__ == "__main__":
+    main()
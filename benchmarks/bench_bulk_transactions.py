@@ -0,0 +1,92 @@
+"""
+Description: Times applying a file of transactions to the accounts in a generated
+accounts.csv one transaction at a time, each followed by update_data, and as one batch
+through apply_transactions.
+Author: Sukhtab Singh Warya
+Date: 18/10/2026
+Usage: From the project root execute the following command:
+    python benchmarks/bench_bulk_transactions.py [accounts] [transactions] [single_transactions]
+"""
+
+import contextlib
+import io
+import os
+import random
+import shutil
+import sys
+import tempfile
+import time
+
+# Allow the benchmark to be run from the project root or the benchmarks directory.
+sys.path.append(os.path.dirname(os.path.dirname(os.path.abspath(__file__))))
+
+from benchmarks.bench_account_store import make_account
+from benchmarks.bench_billing_run import write_accounts
+from user_interface import manage_data
+from user_interface.account_listing import AccountListing
+from user_interface.bulk_transactions import apply_transactions, read_transactions
+
+DEFAULT_ACCOUNTS = 50_000
+DEFAULT_TRANSACTIONS = 500_000
+# Transactions applied one at a time; each rewrites accounts.csv, so only a sample is timed
+DEFAULT_SINGLE_TRANSACTIONS = 20
+
+
+def write_transactions(path: str, accounts: int, count: int) -> None:
+    """Writes random deposits and withdrawals, some of which overdraw their account."""
+    generator = random.Random(24)
+    with open(path, "w", newline="") as file:
+        file.write("account_number,kind,amount\n")
+        for _ in range(count):
+            kind = "deposit" if generator.random() < 0.5 else "withdraw"
+            file.write(f"{20000 + generator.randrange(accounts)},{kind},{generator.uniform(1.0, 5000.0):.2f}\n")
+
+
+def load(count: int) -> AccountListing:
+    return AccountListing((account.account_number, account) for account in map(make_account, range(count)))
+
+
+def main() -> None:
+    count = int(sys.argv[1]) if len(sys.argv) > 1 else DEFAULT_ACCOUNTS
+    transactions = int(sys.argv[2]) if len(sys.argv) > 2 else DEFAULT_TRANSACTIONS
+    singles = int(sys.argv[3]) if len(sys.argv) > 3 else DEFAULT_SINGLE_TRANSACTIONS
+    directory = tempfile.mkdtemp()
+    accounts_path = os.path.join(directory, "accounts.csv")
+    transactions_path = os.path.join(directory, "transactions.csv")
+    try:
+        print(f"{count:,} accounts, {transactions:,} transactions")
+        write_transactions(transactions_path, count, transactions)
+
+        accounts = load(count)
+        write_accounts(accounts_path, accounts.values())
+        with contextlib.redirect_stdout(io.StringIO()):
+            start = time.perf_counter()
+            rejected = 0
+            for number, (account_number, kind, amount) in enumerate(read_transactions(transactions_path)):
+                if number == singles:
+                    break
+                account = accounts[int(account_number)]
+                try:
+                    getattr(account, kind)(float(amount))
+                except ValueError:
+                    rejected += 1
+                    continue
+                manage_data.update_data(account, accounts_path=accounts_path)
+            elapsed = time.perf_counter() - start
+        print(f"{'one at a time:':16}{singles / elapsed:12,.0f} transactions/s ({singles:,} timed, {rejected:,} rejected)")
+
+        accounts = load(count)
+        write_accounts(accounts_path, accounts.values())
+        with contextlib.redirect_stdout(io.StringIO()), contextlib.redirect_stderr(io.StringIO()):
+            report = apply_transactions(accounts, read_transactions(transactions_path),
+                                        lambda balances: manage_data.write_balances(balances,
+                                                                                    accounts_path=accounts_path))
+        print(f"{'batch:':16}{report.transactions_per_second:12,.0f} transactions/s "
+              f"({report.applied:,} applied to {report.accounts_updated:,} accounts, "
+              f"{len(report.rejections):,} rejected, {report.elapsed:.2f} s)")
+    finally:
+        shutil.rmtree(directory)
+
+
+if __name__ == "__main__":
+    main()
@@ -0,0 +1,81 @@
+"""
+Description: Compares deposits and withdrawals on float and integer-cents accounts:
+the transactions applied per second and how far each balance drifts from the exact
+total of the amounts.
+Author: Sukhtab Singh Warya
+Date: 18/10/2026
+Usage: From the project root execute the following command:
+    python benchmarks/bench_cents_account.py [transactions]
+"""
+
+import os
+import random
+import sys
+import time
+from datetime import date
+from fractions import Fraction
+
+# Allow the benchmark to be run from the project root or the benchmarks directory.
+sys.path.append(os.path.dirname(os.path.dirname(os.path.abspath(__file__))))
+
+from bank_account import SavingsAccount
+from bank_account.cents_account import CentsSavingsAccount
+from utility.money import to_cents
+
+DEFAULT_TRANSACTIONS = 1_000_000
+
+# A balance that keeps every low balance check out of the way
+OPENING_BALANCE = 1_000.0
+
+
+def make_amounts(transactions: int) -> list[float]:
+    """
+    Returns amounts of whole cents under the large transaction threshold, where each
+    withdrawal (every other amount) is smaller than the deposit before it.
+    """
+    generator = random.Random(25)
+    cents = []
+    for position in range(transactions):
+        cents.append(generator.randrange(1, cents[-1]) if position % 2 else generator.randrange(2, 999_999))
+    return [amount / 100 for amount in cents]
+
+
+def run(account_class: type, amounts: list[float]) -> tuple[float, SavingsAccount]:
+    """Deposits every amount and withdraws every other one, returning the time taken and the account."""
+    account = account_class(20002, 1001, OPENING_BALANCE, date.today(), 50.0, None)
+    deposit, withdraw = account.deposit, account.withdraw
+    start = time.perf_counter()
+    for position, amount in enumerate(amounts):
+        if position % 2:
+            withdraw(amount)
+        else:
+            deposit(amount)
+    return time.perf_counter() - start, account
+
+
+def main() -> None:
+    transactions = int(sys.argv[1]) if len(sys.argv) > 1 else DEFAULT_TRANSACTIONS
+    amounts = make_amounts(transactions)
+    exact = Fraction(OPENING_BALANCE) + sum(Fraction(round(amount * 100), 100) * (-1 if position % 2 else 1)
+                                             for position, amount in enumerate(amounts))
+    print(f"{transactions:,} deposits and withdrawals, exact balance ${float(exact):,.2f}")
+
+    for name, account_class in (("float", SavingsAccount), ("cents", CentsSavingsAccount)):
+        elapsed, account = run(account_class, amounts)
+        held = Fraction(account.cents, 100) if account_class is CentsSavingsAccount else Fraction(account._balance)
+        print(f"{name + ':':16}{transactions / elapsed:12,.0f} transactions/s   drift ${float(abs(held - exact)):.2e}")
+
+    # Amounts already in cents skip the conversion deposit and withdraw make
+    signed_cents = [to_cents(-amount if position % 2 else amount) for position, amount in enumerate(amounts)]
+    account = CentsSavingsAccount(20002, 1001, OPENING_BALANCE, date.today(), 50.0, None)
+    update_cents = account.update_cents
+    start = time.perf_counter()
+    for amount in signed_cents:
+        update_cents(amount)
+    elapsed = time.perf_counter() - start
+    drift = abs(Fraction(account.cents, 100) - exact)
+    print(f"{'update_cents:':16}{transactions / elapsed:12,.0f} transactions/s   drift ${float(drift):.2e}")
+
+
+if __name__ == "__main__":
+    main()
@@ -0,0 +1,70 @@
+"""
+Description: Times a burst of 'simulated' emails written one append at a time by
+simulate_send_email and in batches by an EmailOutbox, from one and several threads.
+Author: Sukhtab Singh Warya
+Date: 18/10/2026
+Usage: From the project root execute the following command:
+    python benchmarks/bench_email_outbox.py [messages] [threads]
+"""
+
+import os
+import shutil
+import sys
+import tempfile
+import threading
+import time
+
+# Allow the benchmark to be run from the project root or the benchmarks directory.
+sys.path.append(os.path.dirname(os.path.dirname(os.path.abspath(__file__))))
+
+from utility.email_outbox import EmailOutbox
+from utility.file_utils import simulate_send_email
+
+DEFAULT_MESSAGES = 100_000
+DEFAULT_THREADS = 4
+
+
+def send_burst(send, count: int, threads: int) -> float:
+    """Sends count messages split across threads and returns the seconds taken."""
+    def worker(first: int) -> None:
+        for number in range(first, count, threads):
+            send(f"client{number % 1000}@pixell.com", "ALERT: Unusual Activity: 2026-10-18 09:00:00.000",
+                 f"Notification for {number}: Jane Doe: Low balance warning: $10.00 on account {number}.")
+
+    workers = [threading.Thread(target=worker, args=(first,)) for first in range(threads)]
+    start = time.perf_counter()
+    for thread in workers:
+        thread.start()
+    for thread in workers:
+        thread.join()
+    return time.perf_counter() - start
+
+
+def main() -> None:
+    count = int(sys.argv[1]) if len(sys.argv) > 1 else DEFAULT_MESSAGES
+    threads = int(sys.argv[2]) if len(sys.argv) > 2 else DEFAULT_THREADS
+    directory = tempfile.mkdtemp()
+    cwd = os.getcwd()
+    os.chdir(directory)
+    try:
+        print(f"{count:,} messages")
+        for run_threads in (1, threads):
+            elapsed = send_burst(simulate_send_email, count, run_threads)
+            print(f"simulate_send_email, {run_threads} thread(s): {elapsed:6.2f} s, {count / elapsed:10,.0f} messages/s")
+            os.remove(os.path.join("output", "observer_emails.txt"))
+
+            outbox = EmailOutbox()
+            start = time.perf_counter()
+            send_burst(outbox.send, count, run_threads)
+            outbox.close()
+            elapsed = time.perf_counter() - start
+            print(f"EmailOutbox,         {run_threads} thread(s): {elapsed:6.2f} s, {count / elapsed:10,.0f} messages/s, "
+                  f"{outbox.writes:,} writes")
+            os.remove(os.path.join("output", "observer_emails.txt"))
+    finally:
+        os.chdir(cwd)
+        shutil.rmtree(directory)
+
+
+if __name__ == "__main__":
+    main()
@@ -0,0 +1,106 @@
+"""
+Description: Measures the memory used to route account alerts to clients by attaching
+each client to its accounts and by subscribing it once to an EventBus, and times
+low balance transactions with no listeners, attached clients and subscribed clients.
+Author: Sukhtab Singh Warya
+Date: 18/10/2026
+Usage: From the project root execute the following command:
+    python benchmarks/bench_event_bus.py [clients] [transactions]
+"""
+
+import contextlib
+import gc
+import io
+import os
+import sys
+import time
+import tracemalloc
+from datetime import date
+
+# Allow the benchmark to be run from the project root or the benchmarks directory.
+sys.path.append(os.path.dirname(os.path.dirname(os.path.abspath(__file__))))
+
+from bank_account import BankAccount, SavingsAccount
+from patterns.observer.event_bus import EventBus
+from patterns.observer.observer import Observer
+
+DEFAULT_CLIENTS = 100_000
+DEFAULT_TRANSACTIONS = 1_000_000
+ACCOUNTS_PER_CLIENT = 5
+
+
+class CountingObserver(Observer):
+    """Counts the alerts it receives, standing in for a client without the email I/O."""
+    __slots__ = ("count", "__weakref__")
+
+    def __init__(self):
+        self.count = 0
+
+    def update(self, message):
+        self.count += 1
+
+
+def make_accounts(clients: int) -> list[BankAccount]:
+    """Returns ACCOUNTS_PER_CLIENT low balance accounts for each client."""
+    return [SavingsAccount(20000 + number, 1000 + number // ACCOUNTS_PER_CLIENT, 10.00, date.today(), 50.00, None)
+            for number in range(clients * ACCOUNTS_PER_CLIENT)]
+
+
+def allocated(route) -> int:
+    """Returns the bytes left allocated by route()."""
+    gc.collect()
+    tracemalloc.start()
+    before = tracemalloc.get_traced_memory()[0]
+    kept = route()
+    gc.collect()
+    size = tracemalloc.get_traced_memory()[0] - before
+    tracemalloc.stop()
+    del kept
+    return size
+
+
+def attach_all(accounts, observers) -> None:
+    for account in accounts:
+        account.attach(observers[account.client_number - 1000])
+
+
+def subscribe_all(bus, observers) -> EventBus:
+    for number, observer in enumerate(observers):
+        bus.subscribe(observer, 1000 + number)
+    return bus
+
+
+def transactions_per_second(accounts, count: int) -> float:
+    """Deposits a cent round-robin over the accounts and returns the rate."""
+    start = time.perf_counter()
+    for number in range(count):
+        accounts[number % len(accounts)].deposit(0.01)
+    return count / (time.perf_counter() - start)
+
+
+def main() -> None:
+    clients = int(sys.argv[1]) if len(sys.argv) > 1 else DEFAULT_CLIENTS
+    transactions = int(sys.argv[2]) if len(sys.argv) > 2 else DEFAULT_TRANSACTIONS
+    observers = [CountingObserver() for _ in range(clients)]
+    print(f"{clients:,} clients with {ACCOUNTS_PER_CLIENT} accounts each, {transactions:,} transactions")
+
+    with contextlib.redirect_stdout(io.StringIO()):
+        accounts = make_accounts(clients)
+        attached = allocated(lambda: attach_all(accounts, observers))
+        bus_size = allocated(lambda: subscribe_all(EventBus(), observers))
+    print(f"{'attached to accounts:':24}{attached / clients:7.1f} bytes/client")
+    print(f"{'subscribed to bus:':24}{bus_size / clients:7.1f} bytes/client")
+
+    with contextlib.redirect_stdout(io.StringIO()):
+        idle = transactions_per_second(make_accounts(clients), transactions)
+        rate_attached = transactions_per_second(accounts, transactions)
+        BankAccount.event_bus = subscribe_all(EventBus(), observers)
+        rate_subscribed = transactions_per_second(make_accounts(clients), transactions)
+        BankAccount.event_bus = None
+    print(f"{'no listeners:':24}{idle:10,.0f} transactions/s")
+    print(f"{'attached to accounts:':24}{rate_attached:10,.0f} transactions/s")
+    print(f"{'subscribed to bus:':24}{rate_subscribed:10,.0f} transactions/s")
+
+
+if __name__ == "__main__":
+    main()
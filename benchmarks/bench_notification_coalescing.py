@@ -0,0 +1,85 @@
+"""
+Description: Times a burst of transactions on low-balance accounts with every alert
+emailed to its client and with alerts coalesced into per-client digests.
+Author: Sukhtab Singh Warya
+Date: 18/10/2026
+Usage: From the project root execute the following command:
+    python benchmarks/bench_notification_coalescing.py [transactions] [clients]
+"""
+
+import contextlib
+import io
+import os
+import shutil
+import sys
+import tempfile
+import time
+from datetime import date
+
+# Allow the benchmark to be run from the project root or the benchmarks directory.
+sys.path.append(os.path.dirname(os.path.dirname(os.path.abspath(__file__))))
+
+from bank_account.savings_account import SavingsAccount
+from client.client import Client
+from patterns.observer.notification_coalescer import NotificationCoalescer
+from utility.email_outbox import shared_outbox
+
+DEFAULT_TRANSACTIONS = 100_000
+DEFAULT_CLIENTS = 100
+ACCOUNTS_PER_CLIENT = 3
+
+
+def run(transactions: int, clients: int, coalesce: bool) -> tuple[float, int, int]:
+    """
+    Applies transactions round-robin over the accounts of clients and returns the
+    seconds taken, the bytes of email written and the number of alerts suppressed.
+    """
+    path = os.path.join("output", "observer_emails.txt")
+    size = os.path.getsize(path) if os.path.exists(path) else 0
+    accounts = []
+    coalescers = []
+    for number in range(clients):
+        client = Client(1000 + number, "First", "Last", "client@pixell.com")
+        observer = client
+        if coalesce:
+            observer = NotificationCoalescer(client, suppression_window=300.0, digest_delay=None)
+            coalescers.append(observer)
+        for account_number in range(ACCOUNTS_PER_CLIENT):
+            account = SavingsAccount(20000 + number * ACCOUNTS_PER_CLIENT + account_number, 1000 + number,
+                                     40.00, date.today(), 50.00, None)
+            account.attach(observer)
+            accounts.append(account)
+
+    start = time.perf_counter()
+    for number in range(transactions):
+        accounts[number % len(accounts)].deposit(0.01)
+    for coalescer in coalescers:
+        coalescer.close()
+    shared_outbox().flush()
+    elapsed = time.perf_counter() - start
+    return elapsed, os.path.getsize(path) - size, sum(coalescer.suppressed for coalescer in coalescers)
+
+
+def main() -> None:
+    transactions = int(sys.argv[1]) if len(sys.argv) > 1 else DEFAULT_TRANSACTIONS
+    clients = int(sys.argv[2]) if len(sys.argv) > 2 else DEFAULT_CLIENTS
+    Client.set_email_validation_mode("offline")
+    directory = tempfile.mkdtemp()
+    cwd = os.getcwd()
+    os.chdir(directory)
+    try:
+        print(f"{transactions:,} transactions over {clients * ACCOUNTS_PER_CLIENT:,} accounts of {clients:,} clients")
+        for coalesce in (False, True):
+            with contextlib.redirect_stdout(io.StringIO()):
+                elapsed, size, suppressed = run(transactions, clients, coalesce)
+            label = "coalesced digests:" if coalesce else "email per alert:"
+            print(f"{label:20}{elapsed:6.2f} s, {transactions / elapsed:10,.0f} transactions/s, "
+                  f"{size / 1024:9,.0f} KiB of email, {suppressed:,} suppressed")
+        shared_outbox().close()
+    finally:
+        os.chdir(cwd)
+        shutil.rmtree(directory)
+
+
+if __name__ == "__main__":
+    main()
@@ -0,0 +1,82 @@
+"""
+Description: Times deposits that notify a client observer, with notifications
+delivered on the depositing thread and through a NotificationDispatcher.
+Author: Sukhtab Singh Warya
+Date: 18/10/2026
+Usage: From the project root execute the following command:
+    python benchmarks/bench_notification_latency.py [deposits]
+"""
+
+import contextlib
+import io
+import os
+import shutil
+import statistics
+import sys
+import tempfile
+import time
+from datetime import date
+
+# Allow the benchmark to be run from the project root or the benchmarks directory.
+sys.path.append(os.path.dirname(os.path.dirname(os.path.abspath(__file__))))
+
+from bank_account.savings_account import SavingsAccount
+from client.client import Client
+from patterns.observer.subject import Subject
+from patterns.observer.notification_dispatcher import NotificationDispatcher
+
+DEFAULT_DEPOSITS = 20_000
+
+
+def deposit_latencies(count: int) -> list[float]:
+    """Returns the seconds taken by each of count deposits that leave a low balance."""
+    account = SavingsAccount(26350095, 4008, 10.00, date.today(), 50.00, None)
+    account.attach(Client(4008, "First", "Last", "client@pixell.com"))
+    latencies = []
+    for _ in range(count):
+        start = time.perf_counter()
+        account.deposit(0.001)
+        latencies.append(time.perf_counter() - start)
+    return latencies
+
+
+def report(label: str, latencies: list[float], total: float) -> None:
+    """Prints the median and 99th percentile latency and the overall time."""
+    percentiles = statistics.quantiles(latencies, n=100)
+    print(f"{label:26}p50 {percentiles[49] * 1e6:7.1f} us  p99 {percentiles[98] * 1e6:8.1f} us  "
+          f"total {total:6.2f} s")
+
+
+def main() -> None:
+    count = int(sys.argv[1]) if len(sys.argv) > 1 else DEFAULT_DEPOSITS
+    Client.set_email_validation_mode("offline")
+    directory = tempfile.mkdtemp()
+    cwd = os.getcwd()
+    os.chdir(directory)
+    try:
+        print(f"{count:,} deposits, each emailing the client")
+        with contextlib.redirect_stdout(io.StringIO()):
+            start = time.perf_counter()
+            inline = deposit_latencies(count)
+            inline_total = time.perf_counter() - start
+        report("inline delivery:", inline, inline_total)
+
+        Subject.dispatcher = NotificationDispatcher(capacity=count)
+        with contextlib.redirect_stdout(io.StringIO()):
+            start = time.perf_counter()
+            queued = deposit_latencies(count)
+            queued_deposits = time.perf_counter() - start
+            Subject.dispatcher.drain()
+            queued_total = time.perf_counter() - start
+        report("dispatcher (deposits):", queued, queued_deposits)
+        print(f"{'dispatcher (drained):':26}total {queued_total:6.2f} s, "
+              f"{Subject.dispatcher.delivered:,} delivered, {Subject.dispatcher.dropped:,} dropped")
+        Subject.dispatcher.close()
+        Subject.dispatcher = None
+    finally:
+        os.chdir(cwd)
+        shutil.rmtree(directory)
+
+
+if __name__ == "__main__":
+    main()
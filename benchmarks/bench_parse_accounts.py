@@ -0,0 +1,69 @@
+"""
+Description: Times parsing a generated accounts.csv with iter_accounts, the row parser
+used by load_data.
+Author: Sukhtab Singh Warya
+Date: 18/10/2026
+Usage: From the project root execute the following command:
+    python benchmarks/bench_parse_accounts.py [rows]
+"""
+
+import os
+import random
+import shutil
+import sys
+import tempfile
+import time
+
+# Allow the benchmark to be run from the project root or the benchmarks directory.
+sys.path.append(os.path.dirname(os.path.dirname(os.path.abspath(__file__))))
+
+from user_interface import manage_data
+from user_interface.queued_logging import ErrorSummary
+
+HEADER = "account_number,client_number,balance,date_created,account_type,overdraft_limit,overdraft_rate,minimum_balance,management_fee\n"
+DEFAULT_ROWS = 1_000_000
+
+# One row in a thousand is invalid, so the error path is exercised too
+INVALID_ROW = "{number},1001,ten,2023-01-10,SavingsAccount,Null,Null,50,Null\n"
+ROWS = (
+    "{number},{client},{balance:.2f},2023-{month:02}-{day:02},ChequingAccount,-100,0.035,Null,Null\n",
+    "{number},{client},{balance:.2f},2023-{month:02}-{day:02},SavingsAccount,Null,Null,50,Null\n",
+    "{number},{client},{balance:.2f},2023-{month:02}-{day:02},InvestmentAccount,Null,Null,Null,2.55\n",
+)
+
+
+def write_accounts(path: str, rows: int) -> None:
+    """Writes an accounts file with the given number of accounts of every type."""
+    with open(path, "w", newline="") as file:
+        file.write(HEADER)
+        for number in range(rows):
+            template = INVALID_ROW if number % 1000 == 999 else ROWS[number % 3]
+            file.write(template.format(number=20000 + number, client=1000 + number % 5000,
+                                       balance=random.uniform(0, 30000),
+                                       month=1 + number % 12, day=1 + number % 28))
+
+
+def main() -> None:
+    rows = int(sys.argv[1]) if len(sys.argv) > 1 else DEFAULT_ROWS
+    directory = tempfile.mkdtemp()
+    path = os.path.join(directory, "accounts.csv")
+    try:
+        write_accounts(path, rows)
+        client_numbers = frozenset(range(1000, 6000))
+
+        best = None
+        for _ in range(3):
+            start = time.perf_counter()
+            with ErrorSummary("bench_parse_accounts") as summary:
+                count = sum(1 for _ in manage_data.iter_accounts(client_numbers, path))
+            elapsed = time.perf_counter() - start
+            best = elapsed if best is None else min(best, elapsed)
+
+        print(f"{rows:,} rows, {count:,} accounts, {summary.total:,} errors")
+        print(f"best of 3: {best:.2f} s ({rows / best:,.0f} rows/s)")
+    finally:
+        shutil.rmtree(directory)
+
+
+if __name__ == "__main__":
+    main()
@@ -0,0 +1,51 @@
+"""
+Description: Compares charging every account with its own get_service_charges call against
+portfolio_service_charges over account objects and over an AccountStore.
+Author: Sukhtab Singh Warya
+Date: 18/10/2026
+Usage: From the project root execute the following command:
+    python benchmarks/bench_service_charges.py [accounts]
+"""
+
+import os
+import sys
+import time
+
+# Allow the benchmark to be run from the project root or the benchmarks directory.
+sys.path.append(os.path.dirname(os.path.dirname(os.path.abspath(__file__))))
+
+from benchmarks.bench_account_store import make_account
+from user_interface.account_store import AccountStore
+from user_interface.service_charges import portfolio_service_charges
+
+DEFAULT_ACCOUNTS = 200_000
+
+
+def best_time(charge, repeat: int = 3):
+    """Returns the result and best time of several runs of charge()."""
+    best = None
+    for _ in range(repeat):
+        start = time.perf_counter()
+        result = charge()
+        elapsed = time.perf_counter() - start
+        best = elapsed if best is None else min(best, elapsed)
+    return result, best
+
+
+def main() -> None:
+    count = int(sys.argv[1]) if len(sys.argv) > 1 else DEFAULT_ACCOUNTS
+    accounts = [make_account(number) for number in range(count)]
+    store = AccountStore(accounts)
+
+    expected, loop_time = best_time(lambda: {account.account_number: account.get_service_charges()
+                                             for account in accounts})
+    print(f"{count:,} accounts")
+    print(f"get_service_charges loop:          {loop_time * 1000:8.1f} ms")
+    for name, book in (("portfolio over objects:", accounts), ("portfolio over AccountStore:", store)):
+        charges, elapsed = best_time(lambda: portfolio_service_charges(book))
+        assert charges == expected
+        print(f"{name:35}{elapsed * 1000:8.1f} ms ({loop_time / elapsed:.1f}x)")
+
+
+if __name__ == "__main__":
+    main()
@@ -0,0 +1,79 @@
+"""
+Description: Measures the memory a TransactionLedger uses per transaction and times
+recording transactions and querying an account's transactions by date and by amount.
+Author: Sukhtab Singh Warya
+Date: 18/10/2026
+Usage: From the project root execute the following command:
+    python benchmarks/bench_transaction_ledger.py [transactions] [accounts]
+"""
+
+import gc
+import os
+import random
+import sys
+import time
+import tracemalloc
+from datetime import datetime
+
+# Allow the benchmark to be run from the project root or the benchmarks directory.
+sys.path.append(os.path.dirname(os.path.dirname(os.path.abspath(__file__))))
+
+from bank_account.transaction_ledger import TransactionLedger
+
+DEFAULT_TRANSACTIONS = 2_000_000
+DEFAULT_ACCOUNTS = 10_000
+QUERIES = 10_000
+
+# One transaction a minute from 2026-01-01
+START = datetime(2026, 1, 1).timestamp()
+
+
+def record(ledger: TransactionLedger, transactions: int, accounts: int) -> None:
+    """Records transactions round-robin over the accounts."""
+    generator = random.Random(18)
+    for number in range(transactions):
+        ledger.append(20000 + number % accounts, round(generator.uniform(-500.0, 500.0), 2), 1000.0,
+                      START + 60 * number)
+
+
+def main() -> None:
+    transactions = int(sys.argv[1]) if len(sys.argv) > 1 else DEFAULT_TRANSACTIONS
+    accounts = int(sys.argv[2]) if len(sys.argv) > 2 else DEFAULT_ACCOUNTS
+    print(f"{transactions:,} transactions over {accounts:,} accounts")
+
+    gc.collect()
+    tracemalloc.start()
+    ledger = TransactionLedger()
+    start = time.perf_counter()
+    record(ledger, transactions, accounts)
+    elapsed = time.perf_counter() - start
+    allocated = tracemalloc.get_traced_memory()[0]
+    tracemalloc.stop()
+    print(f"{'record:':16}{transactions / elapsed:12,.0f} transactions/s")
+    print(f"{'memory:':16}{allocated / transactions:12.1f} bytes/transaction "
+          f"({ledger.nbytes / transactions:.1f} in arrays)")
+
+    generator = random.Random(25)
+    span = 60 * transactions
+    start = time.perf_counter()
+    found = 0
+    for _ in range(QUERIES):
+        first = START + generator.uniform(0, span)
+        found += len(ledger.for_account(20000 + generator.randrange(accounts)).between(
+            datetime.fromtimestamp(first), datetime.fromtimestamp(first + span / 20)))
+    elapsed = time.perf_counter() - start
+    print(f"{'date range:':16}{elapsed / QUERIES * 1e6:12.1f} us/query, {found / QUERIES:.1f} transactions each")
+
+    for label in ("amount range:", "  (indexed):"):
+        start = time.perf_counter()
+        found = 0
+        for number in range(QUERIES):
+            low = generator.uniform(-500.0, 450.0)
+            found += len(ledger.for_account(20000 + number % accounts).amounts_between(low, low + 50.0))
+        elapsed = time.perf_counter() - start
+        print(f"{label:16}{elapsed / QUERIES * 1e6:12.1f} us/query, {found / QUERIES:.1f} transactions each")
+    print(f"{'memory indexed:':16}{ledger.nbytes / transactions:12.1f} bytes/transaction in arrays")
+
+
+if __name__ == "__main__":
+    main()
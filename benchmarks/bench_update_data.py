@@ -0,0 +1,67 @@
+"""
+Description: Compares the full-file rewrite in update_data with the offset-indexed
+in-place balance write on generated accounts files.
+Author: Sukhtab Singh Warya
+Date: 18/10/2026
+Usage: From the project root execute the following command:
+    python benchmarks/bench_update_data.py
+"""
+
+import os
+import random
+import shutil
+import sys
+import tempfile
+import time
+from datetime import date
+
+# Allow the benchmark to be run from the project root or the benchmarks directory.
+sys.path.append(os.path.dirname(os.path.dirname(os.path.abspath(__file__))))
+
+from bank_account import ChequingAccount
+from user_interface import manage_data
+from user_interface.balance_offset_index import BalanceOffsetIndex, convert_to_fixed_width
+
+HEADER = "account_number,client_number,balance,date_created,account_type,overdraft_limit,overdraft_rate,minimum_balance,management_fee\n"
+ROW_COUNTS = (10_000, 100_000, 1_000_000)
+
+
+def write_accounts(path: str, rows: int) -> None:
+    """Writes an accounts file with the given number of chequing accounts."""
+    with open(path, "w", newline="") as file:
+        file.write(HEADER)
+        for number in range(rows):
+            file.write(f"{20000 + number},{1000 + number % 5000},{random.uniform(0, 30000):.2f},2023-10-10,ChequingAccount,-100,0.035,Null,Null\n")
+
+
+def time_updates(update, rows: int, updates: int) -> float:
+    """Returns the mean time in seconds of the given number of balance updates."""
+    start = time.perf_counter()
+    for _ in range(updates):
+        account = ChequingAccount(20000 + random.randrange(rows), 1000, round(random.uniform(0, 30000), 2), date.today(), -100, 0.035)
+        update(account)
+    return (time.perf_counter() - start) / updates
+
+
+def main() -> None:
+    directory = tempfile.mkdtemp()
+    path = os.path.join(directory, "accounts.csv")
+    try:
+        print(f"{'rows':>10} {'rewrite (ms)':>14} {'in place (ms)':>14} {'speedup':>10}")
+        for rows in ROW_COUNTS:
+            write_accounts(path, rows)
+            rewrite = time_updates(lambda account: manage_data.update_data(account, accounts_path=path),
+                                   rows, updates=max(3, 100_000 // rows))
+
+            convert_to_fixed_width(path)
+            index = BalanceOffsetIndex(path)
+            in_place = time_updates(lambda account: manage_data.update_data(account, index, path),
+                                    rows, updates=1000)
+
+            print(f"{rows:>10,} {rewrite * 1000:>14.3f} {in_place * 1000:>14.3f} {rewrite / in_place:>9.0f}x")
+    finally:
+        shutil.rmtree(directory)
+
+
+if __name__ == "__main__":
+    main()
@@ -5,11 +5,74 @@ Date: 10/09/2024
 """
 
 from patterns.observer.observer import Observer
-from utility.file_utils import simulate_send_email
+from patterns.observer.event_bus import EventBus, EVENT_TYPES
+from utility.email_outbox import shared_outbox
 from datetime import datetime
+from functools import lru_cache
+from typing import Iterable
 from email_validator import validate_email, EmailNotValidError
 
+# Email validation modes:
+#   "full"     - check the syntax and that the domain can receive email (DNS lookup).
+#   "offline"  - check the syntax only.
+#   "deferred" - check the syntax now and queue the address for validate_deferred_emails().
+EMAIL_VALIDATION_MODES = ("full", "offline", "deferred")
+
+
+class UndeliverableEmailError(ValueError):
+    """
+    Raised for an email address whose syntax is valid but whose domain failed the
+    deliverability check. The check depends on DNS, so the same address may pass later.
+    """
+    pass
+
+
+@lru_cache(maxsize=100000)
+def _check_syntax(email_address: str) -> tuple[str | None, str | None]:
+    """
+    Checks the syntax of an email address, caching the outcome by raw address.
+    Returns:
+        tuple containing the normalized address and None, or None and the error message.
+    """
+    try:
+        return validate_email(email_address, check_deliverability=False).normalized, None
+    except EmailNotValidError as e:
+        return None, str(e)
+
+
+@lru_cache(maxsize=100000)
+def _check_deliverability(email_address: str) -> str:
+    """
+    Runs the full check, including the DNS lookup, on an email address. Only addresses
+    that pass are cached: a failure raises EmailNotValidError, which lru_cache does not
+    keep, so an address rejected during a resolver outage is looked up again next time.
+    Returns:
+        str: The normalized address.
+    """
+    return validate_email(email_address, check_deliverability=True).normalized
+
+
+def _normalize_email(email_address: str, check_deliverability: bool) -> tuple[str | None, str | None]:
+    """
+    Validates an email address.
+    Returns:
+        tuple containing the normalized address and None, or None and the error message.
+    """
+    normalized, error = _check_syntax(email_address)
+    if error is not None or not check_deliverability:
+        return normalized, error
+    try:
+        return _check_deliverability(email_address), None
+    except EmailNotValidError as e:
+        return None, str(e)
+
+
 class Client(Observer):
+    __slots__ = ("_client_number", "_first_name", "_last_name", "_email_address", "__weakref__")
+
+    email_validation_mode = "full"
+    _deferred_email_addresses: dict[str, None] = {}
+
     def __init__(self, client_number: int, first_name: str, last_name: str, email_address: str):
         self._client_number = self._validate_client_number(client_number)
         self._first_name = self._validate_name(first_name, "First name")
@@ -29,13 +92,65 @@ class Client(Observer):
             raise ValueError(f"{field_name} cannot be blank.")
         return name
 
-    @staticmethod
-    def _validate_email_address(email_address: str) -> str:
-        try:
-            valid_email = validate_email(email_address)
-            return valid_email.normalized
-        except EmailNotValidError as e:
-            raise ValueError(f"Invalid email address: {str(e)}")
+    @classmethod
+    def from_storage(cls, client_number: int, first_name: str, last_name: str, email_address: str) -> "Client":
+        """
+        Creates a client from values read back from the data snapshot or a repository,
+        which were validated when they were stored. The email address only gets the
+        offline syntax check, whatever the validation mode, so that loading stored
+        clients does not repeat the DNS lookups.
+        Returns:
+            Client: The client.
+        """
+        client = cls.__new__(cls)
+        client._client_number = cls._validate_client_number(client_number)
+        client._first_name = cls._validate_name(first_name, "First name")
+        client._last_name = cls._validate_name(last_name, "Last name")
+        client._email_address = cls._validate_email_address(email_address, "offline")
+        return client
+
+    @classmethod
+    def _validate_email_address(cls, email_address: str, mode: str = None) -> str:
+        mode = mode or cls.email_validation_mode
+        normalized, error = _check_syntax(email_address)
+        if error is not None:
+            raise ValueError(f"Invalid email address: {error}")
+        if mode == "full":
+            try:
+                normalized = _check_deliverability(email_address)
+            except EmailNotValidError as e:
+                raise UndeliverableEmailError(f"Invalid email address: {e}") from None
+        if mode == "deferred":
+            cls._deferred_email_addresses[email_address] = None
+        return normalized
+
+    @classmethod
+    def set_email_validation_mode(cls, mode: str) -> None:
+        """
+        Selects how email addresses of new clients are validated.
+        Args:
+            mode (str): "full", "offline" or "deferred".
+        """
+        if mode not in EMAIL_VALIDATION_MODES:
+            raise ValueError(f"Email validation mode must be one of {', '.join(EMAIL_VALIDATION_MODES)}.")
+        cls.email_validation_mode = mode
+
+    @classmethod
+    def validate_deferred_emails(cls) -> dict[str, str]:
+        """
+        Runs the full validation, including the deliverability check, on the addresses
+        queued in deferred mode. Meant to be run as a batch job, for example in a
+        background thread after a bulk load.
+        Returns:
+            dict[str, str]: The error message of each address that failed, by address.
+        """
+        addresses, Client._deferred_email_addresses = Client._deferred_email_addresses, {}
+        failures = {}
+        for address in addresses:
+            _, error = _normalize_email(address, True)
+            if error is not None:
+                failures[address] = error
+        return failures
 
     @property
     def client_number(self) -> int:
@@ -53,6 +168,24 @@ class Client(Observer):
     def email_address(self) -> str:
         return self._email_address
 
+    def subscribe(self, event_bus: EventBus, event_types: Iterable[str] = EVENT_TYPES) -> None:
+        """
+        Subscribes the client to the events of all of its accounts.
+        Args:
+            event_bus (EventBus): The bus accounts raise their events on.
+            event_types (Iterable[str]): The events received, all of them by default.
+        """
+        event_bus.subscribe(self, self._client_number, event_types)
+
+    def unsubscribe(self, event_bus: EventBus, event_types: Iterable[str] = EVENT_TYPES) -> None:
+        """
+        Stops the client receiving the events of its accounts.
+        Args:
+            event_bus (EventBus): The bus the client subscribed to.
+            event_types (Iterable[str]): The events to stop, all of them by default.
+        """
+        event_bus.unsubscribe(self, self._client_number, event_types)
+
     def update(self, message: str) -> None:
         print(f"Notification received by {self.first_name} {self.last_name}: {message}")
         current_time = datetime.now().strftime('%Y-%m-%d %H:%M:%S.%f')[:-3]
@@ -60,7 +193,7 @@ class Client(Observer):
         email_message = f"Notification for {self.client_number}: {self.first_name} {self.last_name}: {message}"
 
         try:
-            simulate_send_email(self.email_address, subject, email_message)
+            shared_outbox().send(self.email_address, subject, email_message)
         except Exception as e:
             print(f"Failed to send email to {self.email_address}: {str(e)}")
 
@@ -0,0 +1,137 @@
+"""
+Description: Defines the EventBus class, which delivers account events to the observers
+subscribed to a client's events, and the AccountEvent class describing such an event.
+Author: Sukhtab Singh Warya
+Date: 18/10/2026
+"""
+
+import weakref
+from typing import Iterable, NamedTuple
+from patterns.observer.observer import Observer
+from patterns.observer.subject import Subject, deliver
+
+LOW_BALANCE = "low_balance"
+LARGE_TRANSACTION = "large_transaction"
+EVENT_TYPES = (LOW_BALANCE, LARGE_TRANSACTION)
+
+
+class AccountEvent(NamedTuple):
+    """An event raised by a balance update. The message text is only built when it is read."""
+    event_type: str
+    client_number: int
+    account_number: int
+    amount: float
+    balance: float
+
+    @property
+    def message(self) -> str:
+        """Return the notification message observers receive."""
+        if self.event_type == LOW_BALANCE:
+            return f"Low balance warning: ${round(self.balance, 2):.2f} on account {self.account_number}."
+        return f"Large transaction: ${self.amount:.2f} on account {self.account_number}."
+
+
+class EventBus:
+    """
+    Routes account events to observers by client number and event type, so that a
+    client subscribes once for all of its accounts:
+
+        BankAccount.event_bus = bus = EventBus()
+        client.subscribe(bus)
+
+    The bus holds weak references: an observer that is no longer used elsewhere stops
+    receiving events without being unsubscribed, and its subscription is removed by the
+    next event published to it. Subscribing and unsubscribing take constant time, and
+    an event nobody subscribed to is never built.
+    """
+
+    def __init__(self):
+        """Initializes the bus without subscribers."""
+        # For each event type, by client number: the weak reference to the only subscriber,
+        # or the weak references to several subscribers by observer id.
+        self._subscribers: dict[str, dict[int, weakref.ref | dict[int, weakref.ref]]] = {
+            event_type: {} for event_type in EVENT_TYPES}
+
+    def subscribe(self, observer: Observer, client_number: int, event_types: Iterable[str] = EVENT_TYPES) -> None:
+        """
+        Subscribes an observer to events on a client's accounts.
+        Args:
+            observer (Observer): The observer to update.
+            client_number (int): The client whose account events are delivered.
+            event_types (Iterable[str]): The events delivered, all of them by default.
+        """
+        ref = weakref.ref(observer)
+        for event_type in event_types:
+            if event_type not in EVENT_TYPES:
+                raise ValueError(f"Event type must be one of {', '.join(EVENT_TYPES)}.")
+            clients = self._subscribers[event_type]
+            entry = clients.get(client_number)
+            if isinstance(entry, dict):
+                entry[id(observer)] = ref
+            elif entry is None or entry is ref or entry() is None:
+                clients[client_number] = ref
+            else:
+                clients[client_number] = {id(entry()): entry, id(observer): ref}
+
+    def unsubscribe(self, observer: Observer, client_number: int, event_types: Iterable[str] = EVENT_TYPES) -> None:
+        """
+        Stops delivering a client's account events to an observer.
+        Args:
+            observer (Observer): The subscribed observer.
+            client_number (int): The client the observer subscribed to.
+            event_types (Iterable[str]): The events to stop, all of them by default.
+        """
+        for event_type in event_types:
+            clients = self._subscribers.get(event_type, {})
+            entry = clients.get(client_number)
+            if isinstance(entry, dict):
+                ref = entry.get(id(observer))
+                if ref is not None and ref() is observer:
+                    del entry[id(observer)]
+                    if len(entry) == 1:
+                        clients[client_number] = next(iter(entry.values()))
+            elif entry is not None and entry() is observer:
+                del clients[client_number]
+
+    def has_subscribers(self, client_number: int, event_type: str) -> bool:
+        """Return whether any observer receives this type of event for the client."""
+        return client_number in self._subscribers[event_type]
+
+    def publish(self, event: AccountEvent) -> None:
+        """
+        Delivers an event to its subscribers, through Subject.dispatcher when one is set.
+        Subscriptions of observers that have been garbage collected are removed.
+        Args:
+            event (AccountEvent): The event.
+        """
+        clients = self._subscribers[event.event_type]
+        entry = clients.get(event.client_number)
+        if entry is None:
+            return
+        if isinstance(entry, dict):
+            observers = [ref() for ref in entry.values()]
+            if None in observers:
+                self._forget_collected(clients, event.client_number)
+                observers = [observer for observer in observers if observer is not None]
+        else:
+            observers = [entry()]
+            if observers[0] is None:
+                del clients[event.client_number]
+                return
+        if not observers:
+            return
+        if Subject.dispatcher is not None:
+            Subject.dispatcher.submit(observers, event.message)
+        else:
+            deliver(observers, event.message)
+
+    @staticmethod
+    def _forget_collected(clients: dict, client_number: int) -> None:
+        """Removes the garbage collected observers among a client's subscribers."""
+        live = {observer_id: ref for observer_id, ref in clients[client_number].items() if ref() is not None}
+        if len(live) > 1:
+            clients[client_number] = live
+        elif live:
+            clients[client_number] = next(iter(live.values()))
+        else:
+            del clients[client_number]
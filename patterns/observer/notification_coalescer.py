@@ -0,0 +1,188 @@
+"""
+Description: Defines the NotificationCoalescer class, an observer that sits between a
+client's accounts and the client. It suppresses repeated alerts and delivers the rest
+to the client as one digest.
+Author: Sukhtab Singh Warya
+Date: 18/10/2026
+"""
+
+import atexit
+import re
+import threading
+import time
+import weakref
+from typing import Callable
+from patterns.observer.observer import Observer
+
+# Account alerts read "<kind>: <details> on account <account number>."
+ALERT_PATTERN = re.compile(r"(?P<kind>[^:]+): .* on account (?P<account_number>\d+)\.$")
+
+
+def alert_key(message: str) -> tuple[str, str]:
+    """
+    Returns what identifies an alert as a repeat of another: its kind and account.
+    Messages that are not account alerts are only repeats of the identical message.
+    Args:
+        message (str): The notification message.
+    Returns:
+        tuple[str, str]: The kind of alert and the account number.
+    """
+    match = ALERT_PATTERN.match(message)
+    if match is None:
+        return message, ""
+    return match.group("kind"), match.group("account_number")
+
+
+def digest_message(messages: list[str], suppressed: int = 0) -> str:
+    """
+    Combines alerts into the single message a client receives.
+    Args:
+        messages (list[str]): The alerts, oldest first.
+        suppressed (int): The number of repeated alerts left out.
+    Returns:
+        str: The only alert when there is one and none were suppressed, otherwise a digest.
+    """
+    if len(messages) == 1 and not suppressed:
+        return messages[0]
+    header = f"{len(messages)} alert{'s' if len(messages) != 1 else ''}"
+    if suppressed:
+        header += f" ({suppressed} repeated alert{'s' if suppressed != 1 else ''} suppressed)"
+    return header + ":\n" + "\n".join(f"- {message}" for message in messages)
+
+
+class NotificationCoalescer(Observer):
+    """
+    Attach one coalescer to all of a client's accounts in place of the client:
+
+        coalescer = NotificationCoalescer(client, suppression_window=300.0)
+        for account in accounts.for_client(client.client_number):
+            account.attach(coalescer)
+
+    An alert of the same kind on the same account within suppression_window seconds of
+    the last one delivered is suppressed. Delivered alerts are collected for digest_delay
+    seconds and then passed to the client in one update, so a burst of transactions costs
+    the client one email. A digest counts the repeats suppressed while it was collected;
+    repeats that arrive when no digest is waiting are only counted in suppressed.
+
+    Coalescers still open at exit send their waiting alerts. They are tracked through
+    weak references, so a coalescer nobody uses any more can be garbage collected.
+    """
+
+    __slots__ = ("_observer", "_suppression_window", "_digest_delay", "_clock", "_last_alerted",
+                 "_digest", "_digest_suppressed", "_lock", "_timer", "suppressed", "digests",
+                 "__weakref__")
+
+    def __init__(self, observer: Observer, suppression_window: float = 300.0,
+                 digest_delay: float | None = 5.0, clock: Callable[[], float] = time.monotonic):
+        """
+        Initializes the coalescer.
+        Args:
+            observer (Observer): The observer that receives the digests, usually a Client.
+            suppression_window (float): Seconds during which a repeated alert is suppressed.
+            digest_delay (float): Seconds alerts are collected before a digest is sent.
+                When None, digests are only sent by flush() and close().
+            clock (Callable): Returns the current time in seconds.
+        """
+        if suppression_window < 0:
+            raise ValueError("Suppression window cannot be negative.")
+        if digest_delay is not None and digest_delay <= 0:
+            raise ValueError("Digest delay must be positive.")
+
+        self._observer = observer
+        self._suppression_window = suppression_window
+        self._digest_delay = digest_delay
+        self._clock = clock
+        self._last_alerted: dict[tuple[str, str], float] = {}
+        self._digest: list[str] = []
+        self._digest_suppressed = 0
+        self._lock = threading.RLock()
+        self._timer: threading.Timer | None = None
+        self.suppressed = 0
+        self.digests = 0
+
+        _open_coalescers.add(self)
+
+    @property
+    def pending(self) -> int:
+        """Return the number of alerts waiting for the next digest."""
+        return len(self._digest)
+
+    def update(self, message: str) -> None:
+        """
+        Suppresses the message if it repeats a recent alert, otherwise adds it to the digest.
+        Args:
+            message (str): The notification message.
+        """
+        key = alert_key(message)
+        with self._lock:
+            now = self._clock()
+            last = self._last_alerted.get(key)
+            if last is not None and now - last < self._suppression_window:
+                self.suppressed += 1
+                if self._digest:
+                    self._digest_suppressed += 1
+                return
+
+            self._last_alerted[key] = now
+            if not self._digest:
+                self._start_timer()
+            self._digest.append(message)
+
+    def flush(self) -> int:
+        """
+        Sends the waiting alerts to the observer as one digest.
+        Returns:
+            int: The number of alerts in the digest.
+        """
+        with self._lock:
+            self._cancel_timer()
+            if not self._digest:
+                return 0
+            message = digest_message(self._digest, self._digest_suppressed)
+            count = len(self._digest)
+            self._digest = []
+            self._digest_suppressed = 0
+            self.digests += 1
+            self._forget_expired()
+
+        self._observer.update(message)
+        return count
+
+    def close(self) -> None:
+        """Sends the waiting alerts. Called at exit for coalescers that are not closed earlier."""
+        self.flush()
+        _open_coalescers.discard(self)
+
+    def _forget_expired(self) -> None:
+        """Drops alerts whose suppression window has passed."""
+        now = self._clock()
+        expired = [key for key, last in self._last_alerted.items() if now - last >= self._suppression_window]
+        for key in expired:
+            del self._last_alerted[key]
+
+    def _start_timer(self) -> None:
+        """Schedules a digest digest_delay seconds from now."""
+        if self._digest_delay is None:
+            return
+        self._timer = threading.Timer(self._digest_delay, self.flush)
+        self._timer.daemon = True
+        self._timer.start()
+
+    def _cancel_timer(self) -> None:
+        if self._timer is not None:
+            self._timer.cancel()
+            self._timer = None
+
+    def __str__(self) -> str:
+        return f"Digest for {self._observer}"
+
+
+# The coalescers that have not been closed, flushed by a single exit hook
+_open_coalescers: "weakref.WeakSet[NotificationCoalescer]" = weakref.WeakSet()
+
+
+@atexit.register
+def _close_open_coalescers() -> None:
+    """Sends the waiting alerts of every coalescer still open at exit."""
+    for coalescer in list(_open_coalescers):
+        coalescer.close()
@@ -0,0 +1,163 @@
+"""
+Description: Defines the NotificationDispatcher class, which delivers observer
+notifications from a worker thread so that a transaction does not wait for them.
+Author: Sukhtab Singh Warya
+Date: 18/10/2026
+"""
+
+import atexit
+import logging
+import threading
+from collections import deque
+from typing import Iterable
+from patterns.observer.observer import Observer
+from patterns.observer.subject import Subject, deliver
+
+# What submit() does when the queue is full:
+#   "block"       - wait until the worker has made room.
+#   "drop_newest" - discard the new notification.
+#   "drop_oldest" - discard the oldest queued notification to make room.
+#   "caller_runs" - deliver the new notification on the calling thread.
+BACKPRESSURE_POLICIES = ("block", "drop_newest", "drop_oldest", "caller_runs")
+
+
+class NotificationDispatcher:
+    """
+    Queues notifications and delivers them, in order, from a single worker thread. The
+    queue holds at most capacity notifications; what happens beyond that is set by the
+    backpressure policy. An observer that raises is logged and the next one is updated.
+    drain() waits until every queued notification has been delivered, which makes
+    asynchronous delivery deterministic in tests. Once the dispatcher is closed,
+    notifications are delivered on the calling thread: submit() never raises, because
+    it is called after a balance update has already been applied.
+
+        Subject.dispatcher = NotificationDispatcher(capacity=1000, policy="drop_oldest")
+    """
+
+    def __init__(self, capacity: int = 1000, policy: str = "block"):
+        """
+        Initializes the dispatcher. The worker thread starts with the first notification.
+        Args:
+            capacity (int): Number of notifications the queue holds.
+            policy (str): One of BACKPRESSURE_POLICIES.
+        """
+        if capacity < 1:
+            raise ValueError("Queue capacity must be at least 1.")
+        if policy not in BACKPRESSURE_POLICIES:
+            raise ValueError(f"Backpressure policy must be one of {', '.join(BACKPRESSURE_POLICIES)}.")
+
+        self._capacity = capacity
+        self._policy = policy
+        self._queue: deque[tuple[tuple[Observer, ...], str]] = deque()
+        self._condition = threading.Condition()
+        self._in_flight = 0
+        self._thread: threading.Thread | None = None
+        self._closed = False
+        self.delivered = 0
+        self.dropped = 0
+        self.failed = 0
+
+        atexit.register(self.close)
+
+    @property
+    def pending(self) -> int:
+        """Return the number of notifications queued or being delivered."""
+        return len(self._queue) + self._in_flight
+
+    def submit(self, observers: Iterable[Observer], message: str) -> None:
+        """
+        Queues a message for delivery to observers.
+        Args:
+            observers (Iterable[Observer]): The observers to update.
+            message (str): The message they receive.
+        """
+        event = (tuple(observers), message)
+        if threading.current_thread() is self._thread:
+            # An observer notifying from the worker would otherwise wait on itself
+            self._deliver(event)
+            return
+
+        with self._condition:
+            while not self._closed and len(self._queue) >= self._capacity:
+                if self._policy == "block":
+                    self._condition.wait()
+                elif self._policy == "drop_newest":
+                    self.dropped += 1
+                    return
+                elif self._policy == "drop_oldest":
+                    self._queue.popleft()
+                    self.dropped += 1
+                else:
+                    break
+            else:
+                if not self._closed:
+                    self._queue.append(event)
+                    self._start_worker()
+                    self._condition.notify_all()
+                    return
+
+        # Closed, possibly while waiting for room, or caller_runs with a full queue
+        self._deliver(event)
+
+    def drain(self, timeout: float = None) -> bool:
+        """
+        Waits until every queued notification has been delivered.
+        Args:
+            timeout (float): Seconds to wait, or None to wait as long as it takes.
+        Returns:
+            bool: True if the queue is empty, False if the timeout expired first.
+        """
+        with self._condition:
+            return self._condition.wait_for(lambda: not self._queue and not self._in_flight, timeout)
+
+    def close(self) -> None:
+        """
+        Delivers the queued notifications and stops the worker. Later notifications are
+        delivered on the calling thread, and Subject.dispatcher is cleared if it is this
+        dispatcher.
+        """
+        with self._condition:
+            if self._closed:
+                return
+            self._condition.wait_for(lambda: not self._queue and not self._in_flight)
+            self._closed = True
+            self._condition.notify_all()
+        if Subject.dispatcher is self:
+            Subject.dispatcher = None
+        if self._thread is not None:
+            self._thread.join()
+        atexit.unregister(self.close)
+
+    def _start_worker(self) -> None:
+        """Starts the worker thread if it is not running. Called with the condition held."""
+        if self._thread is None:
+            self._thread = threading.Thread(target=self._run, name="NotificationDispatcher", daemon=True)
+            self._thread.start()
+
+    def _run(self) -> None:
+        """Delivers queued notifications until the dispatcher is closed."""
+        while True:
+            with self._condition:
+                self._condition.wait_for(lambda: self._queue or self._closed)
+                if not self._queue:
+                    return
+                event = self._queue.popleft()
+                self._in_flight += 1
+                self._condition.notify_all()
+
+            self._deliver(event)
+
+            with self._condition:
+                self._in_flight -= 1
+                self._condition.notify_all()
+
+    def _deliver(self, event: tuple[tuple[Observer, ...], str]) -> None:
+        """Updates each observer of a notification, logging the ones that fail."""
+        observers, message = event
+        for observer in observers:
+            try:
+                deliver((observer,), message)
+            except Exception as e:
+                logging.error(f"Unable to notify observer {observer}: {e}")
+                self.failed += 1
+        self.delivered += 1
@@ -12,6 +12,8 @@ class Observer(ABC):
     The Observer interface defines the method for receiving updates from the Subject.
     """
 
+    __slots__ = ()
+
     @abstractmethod
     def update(self, message: str) -> None:
         """
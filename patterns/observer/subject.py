@@ -4,20 +4,31 @@ and notifies them of state changes or events in the application.
 Author: Sukhtab
 """
 
-from typing import List
+from typing import Iterable, List, Optional
 from patterns.observer.observer import Observer
 
 class Subject:
     """
     The Subject class maintains a list of observers and notifies them of state changes.
+    Most subjects never get an observer, so the list is only created by the first attach.
+
+    Observers are updated on the notifying thread unless Subject.dispatcher is set to a
+    NotificationDispatcher, which delivers notifications from a worker thread instead.
     """
 
+    __slots__ = ("_observers",)
+
+    # Optional NotificationDispatcher that delivers notifications off the calling thread
+    dispatcher = None
+
     def __init__(self):
-        """Initializes the Subject with an empty list of observers."""
-        self._observers: List[Observer] = []
+        """Initializes the Subject without observers."""
+        self._observers: Optional[List[Observer]] = None
 
     def attach(self, observer: Observer) -> None:
         """Adds a new observer to the subject's list of observers."""
+        if self._observers is None:
+            self._observers = []
         if observer not in self._observers:
             self._observers.append(observer)
             print(f"Attached observer: {observer}")
@@ -27,6 +38,8 @@ class Subject:
     def detach(self, observer: Observer) -> None:
         """Removes an observer from the subject's list of observers."""
         try:
+            if self._observers is None:
+                raise ValueError(observer)
             self._observers.remove(observer)
             print(f"Detached observer: {observer}")
         except ValueError:
@@ -35,6 +48,16 @@ class Subject:
     def notify(self, message: str) -> None:
         """Alerts all registered observers of a state change."""
         print("Notifying observers...")
-        for observer in self._observers:
-            print(f"Notifying observer: {observer}")
-            observer.update(message)
+        if not self._observers:
+            return
+        if self.dispatcher is not None:
+            self.dispatcher.submit(tuple(self._observers), message)
+        else:
+            deliver(self._observers, message)
+
+
+def deliver(observers: Iterable[Observer], message: str) -> None:
+    """Updates each observer with a message."""
+    for observer in observers:
+        print(f"Notifying observer: {observer}")
+        observer.update(message)
@@ -4,13 +4,16 @@ Author: Sukhtab Singh Warya
 Date: 25/10/2024
 """
 
-from patterns.strategy.service_charge_strategy import ServiceChargeStrategy
+from patterns.strategy.service_charge_strategy import ServiceChargeStrategy, management_fee_cents, management_fees_batch
 from datetime import date, timedelta
 
 class ManagementFeeStrategy(ServiceChargeStrategy):
     """
     Concrete strategy for calculating management fees for investment accounts.
     """
+
+    __slots__ = ("_annual_fee", "_account_creation_date")
+
     TEN_YEARS_AGO = date.today() - timedelta(days=10 * 365.25)
 
     def __init__(self, annual_fee: float, account_creation_date: date):
@@ -28,3 +31,18 @@ class ManagementFeeStrategy(ServiceChargeStrategy):
         if self._account_creation_date < ManagementFeeStrategy.TEN_YEARS_AGO:
             return self._annual_fee / 2
         return self._annual_fee
+
+    def calculate_service_charges_cents(self, account_balance: int) -> int:
+        """
+        Calculate the management fee in cents; half a fee is rounded up to the cent.
+        """
+        return management_fee_cents(self._annual_fee, self._account_creation_date < ManagementFeeStrategy.TEN_YEARS_AGO)
+
+    def calculate_service_charges_batch(self, account_balances, account_creation_dates=None):
+        """
+        Calculate management fees for many accounts charged the same annual fee.
+        Accounts older than 10 years are charged half of the fee.
+        account_creation_dates defaults to the creation date this strategy was made with.
+        """
+        return management_fees_batch(self._annual_fee, ManagementFeeStrategy.TEN_YEARS_AGO,
+                                     len(account_balances), self._account_creation_date, account_creation_dates)
@@ -5,12 +5,20 @@ Date: 25/10/2025
 """
 
 from .service_charge_strategy import ServiceChargeStrategy
+from utility.money import to_cents
+
+try:
+    import numpy
+except ImportError:
+    numpy = None
 
 class MinimumBalanceStrategy(ServiceChargeStrategy):
     """
     Concrete strategy for calculating service charges based on maintaining a minimum balance.
     """
 
+    __slots__ = ("_minimum_balance", "_service_charge")
+
     def __init__(self, minimum_balance: float, service_charge: float):
         """
         Initialize the MinimumBalanceStrategy.
@@ -35,3 +43,28 @@ class MinimumBalanceStrategy(ServiceChargeStrategy):
         if account_balance < self._minimum_balance:
             return self._service_charge
         return 0.0
+
+    def calculate_service_charges_cents(self, account_balance: int) -> int:
+        """
+        Calculate the service charges in cents based on an account balance in cents.
+        Args:
+            account_balance (int): The current balance of the savings account in cents.
+        Returns:
+            int: The service charges in cents.
+        """
+        return to_cents(self._service_charge) if account_balance < to_cents(self._minimum_balance) else 0
+
+    def calculate_service_charges_batch(self, account_balances):
+        """
+        Calculate the service charges for an array of balances in one array operation.
+
+        Args:
+            account_balances: A sequence or array of savings account balances.
+
+        Returns:
+            The service charges, as a NumPy array, or a list without NumPy.
+        """
+        if numpy is None:
+            return super().calculate_service_charges_batch(account_balances)
+        balances = numpy.asarray(account_balances, dtype=float)
+        return numpy.where(balances < self._minimum_balance, float(self._service_charge), 0.0)
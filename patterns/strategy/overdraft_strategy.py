@@ -5,12 +5,20 @@ Date: 25/10/2024
 """
 
 from patterns.strategy.service_charge_strategy import ServiceChargeStrategy
+from utility.money import to_cents
+
+try:
+    import numpy
+except ImportError:
+    numpy = None
 
 class OverdraftStrategy(ServiceChargeStrategy):
     """
     Concrete strategy for calculating service charges for accounts with overdraft protection.
     """
 
+    __slots__ = ("_overdraft_limit", "_overdraft_fee")
+
     def __init__(self, overdraft_limit: float, overdraft_fee: float):
         """
         Initialize the OverdraftStrategy with an overdraft limit and an overdraft fee.
@@ -26,3 +34,21 @@ class OverdraftStrategy(ServiceChargeStrategy):
         if account_balance < 0 and account_balance >= -self._overdraft_limit:
             return self._overdraft_fee
         return 0.0
+
+    def calculate_service_charges_cents(self, account_balance: int) -> int:
+        """
+        Calculate service charges in cents based on an account balance in cents.
+        """
+        if account_balance < 0 and account_balance >= -to_cents(self._overdraft_limit):
+            return to_cents(self._overdraft_fee)
+        return 0
+
+    def calculate_service_charges_batch(self, account_balances):
+        """
+        Calculate service charges for an array of balances in one array operation.
+        """
+        if numpy is None:
+            return super().calculate_service_charges_batch(account_balances)
+        balances = numpy.asarray(account_balances, dtype=float)
+        in_overdraft = (balances < 0) & (balances >= -self._overdraft_limit)
+        return numpy.where(in_overdraft, float(self._overdraft_fee), 0.0)
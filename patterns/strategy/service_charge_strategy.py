@@ -7,6 +7,12 @@ Date: 25/10/2024
 
 from abc import ABC, abstractmethod
 from datetime import date, timedelta
+from utility.money import to_cents, from_cents
+
+try:
+    import numpy
+except ImportError:
+    numpy = None
 
 class ServiceChargeStrategy(ABC):
     """
@@ -14,6 +20,8 @@ class ServiceChargeStrategy(ABC):
     Each account type will implement this strategy differently.
     """
 
+    __slots__ = ()
+
     @abstractmethod
     def calculate_service_charges(self, account_balance: float) -> float:
         """
@@ -25,10 +33,33 @@ class ServiceChargeStrategy(ABC):
         """
         pass
 
+    def calculate_service_charges_cents(self, account_balance: int) -> int:
+        """
+        Calculate service charges for a balance kept in cents, as CentsAccount does.
+        Subclasses replace this conversion with integer arithmetic.
+
+        :param account_balance: The current balance of the account in cents.
+        :return: The service charges in cents.
+        """
+        return to_cents(self.calculate_service_charges(from_cents(account_balance)))
+
+    def calculate_service_charges_batch(self, account_balances):
+        """
+        Calculate service charges for many accounts that share this strategy.
+        Subclasses replace this loop with array operations when NumPy is installed.
+
+        :param account_balances: A sequence or array of account balances.
+        :return: A NumPy array of service charges, or a list without NumPy, in the order of the balances.
+        """
+        charges = [self.calculate_service_charges(balance) for balance in account_balances]
+        return numpy.array(charges, dtype=float) if numpy is not None else charges
+
 
 class OverdraftStrategy(ServiceChargeStrategy):
     """Concrete strategy for calculating overdraft service charges."""
 
+    __slots__ = ("overdraft_limit", "base_service_charge")
+
     def __init__(self, overdraft_limit: float, base_service_charge: float):
         self.overdraft_limit = overdraft_limit
         self.base_service_charge = base_service_charge
@@ -45,10 +76,38 @@ class OverdraftStrategy(ServiceChargeStrategy):
             return self.base_service_charge + (overdraft_amount * 0.05)  # Assuming 5% overdraft fee
         return self.base_service_charge
 
+    def calculate_service_charges_cents(self, account_balance: int) -> int:
+        """
+        Calculate service charges in cents; the overdraft fee is rounded to the nearest cent.
+
+        :param account_balance: The current balance of the account in cents.
+        :return: The service charge in cents.
+        """
+        overdraft_limit = to_cents(self.overdraft_limit)
+        if account_balance < overdraft_limit:
+            return to_cents(self.base_service_charge) + ((overdraft_limit - account_balance) * 5 + 50) // 100
+        return to_cents(self.base_service_charge)
+
+    def calculate_service_charges_batch(self, account_balances):
+        """
+        Calculate service charges for an array of balances in one array operation.
+
+        :param account_balances: A sequence or array of account balances.
+        :return: A NumPy array of service charges, or a list without NumPy.
+        """
+        if numpy is None:
+            return super().calculate_service_charges_batch(account_balances)
+        balances = numpy.asarray(account_balances, dtype=float)
+        overdraft_amounts = self.overdraft_limit - balances
+        return numpy.where(balances < self.overdraft_limit,
+                           self.base_service_charge + (overdraft_amounts * 0.05), self.base_service_charge)
+
 
 class MinimumBalanceStrategy(ServiceChargeStrategy):
     """Concrete strategy for calculating service charges for minimum balance accounts."""
 
+    __slots__ = ("min_balance", "service_charge")
+
     def __init__(self, min_balance: float, service_charge: float):
         self.min_balance = min_balance
         self.service_charge = service_charge
@@ -64,11 +123,35 @@ class MinimumBalanceStrategy(ServiceChargeStrategy):
             return self.service_charge
         return 0.0
 
+    def calculate_service_charges_cents(self, account_balance: int) -> int:
+        """
+        Calculate service charges in cents if the balance is below the minimum required balance.
+
+        :param account_balance: The current balance of the account in cents.
+        :return: The service charge in cents.
+        """
+        return to_cents(self.service_charge) if account_balance < to_cents(self.min_balance) else 0
+
+    def calculate_service_charges_batch(self, account_balances):
+        """
+        Calculate service charges for an array of balances in one array operation.
+
+        :param account_balances: A sequence or array of account balances.
+        :return: A NumPy array of service charges, or a list without NumPy.
+        """
+        if numpy is None:
+            return super().calculate_service_charges_batch(account_balances)
+        balances = numpy.asarray(account_balances, dtype=float)
+        return numpy.where(balances < self.min_balance, float(self.service_charge), 0.0)
+
 
 class ManagementFeeStrategy(ServiceChargeStrategy):
     """
     Concrete strategy for calculating management fees for investment accounts.
     """
+
+    __slots__ = ("_annual_fee", "_account_creation_date")
+
     # Constant for the date that is 10 years ago
     TEN_YEARS_AGO = date.today() - timedelta(days=10 * 365.25)
 
@@ -86,4 +169,56 @@ class ManagementFeeStrategy(ServiceChargeStrategy):
         """
         if self._account_creation_date < ManagementFeeStrategy.TEN_YEARS_AGO:
             return self._annual_fee / 2
-        return self._annual_fee
\ No newline at end of file
+        return self._annual_fee
+
+    def calculate_service_charges_cents(self, account_balance: int) -> int:
+        """
+        Calculate the management fee in cents; half a fee is rounded up to the cent.
+        """
+        return management_fee_cents(self._annual_fee, self._account_creation_date < ManagementFeeStrategy.TEN_YEARS_AGO)
+
+    def calculate_service_charges_batch(self, account_balances, account_creation_dates=None):
+        """
+        Calculate management fees for many accounts charged the same annual fee.
+
+        :param account_balances: A sequence or array of account balances; fees do not depend on them.
+        :param account_creation_dates: The creation date of each account, as dates or a
+            datetime64 array. Defaults to the creation date this strategy was made with.
+        :return: A NumPy array of fees, or a list without NumPy.
+        """
+        return management_fees_batch(self._annual_fee, ManagementFeeStrategy.TEN_YEARS_AGO,
+                                     len(account_balances), self._account_creation_date, account_creation_dates)
+
+
+def management_fee_cents(annual_fee: float, half_fee: bool) -> int:
+    """
+    Calculate a management fee in cents. Shared by both ManagementFeeStrategy classes.
+
+    :param annual_fee: The annual management fee in dollars.
+    :param half_fee: Whether half of the fee is charged, rounded up to the cent.
+    :return: The fee in cents.
+    """
+    fee = to_cents(annual_fee)
+    return (fee + 1) // 2 if half_fee else fee
+
+
+def management_fees_batch(annual_fee: float, half_fee_before: date, count: int, default_creation_date: date,
+                          account_creation_dates=None):
+    """
+    Calculate management fees for count accounts: half the annual fee for accounts
+    created before half_fee_before, the full fee otherwise. Shared by both
+    ManagementFeeStrategy classes.
+
+    :param annual_fee: The annual management fee.
+    :param half_fee_before: Accounts created before this date are charged half the fee.
+    :param count: The number of accounts.
+    :param default_creation_date: The creation date used when no dates are given.
+    :param account_creation_dates: The creation date of each account, or None.
+    :return: A NumPy array of fees, or a list without NumPy.
+    """
+    if account_creation_dates is None:
+        account_creation_dates = [default_creation_date] * count
+    if numpy is None:
+        return [annual_fee / 2 if created < half_fee_before else annual_fee for created in account_creation_dates]
+    dates = numpy.asarray(account_creation_dates, dtype="datetime64[D]")
+    return numpy.where(dates < numpy.datetime64(half_fee_before, "D"), annual_fee / 2, float(annual_fee))
\ No newline at end of file
@@ -0,0 +1,48 @@
+"""
+Description: Test doubles and account fixtures shared by the unit tests.
+Author: Sukhtab Singh Warya
+Date: 18/10/2026
+"""
+
+import threading
+from typing import Iterable
+from bank_account.bank_account import BankAccount
+from patterns.observer.observer import Observer
+from user_interface.account_listing import AccountListing
+
+
+class RecordingObserver(Observer):
+    """Records each message and the thread that delivered it, optionally waiting on a gate first."""
+
+    def __init__(self, gate: threading.Event = None):
+        self.messages = []
+        self.threads = []
+        self.gate = gate
+
+    def update(self, message):
+        if self.gate is not None:
+            self.gate.wait(5)
+        self.messages.append(message)
+        self.threads.append(threading.current_thread())
+
+
+def make_accounts(rows: Iterable[tuple]) -> list[BankAccount]:
+    """
+    Builds a fresh account for each row.
+    Args:
+        rows (Iterable[tuple]): The account class followed by its constructor arguments.
+    Returns:
+        list[BankAccount]: The accounts, in the order of the rows.
+    """
+    return [account_class(*arguments) for account_class, *arguments in rows]
+
+
+def make_account_listing(rows: Iterable[tuple]) -> AccountListing:
+    """
+    Builds a fresh account for each row, keyed by account number.
+    Args:
+        rows (Iterable[tuple]): The account class followed by its constructor arguments.
+    Returns:
+        AccountListing: The accounts by account number.
+    """
+    return AccountListing((account.account_number, account) for account in make_accounts(rows))
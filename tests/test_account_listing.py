@@ -0,0 +1,133 @@
+"""
+Description: Unit tests for the AccountListing class.
+Author: Sukhtab Singh Warya
+Date: 18/10/2026
+"""
+
+import copy
+import pickle
+import unittest
+from bank_account import ChequingAccount, SavingsAccount
+from user_interface.account_listing import AccountListing, LazyAccountListing
+from datetime import date
+
+
+class TestAccountListing(unittest.TestCase):
+
+    def setUp(self):
+        """Set up a listing with accounts for two clients."""
+        self.chequing = ChequingAccount(20001, 1001, 15300.00, date.today(), -50, 0.035)
+        self.savings = SavingsAccount(20002, 1001, 301.54, date.today(), 50.00, None)
+        self.other = SavingsAccount(20003, 1002, 1200.87, date.today(), 50.00, None)
+        self.listing = AccountListing((account.account_number, account) for account in (self.chequing, self.savings, self.other))
+
+    def test_for_client(self):
+        """Test for_client returns only the accounts of the client in insertion order."""
+        self.assertEqual(self.listing.for_client(1001), [self.chequing, self.savings])
+        self.assertEqual(self.listing.for_client(1002), [self.other])
+        self.assertEqual(self.listing.for_client(9999), [])
+
+    def test_behaves_as_dict(self):
+        """Test the listing is a dictionary of accounts by account number."""
+        self.assertIsInstance(self.listing, dict)
+        self.assertEqual(list(self.listing), [20001, 20002, 20003])
+        self.assertIs(self.listing[20002], self.savings)
+
+    def test_replacing_account_updates_index(self):
+        """Test assigning an updated copy of an account replaces it in the index."""
+        updated = copy.deepcopy(self.savings)
+        updated.deposit(100.00)
+        self.listing[20002] = updated
+        self.assertEqual(self.listing.for_client(1001), [self.chequing, updated])
+
+    def test_adding_account_updates_index(self):
+        """Test adding an account adds it to its client's accounts."""
+        account = ChequingAccount(20004, 1003, 10.00, date.today(), -50, 0.035)
+        self.listing.setdefault(20004, account)
+        self.assertEqual(self.listing.for_client(1003), [account])
+        self.assertEqual(self.listing.client_numbers(), {1001, 1002, 1003})
+
+    def test_removing_accounts_updates_index(self):
+        """Test del, pop and clear remove accounts from the index."""
+        del self.listing[20001]
+        self.assertEqual(self.listing.for_client(1001), [self.savings])
+        self.assertIs(self.listing.pop(20003), self.other)
+        self.assertEqual(self.listing.for_client(1002), [])
+        self.assertIsNone(self.listing.pop(20003, None))
+        self.listing.clear()
+        self.assertEqual(self.listing.client_numbers(), set())
+
+    def test_copy_and_pickle_keep_index(self):
+        """Test copies and pickled listings keep the client index."""
+        for listing in (self.listing.copy(), copy.deepcopy(self.listing), pickle.loads(pickle.dumps(self.listing))):
+            self.assertIsInstance(listing, AccountListing)
+            self.assertEqual([account.account_number for account in listing.for_client(1001)], [20001, 20002])
+
+
+class TestLazyAccountListing(unittest.TestCase):
+
+    def setUp(self):
+        """Set up a lazy listing with rows for two clients and count the accounts built."""
+        self.built = []
+        self.listing = LazyAccountListing(["account_number", "client_number", "balance"], self.create_account)
+        self.listing.add_row(20001, 1001, ["20001", "1001", "15300.0"])
+        self.listing.add_row(20002, 1001, ["20002", "1001", "301.54"])
+        self.listing.add_row(20003, 1002, ["20003", "1002", "ten"])
+
+    def create_account(self, row):
+        self.built.append(row["account_number"])
+        return SavingsAccount(int(row["account_number"]), int(row["client_number"]), float(row["balance"]), date.today(), 50.00, None)
+
+    def test_accounts_are_built_on_first_access(self):
+        """Test an account is built once, when it is first accessed."""
+        self.assertEqual(len(self.listing), 3)
+        self.assertEqual(self.built, [])
+        account = self.listing[20002]
+        self.assertEqual(account.balance, 301.54)
+        self.assertIs(self.listing[20002], account)
+        self.assertEqual(self.built, ["20002"])
+        self.assertEqual(self.listing.materialized, 1)
+
+    def test_for_client_builds_only_that_client(self):
+        """Test for_client builds only the accounts of the client."""
+        self.assertEqual([account.account_number for account in self.listing.for_client(1001)], [20001, 20002])
+        self.assertEqual(self.built, ["20001", "20002"])
+
+    def test_failed_row_is_dropped(self):
+        """Test a row that cannot be built is logged, dropped and reported as a KeyError."""
+        with self.assertLogs(level="ERROR"):
+            with self.assertRaises(KeyError):
+                self.listing[20003]
+        self.assertNotIn(20003, self.listing)
+        self.assertEqual(self.listing.for_client(1002), [])
+
+    def test_values_skips_failed_rows(self):
+        """Test values builds every account and skips rows that fail."""
+        with self.assertLogs(level="ERROR"):
+            self.assertEqual([account.account_number for account in self.listing.values()], [20001, 20002])
+
+    def test_views_can_be_iterated_again(self):
+        """Test values and items are views that can be iterated more than once and follow the listing."""
+        values, items = self.listing.values(), self.listing.items()
+        with self.assertLogs(level="ERROR"):
+            first = list(values)
+        self.assertEqual(list(values), first)
+        self.assertEqual([account_number for account_number, _ in items], [20001, 20002])
+        self.assertIn((20001, self.listing[20001]), items)
+        self.assertIn(first[1], values)
+        del self.listing[20002]
+        self.assertEqual(len(values), 1)
+        self.assertEqual(list(items), [(20001, first[0])])
+
+    def test_assign_and_delete(self):
+        """Test assigning and deleting accounts keeps the client index in step."""
+        account = ChequingAccount(20004, 1003, 10.00, date.today(), -50, 0.035)
+        self.listing[20004] = account
+        self.assertEqual(self.listing.for_client(1003), [account])
+        del self.listing[20001]
+        self.assertEqual([account.account_number for account in self.listing.for_client(1001)], [20002])
+        with self.assertRaises(KeyError):
+            del self.listing[20001]
+
+if __name__ == '__main__':
+    unittest.main()
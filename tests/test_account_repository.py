@@ -0,0 +1,131 @@
+"""
+Description: Unit tests for the CSV and SQLite account repositories.
+Author: Sukhtab Singh Warya
+Date: 18/10/2026
+"""
+
+import os
+import shutil
+import tempfile
+import threading
+import unittest
+from unittest import mock
+from user_interface.account_repository import CsvAccountRepository, SqliteAccountRepository, import_csv
+from bank_account import ChequingAccount, SavingsAccount, InvestmentAccount
+from client import client as client_module
+from client.client import Client
+
+CLIENTS_CSV = (
+    "client_number,first_name,last_name,email_address\n"
+    "1001,John,Doe,johndoe@pixell.com\n"
+    "1002,Jane,Smith,janesmith@pixell.com\n"
+    "1003,Bad,Email,not-an-email\n"
+)
+
+ACCOUNTS_CSV = (
+    "account_number,client_number,balance,date_created,account_type,overdraft_limit,overdraft_rate,minimum_balance,management_fee\n"
+    "20001,1001,15300.0,2023-01-10,ChequingAccount,-50,0.035,Null,Null\n"
+    "20002,1001,301.54,2023-01-15,SavingsAccount,Null,Null,50,Null\n"
+    "20004,1002,4500.87,2023-02-05,InvestmentAccount,Null,Null,Null,5\n"
+    "20100,9999,4109.99,2023-10-05,SavingsAccount,Null,Null,100,Null\n"
+)
+
+
+class TestAccountRepository(unittest.TestCase):
+
+    def setUp(self):
+        """Write small CSV files and import them into a SQLite database."""
+        Client.set_email_validation_mode("offline")
+        self.directory = tempfile.mkdtemp()
+        self.clients_path = os.path.join(self.directory, "clients.csv")
+        self.accounts_path = os.path.join(self.directory, "accounts.csv")
+        self.database_path = os.path.join(self.directory, "accounts.db")
+        with open(self.clients_path, "w", newline="") as file:
+            file.write(CLIENTS_CSV)
+        with open(self.accounts_path, "w", newline="") as file:
+            file.write(ACCOUNTS_CSV)
+
+        with self.assertLogs(level="ERROR"):
+            self.imported = import_csv(self.database_path, self.clients_path, self.accounts_path, chunk_size=2)
+        self.repository = SqliteAccountRepository(self.database_path)
+
+    def tearDown(self):
+        self.repository.close()
+        Client.set_email_validation_mode("full")
+        shutil.rmtree(self.directory)
+
+    def test_import_csv_counts(self):
+        """Test import_csv returns the number of valid clients and accounts imported."""
+        self.assertEqual(self.imported, (2, 3))
+
+    def test_load_data_matches_csv(self):
+        """Test the SQLite repository loads the same data as the CSV repository."""
+        csv_repository = CsvAccountRepository(self.clients_path, self.accounts_path)
+        with self.assertLogs(level="ERROR"):
+            csv_clients, csv_accounts = csv_repository.load_data()
+        clients, accounts = self.repository.load_data()
+
+        self.assertEqual({number: str(client) for number, client in clients.items()},
+                         {number: str(client) for number, client in csv_clients.items()})
+        self.assertEqual({number: str(account) for number, account in accounts.items()},
+                         {number: str(account) for number, account in csv_accounts.items()})
+        self.assertEqual([account.account_number for account in accounts.for_client(1001)], [20001, 20002])
+
+    def test_load_skips_deliverability_check(self):
+        """Test stored clients are loaded without a DNS lookup in full validation mode."""
+        Client.set_email_validation_mode("full")
+        with mock.patch.object(client_module, "validate_email", wraps=client_module.validate_email) as validate:
+            clients = self.repository.load_clients()
+        self.assertEqual(sorted(clients), [1001, 1002])
+        self.assertFalse(any(call.kwargs["check_deliverability"] for call in validate.call_args_list))
+
+    def test_lookups(self):
+        """Test lookups by client number and account number return the stored objects."""
+        self.assertEqual(self.repository.get_client(1002).last_name, "Smith")
+        self.assertIsNone(self.repository.get_client(1003))
+
+        self.assertIsInstance(self.repository.get_account(20001), ChequingAccount)
+        self.assertEqual(self.repository.get_account(20001).overdraft_limit, -50)
+        self.assertIsNone(self.repository.get_account(20100))
+
+        accounts = self.repository.accounts_for_client(1001)
+        self.assertEqual([type(account) for account in accounts], [ChequingAccount, SavingsAccount])
+        self.assertIsInstance(self.repository.accounts_for_client(1002)[0], InvestmentAccount)
+        self.assertEqual(self.repository.accounts_for_client(1003), [])
+
+    def test_save_accounts(self):
+        """Test save_accounts persists every balance in one batch."""
+        first, second = self.repository.accounts_for_client(1001)
+        first.withdraw(300.00)
+        second.deposit(0.46)
+        self.repository.save_accounts([first, second])
+        self.repository.close()
+
+        self.repository = SqliteAccountRepository(self.database_path)
+        self.assertEqual([account.balance for account in self.repository.accounts_for_client(1001)],
+                         [15000.00, 302.00])
+
+    def test_save_balances_from_another_thread(self):
+        """Test balances can be saved from a thread other than the one that opened the database."""
+        thread = threading.Thread(target=self.repository.save_balances, args=({20004: 10.0},))
+        thread.start()
+        thread.join()
+        self.assertEqual(self.repository.get_account(20004).balance, 10.0)
+
+    def test_csv_repository_save_balances(self):
+        """Test the CSV repository writes balances to the accounts file."""
+        repository = CsvAccountRepository(self.clients_path, self.accounts_path)
+        repository.save_balances({20002: 1.25})
+        self.assertEqual(repository.get_account(20002).balance, 1.25)
+
+    def test_load_data_applies_journal(self):
+        """Test load_data applies the balances recorded in a transaction journal."""
+        journal_path = os.path.join(self.directory, "journal.csv")
+        with open(journal_path, "w", newline="") as file:
+            file.write("20004,deposit,99.13,4600.0,2024-11-18T10:15:00.123\n")
+        _, accounts = self.repository.load_data(journal_path)
+        self.assertEqual(accounts[20004].balance, 4600.00)
+
+
+if __name__ == '__main__':
+    unittest.main()
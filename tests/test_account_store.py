@@ -0,0 +1,110 @@
+"""
+Description: Unit tests for the AccountStore class and its account views.
+Author: Sukhtab Singh Warya
+Date: 18/10/2026
+"""
+
+import math
+import unittest
+from datetime import date
+from bank_account import BankAccount, ChequingAccount, SavingsAccount, InvestmentAccount
+from tests.helpers import RecordingObserver, make_accounts
+from user_interface import account_store
+from user_interface.account_store import AccountStore
+
+ACCOUNTS = [
+    (ChequingAccount, 20001, 1001, 15300.0, date(2023, 1, 10), -50.0, 0.035),
+    (SavingsAccount, 20002, 1001, 301.54, date(2023, 1, 15), 50.0, None),
+    (InvestmentAccount, 20004, 1002, 4500.87, date(2023, 2, 5), 5.0, None),
+]
+
+
+class TestAccountStore(unittest.TestCase):
+
+    def backends(self):
+        """Yield a store of the sample accounts for each column backend available."""
+        for use_numpy in (False, True):
+            if use_numpy and account_store.numpy is None:
+                continue
+            with self.subTest(use_numpy=use_numpy):
+                yield AccountStore(make_accounts(ACCOUNTS), use_numpy=use_numpy)
+
+    def test_views_match_accounts(self):
+        """Test views report the same fields, charges and text as the accounts they were copied from."""
+        for store in self.backends():
+            self.assertEqual(list(store), [20001, 20002, 20004])
+            for account in make_accounts(ACCOUNTS):
+                view = store[account.account_number]
+                self.assertIsInstance(view, type(account))
+                self.assertIsInstance(view, BankAccount)
+                self.assertEqual((view.account_number, view.client_number, view.balance, view.date_created),
+                                 (account.account_number, account.client_number, account.balance, account.date_created))
+                self.assertEqual(view.get_service_charges(), account.get_service_charges())
+                self.assertEqual(view.calculate_service_charges(), account.calculate_service_charges())
+                self.assertEqual(str(view), str(account))
+
+    def test_deposit_and_withdraw_write_columns(self):
+        """Test deposits and withdrawals through a view are seen by other views and column scans."""
+        for store in self.backends():
+            store[20002].deposit(100.00)
+            store[20002].withdraw(1.54)
+            self.assertEqual(store[20002].balance, 400.00)
+            self.assertAlmostEqual(store.total_balance(), 15300.0 + 400.00 + 4500.87)
+            self.assertAlmostEqual(sum(store.column("balance")), store.total_balance())
+            with self.assertRaises(ValueError):
+                store[20002].withdraw(1000.00)
+            self.assertEqual(store[20002].balance, 400.00)
+
+    def test_observers_attached_to_row(self):
+        """Test an observer attached through one view is notified through another."""
+        for store in self.backends():
+            observer = RecordingObserver()
+            store[20002].attach(observer)
+            store[20002].withdraw(300.00)
+            self.assertEqual(observer.messages, ["Low balance warning: $1.54 on account 20002."])
+            self.assertIsNone(store[20004]._observers)
+
+    def test_lookup_after_index_rebuilds(self):
+        """Test every account is found as the store grows past several index rebuilds."""
+        for store in self.backends():
+            for number in range(30000, 35000):
+                store.add(SavingsAccount, number, 1003, 1.0, date(2023, 1, 1), minimum_balance=50.0)
+            self.assertEqual(len(store), 5003)
+            self.assertTrue(all(store[number].account_number == number for number in range(30000, 35000)))
+            self.assertNotIn(29999, store)
+            self.assertNotIn("20001", store)
+            with self.assertRaises(KeyError):
+                store[35000]
+
+    def test_add_replaces_existing_account(self):
+        """Test adding an account number again replaces its fields instead of adding a row."""
+        for store in self.backends():
+            store.add(InvestmentAccount, 20002, 1002, 7.0, date(2024, 3, 1), management_fee=2.5)
+            self.assertEqual(len(store), 3)
+            self.assertIsInstance(store[20002], InvestmentAccount)
+            self.assertEqual(store[20002].management_fee, 2.5)
+            self.assertEqual([account.account_number for account in store.for_client(1002)], [20002, 20004])
+
+    def test_terms_are_shared(self):
+        """Test accounts with the same terms share one entry, and changing a term affects only its account."""
+        for store in self.backends():
+            store.add(SavingsAccount, 20003, 1001, 10.0, date(2023, 1, 15), minimum_balance=50.0)
+            self.assertEqual(len(store._terms), 3)
+            store[20003].minimum_balance = 75.0
+            self.assertEqual((store[20002].minimum_balance, store[20003].minimum_balance), (50.0, 75.0))
+            minimum_balances = store.column("minimum_balance")
+            self.assertEqual(len(minimum_balances), 4)
+            self.assertEqual([value for value in minimum_balances if not math.isnan(value)], [50.0, 75.0])
+
+    def test_invalid_account_is_rejected(self):
+        """Test non-integer numbers and unknown account types are rejected like BankAccount rejects them."""
+        for store in self.backends():
+            with self.assertRaises(ValueError):
+                store.add(SavingsAccount, "20009", 1001, 1.0, date(2023, 1, 1))
+            with self.assertRaises(ValueError):
+                store.add(BankAccount, 20009, 1001, 1.0, date(2023, 1, 1))
+            self.assertEqual(len(store), 3)
+
+
+if __name__ == '__main__':
+    unittest.main()
@@ -0,0 +1,118 @@
+"""
+Description: Unit tests for the BalanceOffsetIndex class.
+Author: Sukhtab Singh Warya
+Date: 18/10/2026
+"""
+
+import os
+import shutil
+import tempfile
+import unittest
+from user_interface import manage_data
+from user_interface.balance_offset_index import BalanceOffsetIndex, convert_to_fixed_width, BALANCE_FIELD_WIDTH
+from bank_account import SavingsAccount
+from datetime import date
+
+ACCOUNTS = (
+    "account_number,client_number,balance,date_created,account_type,overdraft_limit,overdraft_rate,minimum_balance,management_fee\n"
+    "20001,1001,15300.0,2023-01-10,ChequingAccount,-50,0.035,Null,Null\n"
+    "20002,1001,301.54,2023-01-15,SavingsAccount,Null,Null,50,Null\n"
+)
+
+
+class TestBalanceOffsetIndex(unittest.TestCase):
+
+    def setUp(self):
+        """Write a small accounts file to a temporary directory."""
+        self.directory = tempfile.mkdtemp()
+        self.accounts_path = os.path.join(self.directory, "accounts.csv")
+        with open(self.accounts_path, "w", newline="") as file:
+            file.write(ACCOUNTS)
+
+    def tearDown(self):
+        shutil.rmtree(self.directory)
+
+    def read_file(self):
+        with open(self.accounts_path, newline="") as file:
+            return file.read()
+
+    def test_build_indexes_every_account(self):
+        """Test build records an offset for each account."""
+        index = BalanceOffsetIndex(self.accounts_path)
+        self.assertTrue(index.usable)
+        self.assertEqual(len(index), 2)
+        self.assertIn(20002, index)
+
+    def test_write_balance_fits_in_field(self):
+        """Test write_balance writes in place when the balance fits in the field."""
+        index = BalanceOffsetIndex(self.accounts_path)
+        self.assertTrue(index.write_balance(20002, 250.5))
+        self.assertEqual(self.read_file(), ACCOUNTS.replace("301.54", "250.50"))
+
+    def test_write_balance_too_wide(self):
+        """Test write_balance refuses a balance wider than the field."""
+        index = BalanceOffsetIndex(self.accounts_path)
+        self.assertFalse(index.write_balance(20002, 12345.67))
+        self.assertEqual(self.read_file(), ACCOUNTS)
+
+    def test_write_balance_unknown_account(self):
+        """Test write_balance refuses an account that is not in the file."""
+        index = BalanceOffsetIndex(self.accounts_path)
+        self.assertFalse(index.write_balance(99999, 1.0))
+
+    def test_quoted_file_is_not_usable(self):
+        """Test the index is unusable when the file contains quoted fields."""
+        with open(self.accounts_path, "a", newline="") as file:
+            file.write('20003,1001,"1,000.00",2023-01-15,SavingsAccount,Null,Null,50,Null\n')
+        index = BalanceOffsetIndex(self.accounts_path)
+        self.assertFalse(index.usable)
+        self.assertFalse(index.write_balance(20001, 1.0))
+
+    def test_rebuilds_after_external_change(self):
+        """Test write_balance rebuilds the index when the file was changed elsewhere."""
+        index = BalanceOffsetIndex(self.accounts_path)
+        convert_to_fixed_width(self.accounts_path)
+        self.assertTrue(index.write_balance(20001, 12345678.9))
+        accounts = list(manage_data.iter_accounts(accounts_path=self.accounts_path))
+        self.assertEqual(accounts[0].balance, 12345678.9)
+        self.assertEqual(accounts[1].balance, 301.54)
+
+    def test_convert_to_fixed_width(self):
+        """Test convert_to_fixed_width pads every balance to the same width."""
+        convert_to_fixed_width(self.accounts_path)
+        index = BalanceOffsetIndex(self.accounts_path)
+        self.assertIn(" " * (BALANCE_FIELD_WIDTH - len("15300.00")) + "15300.00", self.read_file())
+        self.assertTrue(index.write_balance(20002, 9999999.99))
+
+    def test_convert_to_fixed_width_skips_padded_file(self):
+        """Test convert_to_fixed_width leaves a file whose balances are already padded untouched."""
+        self.assertTrue(convert_to_fixed_width(self.accounts_path))
+        state = os.stat(self.accounts_path)
+        os.utime(self.accounts_path, ns=(state.st_atime_ns, state.st_mtime_ns - 10**9))
+        state = os.stat(self.accounts_path)
+        self.assertFalse(convert_to_fixed_width(self.accounts_path))
+        self.assertEqual(os.stat(self.accounts_path).st_mtime_ns, state.st_mtime_ns)
+
+    def test_convert_to_fixed_width_keeps_surplus_fields(self):
+        """Test convert_to_fixed_width pads a row with a trailing extra field and keeps the field."""
+        with open(self.accounts_path, "a", newline="") as file:
+            file.write("20003,1001,12.5,2023-01-15,SavingsAccount,Null,Null,50,Null,extra\n")
+        self.assertTrue(convert_to_fixed_width(self.accounts_path))
+        self.assertIn("12.50".rjust(BALANCE_FIELD_WIDTH) + ",2023-01-15,SavingsAccount,Null,Null,50,Null,extra",
+                      self.read_file())
+
+    def test_update_data_falls_back_to_rewrite(self):
+        """Test update_data rewrites the file when the balance does not fit, then writes in place."""
+        index = BalanceOffsetIndex(self.accounts_path)
+        account = SavingsAccount(20002, 1001, 301.54, date(2023, 1, 15), 50, None)
+        account.deposit(20000.00)
+        manage_data.update_data(account, index, self.accounts_path)
+        self.assertIn("20301.54".rjust(BALANCE_FIELD_WIDTH), self.read_file())
+
+        account.withdraw(301.54)
+        self.assertTrue(index.write_balance(account.account_number, account.balance))
+        accounts = list(manage_data.iter_accounts(accounts_path=self.accounts_path))
+        self.assertEqual(accounts[1].balance, 20000.00)
+
+if __name__ == '__main__':
+    unittest.main()
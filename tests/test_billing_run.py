@@ -0,0 +1,149 @@
+"""
+Description: Unit tests for the run_billing function.
+Author: Sukhtab Singh Warya
+Date: 18/10/2026
+"""
+
+import os
+import shutil
+import tempfile
+import unittest
+from datetime import date
+from bank_account import ChequingAccount, SavingsAccount, InvestmentAccount
+from patterns.observer.observer import Observer
+from tests.helpers import make_account_listing
+from user_interface import manage_data
+from user_interface.billing_run import run_billing, BillingReport
+from user_interface.versioned_account_writer import VersionedAccountWriter, prepare_versioned_file
+
+
+class FailingObserver(Observer):
+    def update(self, message):
+        raise RuntimeError("Interrupted")
+
+
+ACCOUNTS = [
+    (ChequingAccount, 20001, 1000, 1000.0, date.today(), -100.0, 0.05),
+    (SavingsAccount, 20002, 1000, 1000.0, date.today(), 50.0, None),
+    (SavingsAccount, 20003, 1001, 5.0, date.today(), 50.0, None),
+    (InvestmentAccount, 20004, 1001, 1000.0, date.today(), 2.5, None),
+    (SavingsAccount, 20005, 1001, 30.0, date.today(), 50.0, None),
+    (ChequingAccount, 20006, 1002, 200.0, date.today(), -100.0, 0.05),
+]
+
+
+EXPECTED_BALANCES = {20001: 999.5, 20002: 990.0, 20004: 987.5, 20005: 10.0, 20006: 199.5}
+
+
+class TestBillingRun(unittest.TestCase):
+
+    def setUp(self):
+        self.directory = tempfile.mkdtemp()
+        self.checkpoint_path = os.path.join(self.directory, "billing.checkpoint")
+        self.persisted = []
+
+    def tearDown(self):
+        shutil.rmtree(self.directory)
+
+    def persist(self, balances):
+        self.persisted.append(dict(balances))
+
+    def test_persisted_balances_are_rounded(self):
+        """Test the checkpoint and persist receive balances rounded to the cent."""
+        accounts = make_account_listing([(SavingsAccount, 20007, 1000, 20.1, date.today(), 50.0, None)])
+        run_billing(accounts, "2026-10", self.persist, self.checkpoint_path)
+        self.assertNotEqual(accounts[20007]._balance, 0.1)
+        self.assertEqual(self.persisted, [{20007: 0.1}])
+
+    def test_run_charges_and_persists_once(self):
+        """Test every account is charged as a withdrawal and the balances are persisted in one call."""
+        accounts = make_account_listing(ACCOUNTS)
+        with self.assertLogs(level="ERROR") as logs:
+            report = run_billing(accounts, "2026-10", self.persist, self.checkpoint_path, partitions=2)
+
+        self.assertEqual(report[:5], BillingReport(6, 5, 1, 43.5, 0)[:5])
+        self.assertGreater(report.accounts_per_second, 0)
+        self.assertEqual(self.persisted, [EXPECTED_BALANCES])
+        self.assertEqual({number: accounts[number].balance for number in EXPECTED_BALANCES}, EXPECTED_BALANCES)
+        self.assertEqual(accounts[20003].balance, 5.0)
+        self.assertIn("Unable to charge account 20003", logs.output[0])
+        self.assertFalse(os.path.exists(self.checkpoint_path))
+
+    def test_process_pool_gives_same_balances(self):
+        """Test billing in worker processes gives the same balances as billing in this process."""
+        accounts = make_account_listing(ACCOUNTS)
+        with self.assertLogs(level="ERROR"):
+            report = run_billing(accounts, "2026-10", self.persist, workers=2, partitions=3)
+        self.assertEqual(report.accounts_charged, 5)
+        self.assertEqual(self.persisted, [EXPECTED_BALANCES])
+
+    def test_resume_after_interruption(self):
+        """Test a run interrupted after one partition resumes without charging that partition again."""
+        accounts = make_account_listing(ACCOUNTS)
+        accounts[20005].attach(FailingObserver())
+        with self.assertRaises(RuntimeError):
+            run_billing(accounts, "2026-10", self.persist, self.checkpoint_path, partitions=2)
+        self.assertEqual(self.persisted, [])
+        self.assertTrue(os.path.exists(self.checkpoint_path))
+
+        reloaded = make_account_listing(ACCOUNTS)
+        with self.assertLogs(level="ERROR"):
+            report = run_billing(reloaded, "2026-10", self.persist, self.checkpoint_path, partitions=2)
+
+        self.assertEqual(report.partitions_resumed, 1)
+        self.assertEqual(report.accounts_charged, 5)
+        self.assertEqual(self.persisted, [EXPECTED_BALANCES])
+        self.assertEqual(reloaded[20002].balance, 990.0)
+
+    def test_resume_after_failed_write(self):
+        """Test a run whose final write failed writes the same balances again without recharging."""
+        def fail(balances):
+            raise OSError("Disk full")
+
+        with self.assertLogs(level="ERROR"), self.assertRaises(OSError):
+            run_billing(make_account_listing(ACCOUNTS), "2026-10", fail, self.checkpoint_path, partitions=2)
+
+        reloaded = make_account_listing(ACCOUNTS)
+        report = run_billing(reloaded, "2026-10", self.persist, self.checkpoint_path, partitions=2)
+        self.assertEqual(report.partitions_resumed, 2)
+        self.assertEqual(report.accounts_rejected, 1)
+        self.assertEqual(self.persisted, [EXPECTED_BALANCES])
+        self.assertEqual(reloaded[20001].balance, 999.5)
+
+    def test_checkpoint_of_other_run_is_ignored(self):
+        """Test a checkpoint left by another billing period is not applied."""
+        with open(self.checkpoint_path, "w") as file:
+            file.write('{"run_id": "2026-09", "partitions": 2}\n')
+            file.write('{"partition": 0, "balances": {"20002": 1.0}, "rejected": 0, "charges": 999.0}\n')
+
+        accounts = make_account_listing(ACCOUNTS)
+        with self.assertLogs(level="ERROR") as logs:
+            report = run_billing(accounts, "2026-10", self.persist, self.checkpoint_path, partitions=2)
+        self.assertEqual(report.partitions_resumed, 0)
+        self.assertEqual(self.persisted, [EXPECTED_BALANCES])
+        self.assertIn("Ignoring billing checkpoint", logs.output[0])
+
+    def test_merged_balances_are_given_to_accounts(self):
+        """Test a run written over another process's change leaves the accounts with the merged balances."""
+        accounts_path = os.path.join(self.directory, "accounts.csv")
+        with open(accounts_path, "w", newline="") as file:
+            file.write("account_number,client_number,balance,date_created,account_type,"
+                       "overdraft_limit,overdraft_rate,minimum_balance,management_fee\n"
+                       "20002,1000,1000.0,2023-01-15,SavingsAccount,Null,Null,50,Null\n")
+        prepare_versioned_file(accounts_path)
+        writer = VersionedAccountWriter(accounts_path)
+        accounts = make_account_listing([ACCOUNTS[1]])
+
+        other = VersionedAccountWriter(accounts_path)
+        other.save_balances({20002: 1100.0})
+
+        run_billing(accounts, "2026-10", writer.save_balances, self.checkpoint_path)
+        self.assertEqual(accounts[20002].balance, 1090.0)
+        accounts[20002].deposit(5.0)
+        writer.save_accounts([accounts[20002]])
+        self.assertEqual(writer.conflicts, 1)
+        self.assertEqual(next(manage_data.iter_accounts(accounts_path=accounts_path)).balance, 1095.0)
+
+
+if __name__ == '__main__':
+    unittest.main()
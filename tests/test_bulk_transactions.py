@@ -0,0 +1,154 @@
+"""
+Description: Unit tests for the apply_transactions function.
+Author: Sukhtab Singh Warya
+Date: 18/10/2026
+"""
+
+import os
+import shutil
+import tempfile
+import unittest
+from datetime import date
+from bank_account import BankAccount, ChequingAccount, SavingsAccount
+from bank_account.cents_account import CentsSavingsAccount
+from bank_account.transaction_ledger import TransactionLedger
+from tests.helpers import RecordingObserver, make_account_listing
+from user_interface import manage_data
+from user_interface.bulk_transactions import apply_transactions, read_transactions
+from user_interface.versioned_account_writer import VersionedAccountWriter, prepare_versioned_file
+
+ACCOUNTS = [
+    (ChequingAccount, 20001, 1000, 1000.0, date.today(), -100.0, 0.05),
+    (SavingsAccount, 20002, 1000, 100.0, date.today(), 50.0, None),
+]
+
+
+class TestBulkTransactions(unittest.TestCase):
+
+    def setUp(self):
+        self.persisted = []
+
+    def tearDown(self):
+        BankAccount.transaction_ledger = None
+
+    def persist(self, balances):
+        self.persisted.append(dict(balances))
+
+    def test_apply_and_persist_once(self):
+        """Test accepted transactions are applied and the balances persisted in one call."""
+        accounts = make_account_listing(ACCOUNTS)
+        report = apply_transactions(accounts, [(20001, "deposit", 250.0), (20002, "withdraw", 30.0),
+                                               (20001, "withdraw", 1200.0)], self.persist)
+        self.assertEqual(report[:4], (3, 3, 2, ()))
+        self.assertGreater(report.transactions_per_second, 0)
+        self.assertEqual(self.persisted, [{20001: 50.0, 20002: 70.0}])
+        self.assertEqual(accounts[20001].balance, 50.0)
+
+    def test_whole_batch_validated_against_running_balance(self):
+        """Test a withdrawal is checked against the balance left by the earlier transactions of the batch."""
+        accounts = make_account_listing(ACCOUNTS)
+        with self.assertLogs(level="ERROR") as logs:
+            report = apply_transactions(accounts, [
+                (20002, "withdraw", 60.0),
+                (20002, "withdraw", 60.0),
+                (20002, "deposit", 100.0),
+                (20002, "withdraw", 60.0),
+                (20003, "deposit", 10.0),
+                (20001, "transfer", 10.0),
+                (20001, "deposit", -5.0),
+                ("twenty", "deposit", 5.0),
+                (20001, "deposit", "ten"),
+            ], self.persist)
+
+        self.assertEqual(report.applied, 3)
+        self.assertEqual([(rejection.record_number, rejection.reason) for rejection in report.rejections], [
+            (2, "Withdrawal amount: $60.00 must not exceed the account balance: $40.00"),
+            (5, "Account 20003 does not exist."),
+            (6, "Transaction kind must be one of deposit, withdraw."),
+            (7, "Deposit amount: $-5.00 must be positive."),
+            (8, "Account number 'twenty' is not a number."),
+            (9, "Amount 'ten' is not a number."),
+        ])
+        self.assertEqual(self.persisted, [{20002: 80.0}])
+        self.assertEqual(len(logs.output), 1)
+        self.assertIn("6 errors", logs.output[0])
+
+    def test_notifications_grouped_by_account(self):
+        """Test an account sends one low balance warning for the batch and one alert per large transaction."""
+        accounts = make_account_listing(ACCOUNTS)
+        observer = RecordingObserver()
+        accounts[20002].attach(observer)
+        apply_transactions(accounts, [(20002, "withdraw", 60.0), (20002, "withdraw", 10.0),
+                                      (20002, "deposit", 15000.0), (20002, "withdraw", 14990.0)], self.persist)
+        self.assertEqual(observer.messages, ["Low balance warning: $40.00 on account 20002.",
+                                             "Large transaction: $15000.00 on account 20002.",
+                                             "Large transaction: $-14990.00 on account 20002."])
+
+    def test_each_transaction_is_recorded(self):
+        """Test every applied transaction reaches the transaction ledger."""
+        ledger = BankAccount.transaction_ledger = TransactionLedger()
+        apply_transactions(make_account_listing(ACCOUNTS), [(20001, "deposit", 5.0), (20001, "withdraw", 10.0)], self.persist)
+        self.assertEqual([(entry.amount, entry.balance) for entry in ledger.for_account(20001)],
+                         [(5.0, 1005.0), (-10.0, 995.0)])
+
+    def test_nothing_persisted_when_all_rejected(self):
+        """Test a batch without an accepted transaction does not persist anything."""
+        with self.assertLogs(level="ERROR"):
+            report = apply_transactions(make_account_listing(ACCOUNTS), [(20002, "withdraw", 500.0)], self.persist)
+        self.assertEqual(report.applied, 0)
+        self.assertEqual(self.persisted, [])
+
+    def test_cents_account_validated_in_cents(self):
+        """Test a batch accepts the withdrawals a cents account's withdraw accepts, and applies them exactly."""
+        account = CentsSavingsAccount(20003, 1000, 0.30, date.today(), 50.0, None)
+        report = apply_transactions({20003: account}, [(20003, "withdraw", "0.10")] * 3, self.persist)
+        self.assertEqual(report.rejections, ())
+        self.assertEqual(account.cents, 0)
+        self.assertEqual(self.persisted, [{20003: 0.0}])
+
+        with self.assertLogs(level="ERROR"):
+            report = apply_transactions({20003: account}, [(20003, "withdraw", 0.01)], self.persist)
+        self.assertEqual(report.rejections[0].reason,
+                         "Withdrawal amount: $0.01 must not exceed the account balance: $0.00")
+
+    def test_read_transactions(self):
+        """Test transactions are read from a file by column name."""
+        directory = tempfile.mkdtemp()
+        self.addCleanup(shutil.rmtree, directory)
+        path = os.path.join(directory, "transactions.csv")
+        with open(path, "w", newline="") as file:
+            file.write("kind,account_number,amount\ndeposit,20001,25.50\nwithdraw,20002,10\n")
+
+        self.assertEqual(list(read_transactions(path)), [["20001", "deposit", "25.50"], ["20002", "withdraw", "10"]])
+        accounts = make_account_listing(ACCOUNTS)
+        report = apply_transactions(accounts, read_transactions(path), self.persist)
+        self.assertEqual(report.applied, 2)
+        self.assertEqual(self.persisted, [{20001: 1025.5, 20002: 90.0}])
+
+
+    def test_merged_balances_are_given_to_accounts(self):
+        """Test a batch written over another process's change leaves the accounts with the merged balances."""
+        directory = tempfile.mkdtemp()
+        self.addCleanup(shutil.rmtree, directory)
+        accounts_path = os.path.join(directory, "accounts.csv")
+        with open(accounts_path, "w", newline="") as file:
+            file.write("account_number,client_number,balance,date_created,account_type,"
+                       "overdraft_limit,overdraft_rate,minimum_balance,management_fee\n"
+                       "20002,1000,100.0,2023-01-15,SavingsAccount,Null,Null,50,Null\n")
+        prepare_versioned_file(accounts_path)
+        writer = VersionedAccountWriter(accounts_path)
+        accounts = make_account_listing(ACCOUNTS)
+
+        other = VersionedAccountWriter(accounts_path)
+        other.save_balances({20002: 150.0})
+
+        apply_transactions(accounts, [(20002, "deposit", 10.0)], writer.save_balances)
+        self.assertEqual(accounts[20002].balance, 160.0)
+        apply_transactions(accounts, [(20002, "withdraw", 5.0)], writer.save_balances)
+        self.assertEqual(accounts[20002].balance, 155.0)
+        self.assertEqual(writer.conflicts, 1)
+        self.assertEqual(next(manage_data.iter_accounts(accounts_path=accounts_path)).balance, 155.0)
+
+
+if __name__ == '__main__':
+    unittest.main()
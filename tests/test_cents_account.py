@@ -0,0 +1,154 @@
+"""
+Description: Unit tests for the accounts that keep their balance in cents and the
+money conversions they use.
+Author: Sukhtab Singh Warya
+Date: 18/10/2026
+"""
+
+import os
+import shutil
+import tempfile
+import unittest
+from datetime import date
+from bank_account import BankAccount, ChequingAccount, SavingsAccount, InvestmentAccount
+from bank_account.cents_account import CentsChequingAccount, CentsSavingsAccount, CentsInvestmentAccount
+from bank_account.transaction_ledger import TransactionLedger
+from patterns.strategy.service_charge_strategy import OverdraftStrategy
+from user_interface import manage_data
+from user_interface.data_snapshot import read_snapshot, write_snapshot
+from utility.money import to_cents, from_cents
+
+
+class TestMoney(unittest.TestCase):
+
+    def test_to_cents_rounds_half_cents_up(self):
+        """Test amounts written with a half cent are rounded away from zero."""
+        self.assertEqual([to_cents(amount) for amount in (1.005, 2.675, 0.125, -1.005, 10.0049, 0.1 + 0.2)],
+                         [101, 268, 13, -101, 1000, 30])
+
+    def test_round_trip(self):
+        """Test every amount of cents converts to dollars and back unchanged."""
+        for cents in list(range(-100000, 100000, 7)) + [2 ** 53 // 100, -(2 ** 53 // 100), 0]:
+            self.assertEqual(to_cents(from_cents(cents)), cents)
+        self.assertEqual(from_cents(123456), 1234.56)
+
+
+class TestCentsAccount(unittest.TestCase):
+
+    def setUp(self):
+        self.today = date.today()
+
+    def tearDown(self):
+        BankAccount.transaction_ledger = None
+
+    def test_repeated_deposits_are_exact(self):
+        """Test a thousand deposits of ten cents add up to exactly one hundred dollars."""
+        account = CentsSavingsAccount(20002, 1001, 0.0, self.today, 50.0, None)
+        floats = SavingsAccount(20002, 1001, 0.0, self.today, 50.0, None)
+        for _ in range(1000):
+            account.deposit(0.1)
+            floats.deposit(0.1)
+        self.assertEqual(account.cents, 10000)
+        self.assertEqual(account.balance, 100.0)
+        self.assertNotEqual(floats._balance, 100.0)
+
+    def test_withdraw_whole_balance(self):
+        """Test the whole balance can be withdrawn after deposits a float balance cannot hold exactly."""
+        account = CentsChequingAccount(20001, 1001, 0.0, self.today, -100.0, 0.05)
+        for amount in (0.1, 0.2, 0.7, 19.99):
+            account.deposit(amount)
+        account.withdraw(20.99)
+        self.assertEqual(account.cents, 0)
+        with self.assertRaises(ValueError):
+            account.withdraw(0.01)
+
+    def test_matches_float_account_interface(self):
+        """Test cents accounts are the account types they extend and show balances in dollars."""
+        account = CentsInvestmentAccount(20004, 1002, 4500.87, self.today, 5.0, None)
+        self.assertIsInstance(account, InvestmentAccount)
+        self.assertEqual(account.cents, 450087)
+        self.assertEqual(account._balance, 4500.87)
+        self.assertEqual(str(account), str(InvestmentAccount(20004, 1002, 4500.87, self.today, 5.0, None)))
+        with self.assertRaises(ValueError):
+            account.deposit(0)
+        with self.assertRaises(AttributeError):
+            account.anything = 1
+
+    def test_ledger_and_events_see_dollars(self):
+        """Test the ledger records dollars and a low balance warning shows the exact balance."""
+        ledger = BankAccount.transaction_ledger = TransactionLedger()
+        account = CentsSavingsAccount(20002, 1001, 60.0, self.today, 50.0, None)
+        messages = []
+        account.attach(type("Recorder", (), {"update": lambda self, message: messages.append(message)})())
+        account.update_balance_batch([-10.1, -0.2])
+        self.assertEqual([(entry.amount, entry.balance) for entry in ledger.for_account(20002)],
+                         [(-10.1, 49.9), (-0.2, 49.7)])
+        self.assertEqual(messages, ["Low balance warning: $49.70 on account 20002."])
+
+    def test_service_charges_match_float_accounts(self):
+        """Test service charges calculated in cents match the float accounts' charges to the cent."""
+        for balance in (-100.0, -0.01, 0.0, 49.99, 50.0, 5000.0):
+            self.assertEqual(CentsChequingAccount(20001, 1001, balance, self.today, -100.0, 0.05).get_service_charges(),
+                             round(ChequingAccount(20001, 1001, balance, self.today, -100.0, 0.05).get_service_charges(), 2))
+            self.assertEqual(CentsSavingsAccount(20002, 1001, balance, self.today, 50.0, None).get_service_charges(),
+                             SavingsAccount(20002, 1001, balance, self.today, 50.0, None).get_service_charges())
+        self.assertEqual(CentsInvestmentAccount(20004, 1002, 10.0, date(2010, 1, 1), 5.0, None).get_service_charges(),
+                         InvestmentAccount(20004, 1002, 10.0, date(2010, 1, 1), 5.0, None).get_service_charges())
+
+    def test_strategy_cents(self):
+        """Test the strategies' integer calculations round the overdraft and half fees to the cent."""
+        strategy = OverdraftStrategy(overdraft_limit=-100.0, base_service_charge=0.50)
+        self.assertEqual(strategy.calculate_service_charges_cents(-10010), 50 + 1)
+        self.assertEqual(strategy.calculate_service_charges_cents(-10030), 50 + 2)
+        self.assertEqual(strategy.calculate_service_charges_cents(0), 50)
+
+
+class TestMoneyEngine(unittest.TestCase):
+
+    def setUp(self):
+        self.directory = tempfile.mkdtemp()
+        self.accounts_path = os.path.join(self.directory, "accounts.csv")
+        with open(self.accounts_path, "w", newline="") as file:
+            file.write("account_number,client_number,balance,date_created,account_type,"
+                       "overdraft_limit,overdraft_rate,minimum_balance,management_fee\n"
+                       "20001,1001,0.10,2023-01-10,ChequingAccount,-50,0.035,Null,Null\n"
+                       "20002,1001,301.54,2023-01-15,SavingsAccount,Null,Null,50,Null\n")
+
+    def tearDown(self):
+        manage_data.set_money_engine("float")
+        shutil.rmtree(self.directory)
+
+    def test_cents_engine_reads_and_writes_exact_balances(self):
+        """Test the cents engine loads cents accounts and writes their balances back unchanged."""
+        manage_data.set_money_engine("cents")
+        accounts = list(manage_data.iter_accounts(accounts_path=self.accounts_path))
+        self.assertIsInstance(accounts[0], CentsChequingAccount)
+        self.assertIsInstance(accounts[1], CentsSavingsAccount)
+        for _ in range(3):
+            accounts[0].deposit(0.1)
+        manage_data.update_accounts(accounts, accounts_path=self.accounts_path)
+
+        manage_data.set_money_engine("float")
+        balances = [account.balance for account in manage_data.iter_accounts(accounts_path=self.accounts_path)]
+        self.assertEqual(balances, [0.4, 301.54])
+
+    def test_snapshot_round_trip(self):
+        """Test cents accounts are written to a snapshot as their account type and read back as cents accounts."""
+        manage_data.set_money_engine("cents")
+        accounts = list(manage_data.iter_accounts(accounts_path=self.accounts_path))
+        snapshot_path = os.path.join(self.directory, "snapshot.bin")
+        write_snapshot(snapshot_path, [], accounts)
+        self.assertIs(type(read_snapshot(snapshot_path)[1][20001]), ChequingAccount)
+        loaded = read_snapshot(snapshot_path, manage_data.account_classes)[1]
+        self.assertIs(type(loaded[20002]), CentsSavingsAccount)
+        self.assertEqual(loaded[20002].cents, 30154)
+
+    def test_invalid_engine(self):
+        """Test set_money_engine raises ValueError for an unknown engine."""
+        with self.assertRaises(ValueError):
+            manage_data.set_money_engine("decimal")
+        self.assertIs(manage_data.account_classes, manage_data.MONEY_ENGINES["float"])
+
+
+if __name__ == '__main__':
+    unittest.main()
@@ -6,6 +6,8 @@ Date: 10/09/2024
 """
 
 import unittest
+from unittest import mock
+from client import client as client_module
 from client.client import Client
 from email_validator import EmailNotValidError
 
@@ -67,5 +69,82 @@ class TestClient(unittest.TestCase):
         client = Client(client_number=1010, first_name="Sukhtab", last_name="Warya", email_address="sukhtabwarya@gmail.com")
         self.assertEqual(str(client), "Warya, Sukhtab [1010] - sukhtabwarya@gmail.com\n")
 
+
+class TestClientEmailValidation(unittest.TestCase):
+
+    def setUp(self):
+        """Start each test in offline mode with empty caches."""
+        client_module._check_syntax.cache_clear()
+        client_module._check_deliverability.cache_clear()
+        Client.validate_deferred_emails()
+        Client.set_email_validation_mode("offline")
+
+    def tearDown(self):
+        Client.set_email_validation_mode("full")
+
+    def test_offline_mode_checks_syntax_only(self):
+        """Test offline mode accepts a well-formed address without a deliverability check."""
+        with mock.patch.object(client_module, "validate_email", wraps=client_module.validate_email) as validate:
+            client = Client(1010, "Sukhtab", "Warya", "SukhtabWarya@Pixell.com")
+        self.assertEqual(client.email_address, "SukhtabWarya@pixell.com")
+        validate.assert_called_once_with("SukhtabWarya@Pixell.com", check_deliverability=False)
+
+    def test_offline_mode_rejects_invalid_syntax(self):
+        """Test offline mode raises ValueError for a malformed address."""
+        with self.assertRaises(ValueError) as context:
+            Client(1010, "Sukhtab", "Warya", "invalid-email")
+        self.assertTrue(str(context.exception).startswith("Invalid email address: "))
+
+    def test_results_are_cached_by_raw_address(self):
+        """Test an address is validated once however many clients use it."""
+        with mock.patch.object(client_module, "validate_email", wraps=client_module.validate_email) as validate:
+            for client_number in range(5):
+                Client(client_number, "Sukhtab", "Warya", "sukhtabwarya@pixell.com")
+            for _ in range(2):
+                with self.assertRaises(ValueError):
+                    Client(1010, "Sukhtab", "Warya", "invalid-email")
+        self.assertEqual(validate.call_count, 2)
+
+    def test_deferred_mode_queues_full_validation(self):
+        """Test deferred mode accepts the client and reports deliverability failures later."""
+        Client.set_email_validation_mode("deferred")
+        error = EmailNotValidError("The domain name pixell.com does not exist.")
+        validate_email = client_module.validate_email
+
+        def validate(address, check_deliverability):
+            if check_deliverability:
+                raise error
+            return validate_email(address, check_deliverability=False)
+
+        with mock.patch.object(client_module, "validate_email", side_effect=validate):
+            client = Client(1010, "Sukhtab", "Warya", "sukhtabwarya@pixell.com")
+            self.assertEqual(client.email_address, "sukhtabwarya@pixell.com")
+            self.assertEqual(Client.validate_deferred_emails(), {"sukhtabwarya@pixell.com": str(error)})
+        self.assertEqual(Client.validate_deferred_emails(), {})
+
+    def test_failed_deliverability_is_not_cached(self):
+        """Test an address rejected by a failed DNS lookup is looked up again by the next client."""
+        Client.set_email_validation_mode("full")
+        validate_email = client_module.validate_email
+        outage = [EmailNotValidError("The DNS query timed out.")]
+
+        def validate(address, check_deliverability):
+            if check_deliverability and outage:
+                raise outage.pop()
+            return validate_email(address, check_deliverability=False)
+
+        with mock.patch.object(client_module, "validate_email", side_effect=validate) as patched:
+            with self.assertRaises(ValueError):
+                Client(1010, "Sukhtab", "Warya", "sukhtabwarya@pixell.com")
+            for _ in range(2):
+                client = Client(1010, "Sukhtab", "Warya", "sukhtabwarya@pixell.com")
+        self.assertEqual(client.email_address, "sukhtabwarya@pixell.com")
+        self.assertEqual([call.kwargs["check_deliverability"] for call in patched.call_args_list], [False, True, True])
+
+    def test_invalid_mode(self):
+        """Test set_email_validation_mode raises ValueError for an unknown mode."""
+        with self.assertRaises(ValueError):
+            Client.set_email_validation_mode("sometimes")
+
 if __name__ == '__main__':
     unittest.main()
@@ -0,0 +1,152 @@
+"""
+Description: Unit tests for the DataFileWatcher class.
+Author: Sukhtab Singh Warya
+Date: 18/10/2026
+"""
+
+import os
+import shutil
+import tempfile
+import unittest
+from user_interface import manage_data
+from user_interface.account_listing import AccountListing
+from user_interface.data_file_watcher import DataFileWatcher, ReloadReport
+from client.client import Client
+
+CLIENTS_HEADER = "client_number,first_name,last_name,email_address\n"
+CLIENT_ROWS = [
+    "1001,John,Doe,johndoe@pixell.com\n",
+    "1002,Jane,Smith,janesmith@pixell.com\n",
+]
+
+ACCOUNTS_HEADER = "account_number,client_number,balance,date_created,account_type,overdraft_limit,overdraft_rate,minimum_balance,management_fee\n"
+ACCOUNT_ROWS = [
+    "20001,1001,15300.0,2023-01-10,ChequingAccount,-50,0.035,Null,Null\n",
+    "20002,1001,301.54,2023-01-15,SavingsAccount,Null,Null,50,Null\n",
+    "20004,1002,4500.87,2023-02-05,InvestmentAccount,Null,Null,Null,5\n",
+    "20100,1003,4109.99,2023-10-05,SavingsAccount,Null,Null,100,Null\n",
+]
+
+
+class TestDataFileWatcher(unittest.TestCase):
+
+    def setUp(self):
+        """Write small data files, load them and watch them."""
+        Client.set_email_validation_mode("offline")
+        self.directory = tempfile.mkdtemp()
+        self.clients_path = os.path.join(self.directory, "clients.csv")
+        self.accounts_path = os.path.join(self.directory, "accounts.csv")
+        self.write_file(self.clients_path, CLIENTS_HEADER, CLIENT_ROWS)
+        self.write_file(self.accounts_path, ACCOUNTS_HEADER, ACCOUNT_ROWS)
+
+        self.clients = {client.client_number: client for client in manage_data.iter_clients(self.clients_path)}
+        with self.assertLogs(level="ERROR"):
+            self.accounts = AccountListing((account.account_number, account) for account in
+                                           manage_data.iter_accounts(self.clients, self.accounts_path))
+            self.watcher = DataFileWatcher(self.clients, self.accounts, self.clients_path, self.accounts_path)
+
+    def tearDown(self):
+        Client.set_email_validation_mode("full")
+        shutil.rmtree(self.directory)
+
+    @staticmethod
+    def write_file(path, header, rows):
+        """Write a data file and move its modification time forward so the change is always seen."""
+        existed = os.path.exists(path)
+        with open(path, "w", newline="") as file:
+            file.write(header)
+            file.writelines(rows)
+        if existed:
+            stat = os.stat(path)
+            os.utime(path, ns=(stat.st_atime_ns, stat.st_mtime_ns + 1_000_000_000))
+
+    def test_poll_without_changes(self):
+        """Test poll returns None when neither file has changed."""
+        self.assertIsNone(self.watcher.poll())
+
+    def test_poll_applies_changed_account_only(self):
+        """Test an edited account row updates only that account, in place."""
+        unchanged, edited = self.accounts[20001], self.accounts[20002]
+        rows = ACCOUNT_ROWS.copy()
+        rows[1] = "20002,1001,999.99,2023-01-15,SavingsAccount,Null,Null,75,Null\n"
+        self.write_file(self.accounts_path, ACCOUNTS_HEADER, rows)
+
+        self.assertEqual(self.watcher.poll(), ReloadReport(accounts_changed=1))
+        self.assertIs(self.accounts[20002], edited)
+        self.assertEqual((edited.balance, edited.minimum_balance), (999.99, 75.0))
+        self.assertIs(self.accounts[20001], unchanged)
+
+    def test_poll_skips_unsaved_account(self):
+        """Test a row written before the latest unsaved change does not overwrite the account."""
+        unsaved = {20004}
+        watcher = DataFileWatcher(self.clients, self.accounts, self.clients_path, self.accounts_path, unsaved)
+        account = self.accounts[20004]
+        rows = ACCOUNT_ROWS.copy()
+        rows[2] = "20004,1002,    4600.00,2023-02-05,InvestmentAccount,Null,Null,Null,5\n"
+        self.write_file(self.accounts_path, ACCOUNTS_HEADER, rows)
+        account.deposit(120.00)
+
+        self.assertEqual(watcher.poll(), ReloadReport())
+        self.assertIs(self.accounts[20004], account)
+        self.assertEqual(account.balance, 4620.87)
+
+        unsaved.clear()
+        self.write_file(self.accounts_path, ACCOUNTS_HEADER, rows)
+        self.assertEqual(watcher.poll(), ReloadReport(accounts_changed=1))
+        self.assertIs(self.accounts[20004], account)
+        self.assertEqual(account.balance, 4600.00)
+
+    def test_poll_applies_added_and_removed_accounts(self):
+        """Test added and removed account rows are applied and counted."""
+        rows = ACCOUNT_ROWS[1:] + ["20005,1002,10.00,2023-02-05,SavingsAccount,Null,Null,50,Null\n"]
+        self.write_file(self.accounts_path, ACCOUNTS_HEADER, rows)
+
+        report = self.watcher.poll()
+        self.assertEqual(report, ReloadReport(accounts_added=1, accounts_removed=1))
+        self.assertEqual(report.rows_touched, 2)
+        self.assertNotIn(20001, self.accounts)
+        self.assertEqual([account.account_number for account in self.accounts.for_client(1002)], [20004, 20005])
+
+    def test_poll_same_balance_keeps_account(self):
+        """Test a row rewritten with the balance already in memory is not counted as a change."""
+        self.accounts[20004].deposit(99.13)
+        rows = ACCOUNT_ROWS.copy()
+        rows[2] = "20004,1002,    4600.00,2023-02-05,InvestmentAccount,Null,Null,Null,5\n"
+        self.write_file(self.accounts_path, ACCOUNTS_HEADER, rows)
+
+        self.assertEqual(self.watcher.poll(), ReloadReport())
+
+    def test_added_client_brings_in_accounts(self):
+        """Test accounts of a client that is added to clients.csv are loaded."""
+        self.write_file(self.clients_path, CLIENTS_HEADER, CLIENT_ROWS + ["1003,New,Client,new@pixell.com\n"])
+
+        self.assertEqual(self.watcher.poll(), ReloadReport(clients_added=1, accounts_added=1))
+        self.assertEqual(self.clients[1003].first_name, "New")
+        self.assertIn(20100, self.accounts)
+
+    def test_removed_client_removes_accounts(self):
+        """Test accounts of a client that is removed from clients.csv are removed and logged."""
+        self.write_file(self.clients_path, CLIENTS_HEADER, CLIENT_ROWS[1:])
+
+        with self.assertLogs(level="ERROR") as logs:
+            report = self.watcher.poll()
+        self.assertEqual(report, ReloadReport(clients_removed=1, accounts_removed=2))
+        self.assertNotIn(1001, self.clients)
+        self.assertEqual(self.accounts.for_client(1001), [])
+        self.assertEqual(len(logs.output), 1)
+        self.assertIn("Data file reload: 2 errors\n  2 x Bank Account: ... contains invalid Client Number: ...", logs.output[0])
+
+    def test_invalid_changed_row_is_removed(self):
+        """Test a row changed to an invalid value is logged and removed."""
+        rows = ACCOUNT_ROWS.copy()
+        rows[0] = "20001,1001,ten,2023-01-10,ChequingAccount,-50,0.035,Null,Null\n"
+        self.write_file(self.accounts_path, ACCOUNTS_HEADER, rows)
+
+        with self.assertLogs(level="ERROR") as logs:
+            self.assertEqual(self.watcher.poll(), ReloadReport(accounts_removed=1))
+        self.assertEqual(len(logs.output), 1)
+        self.assertIn("e.g. Unable to create bank account: could not convert string to float: 'ten'", logs.output[0])
+
+
+if __name__ == '__main__':
+    unittest.main()
@@ -0,0 +1,128 @@
+"""
+Description: Unit tests for reading and writing the binary data snapshot.
+Author: Sukhtab Singh Warya
+Date: 18/10/2026
+"""
+
+import os
+import shutil
+import tempfile
+import time
+import unittest
+from unittest import mock
+from bank_account import ChequingAccount, SavingsAccount, InvestmentAccount
+from client import client as client_module
+from client.client import Client
+from email_validator import EmailNotValidError
+from user_interface import manage_data
+from user_interface.data_snapshot import read_snapshot, write_snapshot, snapshot_is_fresh
+from datetime import date
+
+
+class TestDataSnapshot(unittest.TestCase):
+
+    def setUp(self):
+        """Set up one account of each type and a temporary directory."""
+        self.directory = tempfile.mkdtemp()
+        self.snapshot_path = os.path.join(self.directory, "snapshot.bin")
+        self.accounts = [
+            ChequingAccount(20001, 1001, 15300.0, date(2023, 1, 10), -50.0, 0.035),
+            SavingsAccount(20002, 1001, 301.54, date(2023, 1, 15), 50.0, None),
+            InvestmentAccount(20004, 1002, 4500.87, date(2023, 2, 5), 5.0, None),
+        ]
+
+    def tearDown(self):
+        shutil.rmtree(self.directory)
+
+    def test_round_trip(self):
+        """Test accounts read from a snapshot match the accounts written to it."""
+        write_snapshot(self.snapshot_path, [], self.accounts)
+        clients, accounts = read_snapshot(self.snapshot_path)
+        self.assertEqual(clients, {})
+        self.assertEqual(list(accounts), [20001, 20002, 20004])
+        for original in self.accounts:
+            loaded = accounts[original.account_number]
+            self.assertIs(type(loaded), type(original))
+            self.assertEqual(str(loaded), str(original))
+            self.assertEqual(loaded.client_number, original.client_number)
+            self.assertEqual(loaded.date_created, original.date_created)
+        self.assertEqual(accounts[20001].overdraft_limit, -50.0)
+        self.assertEqual(accounts[20001].overdraft_rate, 0.035)
+        self.assertEqual(accounts[20002].minimum_balance, 50.0)
+        self.assertEqual(accounts[20004].management_fee, 5.0)
+
+    def test_clients_loaded_without_deliverability_check(self):
+        """Test clients read from a snapshot only get the offline syntax check in full validation mode."""
+        Client.set_email_validation_mode("offline")
+        client = Client(1001, "John", "Doe", "johndoe@pixell.com")
+        Client.set_email_validation_mode("full")
+        write_snapshot(self.snapshot_path, [client], self.accounts)
+        with mock.patch.object(client_module, "validate_email", wraps=client_module.validate_email) as validate:
+            clients, _ = read_snapshot(self.snapshot_path)
+        self.assertEqual(str(clients[1001]), str(client))
+        self.assertFalse(any(call.kwargs["check_deliverability"] for call in validate.call_args_list))
+
+    def test_missing_snapshot(self):
+        """Test read_snapshot returns None when there is no snapshot."""
+        self.assertIsNone(read_snapshot(self.snapshot_path))
+
+    def test_truncated_snapshot(self):
+        """Test read_snapshot logs an error and returns None for a damaged snapshot."""
+        write_snapshot(self.snapshot_path, [], self.accounts)
+        with open(self.snapshot_path, "r+b") as file:
+            file.truncate(40)
+        with self.assertLogs(level="ERROR"):
+            self.assertIsNone(read_snapshot(self.snapshot_path))
+
+    def test_snapshot_is_fresh(self):
+        """Test the snapshot is only fresh while it is newer than its sources."""
+        source_path = os.path.join(self.directory, "accounts.csv")
+        with open(source_path, "w") as file:
+            file.write("account_number\n")
+        self.assertFalse(snapshot_is_fresh(self.snapshot_path, [source_path]))
+
+        write_snapshot(self.snapshot_path, [], self.accounts)
+        os.utime(source_path, ns=(0, 0))
+        self.assertTrue(snapshot_is_fresh(self.snapshot_path, [source_path]))
+
+        os.utime(source_path, ns=(time.time_ns() + 10**9, time.time_ns() + 10**9))
+        self.assertFalse(snapshot_is_fresh(self.snapshot_path, [source_path]))
+
+    def test_no_snapshot_after_failed_deliverability_check(self):
+        """Test a load that rejects a client for deliverability writes no snapshot, so a later load sees the client."""
+        clients_path = os.path.join(self.directory, "clients.csv")
+        accounts_path = os.path.join(self.directory, "accounts.csv")
+        with open(clients_path, "w", newline="") as file:
+            file.write("client_number,first_name,last_name,email_address\n1001,John,Doe,johndoe@pixell.com\n")
+        with open(accounts_path, "w", newline="") as file:
+            file.write("account_number,client_number,balance,date_created,account_type,"
+                       "overdraft_limit,overdraft_rate,minimum_balance,management_fee\n"
+                       "20002,1001,301.54,2023-01-15,SavingsAccount,Null,Null,50,Null\n")
+
+        def validate_email(address, check_deliverability):
+            if check_deliverability and offline:
+                raise EmailNotValidError("The domain name pixell.com does not exist.")
+            return mock.Mock(normalized=address)
+
+        client_module._check_syntax.cache_clear()
+        client_module._check_deliverability.cache_clear()
+        self.addCleanup(client_module._check_syntax.cache_clear)
+        self.addCleanup(client_module._check_deliverability.cache_clear)
+        with mock.patch.object(manage_data, "clients_csv_path", clients_path), \
+                mock.patch.object(manage_data, "accounts_csv_path", accounts_path), \
+                mock.patch.object(manage_data, "snapshot_path", self.snapshot_path), \
+                mock.patch.object(client_module, "validate_email", validate_email):
+            offline = True
+            with self.assertLogs(level="ERROR"):
+                clients, accounts = manage_data.load_data()
+            self.assertEqual((len(clients), len(accounts)), (0, 0))
+            self.assertFalse(os.path.exists(self.snapshot_path))
+
+            offline = False
+            clients, accounts = manage_data.load_data()
+            self.assertEqual((list(clients), list(accounts)), ([1001], [20002]))
+            self.assertTrue(os.path.exists(self.snapshot_path))
+
+
+if __name__ == '__main__':
+    unittest.main()
@@ -0,0 +1,154 @@
+"""
+Description: Unit tests for the EmailOutbox class.
+Author: Sukhtab Singh Warya
+Date: 18/10/2026
+"""
+
+import os
+import shutil
+import tempfile
+import threading
+import time
+import unittest
+from unittest import mock
+from client.client import Client
+from utility.email_outbox import EmailOutbox
+from utility.file_utils import simulate_send_email
+
+
+class TestEmailOutbox(unittest.TestCase):
+
+    def setUp(self):
+        self.directory = tempfile.mkdtemp()
+        self.path = os.path.join(self.directory, "output", "observer_emails.txt")
+
+    def tearDown(self):
+        shutil.rmtree(self.directory)
+
+    def read(self, path=None):
+        with open(path or self.path) as file:
+            return file.read()
+
+    def test_format_matches_simulate_send_email(self):
+        """Test the outbox writes exactly the bytes simulate_send_email writes."""
+        outbox = EmailOutbox(self.path)
+        outbox.send("client@pixell.com", "ALERT: Unusual Activity", "Low balance warning: $10.00")
+        outbox.send("other@pixell.com", "ALERT: Unusual Activity", "Large transaction: $20000.00")
+        outbox.close()
+
+        cwd = os.getcwd()
+        os.chdir(self.directory)
+        try:
+            os.rename(self.path, self.path + ".outbox")
+            simulate_send_email("client@pixell.com", "ALERT: Unusual Activity", "Low balance warning: $10.00")
+            simulate_send_email("other@pixell.com", "ALERT: Unusual Activity", "Large transaction: $20000.00")
+        finally:
+            os.chdir(cwd)
+
+        with open(self.path, "rb") as expected, open(self.path + ".outbox", "rb") as written:
+            self.assertEqual(written.read(), expected.read())
+
+    def test_flush_on_max_pending(self):
+        """Test messages are buffered until max_pending of them are waiting."""
+        outbox = EmailOutbox(self.path, max_pending=3, max_delay=None)
+        self.addCleanup(outbox.close)
+        outbox.send("a@pixell.com", "Subject", "one")
+        outbox.send("a@pixell.com", "Subject", "two")
+        self.assertFalse(os.path.exists(self.path))
+        self.assertEqual(outbox.pending, 2)
+
+        outbox.send("a@pixell.com", "Subject", "three")
+        self.assertEqual(outbox.pending, 0)
+        self.assertEqual(outbox.writes, 1)
+        self.assertEqual(self.read().count("---\nTo: a@pixell.com"), 3)
+
+    def test_flush_after_max_delay(self):
+        """Test waiting messages are written once the oldest has waited max_delay seconds."""
+        outbox = EmailOutbox(self.path, max_pending=100, max_delay=0.05)
+        self.addCleanup(outbox.close)
+        outbox.send("a@pixell.com", "Subject", "one")
+        deadline = time.monotonic() + 5
+        while outbox.pending and time.monotonic() < deadline:
+            time.sleep(0.01)
+        self.assertEqual(outbox.pending, 0)
+        self.assertIn("Message: one", self.read())
+
+    def test_failed_timed_write_is_retried(self):
+        """Test messages that could not be written by the timer are written by a later timed write."""
+        blocker = os.path.dirname(self.path)
+        with open(blocker, "w"):
+            pass  # A file where the output directory should be
+        outbox = EmailOutbox(self.path, max_pending=100, max_delay=0.02)
+        self.addCleanup(outbox.close)
+        with self.assertLogs(level="ERROR") as logs:
+            outbox.send("a@pixell.com", "Subject", "one")
+            deadline = time.monotonic() + 5
+            while not logs.output and time.monotonic() < deadline:
+                time.sleep(0.01)
+        self.assertIn("Unable to write email outbox", logs.output[0])
+        os.remove(blocker)
+
+        deadline = time.monotonic() + 5
+        while outbox.pending and time.monotonic() < deadline:
+            time.sleep(0.01)
+        self.assertEqual(outbox.pending, 0)
+        self.assertIn("Message: one", self.read())
+
+    def test_rotation_by_size(self):
+        """Test a file that would pass max_bytes is rotated on a message boundary."""
+        message_size = len("---\nTo: a@pixell.com\nSubject: Subject\nMessage: 0\n---\n")
+        outbox = EmailOutbox(self.path, max_pending=100, max_delay=None, max_bytes=2 * message_size,
+                             backup_count=2)
+        for number in range(7):
+            outbox.send("a@pixell.com", "Subject", str(number))
+        outbox.close()
+
+        self.assertEqual(self.read(), "---\nTo: a@pixell.com\nSubject: Subject\nMessage: 6\n---\n")
+        self.assertIn("Message: 4\n", self.read(self.path + ".1"))
+        self.assertIn("Message: 5\n", self.read(self.path + ".1"))
+        self.assertIn("Message: 2\n", self.read(self.path + ".2"))
+        self.assertFalse(os.path.exists(self.path + ".3"))
+
+    def test_concurrent_senders(self):
+        """Test messages sent from several threads are all written whole."""
+        outbox = EmailOutbox(self.path, max_pending=7, max_delay=None)
+
+        def send(thread):
+            for number in range(200):
+                outbox.send(f"{thread}@pixell.com", "Subject", f"{thread}-{number}")
+
+        threads = [threading.Thread(target=send, args=(thread,)) for thread in range(4)]
+        for thread in threads:
+            thread.start()
+        for thread in threads:
+            thread.join()
+        outbox.close()
+
+        messages = self.read().split("---\n---\n")
+        self.assertEqual(len(messages), 800)
+        self.assertEqual(sorted(message.rsplit("Message: ", 1)[1].strip("-\n") for message in messages),
+                         sorted(f"{thread}-{number}" for thread in range(4) for number in range(200)))
+
+    def test_closed_outbox_rejects_messages(self):
+        """Test a closed outbox refuses new messages."""
+        outbox = EmailOutbox(self.path)
+        outbox.close()
+        with self.assertRaises(ValueError):
+            outbox.send("a@pixell.com", "Subject", "late")
+
+    def test_client_update_uses_outbox(self):
+        """Test Client.update sends its email through the shared outbox."""
+        Client.set_email_validation_mode("offline")
+        self.addCleanup(Client.set_email_validation_mode, "full")
+        client = Client(1001, "Jane", "Doe", "jane@pixell.com")
+        outbox = mock.Mock()
+        with mock.patch("client.client.shared_outbox", return_value=outbox):
+            client.update("Low balance warning")
+        email_address, subject, message = outbox.send.call_args.args
+        self.assertEqual(email_address, "jane@pixell.com")
+        self.assertTrue(subject.startswith("ALERT: Unusual Activity: "))
+        self.assertEqual(message, "Notification for 1001: Jane Doe: Low balance warning")
+
+
+if __name__ == '__main__':
+    unittest.main()
@@ -0,0 +1,132 @@
+"""
+Description: Unit tests for the EventBus class.
+Author: Sukhtab Singh Warya
+Date: 18/10/2026
+"""
+
+import gc
+import unittest
+from datetime import date
+from unittest import mock
+from bank_account import BankAccount, ChequingAccount, SavingsAccount
+from client.client import Client
+from patterns.observer.event_bus import EventBus, AccountEvent, LOW_BALANCE, LARGE_TRANSACTION
+from patterns.observer.subject import Subject
+from patterns.observer.notification_dispatcher import NotificationDispatcher
+from tests.helpers import RecordingObserver
+
+
+class TestEventBus(unittest.TestCase):
+
+    def setUp(self):
+        self.bus = EventBus()
+        BankAccount.event_bus = self.bus
+        self.savings = SavingsAccount(20001, 1001, 100.00, date.today(), 50.00, None)
+        self.chequing = ChequingAccount(20002, 1001, 100.00, date.today(), -100.00, 0.05)
+        self.other = SavingsAccount(20003, 1002, 100.00, date.today(), 50.00, None)
+
+    def tearDown(self):
+        BankAccount.event_bus = None
+
+    def test_event_message(self):
+        """Test events carry the messages accounts have always sent."""
+        self.assertEqual(AccountEvent(LOW_BALANCE, 1001, 20001, -60.0, 39.996).message,
+                         "Low balance warning: $40.00 on account 20001.")
+        self.assertEqual(AccountEvent(LARGE_TRANSACTION, 1001, 20001, 20000.0, 20100.0).message,
+                         "Large transaction: $20000.00 on account 20001.")
+
+    def test_one_subscription_covers_all_client_accounts(self):
+        """Test an observer subscribed to a client receives events from every account of that client only."""
+        observer = RecordingObserver()
+        self.bus.subscribe(observer, 1001)
+        self.savings.withdraw(60.00)
+        self.chequing.deposit(20000.00)
+        self.other.withdraw(60.00)
+        self.assertEqual(observer.messages, ["Low balance warning: $40.00 on account 20001.",
+                                             "Large transaction: $20000.00 on account 20002."])
+
+    def test_subscribe_to_event_types(self):
+        """Test an observer only receives the event types it subscribed to."""
+        observer = RecordingObserver()
+        self.bus.subscribe(observer, 1001, [LARGE_TRANSACTION])
+        self.savings.withdraw(60.00)
+        self.savings.deposit(20000.00)
+        self.assertEqual(observer.messages, ["Large transaction: $20000.00 on account 20001."])
+        with self.assertRaises(ValueError):
+            self.bus.subscribe(observer, 1001, ["overdrawn"])
+
+    def test_several_subscribers(self):
+        """Test several observers of one client each receive its events until they unsubscribe."""
+        first, second = RecordingObserver(), RecordingObserver()
+        self.bus.subscribe(first, 1001)
+        self.bus.subscribe(second, 1001)
+        self.savings.withdraw(60.00)
+        self.bus.unsubscribe(first, 1001)
+        self.savings.withdraw(10.00)
+        self.assertEqual(first.messages, ["Low balance warning: $40.00 on account 20001."])
+        self.assertEqual(second.messages, ["Low balance warning: $40.00 on account 20001.",
+                                           "Low balance warning: $30.00 on account 20001."])
+
+    def test_unsubscribe(self):
+        """Test an unsubscribed observer receives no further events and its entry is removed."""
+        observer = RecordingObserver()
+        self.bus.subscribe(observer, 1001)
+        self.bus.unsubscribe(observer, 1001)
+        self.savings.withdraw(60.00)
+        self.assertEqual(observer.messages, [])
+        self.assertFalse(self.bus.has_subscribers(1001, LOW_BALANCE))
+
+    def test_collected_observer_is_dropped(self):
+        """Test the bus does not keep an observer alive and forgets it on the next event."""
+        observer = RecordingObserver()
+        self.bus.subscribe(observer, 1001)
+        del observer
+        gc.collect()
+        self.savings.withdraw(60.00)
+        self.assertFalse(self.bus.has_subscribers(1001, LOW_BALANCE))
+
+    def test_no_event_built_without_listeners(self):
+        """Test an account with no subscribers or observers neither builds an event nor notifies."""
+        with mock.patch("bank_account.bank_account.AccountEvent") as event, \
+                mock.patch.object(SavingsAccount, "notify") as notify:
+            self.savings.withdraw(60.00)
+        event.assert_not_called()
+        notify.assert_not_called()
+
+    def test_attached_observers_still_notified(self):
+        """Test observers attached to an account keep receiving its messages."""
+        attached = RecordingObserver()
+        subscribed = RecordingObserver()
+        self.savings.attach(attached)
+        self.bus.subscribe(subscribed, 1001)
+        self.savings.withdraw(60.00)
+        self.assertEqual(attached.messages, subscribed.messages)
+        self.assertEqual(len(attached.messages), 1)
+
+    def test_delivery_through_dispatcher(self):
+        """Test events are delivered through Subject.dispatcher when one is set."""
+        Subject.dispatcher = NotificationDispatcher()
+        self.addCleanup(setattr, Subject, "dispatcher", None)
+        self.addCleanup(Subject.dispatcher.close)
+        observer = RecordingObserver()
+        self.bus.subscribe(observer, 1001)
+        self.savings.withdraw(60.00)
+        Subject.dispatcher.drain(5)
+        self.assertEqual(observer.messages, ["Low balance warning: $40.00 on account 20001."])
+
+    def test_client_subscribes_once(self):
+        """Test a client subscribes to its own accounts' events."""
+        Client.set_email_validation_mode("offline")
+        self.addCleanup(Client.set_email_validation_mode, "full")
+        client = Client(1001, "Jane", "Doe", "jane@pixell.com")
+        client.subscribe(self.bus)
+        with mock.patch.object(Client, "update") as update:
+            self.savings.withdraw(60.00)
+            self.chequing.withdraw(60.00)
+        self.assertEqual(update.call_count, 2)
+        client.unsubscribe(self.bus)
+        self.assertFalse(self.bus.has_subscribers(1001, LOW_BALANCE))
+
+
+if __name__ == '__main__':
+    unittest.main()
@@ -0,0 +1,174 @@
+"""
+Description: Unit tests for the data loading and updating functions in manage_data.
+Author: Sukhtab Singh Warya
+Date: 18/10/2026
+"""
+
+import multiprocessing
+import os
+import shutil
+import tempfile
+import unittest
+from user_interface import manage_data
+from bank_account import ChequingAccount, SavingsAccount, InvestmentAccount
+from bank_account.cents_account import CentsChequingAccount, CentsSavingsAccount
+
+ACCOUNTS_HEADER = "account_number,client_number,balance,date_created,account_type,overdraft_limit,overdraft_rate,minimum_balance,management_fee\n"
+
+ACCOUNT_ROWS = [
+    "20001,1001,15300.0,2023-01-10,ChequingAccount,-50,0.035,Null,Null\n",
+    "20002,1001,301.54,2023-01-15,SavingsAccount,Null,Null,50,Null\n",
+    "20004,1002,4500.87,2023-02-05,InvestmentAccount,Null,Null,Null,5\n",
+    "20097,1009,ten,2023-09-10,SavingsAccount,Null,Null,50,Null\n",
+    "20099,1002,6764.67,2023-10-01,InvestmentAccoun,Null,Null,Null,3\n",
+    "20100,9999,4109.99,2023-10-05,SavingsAccount,Null,Null,100,Null\n",
+]
+
+
+def build_credit_account(*values):
+    """Builds an account of a registered type; defined at module level so that worker processes can import it."""
+    return manage_data._build_savings_account(*values)
+
+
+class TestManageData(unittest.TestCase):
+
+    def setUp(self):
+        """Write a small accounts file to a temporary directory."""
+        self.directory = tempfile.mkdtemp()
+        self.accounts_path = os.path.join(self.directory, "accounts.csv")
+        with open(self.accounts_path, "w", newline="") as file:
+            file.write(ACCOUNTS_HEADER)
+            file.writelines(ACCOUNT_ROWS)
+
+    def tearDown(self):
+        shutil.rmtree(self.directory)
+
+    def test_iter_accounts_yields_valid_accounts(self):
+        """Test iter_accounts yields each valid account with the right type."""
+        with self.assertLogs(level="ERROR"):
+            accounts = list(manage_data.iter_accounts({1001, 1002}, self.accounts_path))
+        self.assertEqual([account.account_number for account in accounts], [20001, 20002, 20004])
+        self.assertIsInstance(accounts[0], ChequingAccount)
+        self.assertIsInstance(accounts[1], SavingsAccount)
+        self.assertIsInstance(accounts[2], InvestmentAccount)
+        self.assertEqual(accounts[1].balance, 301.54)
+
+    def test_iter_accounts_logs_rejected_rows(self):
+        """Test iter_accounts logs the same errors as load_data for rejected rows."""
+        with self.assertLogs(level="ERROR") as logs:
+            list(manage_data.iter_accounts({1001, 1002}, self.accounts_path))
+        self.assertEqual(logs.output, [
+            "ERROR:root:Unable to create bank account: could not convert string to float: 'ten'",
+            "ERROR:root:Invalid account type for account 20099: InvestmentAccoun",
+            "ERROR:root:Bank Account: 20100 contains invalid Client Number: 9999",
+        ])
+
+    def test_iter_accounts_without_client_numbers(self):
+        """Test iter_accounts skips the client number check when no client numbers are given."""
+        with self.assertLogs(level="ERROR"):
+            accounts = list(manage_data.iter_accounts(accounts_path=self.accounts_path))
+        self.assertEqual([account.account_number for account in accounts], [20001, 20002, 20004, 20100])
+
+    def test_iter_accounts_chunked(self):
+        """Test iter_accounts_chunked groups accounts into lists of the requested size."""
+        with self.assertLogs(level="ERROR"):
+            chunks = list(manage_data.iter_accounts_chunked(2, {1001, 1002}, self.accounts_path))
+        self.assertEqual([[account.account_number for account in chunk] for chunk in chunks], [[20001, 20002], [20004]])
+
+    def test_iter_accounts_chunked_invalid_chunk_size(self):
+        """Test iter_accounts_chunked raises ValueError when chunk size is less than 1."""
+        with self.assertRaises(ValueError):
+            next(manage_data.iter_accounts_chunked(0, None, self.accounts_path))
+
+    def test_iter_accounts_missing_file(self):
+        """Test iter_accounts logs an error when the file does not exist."""
+        with self.assertLogs(level="ERROR") as logs:
+            accounts = list(manage_data.iter_accounts(None, os.path.join(self.directory, "missing.csv")))
+        self.assertEqual(accounts, [])
+        self.assertEqual(logs.output, ["ERROR:root:accounts.csv file not found"])
+
+    def test_update_accounts_writes_all_balances_in_one_pass(self):
+        """Test update_accounts updates the balance of every given account."""
+        with self.assertLogs(level="ERROR"):
+            accounts = list(manage_data.iter_accounts({1001, 1002}, self.accounts_path))
+        accounts[0].withdraw(300.00)
+        accounts[2].deposit(99.13)
+        manage_data.update_accounts([accounts[0], accounts[2]], accounts_path=self.accounts_path)
+
+        with self.assertLogs(level="ERROR"):
+            balances = [account.balance for account in manage_data.iter_accounts({1001, 1002}, self.accounts_path)]
+        self.assertEqual(balances, [15000.00, 301.54, 4600.00])
+
+    def test_iter_accounts_parallel_matches_serial(self):
+        """Test the parallel loader yields the same accounts and errors as the serial loader."""
+        with open(self.accounts_path, "a", newline="") as file:
+            file.writelines(row.replace("200", "210", 1) for row in ACCOUNT_ROWS * 5)
+
+        with self.assertLogs(level="ERROR") as serial_logs:
+            serial = list(manage_data.iter_accounts({1001, 1002}, self.accounts_path))
+        for workers in (1, 3, 50):
+            with self.assertLogs(level="ERROR") as parallel_logs:
+                parallel = list(manage_data.iter_accounts_parallel({1001, 1002}, self.accounts_path, workers))
+            self.assertEqual([str(account) for account in parallel], [str(account) for account in serial])
+            self.assertEqual(parallel_logs.output, serial_logs.output)
+
+    def test_iter_accounts_parallel_quoted_fields(self):
+        """Test the parallel loader falls back to the serial loader for quoted fields."""
+        with open(self.accounts_path, "a", newline="") as file:
+            file.write('"20200",1001,1.00,2023-01-15,SavingsAccount,Null,Null,50,Null\n')
+        with self.assertLogs(level="ERROR"):
+            accounts = list(manage_data.iter_accounts_parallel({1001, 1002}, self.accounts_path, 2))
+        self.assertEqual([account.account_number for account in accounts], [20001, 20002, 20004, 20200])
+
+    def test_iter_accounts_parallel_spawned_workers(self):
+        """Test spawned workers build the registered account types with the selected money engine."""
+        with open(self.accounts_path, "a", newline="") as file:
+            file.write("20300,1001,25.00,2023-01-15,CreditAccount,Null,Null,50,Null\n")
+        manage_data.register_account_type("CreditAccount", build_credit_account)
+        self.addCleanup(manage_data.ACCOUNT_TYPES.pop, "CreditAccount")
+        manage_data.set_money_engine("cents")
+        self.addCleanup(manage_data.set_money_engine, "float")
+
+        with self.assertLogs(level="ERROR") as logs:
+            accounts = list(manage_data.iter_accounts_parallel({1001, 1002}, self.accounts_path, 2,
+                                                               multiprocessing.get_context("spawn")))
+        self.assertEqual([account.account_number for account in accounts], [20001, 20002, 20004, 20300])
+        self.assertIsInstance(accounts[0], CentsChequingAccount)
+        self.assertIsInstance(accounts[3], CentsSavingsAccount)
+        self.assertEqual(accounts[3].cents, 2500)
+        self.assertFalse(any("CreditAccount" in message for message in logs.output))
+
+    def test_iter_accounts_parallel_missing_file(self):
+        """Test the parallel loader logs an error when the file does not exist."""
+        with self.assertLogs(level="ERROR") as logs:
+            accounts = list(manage_data.iter_accounts_parallel(None, os.path.join(self.directory, "missing.csv"), 2))
+        self.assertEqual(accounts, [])
+        self.assertEqual(logs.output, ["ERROR:root:accounts.csv file not found"])
+
+    def test_load_accounts_lazy(self):
+        """Test load_accounts_lazy only builds accounts when they are accessed."""
+        with self.assertLogs(level="ERROR") as logs:
+            accounts = manage_data.load_accounts_lazy({1001, 1002, 1009}, self.accounts_path)
+        self.assertEqual(logs.output, [
+            "ERROR:root:Invalid account type for account 20099: InvestmentAccoun",
+            "ERROR:root:Bank Account: 20100 contains invalid Client Number: 9999",
+        ])
+        self.assertEqual(list(accounts), [20001, 20002, 20004, 20097])
+        self.assertEqual(accounts.materialized, 0)
+
+        self.assertEqual([account.account_number for account in accounts.for_client(1001)], [20001, 20002])
+        self.assertEqual(accounts.materialized, 2)
+        self.assertIsInstance(accounts[20004], InvestmentAccount)
+        self.assertEqual(accounts[20004].balance, 4500.87)
+
+    def test_load_accounts_lazy_invalid_row_fails_on_access(self):
+        """Test a row with an invalid field is logged and dropped when it is first accessed."""
+        with self.assertLogs(level="ERROR"):
+            accounts = manage_data.load_accounts_lazy({1001, 1002, 1009}, self.accounts_path)
+        with self.assertLogs(level="ERROR") as logs:
+            self.assertEqual(accounts.for_client(1009), [])
+        self.assertEqual(logs.output, ["ERROR:root:Unable to create bank account: could not convert string to float: 'ten'"])
+        self.assertNotIn(20097, accounts)
+
+if __name__ == '__main__':
+    unittest.main()
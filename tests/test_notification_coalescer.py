@@ -0,0 +1,138 @@
+"""
+Description: Unit tests for the NotificationCoalescer class.
+Author: Sukhtab Singh Warya
+Date: 18/10/2026
+"""
+
+import gc
+import time
+import unittest
+import weakref
+from datetime import date
+from unittest import mock
+from bank_account import ChequingAccount, SavingsAccount
+from client.client import Client
+from patterns.observer.notification_coalescer import NotificationCoalescer, alert_key, digest_message
+
+
+class FakeClock:
+    def __init__(self):
+        self.now = 0.0
+
+    def __call__(self):
+        return self.now
+
+
+class TestNotificationCoalescer(unittest.TestCase):
+
+    def setUp(self):
+        self.clock = FakeClock()
+        self.client = mock.Mock()
+        self.coalescer = NotificationCoalescer(self.client, suppression_window=60.0, digest_delay=None,
+                                               clock=self.clock)
+        self.addCleanup(self.coalescer.close)
+        self.savings = SavingsAccount(20001, 1001, 100.00, date.today(), 50.00, None)
+        self.chequing = ChequingAccount(20002, 1001, 100.00, date.today(), -100.00, 0.05)
+        self.savings.attach(self.coalescer)
+        self.chequing.attach(self.coalescer)
+
+    def test_alert_key(self):
+        """Test alerts are identified by kind and account, other messages by their text."""
+        self.assertEqual(alert_key("Low balance warning: $10.00 on account 20001."),
+                         ("Low balance warning", "20001"))
+        self.assertEqual(alert_key("Large transaction: $20000.00 on account 20001."),
+                         ("Large transaction", "20001"))
+        self.assertEqual(alert_key("Statement ready"), ("Statement ready", ""))
+
+    def test_single_alert_is_passed_on_unchanged(self):
+        """Test a digest of one alert is the alert itself."""
+        self.savings.withdraw(60.00)
+        self.assertEqual(self.coalescer.flush(), 1)
+        self.client.update.assert_called_once_with("Low balance warning: $40.00 on account 20001.")
+
+    def test_repeated_alerts_are_suppressed(self):
+        """Test repeated alerts on one account within the window become one alert and a count."""
+        self.savings.withdraw(55.00)
+        for _ in range(4):
+            self.savings.withdraw(5.00)
+        self.coalescer.flush()
+
+        self.assertEqual(self.coalescer.suppressed, 4)
+        self.client.update.assert_called_once_with(
+            "1 alert (4 repeated alerts suppressed):\n- Low balance warning: $45.00 on account 20001.")
+
+    def test_digest_covers_all_client_accounts(self):
+        """Test alerts from several accounts of a client reach the client as one digest."""
+        self.savings.withdraw(60.00)
+        self.chequing.withdraw(80.00)
+        self.chequing.deposit(20000.00)
+        self.assertEqual(self.coalescer.flush(), 3)
+        self.client.update.assert_called_once_with(digest_message([
+            "Low balance warning: $40.00 on account 20001.",
+            "Low balance warning: $20.00 on account 20002.",
+            "Large transaction: $20000.00 on account 20002.",
+        ]))
+        self.assertEqual(self.coalescer.digests, 1)
+
+    def test_alert_repeats_after_window(self):
+        """Test an alert is delivered again once the suppression window has passed."""
+        self.savings.withdraw(60.00)
+        self.coalescer.flush()
+        self.clock.now = 59.0
+        self.savings.withdraw(1.00)
+        self.clock.now = 61.0
+        self.savings.withdraw(1.00)
+        self.coalescer.flush()
+
+        self.assertEqual(self.client.update.call_args_list[1].args[0],
+                         "Low balance warning: $38.00 on account 20001.")
+        self.assertEqual(self.coalescer.suppressed, 1)
+
+    def test_suppressed_repeat_without_digest_is_not_carried_over(self):
+        """Test a repeat suppressed after its digest was sent is not reported in an unrelated later digest."""
+        self.savings.withdraw(60.00)
+        self.coalescer.flush()
+        self.savings.withdraw(1.00)
+        self.chequing.deposit(20000.00)
+        self.coalescer.flush()
+
+        self.assertEqual(self.coalescer.suppressed, 1)
+        self.client.update.assert_called_with("Large transaction: $20000.00 on account 20002.")
+
+    def test_unused_coalescer_is_released(self):
+        """Test a coalescer that is no longer referenced can be garbage collected."""
+        coalescer = NotificationCoalescer(mock.Mock(), digest_delay=None)
+        reference = weakref.ref(coalescer)
+        del coalescer
+        gc.collect()
+        self.assertIsNone(reference())
+
+    def test_digest_delay(self):
+        """Test a digest is sent digest_delay seconds after the first alert."""
+        coalescer = NotificationCoalescer(self.client, digest_delay=0.05)
+        self.addCleanup(coalescer.close)
+        coalescer.update("Low balance warning: $10.00 on account 20003.")
+        deadline = time.monotonic() + 5
+        while coalescer.pending and time.monotonic() < deadline:
+            time.sleep(0.01)
+        self.client.update.assert_called_once_with("Low balance warning: $10.00 on account 20003.")
+
+    def test_client_receives_one_email(self):
+        """Test a burst of transactions on a client's accounts costs the client one email."""
+        Client.set_email_validation_mode("offline")
+        self.addCleanup(Client.set_email_validation_mode, "full")
+        outbox = mock.Mock()
+        coalescer = NotificationCoalescer(Client(1001, "Jane", "Doe", "jane@pixell.com"), digest_delay=None)
+        self.savings.detach(self.coalescer)
+        self.savings.attach(coalescer)
+        with mock.patch("client.client.shared_outbox", return_value=outbox):
+            self.savings.withdraw(60.00)
+            for _ in range(9):
+                self.savings.withdraw(1.00)
+            coalescer.close()
+        outbox.send.assert_called_once()
+        self.assertIn("9 repeated alerts suppressed", outbox.send.call_args.args[2])
+
+
+if __name__ == '__main__':
+    unittest.main()
@@ -0,0 +1,166 @@
+"""
+Description: Unit tests for the NotificationDispatcher class.
+Author: Sukhtab Singh Warya
+Date: 18/10/2026
+"""
+
+import threading
+import time
+import unittest
+from datetime import date
+from bank_account.savings_account import SavingsAccount
+from patterns.observer.observer import Observer
+from patterns.observer.subject import Subject
+from patterns.observer.notification_dispatcher import NotificationDispatcher
+from tests.helpers import RecordingObserver
+
+
+class FailingObserver(Observer):
+    def update(self, message):
+        raise RuntimeError("Mail server unavailable")
+
+
+class TestNotificationDispatcher(unittest.TestCase):
+
+    def setUp(self):
+        self.gate = threading.Event()
+
+    def tearDown(self):
+        self.gate.set()
+        Subject.dispatcher = None
+
+    def blocked_dispatcher(self, capacity, policy):
+        """Returns a dispatcher whose worker is held delivering a first message and an observer of it."""
+        dispatcher = NotificationDispatcher(capacity, policy)
+        observer = RecordingObserver(self.gate)
+        dispatcher.submit([observer], "first")
+        while dispatcher.pending != 1 or len(dispatcher._queue):
+            time.sleep(0.001)
+        self.addCleanup(dispatcher.close)
+        return dispatcher, observer
+
+    def test_invalid_arguments(self):
+        """Test the dispatcher rejects a capacity below one and an unknown policy."""
+        with self.assertRaises(ValueError):
+            NotificationDispatcher(0)
+        with self.assertRaises(ValueError):
+            NotificationDispatcher(10, "retry")
+
+    def test_subject_notifies_through_dispatcher(self):
+        """Test a subject delivers notifications in order from the worker thread once drained."""
+        Subject.dispatcher = NotificationDispatcher()
+        self.addCleanup(Subject.dispatcher.close)
+        account = SavingsAccount(26350095, 4008, 1400.00, date.today(), 50.00, None)
+        observer = RecordingObserver()
+        account.attach(observer)
+
+        account.withdraw(1390.00)
+        account.withdraw(5.00)
+        self.assertTrue(Subject.dispatcher.drain(5))
+
+        self.assertEqual(observer.messages, ["Low balance warning: $10.00 on account 26350095.",
+                                             "Low balance warning: $5.00 on account 26350095."])
+        self.assertNotIn(threading.current_thread(), observer.threads)
+        self.assertEqual(Subject.dispatcher.delivered, 2)
+
+    def test_drop_newest(self):
+        """Test a full queue discards new notifications under the drop_newest policy."""
+        dispatcher, observer = self.blocked_dispatcher(2, "drop_newest")
+        for message in ("second", "third", "fourth"):
+            dispatcher.submit([observer], message)
+        self.gate.set()
+        dispatcher.drain(5)
+        self.assertEqual(observer.messages, ["first", "second", "third"])
+        self.assertEqual(dispatcher.dropped, 1)
+
+    def test_drop_oldest(self):
+        """Test a full queue discards the oldest queued notification under the drop_oldest policy."""
+        dispatcher, observer = self.blocked_dispatcher(2, "drop_oldest")
+        for message in ("second", "third", "fourth"):
+            dispatcher.submit([observer], message)
+        self.gate.set()
+        dispatcher.drain(5)
+        self.assertEqual(observer.messages, ["first", "third", "fourth"])
+        self.assertEqual(dispatcher.dropped, 1)
+
+    def test_caller_runs(self):
+        """Test a full queue delivers on the calling thread under the caller_runs policy."""
+        dispatcher, observer = self.blocked_dispatcher(1, "caller_runs")
+        dispatcher.submit([observer], "second")
+        inline = RecordingObserver()
+        dispatcher.submit([inline], "third")
+        self.assertEqual(inline.threads, [threading.current_thread()])
+        self.gate.set()
+        dispatcher.drain(5)
+        self.assertEqual(observer.messages, ["first", "second"])
+
+    def test_block_waits_for_room(self):
+        """Test a full queue makes the caller wait under the block policy and loses nothing."""
+        dispatcher, observer = self.blocked_dispatcher(1, "block")
+        dispatcher.submit([observer], "second")
+        producer = threading.Thread(target=dispatcher.submit, args=([observer], "third"))
+        producer.start()
+        producer.join(0.05)
+        self.assertTrue(producer.is_alive())
+        self.assertFalse(dispatcher.drain(0.01))
+
+        self.gate.set()
+        producer.join(5)
+        dispatcher.drain(5)
+        self.assertEqual(observer.messages, ["first", "second", "third"])
+        self.assertEqual(dispatcher.dropped, 0)
+
+    def test_failing_observer_is_logged(self):
+        """Test an observer that raises is logged and the remaining observers are still updated."""
+        dispatcher = NotificationDispatcher()
+        self.addCleanup(dispatcher.close)
+        observer = RecordingObserver()
+        with self.assertLogs(level="ERROR") as logs:
+            dispatcher.submit([FailingObserver(), observer], "message")
+            dispatcher.drain(5)
+        self.assertEqual(observer.messages, ["message"])
+        self.assertEqual(dispatcher.failed, 1)
+        self.assertIn("Mail server unavailable", logs.output[0])
+
+    def test_close_delivers_queued_notifications(self):
+        """Test close delivers what is queued and later notifications are delivered on the calling thread."""
+        dispatcher = NotificationDispatcher()
+        observer = RecordingObserver()
+        dispatcher.submit([observer], "message")
+        dispatcher.close()
+        self.assertEqual(observer.messages, ["message"])
+        dispatcher.submit([observer], "late")
+        self.assertEqual(observer.messages, ["message", "late"])
+        self.assertEqual(observer.threads[-1], threading.current_thread())
+
+    def test_balance_update_after_close(self):
+        """Test a withdrawal notifies its observers after the dispatcher is closed, and close clears Subject.dispatcher."""
+        dispatcher = Subject.dispatcher = NotificationDispatcher()
+        dispatcher.close()
+        self.assertIsNone(Subject.dispatcher)
+
+        Subject.dispatcher = dispatcher
+        account = SavingsAccount(20002, 1001, 100.0, date.today(), 50.0, None)
+        observer = RecordingObserver()
+        account.attach(observer)
+        account.withdraw(90.0)
+        self.assertEqual(account.balance, 10.0)
+        self.assertEqual(observer.messages, ["Low balance warning: $10.00 on account 20002."])
+
+    def test_blocked_submit_delivered_when_closed(self):
+        """Test a notification waiting for room under the block policy is still delivered if the dispatcher closes."""
+        dispatcher, observer = self.blocked_dispatcher(1, "block")
+        dispatcher.submit([observer], "second")
+        producer = threading.Thread(target=dispatcher.submit, args=([observer], "third"))
+        producer.start()
+        producer.join(0.05)
+        closer = threading.Thread(target=dispatcher.close)
+        closer.start()
+        self.gate.set()
+        producer.join(5)
+        closer.join(5)
+        self.assertEqual(sorted(observer.messages), ["first", "second", "third"])
+
+
+if __name__ == '__main__':
+    unittest.main()
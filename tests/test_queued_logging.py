@@ -0,0 +1,110 @@
+"""
+Description: Unit tests for queue-based logging and the ErrorSummary class.
+Author: Sukhtab Singh Warya
+Date: 18/10/2026
+"""
+
+import logging
+import os
+import shutil
+import tempfile
+import threading
+import unittest
+from logging.handlers import QueueHandler
+from unittest import mock
+from user_interface import manage_data
+from user_interface.queued_logging import ErrorSummary, start_queue_logging, stop_queue_logging
+from client.client import Client
+
+
+class TestQueuedLogging(unittest.TestCase):
+
+    def setUp(self):
+        """Create a logger, outside the logging hierarchy, with its own file handler."""
+        self.directory = tempfile.mkdtemp()
+        self.log_path = os.path.join(self.directory, "test.log")
+        self.logger = logging.Logger("test_queued_logging")
+        self.file_handler = logging.FileHandler(self.log_path)
+        self.logger.addHandler(self.file_handler)
+
+    def tearDown(self):
+        stop_queue_logging(self.logger)
+        self.logger.removeHandler(self.file_handler)
+        self.file_handler.close()
+        shutil.rmtree(self.directory)
+
+    def read_log(self):
+        with open(self.log_path) as file:
+            return file.read()
+
+    def test_records_are_written_by_listener(self):
+        """Test records reach the original handler through the queue once the listener stops."""
+        listener = start_queue_logging(self.logger)
+        self.assertIs(start_queue_logging(self.logger), listener)
+        self.assertNotIn(self.file_handler, self.logger.handlers)
+
+        for i in range(100):
+            self.logger.error(f"Row {i} is invalid")
+        stop_queue_logging(self.logger)
+
+        self.assertEqual(self.read_log().splitlines(), [f"Row {i} is invalid" for i in range(100)])
+        self.assertEqual(self.logger.handlers, [self.file_handler])
+
+    def test_importing_manage_data_leaves_root_logger(self):
+        """Test importing manage_data does not move the root logger's handlers onto a queue."""
+        self.assertFalse(any(isinstance(handler, QueueHandler) for handler in logging.getLogger().handlers))
+
+    def test_error_summary_counts_kinds(self):
+        """Test errors differing only in numbers and quoted text are counted as one kind."""
+        with ErrorSummary("load", self.logger, max_samples=2) as summary:
+            self.logger.error("Unable to create bank account: could not convert string to float: 'ten'")
+            self.logger.error("Unable to create bank account: could not convert string to float: 'x'")
+            self.logger.error("Unable to create bank account: could not convert string to float: ''")
+            self.logger.error("Bank Account: 20100 contains invalid Client Number: 9999")
+            self.logger.warning("Not an error")
+
+        self.assertEqual(summary.total, 4)
+        self.assertEqual(summary.counts, {
+            "Unable to create bank account: could not convert string to float: ...": 3,
+            "Bank Account: ... contains invalid Client Number: ...": 1,
+        })
+        self.assertEqual(len(summary.samples["Unable to create bank account: could not convert string to float: ..."]), 2)
+        self.assertEqual(self.read_log().splitlines(), ["Not an error"] + summary.summary().splitlines())
+
+    def test_error_summary_ignores_other_threads(self):
+        """Test errors logged by another thread are not held back."""
+        with ErrorSummary("load", self.logger) as summary:
+            thread = threading.Thread(target=self.logger.error, args=("From another thread",))
+            thread.start()
+            thread.join()
+        self.assertEqual(summary.total, 0)
+        self.assertEqual(self.read_log(), "From another thread\n")
+
+    def test_load_data_logs_one_summary(self):
+        """Test load_data logs one summary for all rejected rows."""
+        Client.set_email_validation_mode("offline")
+        self.addCleanup(Client.set_email_validation_mode, "full")
+        clients_path = os.path.join(self.directory, "clients.csv")
+        accounts_path = os.path.join(self.directory, "accounts.csv")
+        with open(clients_path, "w", newline="") as file:
+            file.write("client_number,first_name,last_name,email_address\n1001,John,Doe,johndoe@pixell.com\n")
+        with open(accounts_path, "w", newline="") as file:
+            file.write("account_number,client_number,balance,date_created,account_type,"
+                       "overdraft_limit,overdraft_rate,minimum_balance,management_fee\n")
+            file.write("20001,1001,1.00,2023-01-10,SavingsAccount,Null,Null,50,Null\n")
+            for i in range(500):
+                file.write(f"{30000 + i},9999,1.00,2023-01-10,SavingsAccount,Null,Null,50,Null\n")
+
+        with mock.patch.object(manage_data, "clients_csv_path", clients_path), \
+                mock.patch.object(manage_data, "accounts_csv_path", accounts_path), \
+                self.assertLogs(level="ERROR") as logs:
+            clients, accounts = manage_data.load_data(os.path.join(self.directory, "journal.csv"), use_snapshot=False)
+
+        self.assertEqual(list(accounts), [20001])
+        self.assertEqual(len(logs.output), 1)
+        self.assertIn("load_data: 500 errors\n  500 x Bank Account: ... contains invalid Client Number: ...",
+                      logs.output[0])
+
+
+if __name__ == '__main__':
+    unittest.main()
@@ -0,0 +1,133 @@
+"""
+Description: Unit tests for the row_schema module and the compiled row parsers in manage_data.
+Author: Sukhtab Singh Warya
+Date: 18/10/2026
+"""
+
+import csv
+import io
+import os
+import shutil
+import tempfile
+import unittest
+from datetime import date, datetime
+from user_interface import manage_data
+from user_interface.row_schema import ACCOUNTS_SCHEMA, Field, RowSchema, nullable, parse_iso_date
+from client.client import Client
+
+ACCOUNTS_HEADER = "account_number,client_number,balance,date_created,account_type,overdraft_limit,overdraft_rate,minimum_balance,management_fee\n"
+ACCOUNT_ROWS = [
+    "20001,1001,15300.0,2023-01-10,ChequingAccount,-50,0.035,Null,Null\n",
+    "20002,1001,301.54,2023-01-15,SavingsAccount,Null,Null,50,Null\n",
+    "20003,1001,10.00,2023-01-15,SavingsAccount,Null,Null,50\n",
+    "\n",
+    "20004,1002,4500.87,2023-02-05,InvestmentAccount,Null,Null,Null,5\n",
+    "20005,1002,ten,2023-02-05,InvestmentAccount,Null,Null,Null,5\n",
+    "20006,1002,10.00,2023-2-5,InvestmentAccount,Null,Null,Null,5\n",
+    "20007,1002,10.00,2023-02-30,InvestmentAccount,Null,Null,Null,5\n",
+    "20008,1002,10.00,2023-02-05,CreditAccount,Null,Null,Null,Null\n",
+    "20100,1003,4109.99,2023-10-05,SavingsAccount,Null,Null,100,Null\n",
+]
+
+
+def describe(account):
+    """Return the field values of an account, for comparing accounts built by different parsers."""
+    names = [name for cls in type(account).__mro__ for name in getattr(cls, "__slots__", ())]
+    return type(account), {name: getattr(account, name) for name in names
+                           if isinstance(getattr(account, name), (int, float, str, date, type(None)))}
+
+
+class TestRowSchema(unittest.TestCase):
+
+    def test_parse_iso_date_matches_strptime(self):
+        """Test parse_iso_date accepts and rejects the same text as strptime."""
+        for text in ("2023-01-10", "1999-12-31", "2024-02-29", "2023-1-5", "0023-01-10", "20230915",
+                     "2023-02-30", "2023-13-01", "2023-01-1x", "２０２３-01-10", "", None):
+            try:
+                expected = datetime.strptime(text, "%Y-%m-%d").date()
+            except Exception as e:
+                with self.assertRaises(type(e)) as raised:
+                    parse_iso_date(text)
+                self.assertEqual(str(raised.exception), str(e))
+            else:
+                self.assertEqual(parse_iso_date(text), expected)
+
+    def test_compiled_converter_follows_dict_reader(self):
+        """Test short rows, extra columns and repeated columns convert as csv.DictReader rows do."""
+        schema = RowSchema((Field("a", int), Field("b"), Field("c", nullable(float))))
+        header = ["c", "a", "b", "a"]
+        convert = schema.compile(header)
+        for row in (["1.5", "9", "x", "2"], ["Null", "9", "x", "2", "extra"], ["1.5", "9", "x"]):
+            dict_row = next(csv.DictReader([",".join(row)], fieldnames=header))
+            try:
+                expected = schema.convert_mapping(dict_row)
+            except Exception as e:
+                with self.assertRaises(type(e)):
+                    convert(row)
+            else:
+                self.assertEqual(convert(row), expected)
+
+    def test_missing_column_raises_key_error(self):
+        """Test a field missing from the header fails with the KeyError a csv.DictReader row raises."""
+        convert = ACCOUNTS_SCHEMA.compile(["account_number", "client_number"])
+        with self.assertRaises(KeyError) as raised:
+            convert(["20001", "1001"])
+        self.assertEqual(raised.exception.args, ("balance",))
+
+
+class TestCompiledParsers(unittest.TestCase):
+
+    def setUp(self):
+        Client.set_email_validation_mode("offline")
+        self.directory = tempfile.mkdtemp()
+        self.accounts_path = os.path.join(self.directory, "accounts.csv")
+        with open(self.accounts_path, "w", newline="") as file:
+            file.write(ACCOUNTS_HEADER)
+            file.writelines(ACCOUNT_ROWS)
+
+    def tearDown(self):
+        Client.set_email_validation_mode("full")
+        shutil.rmtree(self.directory)
+
+    def test_iter_accounts_matches_dict_rows(self):
+        """Test iter_accounts builds the same accounts and logs the same errors as building from DictReader rows."""
+        expected, expected_errors = [], []
+        for row in csv.DictReader(io.StringIO(ACCOUNTS_HEADER + "".join(ACCOUNT_ROWS))):
+            try:
+                account = manage_data._create_account(row, expected_errors.append)
+            except Exception as e:
+                expected_errors.append(f"Unable to create bank account: {e}")
+                continue
+            if account is not None and account.client_number not in (1001, 1002):
+                expected_errors.append(f"Bank Account: {account.account_number} contains invalid "
+                                       f"Client Number: {account.client_number}")
+            elif account is not None:
+                expected.append(account)
+
+        with self.assertLogs(level="ERROR") as logs:
+            accounts = list(manage_data.iter_accounts({1001, 1002}, self.accounts_path))
+
+        self.assertEqual([account.account_number for account in accounts], [20001, 20002, 20004, 20006])
+        self.assertEqual([describe(account) for account in accounts], [describe(account) for account in expected])
+        self.assertEqual([line.split(":", 2)[2] for line in logs.output], expected_errors)
+        self.assertIn("Invalid account type for account 20008: CreditAccount", expected_errors)
+
+    def test_registered_account_type(self):
+        """Test an account type added with register_account_type is built from accounts.csv."""
+        built = []
+
+        def build_credit_account(*values):
+            built.append(values)
+            return manage_data._build_savings_account(*values)
+
+        manage_data.register_account_type("CreditAccount", build_credit_account)
+        self.addCleanup(manage_data.ACCOUNT_TYPES.pop, "CreditAccount")
+        with self.assertLogs(level="ERROR"):
+            accounts = list(manage_data.iter_accounts({1001, 1002}, self.accounts_path))
+
+        self.assertEqual([account.account_number for account in accounts], [20001, 20002, 20004, 20006, 20008])
+        self.assertEqual(len(built), 1)
+
+
+if __name__ == '__main__':
+    unittest.main()
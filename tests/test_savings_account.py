@@ -6,6 +6,7 @@ Date: 06/10/2024
 
 
 import unittest
+from unittest import mock
 from bank_account.savings_account import SavingsAccount
 from datetime import date
 
@@ -51,5 +52,21 @@ class TestSavingsAccount(unittest.TestCase):
                         "Minimum Balance: $50.00 Account Type: Savings")
         self.assertEqual(str(self.account_valid), expected_str)
 
+    def test_attributes_use_slots(self):
+        """Test the account keeps its attributes in slots rather than an instance dictionary."""
+        self.assertFalse(hasattr(self.account_valid, "__dict__"))
+        with self.assertRaises(AttributeError):
+            self.account_valid.unknown_attribute = 1
+
+    def test_observer_list_created_on_attach(self):
+        """Test the observer list is only allocated when the first observer is attached."""
+        self.assertIsNone(self.account_valid._observers)
+        observer = mock.Mock()
+        self.account_valid.attach(observer)
+        self.account_valid.withdraw(1390.00)
+        observer.update.assert_called_once_with("Low balance warning: $10.00 on account 26350095.")
+        self.account_valid.detach(observer)
+        self.assertEqual(self.account_valid._observers, [])
+
 if __name__ == '__main__':
     unittest.main()
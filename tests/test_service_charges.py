@@ -0,0 +1,78 @@
+"""
+Description: Unit tests for the batch service charge methods and portfolio_service_charges.
+Author: Sukhtab Singh Warya
+Date: 18/10/2026
+"""
+
+import unittest
+from datetime import date, timedelta
+from unittest import mock
+from bank_account import ChequingAccount, SavingsAccount, InvestmentAccount
+from patterns.strategy import service_charge_strategy, overdraft_strategy, minimum_balance_strategy, \
+    management_fee_strategy
+from tests.helpers import make_accounts
+from user_interface.account_store import AccountStore
+from user_interface.service_charges import portfolio_service_charges
+
+BALANCES = [-250.0, -100.0, -99.99, -0.01, 0.0, 49.99, 50.0, 50.01, 1200.0]
+TODAY = date.today()
+DATES = [TODAY, TODAY - timedelta(days=3652), TODAY - timedelta(days=3653), date(2000, 1, 1)]
+
+ACCOUNTS = [row for i, balance in enumerate(BALANCES) for row in (
+    (ChequingAccount, 20000 + i, 1001, balance, TODAY, -100.0 if i % 2 else -50.0, 0.05),
+    (SavingsAccount, 21000 + i, 1001, balance, TODAY, 50.0 if i % 2 else 100.0, None),
+)] + [(InvestmentAccount, 22000 + i, 1002, 100.0, created, 2.55 if i % 2 else 5.0, None)
+      for i, created in enumerate(DATES)]
+
+
+class TestServiceCharges(unittest.TestCase):
+
+    def test_strategy_batches_match_single_calls(self):
+        """Test every strategy's batch method returns what it returns for one balance at a time."""
+        strategies = [
+            service_charge_strategy.OverdraftStrategy(-100.0, 0.50),
+            service_charge_strategy.MinimumBalanceStrategy(50.0, 5.0),
+            overdraft_strategy.OverdraftStrategy(100.0, 25.0),
+            minimum_balance_strategy.MinimumBalanceStrategy(50.0, 5.0),
+        ]
+        for strategy in strategies:
+            with self.subTest(strategy=type(strategy).__module__):
+                self.assertEqual(list(strategy.calculate_service_charges_batch(BALANCES)),
+                                 [strategy.calculate_service_charges(balance) for balance in BALANCES])
+
+    def test_management_fee_batches_use_creation_dates(self):
+        """Test management fee batches charge half the fee for accounts created before ten years ago."""
+        for module in (service_charge_strategy, management_fee_strategy):
+            with self.subTest(module=module.__name__):
+                strategy = module.ManagementFeeStrategy(3.0, TODAY)
+                self.assertEqual(list(strategy.calculate_service_charges_batch([0.0] * 2)), [3.0, 3.0])
+                expected = [module.ManagementFeeStrategy(3.0, created).calculate_service_charges(0.0)
+                            for created in DATES]
+                self.assertEqual(list(strategy.calculate_service_charges_batch([0.0] * 4, DATES)), expected)
+
+    def test_portfolio_matches_get_service_charges(self):
+        """Test the portfolio charges equal each account's own get_service_charges."""
+        accounts = make_accounts(ACCOUNTS)
+        expected = {account.account_number: account.get_service_charges() for account in accounts}
+        self.assertEqual(portfolio_service_charges(accounts), expected)
+        self.assertEqual(portfolio_service_charges(AccountStore(accounts)), expected)
+        self.assertEqual(portfolio_service_charges(AccountStore(accounts, use_numpy=False)), expected)
+
+    def test_portfolio_without_numpy(self):
+        """Test batch methods fall back to lists when NumPy is not installed."""
+        accounts = make_accounts(ACCOUNTS)
+        expected = {account.account_number: account.get_service_charges() for account in accounts}
+        with mock.patch.object(service_charge_strategy, "numpy", None), \
+                mock.patch("bank_account.savings_account.numpy", None), \
+                mock.patch("bank_account.investment_account.numpy", None):
+            self.assertEqual(portfolio_service_charges(accounts), expected)
+
+    def test_account_with_replaced_strategy_is_charged_alone(self):
+        """Test an account whose strategy a batch call cannot reproduce is charged by its own method."""
+        account = ChequingAccount(20100, 1001, -10.0, TODAY, -100.0, 0.05)
+        account.service_charge_strategy = overdraft_strategy.OverdraftStrategy(100.0, 25.0)
+        self.assertEqual(portfolio_service_charges([account]), {20100: 25.0})
+
+
+if __name__ == '__main__':
+    unittest.main()
@@ -0,0 +1,192 @@
+"""
+Description: Unit tests for the TransactionJournal class.
+Author: Sukhtab Singh Warya
+Date: 18/10/2026
+"""
+
+import os
+import shutil
+import tempfile
+import unittest
+from unittest import mock
+from bank_account import BankAccount, ChequingAccount
+from client.client import Client
+from user_interface import manage_data
+from user_interface.transaction_journal import TransactionJournal, JournalInUseError, read_journal, replay_journal
+from datetime import date, datetime
+
+ACCOUNTS = (
+    "account_number,client_number,balance,date_created,account_type,overdraft_limit,overdraft_rate,minimum_balance,management_fee\n"
+    "20001,1001,15300.0,2023-01-10,ChequingAccount,-50,0.035,Null,Null\n"
+    "20002,1001,301.54,2023-01-15,SavingsAccount,Null,Null,50,Null\n"
+)
+
+
+class TestTransactionJournal(unittest.TestCase):
+
+    def setUp(self):
+        """Create a journal in a temporary directory."""
+        self.directory = tempfile.mkdtemp()
+        self.journal_path = os.path.join(self.directory, "journal.csv")
+        self.journal = TransactionJournal(self.journal_path, fsync_every=2, compaction_threshold=3)
+
+    def tearDown(self):
+        self.journal.close()
+        BankAccount.transaction_journal = None
+        shutil.rmtree(self.directory)
+
+    def test_append_and_replay(self):
+        """Test replay_journal returns the last recorded balance of each account."""
+        self.journal.append(20001, -300.0, 15000.0)
+        self.journal.append(20002, 50.0, 351.54)
+        self.journal.append(20001, 25.5, 15025.5)
+        entries = list(read_journal(self.journal_path))
+        self.assertEqual([entry[:4] for entry in entries], [
+            (20001, "withdraw", 300.0, 15000.0),
+            (20002, "deposit", 50.0, 351.54),
+            (20001, "deposit", 25.5, 15025.5),
+        ])
+        self.assertEqual(replay_journal(self.journal_path), {20001: 15025.5, 20002: 351.54})
+
+    def test_bank_account_records_transactions(self):
+        """Test deposits and withdrawals are journaled through update_balance."""
+        BankAccount.transaction_journal = self.journal
+        account = ChequingAccount(20001, 1001, 1000.00, date.today(), -50, 0.035)
+        account.deposit(200.00)
+        account.withdraw(450.00)
+        self.assertEqual([entry[:4] for entry in read_journal(self.journal_path)], [
+            (20001, "deposit", 200.0, 1200.0),
+            (20001, "withdraw", 450.0, 750.0),
+        ])
+
+    def test_partial_last_line_is_ignored(self):
+        """Test a line cut short by a crash is ignored and removed on reopening."""
+        self.journal.append(20001, -300.0, 15000.0)
+        self.journal.close()
+        with open(self.journal_path, "a") as file:
+            file.write("20002,depo")
+        self.assertEqual(replay_journal(self.journal_path), {20001: 15000.0})
+
+        self.journal = TransactionJournal(self.journal_path)
+        self.journal.append(20002, 50.0, 351.54)
+        self.assertEqual(replay_journal(self.journal_path), {20001: 15000.0, 20002: 351.54})
+
+    def test_needs_compaction(self):
+        """Test needs_compaction becomes True at the compaction threshold."""
+        self.journal.append(20001, 1.0, 1.0)
+        self.journal.append(20001, 1.0, 2.0)
+        self.assertFalse(self.journal.needs_compaction)
+        self.journal.append(20001, 1.0, 3.0)
+        self.assertTrue(self.journal.needs_compaction)
+
+    def test_compact_journal_folds_into_accounts(self):
+        """Test compact_journal writes journaled balances to accounts.csv and empties the journal."""
+        accounts_path = os.path.join(self.directory, "accounts.csv")
+        with open(accounts_path, "w", newline="") as file:
+            file.write(ACCOUNTS)
+        self.journal.append(20002, 50.0, 351.54)
+        self.journal.append(20002, -1.54, 350.0)
+
+        self.assertEqual(manage_data.compact_journal(self.journal, accounts_path=accounts_path), 1)
+        self.assertEqual(replay_journal(self.journal_path), {})
+        self.assertFalse(self.journal.needs_compaction)
+        balances = [account.balance for account in manage_data.iter_accounts(accounts_path=accounts_path)]
+        self.assertEqual(balances, [15300.0, 350.0])
+
+    def write_stale_journal(self, accounts_path):
+        """Writes a journal with lines recorded before, at and after the last write of accounts.csv."""
+        journal_path = os.path.join(self.directory, "stale.csv")
+        with open(journal_path, "w", newline="") as file:
+            file.write("20001,withdraw,300.0,15000.0,2026-10-18T10:00:00.000\n"
+                       "20002,deposit,50.0,351.54,2026-10-18T10:00:01.000\n"
+                       "20001,deposit,1.0,15001.0,2026-10-18T09:59:59.999\n")
+        written = datetime(2026, 10, 18, 10, 0, 1).timestamp()
+        os.utime(accounts_path, (written, written))
+        return journal_path
+
+    def test_replay_skips_lines_older_than_accounts_file(self):
+        """Test replay_journal skips lines recorded before accounts.csv was last written."""
+        accounts_path = os.path.join(self.directory, "accounts.csv")
+        with open(accounts_path, "w", newline="") as file:
+            file.write(ACCOUNTS)
+        journal_path = self.write_stale_journal(accounts_path)
+
+        self.assertEqual(replay_journal(journal_path), {20001: 15000.0, 20002: 351.54})
+        self.assertEqual(replay_journal(journal_path, accounts_path), {20002: 351.54})
+        self.assertEqual(replay_journal(journal_path, os.path.join(self.directory, "missing.csv")),
+                         {20001: 15000.0, 20002: 351.54})
+
+    def test_load_data_keeps_later_writes_of_accounts_file(self):
+        """Test load_data and compact_journal keep a balance written to accounts.csv after it was journaled."""
+        accounts_path = os.path.join(self.directory, "accounts.csv")
+        clients_path = os.path.join(self.directory, "clients.csv")
+        with open(accounts_path, "w", newline="") as file:
+            file.write(ACCOUNTS)
+        with open(clients_path, "w", newline="") as file:
+            file.write("client_number,first_name,last_name,email_address\n1001,John,Doe,johndoe@pixell.com\n")
+        journal_path = self.write_stale_journal(accounts_path)
+
+        Client.set_email_validation_mode("offline")
+        self.addCleanup(Client.set_email_validation_mode, "full")
+        with mock.patch.object(manage_data, "clients_csv_path", clients_path), \
+                mock.patch.object(manage_data, "accounts_csv_path", accounts_path):
+            accounts = manage_data.load_data(journal_path, use_snapshot=False)[1]
+        self.assertEqual((accounts[20001].balance, accounts[20002].balance), (15300.0, 351.54))
+
+        journal = TransactionJournal(journal_path)
+        self.addCleanup(journal.close)
+        self.assertEqual(manage_data.compact_journal(journal, accounts_path=accounts_path), 1)
+        balances = [account.balance for account in manage_data.iter_accounts(accounts_path=accounts_path)]
+        self.assertEqual(balances, [15300.0, 351.54])
+
+    def test_default_syncs_in_groups(self):
+        """Test the default journal writes every line at once but calls fsync once per group of appends."""
+        journal = TransactionJournal(os.path.join(self.directory, "grouped.csv"))
+        self.addCleanup(journal.close)
+        with mock.patch.object(os, "fsync") as fsync:
+            for _ in range(64):
+                journal.append(20001, 1.0, 100.0)
+        self.assertEqual(fsync.call_count, 2)
+        self.assertEqual(len(list(read_journal(journal.journal_path))), 64)
+
+    def test_journal_belongs_to_one_journal_at_a_time(self):
+        """Test an open journal file cannot be opened again, and claim moves on to a numbered journal."""
+        with self.assertRaises(JournalInUseError):
+            TransactionJournal(self.journal_path)
+        journal = TransactionJournal.claim(self.journal_path)
+        self.addCleanup(journal.close)
+        self.assertEqual(journal.journal_path, os.path.join(self.directory, "journal.1.csv"))
+
+        self.journal.append(20001, 1.0, 100.0)
+        journal.append(20002, 1.0, 200.0)
+        self.assertEqual(replay_journal(self.journal_path), {20001: 100.0})
+        self.assertEqual(replay_journal(journal.journal_path), {20002: 200.0})
+
+    def test_claim_adopts_journals_of_stopped_processes(self):
+        """Test claim moves the lines of unclaimed numbered journals into the claimed one, newest balance winning."""
+        stopped = TransactionJournal(os.path.join(self.directory, "journal.2.csv"))
+        stopped.append(20001, 1.0, 100.0)
+        stopped.append(20002, 1.0, 200.0)
+        stopped.close()
+        running = TransactionJournal(os.path.join(self.directory, "journal.1.csv"))
+        self.addCleanup(running.close)
+        running.append(20003, 1.0, 300.0)
+        self.journal.close()
+        with open(self.journal_path, "w") as file:
+            file.write("20001,deposit,1.0,150.0,2999-01-01T00:00:00.000\n")
+
+        self.journal = TransactionJournal.claim(self.journal_path)
+        self.assertEqual(self.journal.journal_path, self.journal_path)
+        self.assertEqual(replay_journal(self.journal_path), {20001: 150.0, 20002: 200.0})
+        self.assertFalse(os.path.exists(os.path.join(self.directory, "journal.2.csv")))
+        self.assertEqual(replay_journal(running.journal_path), {20003: 300.0})
+
+    def test_invalid_settings(self):
+        """Test __init__ raises ValueError for invalid settings."""
+        with self.assertRaises(ValueError):
+            TransactionJournal(self.journal_path, fsync_every=-1)
+        with self.assertRaises(ValueError):
+            TransactionJournal(self.journal_path, compaction_threshold=0)
+
+if __name__ == '__main__':
+    unittest.main()
@@ -0,0 +1,92 @@
+"""
+Description: Unit tests for the TransactionLedger class.
+Author: Sukhtab Singh Warya
+Date: 18/10/2026
+"""
+
+import time
+import unittest
+from datetime import date, datetime
+from bank_account import BankAccount, ChequingAccount
+from bank_account.transaction_ledger import TransactionLedger, AccountLedger, LedgerEntry
+
+# POSIX timestamps of 2026-10-01 to 2026-10-05 at noon, local time
+DAYS = [datetime(2026, 10, day, 12).timestamp() for day in range(1, 6)]
+
+
+class TestTransactionLedger(unittest.TestCase):
+
+    def setUp(self):
+        self.ledger = AccountLedger()
+        for timestamp, amount, balance in zip(DAYS, (500.0, -20.0, 75.0, -300.0, 20.0),
+                                              (500.0, 480.0, 555.0, 255.0, 275.0)):
+            self.ledger.append(amount, balance, timestamp)
+
+    def tearDown(self):
+        BankAccount.transaction_ledger = None
+
+    def test_entries(self):
+        """Test entries hold the time, kind, signed amount and resulting balance."""
+        self.assertEqual(len(self.ledger), 5)
+        self.assertEqual(self.ledger[1], LedgerEntry(datetime(2026, 10, 2, 12), "withdraw", -20.0, 480.0))
+        self.assertEqual([entry.kind for entry in self.ledger],
+                         ["deposit", "withdraw", "deposit", "withdraw", "deposit"])
+
+    def test_between_dates(self):
+        """Test a date range includes its start and excludes its end."""
+        entries = self.ledger.between(datetime(2026, 10, 2, 12), datetime(2026, 10, 4, 12))
+        self.assertEqual([entry.balance for entry in entries], [480.0, 555.0])
+        self.assertEqual(self.ledger.between(datetime(2026, 11, 1), datetime(2026, 12, 1)), [])
+
+    def test_amounts_between(self):
+        """Test an amount range is inclusive and returns the entries oldest first."""
+        entries = self.ledger.amounts_between(-20.0, 75.0)
+        self.assertEqual([entry.amount for entry in entries], [-20.0, 75.0, 20.0])
+        self.assertEqual([entry.amount for entry in self.ledger.amounts_between(-1000.0, -100.0)], [-300.0])
+
+    def test_amount_index_follows_appends(self):
+        """Test a transaction appended after an amount query is found by the next one."""
+        self.assertEqual(self.ledger.amounts_between(30.0, 30.0), [])
+        self.ledger.append(30.0, 305.0, DAYS[-1] + 60)
+        self.assertEqual([entry.balance for entry in self.ledger.amounts_between(30.0, 30.0)], [305.0])
+
+    def test_earlier_timestamp_is_rejected(self):
+        """Test a transaction timestamped before the previous one raises ValueError and is not recorded."""
+        with self.assertRaises(ValueError):
+            self.ledger.append(1.0, 276.0, DAYS[0])
+        self.assertEqual(len(self.ledger), len(DAYS))
+        self.ledger.append(1.0, 276.0, DAYS[-1])
+        self.assertEqual(self.ledger[-1].timestamp, datetime(2026, 10, 5, 12))
+
+    def test_clock_timestamps_never_decrease(self):
+        """Test a transaction timed by a clock that was set back is recorded at the previous time."""
+        ledger = AccountLedger()
+        ledger.append(1.0, 1.0, time.time() + 3600)
+        ledger.append(1.0, 2.0)
+        self.assertEqual(ledger[1].timestamp, ledger[0].timestamp)
+
+    def test_memory_per_entry(self):
+        """Test the arrays hold 24 bytes per transaction, plus 16 once amounts are indexed."""
+        ledger = AccountLedger()
+        for number in range(10_000):
+            ledger.append(float(number), float(number), float(number))
+        self.assertLess(ledger.nbytes / len(ledger), 26)
+        ledger.amounts_between(0.0, 1.0)
+        self.assertLess(ledger.nbytes / len(ledger), 42)
+
+    def test_bank_account_records_transactions(self):
+        """Test deposits and withdrawals are recorded per account through update_balance."""
+        ledger = BankAccount.transaction_ledger = TransactionLedger()
+        account = ChequingAccount(20001, 1001, 1000.00, date.today(), -50, 0.035)
+        account.deposit(200.00)
+        account.withdraw(450.00)
+
+        self.assertEqual([(entry.kind, entry.amount, entry.balance) for entry in ledger.for_account(20001)],
+                         [("deposit", 200.0, 1200.0), ("withdraw", -450.0, 750.0)])
+        self.assertEqual(len(ledger), 2)
+        self.assertNotIn(20002, ledger)
+        self.assertEqual(len(ledger.for_account(20002)), 0)
+
+
+if __name__ == '__main__':
+    unittest.main()
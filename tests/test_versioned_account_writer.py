@@ -0,0 +1,198 @@
+"""
+Description: Unit tests for the VersionedAccountWriter class, including a stress test with
+several writer processes.
+Author: Sukhtab Singh Warya
+Date: 18/10/2026
+"""
+
+import csv
+import multiprocessing
+import os
+import shutil
+import tempfile
+import unittest
+from functools import partial
+from bank_account import BankAccount
+from client.client import Client
+from user_interface import manage_data
+from user_interface.data_file_watcher import DataFileWatcher
+from user_interface.transaction_journal import TransactionJournal
+from user_interface.versioned_account_writer import (VersionedAccountWriter, ConcurrentUpdateError,
+                                                     prepare_versioned_file, has_version_column)
+from user_interface.write_behind_buffer import WriteBehindBuffer
+
+ACCOUNTS = (
+    "account_number,client_number,balance,date_created,account_type,overdraft_limit,overdraft_rate,minimum_balance,management_fee\n"
+    "20001,1001,15300.0,2023-01-10,ChequingAccount,-50,0.035,Null,Null\n"
+    "20002,1001,301.54,2023-01-15,SavingsAccount,Null,Null,50,Null\n"
+    "20004,1002,4500.87,2023-02-05,InvestmentAccount,Null,Null,Null,5\n"
+)
+
+WRITERS = 4
+DEPOSITS = 25
+
+
+def load_accounts(accounts_path):
+    """Return the accounts in the file by account number."""
+    return {account.account_number: account for account in manage_data.iter_accounts(accounts_path=accounts_path)}
+
+
+def deposit_repeatedly(accounts_path, own_account_number):
+    """Deposit 1.00 DEPOSITS times into a shared account and into this writer's own account."""
+    writer = VersionedAccountWriter(accounts_path)
+    accounts = load_accounts(accounts_path)
+    writer.track(accounts.values(), refresh=True)
+    for _ in range(DEPOSITS):
+        for account_number in (20001, own_account_number):
+            accounts[account_number].deposit(1.00)
+            writer.save_accounts([accounts[account_number]])
+
+
+class TestVersionedAccountWriter(unittest.TestCase):
+
+    def setUp(self):
+        """Write a small accounts file with a version column to a temporary directory."""
+        self.directory = tempfile.mkdtemp()
+        self.accounts_path = os.path.join(self.directory, "accounts.csv")
+        with open(self.accounts_path, "w", newline="") as file:
+            file.write(ACCOUNTS)
+        prepare_versioned_file(self.accounts_path)
+
+    def tearDown(self):
+        shutil.rmtree(self.directory)
+
+    def read_versions(self):
+        """Return the version of each row in the file."""
+        with open(self.accounts_path, newline="") as file:
+            return {int(row["account_number"]): int(row["version"]) for row in csv.DictReader(file)}
+
+    def test_prepared_file_loads(self):
+        """Test a file with padded balances and a version column still loads."""
+        self.assertTrue(has_version_column(self.accounts_path))
+        accounts = load_accounts(self.accounts_path)
+        self.assertEqual(accounts[20002].balance, 301.54)
+        self.assertEqual(self.read_versions(), {20001: 0, 20002: 0, 20004: 0})
+
+    def test_file_without_version_column(self):
+        """Test the writer refuses a file without a version column."""
+        with open(self.accounts_path, "w", newline="") as file:
+            file.write(ACCOUNTS)
+        with self.assertRaises(ValueError):
+            VersionedAccountWriter(self.accounts_path)
+
+    def test_save_accounts_increments_version(self):
+        """Test a write updates the balance in place and increments the row's version."""
+        size = os.path.getsize(self.accounts_path)
+        writer = VersionedAccountWriter(self.accounts_path)
+        accounts = load_accounts(self.accounts_path)
+        accounts[20002].deposit(0.46)
+        writer.save_accounts([accounts[20002]])
+
+        self.assertEqual(load_accounts(self.accounts_path)[20002].balance, 302.00)
+        self.assertEqual(self.read_versions(), {20001: 0, 20002: 1, 20004: 0})
+        self.assertEqual(os.path.getsize(self.accounts_path), size)
+
+    def test_conflicting_write_is_merged(self):
+        """Test a write to an account changed by another writer is applied on top of that change."""
+        first, second = VersionedAccountWriter(self.accounts_path), VersionedAccountWriter(self.accounts_path)
+        first_accounts, second_accounts = load_accounts(self.accounts_path), load_accounts(self.accounts_path)
+
+        first_accounts[20004].deposit(100.00)
+        first.save_accounts([first_accounts[20004]])
+        second_accounts[20004].withdraw(0.87)
+        second.save_accounts([second_accounts[20004]])
+
+        self.assertEqual(second.conflicts, 1)
+        self.assertEqual(second_accounts[20004].balance, 4600.00)
+        self.assertEqual(load_accounts(self.accounts_path)[20004].balance, 4600.00)
+        self.assertEqual(self.read_versions()[20004], 2)
+
+    def test_conflicting_write_raises_without_merging(self):
+        """Test a conflicting write raises ConcurrentUpdateError when merging is disabled."""
+        first = VersionedAccountWriter(self.accounts_path)
+        second = VersionedAccountWriter(self.accounts_path, merge_conflicts=False)
+        first.save_balances({20001: 1.00})
+        with self.assertRaises(ConcurrentUpdateError):
+            second.save_balances({20001: 2.00})
+        self.assertEqual(load_accounts(self.accounts_path)[20001].balance, 1.00)
+
+    def test_close_sequence_keeps_other_writers_update(self):
+        """Test flushing and compacting the journal on close keeps a deposit saved by another writer."""
+        journal = TransactionJournal(os.path.join(self.directory, "journal.csv"))
+        self.addCleanup(setattr, BankAccount, "transaction_journal", None)
+        writer, accounts = VersionedAccountWriter(self.accounts_path), load_accounts(self.accounts_path)
+        buffer = WriteBehindBuffer(writer.save_accounts, max_delay=None)
+        other_writer, other_accounts = VersionedAccountWriter(self.accounts_path), load_accounts(self.accounts_path)
+
+        other_accounts[20002].deposit(50.00)
+        other_writer.save_accounts([other_accounts[20002]])
+        BankAccount.transaction_journal = journal
+        accounts[20002].deposit(10.00)
+        buffer.mark_dirty(accounts[20002])
+
+        buffer.close()
+        journal.compact_accounts(accounts, writer.save_accounts)
+        journal.close()
+
+        self.assertEqual(load_accounts(self.accounts_path)[20002].balance, 361.54)
+        self.assertEqual(accounts[20002].balance, 361.54)
+
+    def test_watcher_refresh_then_local_change(self):
+        """Test a balance refreshed by the watcher is not merged again when a local change is saved."""
+        Client.set_email_validation_mode("offline")
+        self.addCleanup(Client.set_email_validation_mode, "full")
+        clients_path = os.path.join(self.directory, "clients.csv")
+        with open(clients_path, "w", newline="") as file:
+            file.write("client_number,first_name,last_name,email_address\n"
+                       "1001,John,Doe,johndoe@pixell.com\n1002,Jane,Smith,janesmith@pixell.com\n")
+        clients = {client.client_number: client for client in manage_data.iter_clients(clients_path)}
+        writer, accounts = VersionedAccountWriter(self.accounts_path), load_accounts(self.accounts_path)
+        watcher = DataFileWatcher(clients, accounts, clients_path, self.accounts_path,
+                                  refreshed=partial(writer.track, refresh=True))
+
+        VersionedAccountWriter(self.accounts_path).save_balances({20002: 351.54})
+        watcher.reload()
+        self.assertEqual(accounts[20002].balance, 351.54)
+        accounts[20002].deposit(10.00)
+        writer.save_accounts([accounts[20002]])
+
+        self.assertEqual(load_accounts(self.accounts_path)[20002].balance, 361.54)
+        self.assertEqual(writer.conflicts, 0)
+
+    def test_wide_balance_rewrites_file(self):
+        """Test a balance too wide for its field is written by rewriting the file."""
+        writer = VersionedAccountWriter(self.accounts_path)
+        writer.save_balances({20002: 1234567890123.45})
+        other = VersionedAccountWriter(self.accounts_path)
+
+        self.assertEqual(load_accounts(self.accounts_path)[20002].balance, 1234567890123.45)
+        writer.save_balances({20004: 1.00})
+        other.save_balances({20001: 2.00})
+        self.assertEqual([account.balance for account in load_accounts(self.accounts_path).values()],
+                         [2.00, 1234567890123.45, 1.00])
+        self.assertEqual(self.read_versions(), {20001: 1, 20002: 1, 20004: 1})
+
+    def test_concurrent_writer_processes_lose_no_update(self):
+        """Test several processes writing the same and different accounts lose no update."""
+        with open(self.accounts_path, "a", newline="") as file:
+            for i in range(WRITERS):
+                file.write(f"{30000 + i},1001,0.0,2023-01-10,SavingsAccount,Null,Null,50,Null\n")
+        prepare_versioned_file(self.accounts_path)
+
+        processes = [multiprocessing.Process(target=deposit_repeatedly, args=(self.accounts_path, 30000 + i))
+                     for i in range(WRITERS)]
+        for process in processes:
+            process.start()
+        for process in processes:
+            process.join()
+            self.assertEqual(process.exitcode, 0)
+
+        accounts = load_accounts(self.accounts_path)
+        self.assertEqual(accounts[20001].balance, 15300.00 + WRITERS * DEPOSITS)
+        for i in range(WRITERS):
+            self.assertEqual(accounts[30000 + i].balance, DEPOSITS)
+        self.assertEqual(self.read_versions()[20001], WRITERS * DEPOSITS)
+
+
+if __name__ == '__main__':
+    unittest.main()
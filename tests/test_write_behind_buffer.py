@@ -0,0 +1,109 @@
+"""
+Description: Unit tests for the WriteBehindBuffer class.
+Author: Sukhtab Singh Warya
+Date: 18/10/2026
+"""
+
+import threading
+import unittest
+from bank_account import SavingsAccount
+from user_interface.write_behind_buffer import WriteBehindBuffer
+from datetime import date
+
+
+class TestWriteBehindBuffer(unittest.TestCase):
+
+    def setUp(self):
+        """Set up a buffer that records what it persists."""
+        self.written = []
+        self.account = SavingsAccount(20002, 1001, 301.54, date.today(), 50.00, None)
+
+    def persist(self, accounts):
+        self.written.append([(account.account_number, account.balance) for account in accounts])
+
+    def test_updates_to_same_account_are_coalesced(self):
+        """Test ten updates to the same account result in one write of the latest balance."""
+        buffer = WriteBehindBuffer(self.persist, max_delay=None)
+        for _ in range(10):
+            self.account.deposit(10.00)
+            buffer.mark_dirty(self.account)
+        self.assertEqual(self.written, [])
+        self.assertEqual(buffer.pending, 1)
+        self.assertIn(20002, buffer)
+        self.assertEqual(buffer.flush(), 1)
+        self.assertNotIn(20002, buffer)
+        self.assertEqual(self.written, [[(20002, 401.54)]])
+        self.assertEqual(buffer.writes, 1)
+
+    def test_flush_on_count_threshold(self):
+        """Test the buffer flushes when max_pending accounts are dirty."""
+        buffer = WriteBehindBuffer(self.persist, max_pending=2, max_delay=None)
+        buffer.mark_dirty(self.account)
+        buffer.mark_dirty(SavingsAccount(20003, 1001, 10.00, date.today(), 50.00, None))
+        self.assertEqual(self.written, [[(20002, 301.54), (20003, 10.00)]])
+        self.assertEqual(buffer.pending, 0)
+
+    def test_flush_on_time_threshold(self):
+        """Test the buffer flushes once the delay has passed."""
+        flushed = threading.Event()
+        buffer = WriteBehindBuffer(lambda accounts: (self.persist(accounts), flushed.set()), max_delay=0.01)
+        buffer.mark_dirty(self.account)
+        self.assertTrue(flushed.wait(5))
+        self.assertEqual(self.written, [[(20002, 301.54)]])
+
+    def test_flush_with_nothing_pending(self):
+        """Test flush does not persist when no account is dirty."""
+        buffer = WriteBehindBuffer(self.persist, max_delay=None)
+        self.assertEqual(buffer.flush(), 0)
+        self.assertEqual(self.written, [])
+
+    def test_close_flushes_and_rejects_updates(self):
+        """Test close writes pending accounts and refuses further updates."""
+        buffer = WriteBehindBuffer(self.persist, max_delay=None)
+        buffer.mark_dirty(self.account)
+        buffer.close()
+        self.assertEqual(self.written, [[(20002, 301.54)]])
+        with self.assertRaises(ValueError):
+            buffer.mark_dirty(self.account)
+
+    def test_failed_timed_flush_is_logged_and_retried(self):
+        """Test a timed write that fails is logged and tried again after another delay."""
+        flushed = threading.Event()
+        failures = [OSError("accounts.csv is locked")]
+
+        def persist(accounts):
+            if failures:
+                raise failures.pop()
+            self.persist(accounts)
+            flushed.set()
+
+        buffer = WriteBehindBuffer(persist, max_delay=0.01)
+        self.addCleanup(buffer.close)
+        with self.assertLogs(level="ERROR") as logs:
+            buffer.mark_dirty(self.account)
+            self.assertTrue(flushed.wait(5))
+        self.assertIn("Unable to write 1 buffered accounts: accounts.csv is locked", logs.output[0])
+        self.assertEqual(self.written, [[(20002, 301.54)]])
+
+    def test_failed_close_still_closes(self):
+        """Test close raises the error of a failed final write and leaves the buffer closed."""
+        def persist(accounts):
+            raise OSError("disk full")
+
+        buffer = WriteBehindBuffer(persist, max_delay=None)
+        buffer.mark_dirty(self.account)
+        with self.assertRaises(OSError):
+            buffer.close()
+        buffer.close()
+        with self.assertRaises(ValueError):
+            buffer.mark_dirty(self.account)
+
+    def test_invalid_thresholds(self):
+        """Test __init__ raises ValueError for invalid thresholds."""
+        with self.assertRaises(ValueError):
+            WriteBehindBuffer(self.persist, max_pending=0)
+        with self.assertRaises(ValueError):
+            WriteBehindBuffer(self.persist, max_delay=0)
+
+if __name__ == '__main__':
+    unittest.main()
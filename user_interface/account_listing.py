@@ -0,0 +1,252 @@
+"""
+Description: Defines the AccountListing and LazyAccountListing classes, mappings of bank
+accounts by account number that also index the accounts of each client.
+Author: Sukhtab Singh Warya
+Date: 18/10/2026
+"""
+
+import logging
+from collections.abc import ItemsView, MutableMapping, ValuesView
+from typing import Callable
+from bank_account.bank_account import BankAccount
+
+
+class AccountListing(dict):
+    """
+    A dictionary of bank accounts keyed by account number. Every change made through
+    the dictionary also updates a secondary index from client number to that client's
+    accounts, so for_client() costs the size of the client's portfolio instead of a
+    scan over every account.
+    """
+
+    def __init__(self, accounts=()):
+        """
+        Initializes the listing.
+        Args:
+            accounts: A mapping or an iterable of (account_number, account) pairs.
+        """
+        super().__init__()
+        self._by_client: dict[int, dict[int, BankAccount]] = {}
+        self.update(accounts)
+
+    def for_client(self, client_number: int) -> list[BankAccount]:
+        """
+        Returns the accounts of a client.
+        Args:
+            client_number (int): The client whose accounts are returned.
+        Returns:
+            list[BankAccount]: The client's accounts in the order they were added.
+        """
+        return list(self._by_client.get(client_number, {}).values())
+
+    def client_numbers(self) -> set[int]:
+        """Return the client numbers that have at least one account."""
+        return set(self._by_client)
+
+    def __setitem__(self, account_number: int, account: BankAccount) -> None:
+        previous = self.get(account_number)
+        if previous is not None and previous.client_number != account.client_number:
+            self._unindex(account_number, previous)
+        super().__setitem__(account_number, account)
+        self._by_client.setdefault(account.client_number, {})[account_number] = account
+
+    def __delitem__(self, account_number: int) -> None:
+        account = self[account_number]
+        super().__delitem__(account_number)
+        self._unindex(account_number, account)
+
+    def pop(self, account_number: int, *default):
+        if account_number not in self:
+            return super().pop(account_number, *default)
+        account = super().pop(account_number)
+        self._unindex(account_number, account)
+        return account
+
+    def popitem(self) -> tuple[int, BankAccount]:
+        account_number, account = super().popitem()
+        self._unindex(account_number, account)
+        return account_number, account
+
+    def setdefault(self, account_number: int, default: BankAccount = None) -> BankAccount:
+        if account_number not in self:
+            self[account_number] = default
+        return self[account_number]
+
+    def update(self, accounts=()) -> None:
+        pairs = accounts.items() if hasattr(accounts, "keys") else accounts
+        for account_number, account in pairs:
+            self[account_number] = account
+
+    def clear(self) -> None:
+        super().clear()
+        self._by_client.clear()
+
+    def copy(self) -> "AccountListing":
+        return AccountListing(self)
+
+    def __ior__(self, other):
+        self.update(other)
+        return self
+
+    def __reduce__(self):
+        return self.__class__, (dict(self),)
+
+    def _unindex(self, account_number: int, account: BankAccount) -> None:
+        """Removes an account from the client index."""
+        client_accounts = self._by_client.get(account.client_number)
+        if client_accounts is not None:
+            client_accounts.pop(account_number, None)
+            if not client_accounts:
+                del self._by_client[account.client_number]
+
+
+class LazyAccountListing(MutableMapping):
+    """
+    A mapping of bank accounts keyed by account number that keeps each account as the
+    compact text of its CSV row until it is first accessed. Only then is the account
+    object built, through the create_account function, and kept in place of the text.
+    Like AccountListing, it indexes accounts by client number so that for_client()
+    only builds the accounts of that client.
+
+    Rows are checked for a valid account number, client number and account type when
+    they are added; the remaining fields are only converted when the account is built.
+    A row that fails then is logged, dropped from the listing and reported as a KeyError.
+    """
+
+    # Separates the fields of a stored row; it cannot appear in a CSV field read from the data files
+    FIELD_SEPARATOR = "\x1f"
+
+    def __init__(self, fieldnames: list[str], create_account: Callable[[dict], BankAccount | None]):
+        """
+        Initializes an empty listing.
+        Args:
+            fieldnames (list[str]): The column names of the stored rows.
+            create_account (Callable): Builds an account from a row dictionary.
+        """
+        self._fieldnames = list(fieldnames)
+        self._client_column = self._fieldnames.index("client_number")
+        self._create_account = create_account
+        self._entries: dict[int, str | BankAccount] = {}
+        self._by_client: dict[int, dict[int, None]] = {}
+
+    @property
+    def materialized(self) -> int:
+        """Return the number of accounts that have been built."""
+        return sum(1 for entry in self._entries.values() if not isinstance(entry, str))
+
+    def add_row(self, account_number: int, client_number: int, values: list[str]) -> None:
+        """
+        Stores the fields of an account row without building the account.
+        Args:
+            account_number (int): The account number of the row.
+            client_number (int): The client number of the row.
+            values (list[str]): The fields of the row in column order.
+        """
+        self._discard(account_number)
+        self._entries[account_number] = self.FIELD_SEPARATOR.join(values)
+        self._by_client.setdefault(client_number, {})[account_number] = None
+
+    def for_client(self, client_number: int) -> list[BankAccount]:
+        """
+        Returns the accounts of a client, building them if necessary.
+        Args:
+            client_number (int): The client whose accounts are returned.
+        Returns:
+            list[BankAccount]: The client's accounts in the order they were added.
+        """
+        accounts = []
+        for account_number in list(self._by_client.get(client_number, ())):
+            try:
+                accounts.append(self[account_number])
+            except KeyError:
+                continue
+        return accounts
+
+    def values(self) -> ValuesView:
+        """Returns a view of the accounts that builds each one as it is reached."""
+        return _LazyValuesView(self)
+
+    def items(self) -> ItemsView:
+        """Returns a view of the (account_number, account) pairs that builds each account as it is reached."""
+        return _LazyItemsView(self)
+
+    def _built_items(self):
+        """Yields (account_number, account) pairs, skipping rows that fail to build."""
+        for account_number in list(self._entries):
+            try:
+                yield account_number, self[account_number]
+            except KeyError:
+                continue
+
+    def __getitem__(self, account_number: int) -> BankAccount:
+        entry = self._entries[account_number]
+        if not isinstance(entry, str):
+            return entry
+
+        values = entry.split(self.FIELD_SEPARATOR)
+        row = dict(zip(self._fieldnames, values))
+        for fieldname in self._fieldnames[len(values):]:
+            row[fieldname] = None  # Missing fields are None, as with csv.DictReader
+
+        try:
+            account = self._create_account(row)
+        except Exception as e:
+            logging.error(f"Unable to create bank account: {e}")
+            account = None
+
+        if account is None:
+            self._discard(account_number)
+            raise KeyError(account_number)
+
+        self._entries[account_number] = account
+        return account
+
+    def __setitem__(self, account_number: int, account: BankAccount) -> None:
+        self._discard(account_number)
+        self._entries[account_number] = account
+        self._by_client.setdefault(account.client_number, {})[account_number] = None
+
+    def __delitem__(self, account_number: int) -> None:
+        if account_number not in self._entries:
+            raise KeyError(account_number)
+        self._discard(account_number)
+
+    def __contains__(self, account_number: object) -> bool:
+        return account_number in self._entries
+
+    def __iter__(self):
+        return iter(self._entries)
+
+    def __len__(self) -> int:
+        return len(self._entries)
+
+    def _discard(self, account_number: int) -> None:
+        """Removes an account or stored row and its client index entry, if present."""
+        entry = self._entries.pop(account_number, None)
+        if entry is None:
+            return
+        if isinstance(entry, str):
+            client_number = int(entry.split(self.FIELD_SEPARATOR)[self._client_column])
+        else:
+            client_number = entry.client_number
+
+        account_numbers = self._by_client.get(client_number)
+        if account_numbers is not None:
+            account_numbers.pop(account_number, None)
+            if not account_numbers:
+                del self._by_client[client_number]
+
+
+class _LazyValuesView(ValuesView):
+    """A values view of a LazyAccountListing that skips rows that fail to build."""
+
+    def __iter__(self):
+        for _, account in self._mapping._built_items():
+            yield account
+
+
+class _LazyItemsView(ItemsView):
+    """An items view of a LazyAccountListing that skips rows that fail to build."""
+
+    def __iter__(self):
+        return self._mapping._built_items()
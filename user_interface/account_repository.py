@@ -0,0 +1,322 @@
+"""
+Description: Defines the AccountRepository interface for loading and saving clients and
+bank accounts, with a CSV implementation over manage_data and a SQLite implementation.
+Author: Sukhtab Singh Warya
+Date: 18/10/2026
+"""
+
+import logging
+import sqlite3
+import threading
+from abc import ABC, abstractmethod
+from datetime import date
+from typing import Iterable
+from bank_account.bank_account import BankAccount
+from client.client import Client
+from user_interface import manage_data
+from user_interface.account_listing import AccountListing
+from user_interface.balance_offset_index import BalanceOffsetIndex
+from user_interface.data_snapshot import account_type_of
+from user_interface.transaction_journal import replay_journal
+
+
+class AccountRepository(ABC):
+    """
+    Loads and saves clients and bank accounts. Callers such as ClientLookupWindow and
+    batch jobs work against this interface so that the storage engine can be swapped.
+    """
+
+    @abstractmethod
+    def load_clients(self) -> dict[int, Client]:
+        """Return every client by client number."""
+        pass
+
+    @abstractmethod
+    def load_accounts(self) -> AccountListing:
+        """Return every bank account by account number."""
+        pass
+
+    @abstractmethod
+    def get_client(self, client_number: int) -> Client | None:
+        """Return the client with the given client number, or None if there is none."""
+        pass
+
+    @abstractmethod
+    def get_account(self, account_number: int) -> BankAccount | None:
+        """Return the account with the given account number, or None if there is none."""
+        pass
+
+    @abstractmethod
+    def accounts_for_client(self, client_number: int) -> list[BankAccount]:
+        """Return the accounts of a client."""
+        pass
+
+    @abstractmethod
+    def save_balances(self, balances: dict[int, float]) -> None:
+        """
+        Persists balances by account number in one batch.
+        Args:
+            balances (dict[int, float]): The new balance of each account.
+        """
+        pass
+
+    def save_accounts(self, accounts: Iterable[BankAccount]) -> None:
+        """
+        Persists the balances of several accounts in one batch.
+        Args:
+            accounts (Iterable[BankAccount]): Bank accounts containing updated balances.
+        """
+        self.save_balances({account.account_number: account.balance for account in accounts})
+
+    def load_data(self, journal_path: str = None) -> tuple[dict[int, Client], AccountListing]:
+        """
+        Loads every client and account, as manage_data.load_data does.
+        Args:
+            journal_path (str): Optional transaction journal whose balances are
+                applied on top of the stored ones.
+        Returns:
+            tuple containing client dictionary and account dictionary.
+        """
+        client_listing = self.load_clients()
+        accounts = self.load_accounts()
+        _apply_journal(accounts, journal_path)
+        return client_listing, accounts
+
+    def close(self) -> None:
+        """Releases any resources held by the repository."""
+        pass
+
+
+class CsvAccountRepository(AccountRepository):
+    """
+    A repository over the clients.csv and accounts.csv files. The files have no
+    index, so every lookup reads the file; use load_data() to keep the data in memory.
+    """
+
+    def __init__(self, clients_path: str = None, accounts_path: str = None,
+                 offset_index: BalanceOffsetIndex = None):
+        """
+        Initializes the repository.
+        Args:
+            clients_path (str): Path to the clients file. Defaults to data/clients.csv.
+            accounts_path (str): Path to the accounts file. Defaults to data/accounts.csv.
+            offset_index (BalanceOffsetIndex): Optional index used to write balances in place.
+        """
+        self._clients_path = clients_path
+        self._accounts_path = accounts_path
+        self._offset_index = offset_index
+
+    def load_clients(self) -> dict[int, Client]:
+        return {client.client_number: client for client in manage_data.iter_clients(self._clients_path)}
+
+    def load_accounts(self) -> AccountListing:
+        client_numbers = {client.client_number for client in manage_data.iter_clients(self._clients_path)}
+        return AccountListing((account.account_number, account)
+                              for account in manage_data.iter_accounts(client_numbers, self._accounts_path))
+
+    def load_data(self, journal_path: str = None) -> tuple[dict[int, Client], AccountListing]:
+        client_listing = self.load_clients()
+        accounts = AccountListing((account.account_number, account)
+                                  for account in manage_data.iter_accounts(client_listing, self._accounts_path))
+        _apply_journal(accounts, journal_path, self._accounts_path or manage_data.accounts_csv_path)
+        return client_listing, accounts
+
+    def get_client(self, client_number: int) -> Client | None:
+        return next((client for client in manage_data.iter_clients(self._clients_path)
+                     if client.client_number == client_number), None)
+
+    def get_account(self, account_number: int) -> BankAccount | None:
+        return next((account for account in manage_data.iter_accounts(accounts_path=self._accounts_path)
+                     if account.account_number == account_number), None)
+
+    def accounts_for_client(self, client_number: int) -> list[BankAccount]:
+        return [account for account in manage_data.iter_accounts(accounts_path=self._accounts_path)
+                if account.client_number == client_number]
+
+    def save_balances(self, balances: dict[int, float]) -> None:
+        manage_data.write_balances(balances, self._offset_index, self._accounts_path)
+
+
+class SqliteAccountRepository(AccountRepository):
+    """
+    A repository stored in a SQLite database. Clients and accounts are kept in tables
+    keyed by client number and account number, with an index on the client number of
+    each account, so lookups read only the rows they return. Writes are batched into a
+    single transaction. The lookup statements are fixed strings with parameters, so
+    sqlite3 prepares each of them once and reuses it from its statement cache.
+
+    The connection may be used from more than one thread (e.g. by the timer of a
+    WriteBehindBuffer); access to it is serialized by a lock.
+    """
+
+    _SCHEMA = """
+        CREATE TABLE IF NOT EXISTS clients (
+            client_number INTEGER PRIMARY KEY,
+            first_name TEXT NOT NULL,
+            last_name TEXT NOT NULL,
+            email_address TEXT NOT NULL
+        );
+        CREATE TABLE IF NOT EXISTS accounts (
+            account_number INTEGER PRIMARY KEY,
+            client_number INTEGER NOT NULL REFERENCES clients (client_number),
+            balance REAL NOT NULL,
+            date_created TEXT NOT NULL,
+            account_type TEXT NOT NULL,
+            overdraft_limit REAL,
+            overdraft_rate REAL,
+            minimum_balance REAL,
+            management_fee REAL
+        );
+        CREATE INDEX IF NOT EXISTS accounts_by_client ON accounts (client_number);
+    """
+
+    _CLIENT_COLUMNS = "client_number, first_name, last_name, email_address"
+    _ACCOUNT_COLUMNS = ("account_number, client_number, balance, date_created, account_type, "
+                        "overdraft_limit, overdraft_rate, minimum_balance, management_fee")
+
+    _SELECT_CLIENTS = f"SELECT {_CLIENT_COLUMNS} FROM clients"
+    _SELECT_CLIENT = f"SELECT {_CLIENT_COLUMNS} FROM clients WHERE client_number = ?"
+    _SELECT_ACCOUNTS = f"SELECT {_ACCOUNT_COLUMNS} FROM accounts"
+    _SELECT_ACCOUNT = f"SELECT {_ACCOUNT_COLUMNS} FROM accounts WHERE account_number = ?"
+    _SELECT_CLIENT_ACCOUNTS = f"SELECT {_ACCOUNT_COLUMNS} FROM accounts WHERE client_number = ?"
+    _INSERT_CLIENT = f"INSERT OR REPLACE INTO clients ({_CLIENT_COLUMNS}) VALUES (?, ?, ?, ?)"
+    _INSERT_ACCOUNT = f"INSERT OR REPLACE INTO accounts ({_ACCOUNT_COLUMNS}) VALUES (?, ?, ?, ?, ?, ?, ?, ?, ?)"
+    _UPDATE_BALANCE = "UPDATE accounts SET balance = ? WHERE account_number = ?"
+
+    def __init__(self, database_path: str):
+        """
+        Opens the database, creating its tables if they do not exist.
+        Args:
+            database_path (str): Path to the database file, or ":memory:".
+        """
+        self._lock = threading.RLock()
+        self._connection = sqlite3.connect(database_path, check_same_thread=False)
+        with self._lock, self._connection:
+            if database_path != ":memory:":
+                self._connection.execute("PRAGMA journal_mode = WAL")
+            self._connection.execute("PRAGMA synchronous = NORMAL")
+            self._connection.executescript(self._SCHEMA)
+
+    def load_clients(self) -> dict[int, Client]:
+        with self._lock:
+            rows = self._connection.execute(self._SELECT_CLIENTS).fetchall()
+        return {client.client_number: client for client in map(self._row_to_client, rows) if client is not None}
+
+    def load_accounts(self) -> AccountListing:
+        with self._lock:
+            rows = self._connection.execute(self._SELECT_ACCOUNTS).fetchall()
+        return AccountListing((account.account_number, account)
+                              for account in map(self._row_to_account, rows) if account is not None)
+
+    def get_client(self, client_number: int) -> Client | None:
+        with self._lock:
+            row = self._connection.execute(self._SELECT_CLIENT, (client_number,)).fetchone()
+        return self._row_to_client(row) if row is not None else None
+
+    def get_account(self, account_number: int) -> BankAccount | None:
+        with self._lock:
+            row = self._connection.execute(self._SELECT_ACCOUNT, (account_number,)).fetchone()
+        return self._row_to_account(row) if row is not None else None
+
+    def accounts_for_client(self, client_number: int) -> list[BankAccount]:
+        with self._lock:
+            rows = self._connection.execute(self._SELECT_CLIENT_ACCOUNTS, (client_number,)).fetchall()
+        return [account for account in map(self._row_to_account, rows) if account is not None]
+
+    def save_balances(self, balances: dict[int, float]) -> None:
+        with self._lock, self._connection:
+            self._connection.executemany(self._UPDATE_BALANCE,
+                                         ((balance, account_number) for account_number, balance in balances.items()))
+
+    def add_clients(self, clients: Iterable[Client]) -> None:
+        """
+        Inserts or replaces clients in one transaction.
+        Args:
+            clients (Iterable[Client]): The clients to store.
+        """
+        rows = ((client.client_number, client.first_name, client.last_name, client.email_address)
+                for client in clients)
+        with self._lock, self._connection:
+            self._connection.executemany(self._INSERT_CLIENT, rows)
+
+    def add_accounts(self, accounts: Iterable[BankAccount]) -> None:
+        """
+        Inserts or replaces bank accounts in one transaction.
+        Args:
+            accounts (Iterable[BankAccount]): The accounts to store.
+        """
+        rows = ((account.account_number, account.client_number, account._balance,
+                 account.date_created.isoformat(), account_type_of(account).__name__,
+                 getattr(account, "overdraft_limit", None), getattr(account, "overdraft_rate", None),
+                 getattr(account, "minimum_balance", None), getattr(account, "management_fee", None))
+                for account in accounts)
+        with self._lock, self._connection:
+            self._connection.executemany(self._INSERT_ACCOUNT, rows)
+
+    def close(self) -> None:
+        with self._lock:
+            self._connection.close()
+
+    @staticmethod
+    def _row_to_client(row: tuple) -> Client | None:
+        try:
+            return Client.from_storage(*row)
+        except Exception as e:
+            logging.error(f"Unable to create client: {e}")
+            return None
+
+    @staticmethod
+    def _row_to_account(row: tuple) -> BankAccount | None:
+        (account_number, client_number, balance, date_created, account_type,
+         overdraft_limit, overdraft_rate, minimum_balance, management_fee) = row
+        try:
+            return manage_data.build_account(account_type, account_number, client_number, balance,
+                                             date.fromisoformat(date_created), overdraft_limit, overdraft_rate,
+                                             minimum_balance, management_fee)
+        except Exception as e:
+            logging.error(f"Unable to create bank account: {e}")
+            return None
+
+
+def _apply_journal(accounts: AccountListing, journal_path: str = None, accounts_path: str = None) -> None:
+    """
+    Applies the balances recorded in a transaction journal to loaded accounts. When the
+    accounts were read from accounts_path, balances journaled before its last write are
+    skipped.
+    """
+    if journal_path is None:
+        return
+    for account_number, balance in replay_journal(journal_path, accounts_path).items():
+        if account_number in accounts:
+            accounts[account_number]._balance = balance
+
+
+def import_csv(database_path: str, clients_path: str = None, accounts_path: str = None,
+               chunk_size: int = manage_data.DEFAULT_CHUNK_SIZE) -> tuple[int, int]:
+    """
+    Copies the valid clients and accounts of the CSV files into a SQLite database.
+    Rows are validated and logged exactly as when the CSV files are loaded, and are
+    inserted chunk_size rows per transaction so that memory use stays bounded.
+    Args:
+        database_path (str): Path to the database file.
+        clients_path (str): Path to the clients file. Defaults to data/clients.csv.
+        accounts_path (str): Path to the accounts file. Defaults to data/accounts.csv.
+        chunk_size (int): Number of rows inserted per transaction.
+    Returns:
+        tuple containing the number of clients and the number of accounts imported.
+    """
+    repository = SqliteAccountRepository(database_path)
+    client_numbers = set()
+    account_count = 0
+    try:
+        for clients in manage_data.iter_clients_chunked(chunk_size, clients_path):
+            repository.add_clients(clients)
+            client_numbers.update(client.client_number for client in clients)
+
+        for accounts in manage_data.iter_accounts_chunked(chunk_size, client_numbers, accounts_path):
+            repository.add_accounts(accounts)
+            account_count += len(accounts)
+    finally:
+        repository.close()
+
+    return len(client_numbers), account_count
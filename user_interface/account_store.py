@@ -0,0 +1,398 @@
+"""
+Description: Defines the AccountStore class, which keeps bank accounts as typed columns
+instead of one Python object per account, and the views it hands out for single accounts.
+Author: Sukhtab Singh Warya
+Date: 18/10/2026
+"""
+
+import math
+from array import array
+from bisect import bisect_left
+from collections.abc import Mapping
+from datetime import date
+from typing import Iterable, Iterator
+from bank_account import BankAccount, ChequingAccount, SavingsAccount, InvestmentAccount
+from patterns.strategy.service_charge_strategy import OverdraftStrategy
+from patterns.strategy.management_fee_strategy import ManagementFeeStrategy
+from user_interface.data_snapshot import ACCOUNT_TYPE_CODES, account_type_of
+
+try:
+    import numpy
+except ImportError:
+    numpy = None
+
+# Column names and array type codes; "terms" is a position in the store's table of terms
+COLUMNS = (
+    ("account_number", "q"), ("client_number", "q"), ("balance", "d"), ("date_created", "i"),
+    ("type_code", "b"), ("terms", "i"),
+)
+
+# Fields of an account that depend on its type. Few accounts have terms of their own,
+# so each distinct combination is stored once and rows refer to it.
+TERMS = ("overdraft_limit", "overdraft_rate", "minimum_balance", "management_fee")
+
+NULL = math.nan
+
+# Rows added since the sorted index was built are found through a dictionary until
+# there are this many of them, or one eighth of the store, whichever is larger
+_MIN_UNINDEXED = 1024
+
+
+class AccountStore(Mapping):
+    """
+    A read-only mapping of account number to bank account that keeps every field in a
+    typed column: NumPy arrays when NumPy is installed, array.array otherwise. An
+    account costs its column cells instead of a Python object, a dictionary of
+    attributes, an observer list and a strategy object. Overdraft limits and rates,
+    minimum balances and management fees are kept once per distinct combination.
+
+    Indexing the store returns a view of one row. A view is a BankAccount whose
+    balance, deposit() and withdraw() read and write the columns, so changes made
+    through any view are seen by every other view and by whole-book scans over
+    column(). Views are created on demand and hold no state of their own.
+    """
+
+    def __init__(self, accounts: Iterable[BankAccount] = (), use_numpy: bool = None):
+        """
+        Initializes the store.
+        Args:
+            accounts (Iterable[BankAccount]): Accounts whose fields are copied into the store.
+            use_numpy (bool): Whether to keep columns in NumPy arrays. Defaults to
+                True when NumPy is installed.
+        """
+        if use_numpy is None:
+            use_numpy = numpy is not None
+        elif use_numpy and numpy is None:
+            raise ValueError("NumPy is not installed")
+        self.uses_numpy = use_numpy
+
+        if use_numpy:
+            self._columns = {name: numpy.empty(0, dtype=code) for name, code in COLUMNS}
+        else:
+            self._columns = {name: array(code) for name, code in COLUMNS}
+        self._size = 0
+        self._terms: list[tuple] = []
+        self._term_ids: dict[tuple, int] = {}
+
+        # Account numbers in order, with the row of each, as of the last rebuild
+        self._sorted_numbers = array("q")
+        self._sorted_rows = array("i")
+        self._unindexed: dict[int, int] = {}
+
+        # Observers attached through views, by row; most accounts have none
+        self._observers: dict[int, list] = {}
+
+        for account in accounts:
+            self.add_account(account)
+        self._trim()
+
+    def add(self, account_type: type, account_number: int, client_number: int, balance: float, date_created: date,
+            overdraft_limit: float = NULL, overdraft_rate: float = NULL, minimum_balance: float = NULL,
+            management_fee: float = NULL) -> BankAccount:
+        """
+        Adds an account, or replaces the fields of the account with the same number.
+        Args:
+            account_type (type): ChequingAccount, SavingsAccount or InvestmentAccount.
+            account_number (int): The account number.
+            client_number (int): The client number.
+            balance (float): The balance; like BankAccount, anything but a float is stored as 0.0.
+            date_created (date): The date the account was created.
+            overdraft_limit (float): The overdraft limit of a chequing account.
+            overdraft_rate (float): The overdraft rate of a chequing account.
+            minimum_balance (float): The minimum balance of a savings account.
+            management_fee (float): The management fee of an investment account.
+        Returns:
+            BankAccount: A view of the account.
+        Raises:
+            ValueError: If the account type is not stored or the numbers are not integers.
+        """
+        if account_type not in ACCOUNT_TYPE_CODES:
+            raise ValueError(f"Invalid account type for account {account_number}: {account_type}")
+        if not isinstance(account_number, int) or not isinstance(client_number, int):
+            raise ValueError("Account and client numbers must be integers.")
+
+        terms = (_or_null(overdraft_limit), _or_null(overdraft_rate), _or_null(minimum_balance), _or_null(management_fee))
+        values = (account_number, client_number, balance if isinstance(balance, float) else 0.0,
+                  date_created.toordinal(), ACCOUNT_TYPE_CODES[account_type], self._term_id(terms))
+
+        row = self._row_of(account_number)
+        if row is None:
+            row = self._append(values)
+            self._unindexed[account_number] = row
+            if len(self._unindexed) > max(_MIN_UNINDEXED, self._size // 8):
+                self._rebuild_index()
+        else:
+            for (name, _), value in zip(COLUMNS, values):
+                self._columns[name][row] = value
+        return self._view(row)
+
+    def add_account(self, account: BankAccount) -> BankAccount:
+        """
+        Copies the fields of an account into the store.
+        Args:
+            account (BankAccount): A ChequingAccount, SavingsAccount or InvestmentAccount.
+        Returns:
+            BankAccount: A view of the stored account.
+        """
+        return self.add(account_type_of(account), account.account_number, account.client_number, account._balance,
+                        account.date_created, getattr(account, "overdraft_limit", NULL),
+                        getattr(account, "overdraft_rate", NULL), getattr(account, "minimum_balance", NULL),
+                        getattr(account, "management_fee", NULL))
+
+    def column(self, name: str):
+        """
+        Returns a column for whole-book scans, such as column("balance").sum() with NumPy.
+        Writing to a column named in COLUMNS writes to the store; a column named in
+        TERMS is built from the table of terms and is a copy.
+        Args:
+            name (str): One of the names in COLUMNS or TERMS.
+        Returns:
+            A NumPy array, or an array.array without NumPy, of one value per row.
+        """
+        if name in TERMS:
+            position = TERMS.index(name)
+            table = array("d", (terms[position] for terms in self._terms))
+            if self.uses_numpy:
+                return numpy.frombuffer(table, dtype="d")[self.column("terms")]
+            return array("d", (table[term_id] for term_id in self._columns["terms"]))
+        values = self._columns[name]
+        return values[:self._size] if self.uses_numpy else values
+
+    def total_balance(self) -> float:
+        """Return the sum of every balance."""
+        if self.uses_numpy:
+            return float(self.column("balance").sum())
+        return math.fsum(self._columns["balance"])
+
+    def for_client(self, client_number: int) -> list[BankAccount]:
+        """
+        Returns the accounts of a client.
+        Args:
+            client_number (int): The client whose accounts are returned.
+        Returns:
+            list[BankAccount]: Views of the client's accounts in the order they were added.
+        """
+        client_numbers = self.column("client_number")
+        if self.uses_numpy:
+            rows = numpy.flatnonzero(client_numbers == client_number).tolist()
+        else:
+            rows = [row for row, number in enumerate(client_numbers) if number == client_number]
+        return [self._view(row) for row in rows]
+
+    def __getitem__(self, account_number: int) -> BankAccount:
+        row = self._row_of(account_number)
+        if row is None:
+            raise KeyError(account_number)
+        return self._view(row)
+
+    def __iter__(self) -> Iterator[int]:
+        return iter(self.column("account_number").tolist())
+
+    def __len__(self) -> int:
+        return self._size
+
+    def __contains__(self, account_number) -> bool:
+        return isinstance(account_number, int) and self._row_of(account_number) is not None
+
+    def _view(self, row: int) -> BankAccount:
+        """Returns a view of a row, of the class matching its type code."""
+        return _VIEW_CLASSES[self._columns["type_code"][row]](self, row)
+
+    def _term_id(self, terms: tuple) -> int:
+        """Returns the position of a combination of terms in the table, adding it if new."""
+        term_id = self._term_ids.get(terms)
+        if term_id is None:
+            term_id = self._term_ids[terms] = len(self._terms)
+            self._terms.append(terms)
+        return term_id
+
+    def _set_term(self, row: int, name: str, value: float) -> None:
+        """Changes one term of a row, pointing the row at the matching combination."""
+        terms = list(self._terms[self._columns["terms"][row]])
+        terms[TERMS.index(name)] = _or_null(value)
+        self._columns["terms"][row] = self._term_id(tuple(terms))
+
+    def _append(self, values: tuple) -> int:
+        """Appends a row, growing NumPy columns by doubling, and returns its position."""
+        row = self._size
+        if self.uses_numpy:
+            if row == len(self._columns["account_number"]):
+                capacity = max(16, 2 * row)
+                for name, column in self._columns.items():
+                    grown = numpy.empty(capacity, dtype=column.dtype)
+                    grown[:row] = column[:row]
+                    self._columns[name] = grown
+            for (name, _), value in zip(COLUMNS, values):
+                self._columns[name][row] = value
+        else:
+            for (name, _), value in zip(COLUMNS, values):
+                self._columns[name].append(value)
+        self._size = row + 1
+        return row
+
+    def _trim(self) -> None:
+        """Releases the spare capacity of NumPy columns and indexes every row."""
+        if self.uses_numpy:
+            for name, column in self._columns.items():
+                self._columns[name] = column[:self._size].copy()
+        self._rebuild_index()
+
+    def _row_of(self, account_number: int) -> int | None:
+        """Returns the row holding an account, or None."""
+        row = self._unindexed.get(account_number)
+        if row is not None:
+            return row
+        i = bisect_left(self._sorted_numbers, account_number)
+        if i < len(self._sorted_numbers) and self._sorted_numbers[i] == account_number:
+            return self._sorted_rows[i]
+        return None
+
+    def _rebuild_index(self) -> None:
+        """Sorts the account numbers so that a lookup is a binary search."""
+        numbers = self.column("account_number")
+        if self.uses_numpy:
+            rows = numpy.argsort(numbers, kind="stable")
+            self._sorted_numbers = array("q", numbers[rows].tobytes())
+            self._sorted_rows = array("i", rows.astype("i").tobytes())
+        else:
+            self._sorted_rows = array("i", sorted(range(self._size), key=numbers.__getitem__))
+            self._sorted_numbers = array("q", (numbers[row] for row in self._sorted_rows))
+        self._unindexed.clear()
+
+
+class AccountView(BankAccount):
+    """
+    A BankAccount backed by one row of an AccountStore. Inherited operations work
+    unchanged because every attribute they use reads or writes the row.
+
+    AccountView declares no __slots__ of its own: its subclasses also derive from the
+    account classes, whose slots would conflict with it.
+    """
+
+    def __init__(self, store: AccountStore, row: int):
+        # BankAccount.__init__ is not called: every field already lives in the store
+        self._store = store
+        self._row = row
+
+    def _get(self, name: str) -> float:
+        return self._store._columns[name][self._row]
+
+    def _set(self, name: str, value) -> None:
+        self._store._columns[name][self._row] = value
+
+    def _term(self, name: str) -> float:
+        store = self._store
+        return store._terms[store._columns["terms"][self._row]][TERMS.index(name)]
+
+    @property
+    def account_number(self) -> int:
+        return int(self._get("account_number"))
+
+    @property
+    def client_number(self) -> int:
+        return int(self._get("client_number"))
+
+    @property
+    def _account_number(self) -> int:
+        return self.account_number
+
+    @property
+    def _client_number(self) -> int:
+        return self.client_number
+
+    @property
+    def _balance(self) -> float:
+        return float(self._get("balance"))
+
+    @_balance.setter
+    def _balance(self, value: float) -> None:
+        self._set("balance", value)
+
+    @property
+    def date_created(self) -> date:
+        return date.fromordinal(int(self._get("date_created")))
+
+    @date_created.setter
+    def date_created(self, value: date) -> None:
+        self._set("date_created", value.toordinal())
+
+    @property
+    def service_charge_strategy(self):
+        return None
+
+    @property
+    def _observers(self) -> list | None:
+        return self._store._observers.get(self._row)
+
+    @_observers.setter
+    def _observers(self, observers: list | None) -> None:
+        self._store._observers[self._row] = observers
+
+    def __eq__(self, other) -> bool:
+        if isinstance(other, AccountView):
+            return self._store is other._store and self._row == other._row
+        return NotImplemented
+
+    def __hash__(self) -> int:
+        return hash((id(self._store), self._row))
+
+
+class ChequingAccountView(AccountView, ChequingAccount):
+    """A ChequingAccount backed by a row of an AccountStore."""
+
+    __slots__ = ()
+
+    @property
+    def _overdraft_limit(self) -> float:
+        return self._term("overdraft_limit")
+
+    @property
+    def _overdraft_rate(self) -> float:
+        return self._term("overdraft_rate")
+
+    @property
+    def service_charge_strategy(self) -> OverdraftStrategy:
+        return OverdraftStrategy(self._overdraft_limit, self.BASE_SERVICE_CHARGE)
+
+
+class SavingsAccountView(AccountView, SavingsAccount):
+    """A SavingsAccount backed by a row of an AccountStore."""
+
+    __slots__ = ()
+
+    @property
+    def minimum_balance(self) -> float:
+        return self._term("minimum_balance")
+
+    @minimum_balance.setter
+    def minimum_balance(self, value: float) -> None:
+        self._store._set_term(self._row, "minimum_balance", value)
+
+
+class InvestmentAccountView(AccountView, InvestmentAccount):
+    """An InvestmentAccount backed by a row of an AccountStore."""
+
+    __slots__ = ()
+
+    @property
+    def management_fee(self) -> float:
+        return self._term("management_fee")
+
+    @management_fee.setter
+    def management_fee(self, value: float) -> None:
+        self._store._set_term(self._row, "management_fee", value)
+
+    @property
+    def _management_fee_strategy(self) -> ManagementFeeStrategy:
+        return ManagementFeeStrategy(annual_fee=self.management_fee, account_creation_date=self.date_created)
+
+
+# View class for each type code
+_VIEW_CLASSES = {ACCOUNT_TYPE_CODES[ChequingAccount]: ChequingAccountView,
+                 ACCOUNT_TYPE_CODES[SavingsAccount]: SavingsAccountView,
+                 ACCOUNT_TYPE_CODES[InvestmentAccount]: InvestmentAccountView}
+
+
+def _or_null(value) -> float:
+    """Returns value as a float, or NaN for a missing optional value."""
+    return NULL if value is None or value != value else float(value)
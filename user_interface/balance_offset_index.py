@@ -0,0 +1,181 @@
+"""
+Description: Keeps the byte offset of every balance field in accounts.csv so that a
+balance update can be written in place instead of rewriting the whole file.
+Author: Sukhtab Singh Warya
+Date: 18/10/2026
+"""
+
+import csv
+import os
+
+# Width that balances are padded to by convert_to_fixed_width
+BALANCE_FIELD_WIDTH = 15
+
+
+class BalanceOffsetIndex:
+    """
+    Maps each account number in accounts.csv to the byte offset and width of its
+    balance field. A new balance that fits in the existing field is written with a
+    single positioned write, right-justified and padded with spaces (float() ignores
+    the padding when the file is read back). The index is rebuilt automatically when
+    the file has been changed by anything other than the index itself.
+    """
+
+    def __init__(self, accounts_path: str, field_name: str = "balance"):
+        """
+        Initializes the index and scans the accounts file.
+        Args:
+            accounts_path (str): Path to the accounts file.
+            field_name (str): The column whose offsets are indexed.
+        """
+        self._accounts_path = accounts_path
+        self._field_name = field_name
+        self._offsets: dict[int, tuple[int, int]] = {}
+        self._usable = False
+        self._file_state = None
+        self.build()
+
+    @property
+    def usable(self) -> bool:
+        """Return True if the file layout allows positioned writes."""
+        return self._usable
+
+    def __len__(self) -> int:
+        return len(self._offsets)
+
+    def __contains__(self, account_number: int) -> bool:
+        return account_number in self._offsets
+
+    def build(self) -> bool:
+        """
+        Scans the accounts file and records the offset and width of each balance field.
+        The index is left unusable when the file is missing or contains quoted fields,
+        since a quoted field can hold a delimiter or a line break.
+        Returns:
+            bool: True if the index can be used for positioned writes.
+        """
+        self._offsets = {}
+        self._usable = False
+
+        try:
+            with open(self._accounts_path, "rb") as file:
+                header = file.readline()
+                if b'"' in header:
+                    return False
+                fields = header.rstrip(b"\r\n").decode().split(",")
+                if "account_number" not in fields or self._field_name not in fields:
+                    return False
+                account_column = fields.index("account_number")
+                field_column = fields.index(self._field_name)
+
+                offset = len(header)
+                for line in file:
+                    if b'"' in line:
+                        self._offsets = {}
+                        return False
+                    values = line.rstrip(b"\r\n").split(b",")
+                    if len(values) > max(account_column, field_column):
+                        try:
+                            account_number = int(values[account_column])
+                        except ValueError:
+                            account_number = None
+                        if account_number is not None:
+                            start = offset + sum(len(value) + 1 for value in values[:field_column])
+                            self._offsets[account_number] = (start, len(values[field_column]))
+                    offset += len(line)
+
+                self._file_state = self._stat()
+        except FileNotFoundError:
+            return False
+
+        self._usable = True
+        return True
+
+    def format_balance(self, balance: float, width: int = BALANCE_FIELD_WIDTH) -> str:
+        """
+        Formats a balance as it is stored in a fixed-width field.
+        Args:
+            balance (float): The balance to format.
+            width (int): The width of the field.
+        Returns:
+            str: The balance with two decimals, right-justified to width.
+        """
+        return f"{balance:.2f}".rjust(width)
+
+    def write_balance(self, account_number: int, balance: float) -> bool:
+        """
+        Writes a balance over the existing balance field of an account.
+        Args:
+            account_number (int): The account to update.
+            balance (float): The new balance.
+        Returns:
+            bool: True if the balance was written, False if the caller has to
+            fall back to rewriting the file (unknown account, unusable layout
+            or a balance that does not fit in the existing field).
+        """
+        if self._file_state != self._stat():
+            self.build()
+
+        if not self._usable or account_number not in self._offsets:
+            return False
+
+        offset, width = self._offsets[account_number]
+        text = self.format_balance(balance, width).encode()
+        if len(text) > width:
+            return False
+
+        with open(self._accounts_path, "r+b") as file:
+            file.seek(offset)
+            file.write(text)
+
+        self._file_state = self._stat()
+        return True
+
+    def _stat(self) -> tuple[int, int] | None:
+        """Return the size and modification time of the accounts file."""
+        try:
+            status = os.stat(self._accounts_path)
+        except FileNotFoundError:
+            return None
+        return status.st_size, status.st_mtime_ns
+
+
+def convert_to_fixed_width(accounts_path: str, width: int = BALANCE_FIELD_WIDTH) -> bool:
+    """
+    Rewrites the accounts file once with every balance padded to the same width,
+    so that any later balance up to that width can be written in place. The file
+    is left untouched when its balances are already padded, so that its
+    modification time only changes when the layout does. Rows with more fields
+    than the header are written back with all of their fields.
+    Args:
+        accounts_path (str): Path to the accounts file.
+        width (int): The width to pad balances to.
+    Returns:
+        bool: True if the file was rewritten, False if it was already padded
+        or has no balance column.
+    """
+    with open(accounts_path, mode='r', newline='') as file:
+        rows = list(csv.reader(file))
+
+    if not rows or 'balance' not in rows[0]:
+        return False
+    balance_column = rows[0].index('balance')
+
+    changed = False
+    for row in rows[1:]:
+        if len(row) <= balance_column:
+            continue  # Leave short rows for load_data to report
+        try:
+            padded = f"{float(row[balance_column]):.2f}".rjust(width)
+        except ValueError:
+            continue  # Leave invalid balances for load_data to report
+        if padded != row[balance_column]:
+            row[balance_column] = padded
+            changed = True
+
+    if not changed:
+        return False
+
+    with open(accounts_path, mode='w', newline='') as file:
+        csv.writer(file).writerows(rows)
+    return True
@@ -0,0 +1,218 @@
+"""
+Description: Runs month-end billing: charges every account its service charges as a
+withdrawal, in partitions by client number across a process pool, with a checkpoint that
+lets an interrupted run resume.
+Author: Sukhtab Singh Warya
+Date: 18/10/2026
+"""
+
+import copy
+import json
+import logging
+import os
+import time
+from concurrent.futures import ProcessPoolExecutor, as_completed
+from typing import Callable, Iterable, Mapping, NamedTuple
+from bank_account.bank_account import BankAccount
+from user_interface import manage_data
+from user_interface.queued_logging import ErrorSummary
+from user_interface.service_charges import portfolio_service_charges
+
+
+class BillingReport(NamedTuple):
+    """The outcome of a billing run."""
+    accounts: int = 0
+    accounts_charged: int = 0
+    accounts_rejected: int = 0
+    total_charges: float = 0.0
+    partitions_resumed: int = 0
+    elapsed: float = 0.0
+
+    @property
+    def accounts_per_second(self) -> float:
+        """Return the number of accounts billed per second."""
+        return self.accounts / self.elapsed if self.elapsed else 0.0
+
+
+def run_billing(accounts: Mapping[int, BankAccount], run_id: str,
+                persist: Callable[[dict[int, float]], dict[int, float] | None] = manage_data.write_balances,
+                checkpoint_path: str = None, workers: int = 1, partitions: int = None) -> BillingReport:
+    """
+    Charges every account its service charges. Accounts are split into partitions by
+    client number, so all the accounts of a client are billed together. The charges of
+    each partition are calculated by portfolio_service_charges, in a pool of worker
+    processes when workers is more than one, and applied as withdrawals to the accounts
+    in this process, so observers are notified as usual. A withdrawal the account
+    refuses is logged and the account is left uncharged. The new balances are then
+    persisted in one call. A store that merges concurrent writes, such as
+    VersionedAccountWriter.save_balances, returns the balances it wrote; they are given
+    to the accounts, so that their next write does not undo the other write.
+
+    When a checkpoint path is given, each billed partition is recorded there with the
+    resulting balances. If the run is interrupted, calling run_billing again with the
+    same run_id and partitions restores the recorded balances instead of charging those
+    partitions again. Recording balances rather than charges makes the final write
+    safe to repeat. The checkpoint is removed once the balances are persisted.
+    Args:
+        accounts (Mapping[int, BankAccount]): The accounts by account number.
+        run_id (str): Names the billing period, e.g. "2026-10"; a checkpoint of another
+            run is ignored.
+        persist (Callable): Called once with the new balance of each charged account,
+            e.g. AccountRepository.save_balances. Defaults to manage_data.write_balances.
+            May return the balance written for each account.
+        checkpoint_path (str): Path to the checkpoint file, or None for no checkpoint.
+        workers (int): Number of worker processes.
+        partitions (int): Number of partitions. Defaults to the number of workers.
+    Returns:
+        BillingReport: The number of accounts billed, charged and rejected, the total
+        charged and the time taken.
+    """
+    if workers < 1:
+        raise ValueError("Number of workers must be at least 1.")
+    partitions = partitions or workers
+    start = time.perf_counter()
+
+    by_partition: list[list[BankAccount]] = [[] for _ in range(partitions)]
+    for account in accounts.values():
+        by_partition[account.client_number % partitions].append(account)
+
+    with ErrorSummary("Billing run"):
+        checkpoint = _Checkpoint(checkpoint_path, run_id, partitions) if checkpoint_path else None
+        completed = checkpoint.completed if checkpoint else {}
+
+        balances: dict[int, float] = {}
+        charged = rejected = 0
+        total_charges = 0.0
+        for record in completed.values():
+            for account_number, balance in record["balances"].items():
+                try:
+                    accounts[int(account_number)]._balance = balance
+                except KeyError:
+                    continue
+                balances[int(account_number)] = balance
+            charged += len(record["balances"])
+            rejected += record["rejected"]
+            total_charges += record["charges"]
+
+        pending = [partition for partition in range(partitions) if partition not in completed]
+        for partition, charges in _charge_partitions(by_partition, pending, workers):
+            record = _apply_charges(accounts, charges)
+            if checkpoint:
+                checkpoint.record(partition, record)
+            balances.update(record["balances"])
+            charged += len(record["balances"])
+            rejected += record["rejected"]
+            total_charges += record["charges"]
+
+        if balances:
+            written = persist(balances)
+            for account_number, balance in (written or {}).items():
+                accounts[account_number]._balance = balance
+        if checkpoint:
+            checkpoint.remove()
+
+    return BillingReport(len(accounts), charged, rejected, round(total_charges, 2), len(completed),
+                         time.perf_counter() - start)
+
+
+def _charge_partitions(by_partition: list[list[BankAccount]], pending: list[int],
+                       workers: int) -> Iterable[tuple[int, dict[int, float]]]:
+    """Yields each pending partition with its charges as soon as they are calculated."""
+    if workers == 1:
+        for partition in pending:
+            yield partition, portfolio_service_charges(by_partition[partition])
+        return
+
+    with ProcessPoolExecutor(max_workers=workers) as executor:
+        futures = {executor.submit(_charge_partition, [_detached(account) for account in by_partition[partition]]):
+                   partition for partition in pending}
+        for future in as_completed(futures):
+            yield futures[future], future.result()
+
+
+def _charge_partition(accounts: list[BankAccount]) -> dict[int, float]:
+    """Calculates the charges of a partition in a worker process."""
+    return portfolio_service_charges(accounts)
+
+
+def _detached(account: BankAccount) -> BankAccount:
+    """Returns a copy of an account without its observers, which do not need to be sent to a worker."""
+    account = copy.copy(account)
+    account._observers = None
+    return account
+
+
+def _apply_charges(accounts: Mapping[int, BankAccount], charges: dict[int, float]) -> dict:
+    """Withdraws the charges from the accounts and returns the record kept in the checkpoint."""
+    balances = {}
+    rejected = 0
+    total_charges = 0.0
+    for account_number, charge in charges.items():
+        if charge <= 0:
+            continue
+        account = accounts[account_number]
+        try:
+            account.withdraw(charge)
+        except ValueError as e:
+            logging.error(f"Unable to charge account {account_number}: {e}")
+            rejected += 1
+            continue
+        balances[account_number] = account.balance
+        total_charges += charge
+    return {"balances": balances, "rejected": rejected, "charges": total_charges}
+
+
+class _Checkpoint:
+    """
+    A JSON lines file: a header naming the run, then one line per billed partition.
+    Lines are appended and synced, and a partly written last line is ignored.
+    """
+
+    def __init__(self, path: str, run_id: str, partitions: int):
+        self._path = path
+        header = {"run_id": run_id, "partitions": partitions}
+        self.completed: dict[int, dict] = {}
+
+        lines = _read_lines(path)
+        if lines and lines[0] == header:
+            self.completed = {line["partition"]: line for line in lines[1:]}
+        elif lines:
+            logging.error(f"Ignoring billing checkpoint {path} of another run: {lines[0]}")
+
+        with open(path, "w") as file:
+            for line in [header, *self.completed.values()]:
+                file.write(json.dumps(line) + "\n")
+            _sync(file)
+
+    def record(self, partition: int, record: dict) -> None:
+        """Appends the record of a billed partition."""
+        with open(self._path, "a") as file:
+            file.write(json.dumps({"partition": partition, **record}) + "\n")
+            _sync(file)
+
+    def remove(self) -> None:
+        """Removes the checkpoint once the run is persisted."""
+        os.remove(self._path)
+
+
+def _read_lines(path: str) -> list[dict]:
+    """Reads the complete lines of a checkpoint file."""
+    try:
+        with open(path) as file:
+            lines = []
+            for text in file:
+                if not text.endswith("\n"):
+                    break
+                lines.append(json.loads(text))
+            return lines
+    except FileNotFoundError:
+        return []
+    except ValueError as e:
+        logging.error(f"Unable to read billing checkpoint {path}: {e}")
+        return []
+
+
+def _sync(file) -> None:
+    """Flushes a file to disk."""
+    file.flush()
+    os.fsync(file.fileno())
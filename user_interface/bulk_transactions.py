@@ -0,0 +1,158 @@
+"""
+Description: Applies a batch of deposits and withdrawals to bank accounts: the whole
+batch is validated first, the accepted transactions are applied in memory with their
+notifications grouped by account, and the new balances are persisted once.
+Author: Sukhtab Singh Warya
+Date: 18/10/2026
+"""
+
+import csv
+import logging
+import math
+import time
+from typing import Callable, Iterable, Iterator, Mapping, NamedTuple
+from bank_account.bank_account import BankAccount
+from bank_account.cents_account import CentsAccount
+from user_interface.queued_logging import ErrorSummary
+from utility.money import to_cents, from_cents
+
+TRANSACTION_KINDS = ("deposit", "withdraw")
+
+
+class Rejection(NamedTuple):
+    """A transaction left out of a batch and the reason why."""
+    record_number: int
+    account_number: object
+    kind: object
+    amount: object
+    reason: str
+
+
+class BulkReport(NamedTuple):
+    """The outcome of applying a batch of transactions."""
+    transactions: int = 0
+    applied: int = 0
+    accounts_updated: int = 0
+    rejections: tuple[Rejection, ...] = ()
+    elapsed: float = 0.0
+
+    @property
+    def transactions_per_second(self) -> float:
+        """Return the number of transactions processed per second."""
+        return self.transactions / self.elapsed if self.elapsed else 0.0
+
+
+def read_transactions(transactions_path: str) -> Iterator[list[str]]:
+    """
+    Reads transactions from a CSV file with an account_number,kind,amount header.
+    Args:
+        transactions_path (str): Path to the transactions file.
+    Returns:
+        Iterator[list[str]]: The account number, kind and amount of each transaction.
+    """
+    with open(transactions_path, newline="") as file:
+        reader = csv.reader(file)
+        header = next(reader, None)
+        if header is None:
+            return
+        positions = [header.index(field) for field in ("account_number", "kind", "amount")]
+        for row in reader:
+            yield [row[position] if position < len(row) else "" for position in positions]
+
+
+def apply_transactions(accounts: Mapping[int, BankAccount], transactions: Iterable[tuple],
+                       persist: Callable[[dict[int, float]], dict[int, float] | None]) -> BulkReport:
+    """
+    Applies a batch of transactions. Every transaction is validated before any is
+    applied, by the rules of BankAccount.deposit and withdraw: the account must exist,
+    the kind must be deposit or withdraw, the amount must be positive and a withdrawal
+    must not exceed the balance the account will have when it is reached, counting the
+    earlier transactions of the batch. Rejected transactions are logged and reported;
+    the accepted ones are applied to their accounts with update_balance_batch, so each
+    account raises its notifications once for the batch. Accounts that keep their
+    balance in cents are validated and updated in cents, so the batch accepts exactly
+    what their withdraw would. The new balances are then persisted in one call. A store
+    that merges concurrent writes, such as VersionedAccountWriter.save_balances, returns
+    the balances it wrote; they are given to the accounts, so that the next write of an
+    account starts from the merged balance rather than undoing the other write.
+    Args:
+        accounts (Mapping[int, BankAccount]): The accounts by account number.
+        transactions (Iterable[tuple]): The account number, kind and amount of each
+            transaction, as values or as the strings read_transactions returns.
+        persist (Callable): Called once with the new balance of each updated account,
+            e.g. the save_balances method of the account store, so that the store's
+            checks apply to the batch. May return the balance written for each account.
+    Returns:
+        BulkReport: The number of transactions read and applied, the number of accounts
+        updated, the rejected transactions and the time taken.
+    """
+    start = time.perf_counter()
+    amounts: dict[int, list[float | int]] = {}
+    balances: dict[int, float | int] = {}
+    rejections = []
+    count = 0
+
+    with ErrorSummary("Bulk transactions"):
+        for count, (account_number, kind, amount) in enumerate(transactions, 1):
+            try:
+                number, signed_amount = _validate(accounts, balances, account_number, kind, amount)
+            except ValueError as e:
+                rejections.append(Rejection(count, account_number, kind, amount, str(e)))
+                logging.error(f"Rejected transaction {count}: {e}")
+                continue
+            balances[number] += signed_amount
+            amounts.setdefault(number, []).append(signed_amount)
+
+        for number, account_amounts in amounts.items():
+            account = accounts[number]
+            if isinstance(account, CentsAccount):
+                account.update_cents_batch(account_amounts)
+            else:
+                account.update_balance_batch(account_amounts)
+        if amounts:
+            written = persist({number: accounts[number].balance for number in amounts})
+            for number, balance in (written or {}).items():
+                accounts[number]._balance = balance
+
+    applied = sum(len(account_amounts) for account_amounts in amounts.values())
+    return BulkReport(count, applied, len(amounts), tuple(rejections), time.perf_counter() - start)
+
+
+def _validate(accounts: Mapping[int, BankAccount], balances: dict[int, float | int], account_number,
+              kind, amount) -> tuple[int, float | int]:
+    """
+    Checks a transaction against the balance its account will have when it is applied.
+    The balances and amounts of accounts kept in cents are integer cents.
+    Returns:
+        tuple[int, float | int]: The account number and the signed amount.
+    """
+    try:
+        number = int(account_number)
+    except (TypeError, ValueError):
+        raise ValueError(f"Account number {account_number!r} is not a number.")
+    if number not in accounts:
+        raise ValueError(f"Account {number} does not exist.")
+    in_cents = isinstance(accounts[number], CentsAccount)
+    if number not in balances:
+        balances[number] = accounts[number].cents if in_cents else accounts[number]._balance
+
+    if kind not in TRANSACTION_KINDS:
+        raise ValueError(f"Transaction kind must be one of {', '.join(TRANSACTION_KINDS)}.")
+    try:
+        value = float(amount)
+    except (TypeError, ValueError):
+        value = math.nan
+    if not math.isfinite(value):
+        raise ValueError(f"Amount {amount!r} is not a number.")
+    amount = to_cents(value) if in_cents else value
+
+    if kind == "deposit":
+        if value <= 0:
+            raise ValueError(f"Deposit amount: ${value:.2f} must be positive.")
+        return number, amount
+    if value <= 0:
+        raise ValueError(f"Withdrawal amount: ${value:.2f} must be positive.")
+    if amount > balances[number]:
+        balance = from_cents(balances[number]) if in_cents else round(balances[number], 2)
+        raise ValueError(f"Withdrawal amount: ${value:.2f} must not exceed the account balance: ${balance:.2f}")
+    return number, -amount
@@ -5,22 +5,81 @@ Date: 18/11/2024
 """
 
 from PySide6.QtWidgets import QTableWidgetItem, QMessageBox
-from PySide6.QtCore import Slot, Qt
+from PySide6.QtCore import Slot, Qt, QTimer
+import logging
+from functools import partial
 from ui_superclasses.lookup_window import LookupWindow
 from user_interface.account_details_window import AccountDetailsWindow
-from user_interface.manage_data import load_data, update_data
+from user_interface.manage_data import load_data, accounts_csv_path, journal_csv_path
+from user_interface.balance_offset_index import BalanceOffsetIndex, convert_to_fixed_width
+from user_interface.data_snapshot import account_type_of
+from user_interface.write_behind_buffer import WriteBehindBuffer
+from user_interface.transaction_journal import TransactionJournal
+from user_interface.account_repository import AccountRepository, CsvAccountRepository
+from user_interface.versioned_account_writer import VersionedAccountWriter, has_version_column
+from user_interface.data_file_watcher import DataFileWatcher
 from bank_account.bank_account import BankAccount
 
 
 class ClientLookupWindow(LookupWindow):
-    def __init__(self):
+    def __init__(self, repository: AccountRepository = None):
         """
         Initialize the ClientLookupWindow, load data, and set up event connections.
+
+        Args:
+            repository (AccountRepository): Optional storage engine, e.g. a
+                SqliteAccountRepository. When None, the CSV files are used.
         """
         super().__init__()
 
-        # Load data into dictionaries
-        self.client_listing, self.accounts = load_data()
+        self.repository = repository
+
+        # Journal every transaction so that no balance is lost between writes. Each running copy of
+        # the application claims a journal of its own and takes over those of copies that stopped.
+        self.journal = TransactionJournal.claim(journal_csv_path)
+
+        if repository is None:
+            # Load data into dictionaries, with the balances of the claimed journal applied
+            self.client_listing, self.accounts = load_data(self.journal.journal_path)
+
+            if has_version_column(accounts_csv_path):
+                # Other copies of the application may write the same file; lock rows and check versions
+                self.balance_store = VersionedAccountWriter(accounts_csv_path)
+            else:
+                # Pad the balances so that later updates fit their fields, then index the
+                # fields so that updates are written in place
+                try:
+                    convert_to_fixed_width(accounts_csv_path)
+                except OSError as e:
+                    logging.error(f"Unable to pad the balances in {accounts_csv_path}: {e}")
+                self.balance_store = CsvAccountRepository(offset_index=BalanceOffsetIndex(accounts_csv_path))
+        else:
+            self.client_listing, self.accounts = repository.load_data(self.journal.journal_path)
+            self.balance_store = repository
+
+        # Collect balance updates and write them together
+        self.write_buffer = WriteBehindBuffer(self.balance_store.save_accounts)
+
+        # Save the balances recovered from the journal now; once accounts.csv is written again,
+        # journal lines older than the write are no longer replayed
+        self.compact_journal()
+
+        # Record the transactions of every account in the claimed journal
+        BankAccount.transaction_journal = self.journal
+
+        # Pick up outside edits to the CSV files without reloading everything
+        self.file_watcher = None
+        if repository is None:
+            # Accounts refreshed from the file are tracked by the versioned writer at their new version
+            refreshed = None
+            if isinstance(self.balance_store, VersionedAccountWriter):
+                refreshed = partial(self.balance_store.track, refresh=True)
+            self.file_watcher = DataFileWatcher(self.client_listing, self.accounts, unsaved=self.write_buffer,
+                                                refreshed=refreshed)
+            self.file_watcher.start()
+            self.reload_timer = QTimer(self)
+            self.reload_timer.timeout.connect(self.on_data_files_changed)
+            self.reload_timer.start(2000)
 
         # Connect the lookup_button click event to the on_lookup_client method
         self.lookup_button.clicked.connect(self.on_lookup_client)
@@ -74,28 +133,27 @@ class ClientLookupWindow(LookupWindow):
         self.client_info_label.setText(f"{client.first_name} {client.last_name}")
 
         # Populate the accounts table with accounts belonging to the client
-        for account in self.accounts.values():
-            if account.client_number == client_number:
-                row_position = self.account_table.rowCount()
-                self.account_table.insertRow(row_position)
-
-                # Add account details to the table
-                account_number_item = QTableWidgetItem(str(account.account_number))
-                balance_item = QTableWidgetItem(f"${account.balance:,.2f}")
-                date_created_item = QTableWidgetItem(account.date_created.strftime("%Y-%m-%d"))
-                account_type_item = QTableWidgetItem(account.__class__.__name__)
-
-                # Align items properly
-                account_number_item.setTextAlignment(Qt.AlignCenter)
-                balance_item.setTextAlignment(Qt.AlignRight)
-                date_created_item.setTextAlignment(Qt.AlignCenter)
-                account_type_item.setTextAlignment(Qt.AlignCenter)
-
-                # Add items to the table
-                self.account_table.setItem(row_position, 0, account_number_item)
-                self.account_table.setItem(row_position, 1, balance_item)
-                self.account_table.setItem(row_position, 2, date_created_item)
-                self.account_table.setItem(row_position, 3, account_type_item)
+        for account in self.accounts.for_client(client_number):
+            row_position = self.account_table.rowCount()
+            self.account_table.insertRow(row_position)
+
+            # Add account details to the table
+            account_number_item = QTableWidgetItem(str(account.account_number))
+            balance_item = QTableWidgetItem(f"${account.balance:,.2f}")
+            date_created_item = QTableWidgetItem(account.date_created.strftime("%Y-%m-%d"))
+            account_type_item = QTableWidgetItem(account_type_of(account).__name__)
+
+            # Align items properly
+            account_number_item.setTextAlignment(Qt.AlignCenter)
+            balance_item.setTextAlignment(Qt.AlignRight)
+            date_created_item.setTextAlignment(Qt.AlignCenter)
+            account_type_item.setTextAlignment(Qt.AlignCenter)
+
+            # Add items to the table
+            self.account_table.setItem(row_position, 0, account_number_item)
+            self.account_table.setItem(row_position, 1, balance_item)
+            self.account_table.setItem(row_position, 2, date_created_item)
+            self.account_table.setItem(row_position, 3, account_type_item)
 
         # Adjust column widths to fit content
         self.account_table.resizeColumnsToContents()
@@ -141,7 +199,7 @@ class ClientLookupWindow(LookupWindow):
     @Slot(BankAccount)
     def update_data(self, account: BankAccount):
         """
-        Update the account data in the table and save it to the CSV file.
+        Update the account data in the table and queue it to be saved to the CSV file.
         """
         for row in range(self.account_table.rowCount()):
             if int(self.account_table.item(row, 0).text()) == account.account_number:
@@ -152,8 +210,56 @@ class ClientLookupWindow(LookupWindow):
         # Update the accounts dictionary
         self.accounts[account.account_number] = account
 
-        # Save the updated data to the CSV file
-        update_data(account)
+        # Queue the updated data to be saved to the CSV file
+        self.write_buffer.mark_dirty(account)
+
+        # Fold the journal into the CSV file once it has grown large enough
+        if self.journal.needs_compaction:
+            self.compact_journal()
+
+    def on_data_files_changed(self):
+        """
+        Apply outside edits to the data files and refresh the displayed client.
+        """
+        report = self.file_watcher.poll()
+        if report is None or not report.rows_touched:
+            return
+
+        logging.info(f"Reloaded data files, {report.rows_touched} rows touched: {report}")
+
+        # Show the displayed client again in case their details or accounts changed
+        client_number_text = self.client_number_edit.text().strip()
+        if client_number_text.isdigit() and self.account_table.rowCount():
+            self.on_lookup_client()
+
+    def closeEvent(self, event):
+        """
+        Save any queued account updates before the window closes.
+        """
+        if self.file_watcher is not None:
+            self.reload_timer.stop()
+            self.file_watcher.stop()
+        try:
+            self.write_buffer.close()
+        except Exception as e:
+            # The journal keeps the unsaved balances; they are applied at the next start
+            logging.error(f"Unable to save account balances: {e}")
+        else:
+            self.compact_journal()
+        self.journal.close()
+        BankAccount.transaction_journal = None
+        if self.repository is not None:
+            self.repository.close()
+        super().closeEvent(event)
+
+    def compact_journal(self):
+        """
+        Fold the journal into the CSV file or the repository. The journaled accounts are
+        saved from the account objects, which hold any balance merged from another
+        process's write, rather than from the balances recorded in the journal.
+        """
+        accounts_path = accounts_csv_path if self.repository is None else None
+        self.journal.compact_accounts(self.accounts, self.balance_store.save_accounts, accounts_path)
 
     def on_filter_clicked(self):
         """
@@ -0,0 +1,316 @@
+"""
+Description: Defines the DataFileWatcher class, which notices outside edits to clients.csv
+and accounts.csv and applies only the rows that changed to the loaded data.
+Author: Sukhtab Singh Warya
+Date: 18/10/2026
+"""
+
+import csv
+import logging
+import os
+import threading
+from typing import Callable, Container, MutableMapping, NamedTuple
+from bank_account.bank_account import BankAccount
+from client.client import Client
+from user_interface import manage_data
+from user_interface.queued_logging import ErrorSummary
+from user_interface.row_schema import CLIENTS_SCHEMA
+
+try:
+    from watchdog.observers import Observer
+except ImportError:
+    Observer = None
+
+
+class ReloadReport(NamedTuple):
+    """The number of clients and accounts a reload added, removed and changed."""
+    clients_added: int = 0
+    clients_removed: int = 0
+    clients_changed: int = 0
+    accounts_added: int = 0
+    accounts_removed: int = 0
+    accounts_changed: int = 0
+
+    @property
+    def rows_touched(self) -> int:
+        """Return the total number of clients and accounts that were added, removed or changed."""
+        return sum(self)
+
+
+class DataFileWatcher:
+    """
+    Keeps a client dictionary and an account dictionary in step with the CSV files
+    they were loaded from. The watcher remembers a hash of every row; when a file
+    changes, it is read again and only rows whose hash differs are turned into
+    objects, so a small edit to a large file costs one read of the file and a few
+    object constructions instead of a full reload.
+
+    Call poll() periodically, e.g. from a QTimer. Without watchdog installed, poll()
+    compares the size and modification time of each file. After start() has set up
+    a watchdog observer, poll() returns immediately unless the observer has seen an
+    event for one of the files.
+
+    Row validation matches manage_data: invalid rows are logged and left out, and
+    accounts are only kept while their client exists. A changed row that produces an
+    account equal to the one in memory (for example after the application wrote a
+    balance itself) leaves the in-memory account in place. A changed row of the same
+    type, client and creation date updates the in-memory account object, so that the
+    windows and buffers holding it see the new values.
+
+    Rows of accounts in unsaved, such as a WriteBehindBuffer, are left alone: the file
+    holds an older balance than memory, which is written back by the next flush. They
+    are compared again by the next reload.
+
+    The accounts that a reload adds or updates are passed to refreshed, so that a
+    VersionedAccountWriter can record the versions they were read at (see
+    VersionedAccountWriter.track). Otherwise the writer's next save would take the
+    refreshed balance for a local change and apply the other process's change twice.
+    """
+
+    def __init__(self, client_listing: dict[int, Client], accounts: MutableMapping[int, BankAccount],
+                 clients_path: str = None, accounts_path: str = None, unsaved: Container[int] = (),
+                 refreshed: Callable[[list[BankAccount]], None] = None):
+        """
+        Initializes the watcher with the rows currently in the files.
+        Args:
+            client_listing (dict[int, Client]): The loaded clients, updated in place.
+            accounts (MutableMapping[int, BankAccount]): The loaded accounts, updated in place.
+            clients_path (str): Path to the clients file. Defaults to data/clients.csv.
+            accounts_path (str): Path to the accounts file. Defaults to data/accounts.csv.
+            unsaved (Container[int]): The account numbers whose changes have not been
+                written yet, e.g. a WriteBehindBuffer.
+            refreshed (Callable): Optional function called with the accounts each reload
+                adds or updates from the file.
+        """
+        self._client_listing = client_listing
+        self._accounts = accounts
+        self._unsaved = unsaved
+        self._refreshed = refreshed
+        self._clients_path = os.path.abspath(clients_path or manage_data.clients_csv_path)
+        self._accounts_path = os.path.abspath(accounts_path or manage_data.accounts_csv_path)
+        self._changed = threading.Event()
+        self._observer = None
+
+        self._stats = self._stat_files()
+        _, client_rows = _read_rows(self._clients_path, "client_number")
+        _, account_rows = _read_rows(self._accounts_path, "account_number")
+        self._client_hashes = {key: hash(row) for key, row in client_rows.items()}
+        self._account_hashes = {key: hash(row) for key, row in account_rows.items()}
+
+    def start(self) -> bool:
+        """
+        Starts a watchdog observer for the data files if watchdog is installed.
+        Returns:
+            bool: True if the observer was started, False if poll() keeps polling.
+        """
+        if Observer is None or self._observer is not None:
+            return self._observer is not None
+
+        handler = _DataFileEventHandler(self._changed, {self._clients_path, self._accounts_path})
+        self._observer = Observer()
+        for directory in {os.path.dirname(self._clients_path), os.path.dirname(self._accounts_path)}:
+            self._observer.schedule(handler, directory)
+        self._observer.daemon = True
+        self._observer.start()
+        return True
+
+    def stop(self) -> None:
+        """Stops the watchdog observer, if one was started."""
+        if self._observer is not None:
+            self._observer.stop()
+            self._observer.join()
+            self._observer = None
+
+    def poll(self) -> ReloadReport | None:
+        """
+        Applies outside changes to the data files, if there are any.
+        Returns:
+            ReloadReport: The changes applied, or None if neither file has changed.
+        """
+        if self._observer is not None:
+            if not self._changed.is_set():
+                return None
+            self._changed.clear()
+
+        if self._stat_files() == self._stats:
+            return None
+        return self.reload()
+
+    def reload(self) -> ReloadReport:
+        """
+        Reads both files and applies the rows that differ from the last read.
+        Returns:
+            ReloadReport: The changes applied.
+        """
+        # Taken before reading so that a write made during the read is seen by the next poll
+        self._stats = self._stat_files()
+
+        with ErrorSummary("Data file reload"):
+            clients_added, clients_removed, clients_changed, affected_clients = self._reload_clients()
+            accounts_added, accounts_removed, accounts_changed = self._reload_accounts(affected_clients)
+
+        return ReloadReport(clients_added, clients_removed, clients_changed,
+                            accounts_added, accounts_removed, accounts_changed)
+
+    def _reload_clients(self) -> tuple[int, int, int, set[int]]:
+        """Applies changed client rows; also returns the client numbers that appeared or disappeared."""
+        fieldnames, rows = _read_rows(self._clients_path, "client_number")
+        convert = CLIENTS_SCHEMA.compile(fieldnames)
+        added = removed = changed = 0
+        affected = set()
+        hashes = {}
+
+        for key, row in rows.items():
+            hashes[key] = row_hash = hash(row)
+            if self._client_hashes.get(key) == row_hash:
+                continue
+
+            try:
+                client = manage_data._client_from_values(convert(list(row)))
+            except Exception as e:
+                logging.error(f"Unable to create client: {e}")
+                client = None
+
+            existing = self._client_listing.get(_to_int(key))
+            if client is None:
+                if existing is not None:
+                    del self._client_listing[existing.client_number]
+                    removed += 1
+                    affected.add(existing.client_number)
+            elif existing is None:
+                self._client_listing[client.client_number] = client
+                added += 1
+                affected.add(client.client_number)
+            elif str(client) != str(existing):
+                self._client_listing[client.client_number] = client
+                changed += 1
+
+        for key in self._client_hashes.keys() - hashes.keys():
+            client_number = _to_int(key)
+            if client_number in self._client_listing:
+                del self._client_listing[client_number]
+                removed += 1
+                affected.add(client_number)
+
+        self._client_hashes = hashes
+        return added, removed, changed, affected
+
+    def _reload_accounts(self, affected_clients: set[int]) -> tuple[int, int, int]:
+        """Applies changed account rows and rows whose client appeared or disappeared."""
+        fieldnames, rows = _read_rows(self._accounts_path, "account_number")
+        client_column = fieldnames.index("client_number") if "client_number" in fieldnames else None
+        added = removed = changed = 0
+        hashes = {}
+        refreshed = []
+
+        for key, row in rows.items():
+            hashes[key] = row_hash = hash(row)
+            client_number = _to_int(row[client_column]) if client_column is not None and client_column < len(row) else None
+            if self._account_hashes.get(key) == row_hash and client_number not in affected_clients:
+                continue
+
+            account_number = _to_int(key)
+            if account_number in self._unsaved and key in self._account_hashes:
+                # Memory is newer than the file; look at the row again once the account is written
+                hashes[key] = self._account_hashes[key]
+                continue
+
+            parsed = list(manage_data._parse_accounts([list(row)], fieldnames, self._client_listing))
+            account = parsed[0] if parsed else None
+
+            existing = self._accounts.get(account_number) if account_number is not None else None
+            if account is None:
+                if existing is not None:
+                    del self._accounts[account_number]
+                    removed += 1
+            elif existing is None:
+                self._accounts[account.account_number] = account
+                refreshed.append(account)
+                added += 1
+            elif _same_account(account, existing):
+                continue
+            elif (type(account) is type(existing) and account.client_number == existing.client_number
+                  and account.date_created == existing.date_created):
+                _update_account(existing, account)
+                refreshed.append(existing)
+                changed += 1
+            else:
+                self._accounts[account.account_number] = account
+                refreshed.append(account)
+                changed += 1
+
+        for key in self._account_hashes.keys() - hashes.keys():
+            account_number = _to_int(key)
+            if account_number in self._accounts:
+                del self._accounts[account_number]
+                removed += 1
+
+        self._account_hashes = hashes
+        if refreshed and self._refreshed is not None:
+            self._refreshed(refreshed)
+        return added, removed, changed
+
+    def _stat_files(self) -> tuple:
+        """Returns the size and modification time of both files, or None for a missing file."""
+        stats = []
+        for path in (self._clients_path, self._accounts_path):
+            try:
+                stat = os.stat(path)
+                stats.append((stat.st_size, stat.st_mtime_ns))
+            except FileNotFoundError:
+                stats.append(None)
+        return tuple(stats)
+
+
+class _DataFileEventHandler:
+    """Receives watchdog events and flags the ones that concern the data files."""
+
+    def __init__(self, changed: threading.Event, paths: set[str]):
+        self._changed = changed
+        self._paths = paths
+
+    def dispatch(self, event) -> None:
+        paths = {os.path.abspath(event.src_path), os.path.abspath(getattr(event, "dest_path", "") or event.src_path)}
+        if paths & self._paths:
+            self._changed.set()
+
+
+def _read_rows(path: str, key_field: str) -> tuple[list[str], dict[str, tuple[str, ...]]]:
+    """
+    Reads a CSV file into its field names and its rows keyed by the text of the key field.
+    A missing file reads as having no rows.
+    """
+    try:
+        with open(path, newline="") as file:
+            reader = csv.reader(file)
+            fieldnames = next(reader, [])
+            key_column = fieldnames.index(key_field) if key_field in fieldnames else 0
+            return fieldnames, {row[key_column] if key_column < len(row) else "": tuple(row) for row in reader if row}
+    except FileNotFoundError:
+        logging.error(f"{os.path.basename(path)} file not found")
+        return [], {}
+
+
+def _to_int(text: str) -> int | None:
+    """Returns the integer in a key field, or None if it is not one."""
+    try:
+        return int(text)
+    except (TypeError, ValueError):
+        return None
+
+
+def _same_account(account: BankAccount, other: BankAccount) -> bool:
+    """Returns True if two accounts have the same type, owner, creation date and displayed values."""
+    return (type(account) is type(other) and account.client_number == other.client_number
+            and account.date_created == other.date_created and str(account) == str(other))
+
+
+def _update_account(account: BankAccount, parsed: BankAccount) -> None:
+    """Gives a loaded account the balance and terms of an account of the same type parsed from its row."""
+    account._balance = parsed._balance
+    account.service_charge_strategy = parsed.service_charge_strategy
+    for account_class in type(parsed).__mro__:
+        if account_class is BankAccount:
+            break
+        for name in getattr(account_class, "__slots__", ()):
+            setattr(account, name, getattr(parsed, name))
@@ -0,0 +1,190 @@
+"""
+Description: Reads and writes a compact binary snapshot of the loaded clients and bank
+accounts, so that startup does not have to parse the CSV files cell by cell.
+Author: Sukhtab Singh Warya
+Date: 18/10/2026
+"""
+
+import logging
+import math
+import os
+import struct
+import sys
+from array import array
+from datetime import date
+from typing import BinaryIO, Iterable
+from bank_account import BankAccount, ChequingAccount, SavingsAccount, InvestmentAccount
+from client.client import Client
+
+# Version 02 discards the snapshots of version 01, which could be written without the clients
+# whose email deliverability check failed during a DNS outage
+SNAPSHOT_MAGIC = b"PRSNAP02"
+
+# Header: magic, byte order (0 little, 1 big), client count, account count
+_HEADER = struct.Struct("<8sBQQ")
+
+# Type codes stored for each account class
+ACCOUNT_TYPE_CODES = {ChequingAccount: 1, SavingsAccount: 2, InvestmentAccount: 3}
+
+NULL = math.nan
+
+
+def account_type_of(account: BankAccount) -> type:
+    """
+    Returns the account type an account is stored as, for accounts of subclasses such
+    as CentsChequingAccount or ChequingAccountView.
+    Args:
+        account (BankAccount): The account.
+    Returns:
+        type: ChequingAccount, SavingsAccount or InvestmentAccount.
+    """
+    for account_type in ACCOUNT_TYPE_CODES:
+        if isinstance(account, account_type):
+            return account_type
+    raise ValueError(f"Invalid account type for account {account.account_number}: {type(account).__name__}")
+
+
+def snapshot_is_fresh(snapshot_path: str, source_paths: Iterable[str]) -> bool:
+    """
+    Returns True if the snapshot exists and is newer than every source file.
+    Args:
+        snapshot_path (str): Path to the snapshot file.
+        source_paths (Iterable[str]): Paths to the CSV files the snapshot was built from.
+    """
+    try:
+        snapshot_time = os.stat(snapshot_path).st_mtime_ns
+        return all(os.stat(path).st_mtime_ns < snapshot_time for path in source_paths)
+    except FileNotFoundError:
+        return False
+
+
+def write_snapshot(snapshot_path: str, clients: Iterable[Client], accounts: Iterable[BankAccount]) -> None:
+    """
+    Writes clients and accounts to a snapshot file as typed arrays, one array per column.
+    The file is written to a temporary name first and then moved into place, so a
+    reader never sees a partly written snapshot.
+    Args:
+        snapshot_path (str): Path to the snapshot file.
+        clients (Iterable[Client]): The clients to store.
+        accounts (Iterable[BankAccount]): The accounts to store.
+    """
+    client_numbers = array("q")
+    first_names, last_names, email_addresses = [], [], []
+    for client in clients:
+        client_numbers.append(client.client_number)
+        first_names.append(client.first_name)
+        last_names.append(client.last_name)
+        email_addresses.append(client.email_address)
+
+    columns = {name: array(code) for name, code in (
+        ("account_number", "q"), ("client_number", "q"), ("balance", "d"), ("date_created", "i"),
+        ("type_code", "b"), ("overdraft_limit", "d"), ("overdraft_rate", "d"),
+        ("minimum_balance", "d"), ("management_fee", "d"))}
+    for account in accounts:
+        columns["account_number"].append(account.account_number)
+        columns["client_number"].append(account.client_number)
+        columns["balance"].append(account._balance)
+        columns["date_created"].append(account.date_created.toordinal())
+        columns["type_code"].append(ACCOUNT_TYPE_CODES[account_type_of(account)])
+        columns["overdraft_limit"].append(getattr(account, "overdraft_limit", NULL))
+        columns["overdraft_rate"].append(getattr(account, "overdraft_rate", NULL))
+        columns["minimum_balance"].append(getattr(account, "minimum_balance", NULL))
+        columns["management_fee"].append(getattr(account, "management_fee", NULL))
+
+    temporary_path = snapshot_path + ".tmp"
+    with open(temporary_path, "wb") as file:
+        file.write(_HEADER.pack(SNAPSHOT_MAGIC, sys.byteorder == "big", len(client_numbers), len(columns["account_number"])))
+        client_numbers.tofile(file)
+        for strings in (first_names, last_names, email_addresses):
+            _write_strings(file, strings)
+        for column in columns.values():
+            column.tofile(file)
+    os.replace(temporary_path, snapshot_path)
+
+
+def read_snapshot(snapshot_path: str, account_classes: tuple[type, type, type] = (
+        ChequingAccount, SavingsAccount, InvestmentAccount)) -> tuple[dict[int, Client], dict[int, BankAccount]] | None:
+    """
+    Reads the clients and accounts stored in a snapshot file.
+    Args:
+        snapshot_path (str): Path to the snapshot file.
+        account_classes (tuple): The chequing, savings and investment account classes
+            to create.
+    Returns:
+        tuple containing client dictionary and account dictionary, or None if the
+        snapshot is missing, was written on a machine with a different byte order
+        or cannot be read.
+    """
+    try:
+        with open(snapshot_path, "rb") as file:
+            magic, big_endian, client_count, account_count = _HEADER.unpack(file.read(_HEADER.size))
+            if magic != SNAPSHOT_MAGIC or big_endian != (sys.byteorder == "big"):
+                return None
+
+            client_numbers = _read_array(file, "q", client_count)
+            first_names, last_names, email_addresses = (_read_strings(file, client_count) for _ in range(3))
+
+            account_numbers = _read_array(file, "q", account_count)
+            account_client_numbers = _read_array(file, "q", account_count)
+            balances = _read_array(file, "d", account_count)
+            dates_created = _read_array(file, "i", account_count)
+            type_codes = _read_array(file, "b", account_count)
+            overdraft_limits = _read_array(file, "d", account_count)
+            overdraft_rates = _read_array(file, "d", account_count)
+            minimum_balances = _read_array(file, "d", account_count)
+            management_fees = _read_array(file, "d", account_count)
+
+        client_listing = {
+            client_number: Client.from_storage(client_number, first_name, last_name, email_address)
+            for client_number, first_name, last_name, email_address
+            in zip(client_numbers, first_names, last_names, email_addresses)
+        }
+
+        chequing_class, savings_class, investment_class = account_classes
+        accounts = {}
+        for i in range(account_count):
+            date_created = date.fromordinal(dates_created[i])
+            type_code = type_codes[i]
+            if type_code == 1:
+                account = chequing_class(account_numbers[i], account_client_numbers[i], balances[i], date_created,
+                                         overdraft_limits[i], overdraft_rates[i])
+            elif type_code == 2:
+                account = savings_class(account_numbers[i], account_client_numbers[i], balances[i], date_created,
+                                        minimum_balances[i], None)
+            else:
+                account = investment_class(account_numbers[i], account_client_numbers[i], balances[i], date_created,
+                                           management_fees[i], None)
+            accounts[account.account_number] = account
+
+    except FileNotFoundError:
+        return None
+    except (struct.error, EOFError, ValueError, UnicodeDecodeError) as e:
+        logging.error(f"Unable to read snapshot {snapshot_path}: {e}")
+        return None
+
+    return client_listing, accounts
+
+
+def _write_strings(file: BinaryIO, strings: list[str]) -> None:
+    """Writes strings as an array of byte lengths followed by their UTF-8 bytes."""
+    encoded = [string.encode() for string in strings]
+    array("I", map(len, encoded)).tofile(file)
+    file.write(b"".join(encoded))
+
+
+def _read_strings(file: BinaryIO, count: int) -> list[str]:
+    """Reads strings written by _write_strings."""
+    lengths = _read_array(file, "I", count)
+    blob = file.read(sum(lengths))
+    strings, offset = [], 0
+    for length in lengths:
+        strings.append(blob[offset:offset + length].decode())
+        offset += length
+    return strings
+
+
+def _read_array(file: BinaryIO, code: str, count: int) -> array:
+    """Reads count items of the given type code in one bulk read."""
+    values = array(code)
+    values.fromfile(file, count)
+    return values
@@ -5,10 +5,16 @@ Date: 18/11/2024
 """
 
 
+import io
 import os
 import sys
 import csv
-from datetime import datetime, date, timedelta
+from contextlib import nullcontext
+from datetime import date
+from concurrent.futures import ProcessPoolExecutor
+from multiprocessing.context import BaseContext
+from itertools import islice, repeat
+from typing import Callable, Container, Iterable, Iterator
 import logging
 
 # THIS LINE IS NEEDED SO THAT THE GIVEN TESTING CODE CAN RUN FROM THIS DIRECTORY.
@@ -16,7 +22,14 @@ sys.path.append(os.path.dirname(os.path.dirname(__file__)))
 
 # Import required classes
 from bank_account import ChequingAccount, SavingsAccount, InvestmentAccount, BankAccount
-from client.client import Client
+from bank_account.cents_account import CentsChequingAccount, CentsSavingsAccount, CentsInvestmentAccount
+from client.client import Client, UndeliverableEmailError
+from user_interface.balance_offset_index import BalanceOffsetIndex
+from user_interface.transaction_journal import TransactionJournal, replay_journal
+from user_interface.account_listing import AccountListing, LazyAccountListing
+from user_interface.data_snapshot import read_snapshot, write_snapshot, snapshot_is_fresh
+from user_interface.queued_logging import ErrorSummary
+from user_interface.row_schema import ACCOUNTS_SCHEMA, CLIENTS_SCHEMA
 
 # *******************************************************************************
 # GIVEN LOGGING AND FILE ACCESS CODE
@@ -50,107 +63,587 @@ accounts_csv_path = os.path.join(data_dir, 'accounts.csv')
 # END GIVEN LOGGING AND FILE ACCESS CODE
 # *******************************************************************************
 
+# Number of records in each list yielded by the chunked iterators
+DEFAULT_CHUNK_SIZE = 10000
 
-def load_data() -> tuple[dict, dict]:
+# Builds each type of account from converted row values, by account type name
+ACCOUNT_TYPES: dict[str, Callable[..., BankAccount]] = {}
+
+# The first transaction journal; each running copy of the application claims a journal
+# of its own next to it (see TransactionJournal.claim)
+journal_csv_path = os.path.join(data_dir, 'journal.csv')
+
+# Binary snapshot of the parsed CSV files, used while it is newer than both of them
+snapshot_path = os.path.join(data_dir, 'snapshot.bin')
+
+
+def register_account_type(name: str, factory: Callable[..., BankAccount]) -> None:
     """
-    Populates a client dictionary and an account dictionary with 
-    corresponding data from files within the data directory.
+    Registers the function that builds accounts of a type named in accounts.csv.
+    Args:
+        name (str): The account type name, e.g. "ChequingAccount".
+        factory (Callable): Called with the account number, client number, balance,
+            creation date, overdraft limit, overdraft rate, minimum balance and
+            management fee; returns the account. iter_accounts_parallel sends it
+            to its worker processes, so it must be a module-level function.
+    """
+    ACCOUNT_TYPES[sys.intern(name)] = factory
+
+
+# The chequing, savings and investment account classes loaded by each money engine:
+#   "float" - balances are kept as floats.
+#   "cents" - balances are kept as integer cents and converted when they are read or written.
+MONEY_ENGINES = {
+    "float": (ChequingAccount, SavingsAccount, InvestmentAccount),
+    "cents": (CentsChequingAccount, CentsSavingsAccount, CentsInvestmentAccount),
+}
+
+# The account classes of the selected money engine
+account_classes = MONEY_ENGINES["float"]
+
+
+def set_money_engine(engine: str) -> None:
+    """
+    Selects the account classes that load_data and build_account create.
+    Args:
+        engine (str): "float" or "cents".
+    """
+    global account_classes
+    if engine not in MONEY_ENGINES:
+        raise ValueError(f"Money engine must be one of {', '.join(MONEY_ENGINES)}.")
+    account_classes = MONEY_ENGINES[engine]
+
+
+def _build_chequing_account(account_number, client_number, balance, date_created,
+                            overdraft_limit, overdraft_rate, minimum_balance, management_fee) -> ChequingAccount:
+    return account_classes[0](account_number, client_number, balance, date_created, overdraft_limit, overdraft_rate)
+
+
+def _build_savings_account(account_number, client_number, balance, date_created,
+                           overdraft_limit, overdraft_rate, minimum_balance, management_fee) -> SavingsAccount:
+    return account_classes[1](account_number, client_number, balance, date_created, minimum_balance, None)
+
+
+def _build_investment_account(account_number, client_number, balance, date_created,
+                              overdraft_limit, overdraft_rate, minimum_balance, management_fee) -> InvestmentAccount:
+    return account_classes[2](account_number, client_number, balance, date_created, management_fee, None)
+
+
+register_account_type("ChequingAccount", _build_chequing_account)
+register_account_type("SavingsAccount", _build_savings_account)
+register_account_type("InvestmentAccount", _build_investment_account)
+
+
+def _create_client(row: dict) -> Client:
+    """
+    Builds a validated Client from a row of clients.csv.
+    Args:
+        row (dict): A row read by csv.DictReader.
     Returns:
-        tuple containing client dictionary and account dictionary.
+        Client: The client described by the row.
+    Raises:
+        ValueError: If the row does not describe a valid client.
     """
-    client_listing = {}
-    accounts = {}
+    return _client_from_values(CLIENTS_SCHEMA.convert_mapping(row))
+
+
+def _client_from_values(values: list) -> Client:
+    """Builds a validated Client from the values of a row converted by CLIENTS_SCHEMA."""
+    client_number, first_name, last_name, email_address = values
+
+    if not first_name or not last_name:
+        raise ValueError("First Name or Last Name cannot be blank")
+
+    return Client(client_number, first_name, last_name, email_address)
 
-    # READ CLIENT DATA
-    try:
-        with open(clients_csv_path, newline='') as csvfile:
-            reader = csv.DictReader(csvfile)
-            for row in reader:
-                try:
-                    client_number = int(row["client_number"])
-                    first_name = row["first_name"]
-                    last_name = row["last_name"]
-                    email_address = row["email_address"]
 
-                    if not first_name or not last_name:
-                        raise ValueError("First Name or Last Name cannot be blank")
+def _create_account(row: dict, log_error: Callable[[str], None] = logging.error) -> BankAccount | None:
+    """
+    Builds a validated bank account from a row of accounts.csv.
+    Args:
+        row (dict): A row read by csv.DictReader.
+        log_error (Callable): Reports an unrecognized account type.
+    Returns:
+        BankAccount: The account described by the row, or None if the
+        account type is not recognized (the error is logged).
+    Raises:
+        ValueError: If a field of the row cannot be converted.
+    """
+    return _account_from_values(ACCOUNTS_SCHEMA.convert_mapping(row), log_error)
 
-                    client = Client(client_number, first_name, last_name, email_address)
-                    client_listing[client_number] = client
 
+def _account_from_values(values: list, log_error: Callable[[str], None] = logging.error) -> BankAccount | None:
+    """Builds a bank account from the values of a row converted by ACCOUNTS_SCHEMA."""
+    (account_number, client_number, balance, date_created, account_type,
+     overdraft_limit, overdraft_rate, minimum_balance, management_fee) = values
+
+    factory = ACCOUNT_TYPES.get(account_type)
+    if factory is None:
+        log_error(f"Invalid account type for account {account_number}: {account_type}")
+        return None
+
+    return factory(account_number, client_number, balance, date_created,
+                   overdraft_limit, overdraft_rate, minimum_balance, management_fee)
+
+
+def build_account(account_type: str, account_number: int, client_number: int, balance: float, date_created: date,
+                  overdraft_limit: float = None, overdraft_rate: float = None, minimum_balance: float = None,
+                  management_fee: float = None, log_error: Callable[[str], None] = logging.error) -> BankAccount | None:
+    """
+    Builds a bank account of the named type from converted field values.
+    Args:
+        account_type (str): A registered account type, e.g. "ChequingAccount".
+        account_number (int): The account number.
+        client_number (int): The client number.
+        balance (float): The balance.
+        date_created (date): The date the account was created.
+        overdraft_limit (float): The overdraft limit of a chequing account.
+        overdraft_rate (float): The overdraft rate of a chequing account.
+        minimum_balance (float): The minimum balance of a savings account.
+        management_fee (float): The management fee of an investment account.
+        log_error (Callable): Reports an unrecognized account type.
+    Returns:
+        BankAccount: The account, or None if the account type is not recognized.
+    Raises:
+        ValueError: If the account rejects one of the values.
+    """
+    return _account_from_values([account_number, client_number, balance, date_created, account_type,
+                                 overdraft_limit, overdraft_rate, minimum_balance, management_fee], log_error)
+
+
+def iter_clients(clients_path: str = None, errors: list[Exception] = None) -> Iterator[Client]:
+    """
+    Yields validated clients from clients.csv one row at a time so that
+    large files can be processed without holding every client in memory.
+    Rows that cannot be turned into a Client are logged and skipped.
+    Args:
+        clients_path (str): Path to the clients file. Defaults to data/clients.csv.
+        errors (list[Exception]): Optional list that receives the exception raised
+            for each skipped row.
+    Yields:
+        Client: Each valid client in file order.
+    """
+    clients_path = clients_path or clients_csv_path
+
+    try:
+        with open(clients_path, newline='') as csvfile:
+            reader = csv.reader(csvfile)
+            convert = CLIENTS_SCHEMA.compile(next(reader, []))
+            for values in reader:
+                if not values:
+                    continue  # csv.DictReader skips blank lines
+                try:
+                    client = _client_from_values(convert(values))
                 except Exception as e:
                     logging.error(f"Unable to create client: {e}")
+                    if errors is not None:
+                        errors.append(e)
+                    continue
+                yield client
 
     except FileNotFoundError:
         logging.error("clients.csv file not found")
 
-    # READ ACCOUNT DATA
+
+def iter_accounts(client_numbers: Container[int] = None, accounts_path: str = None) -> Iterator[BankAccount]:
+    """
+    Yields validated bank accounts from accounts.csv one row at a time so that
+    large files can be processed without holding every account in memory.
+    Rows that cannot be turned into an account are logged and skipped.
+    Args:
+        client_numbers (Container[int]): The valid client numbers. Accounts whose
+            client number is not in this container are logged and skipped.
+            When None, the client number is not checked.
+        accounts_path (str): Path to the accounts file. Defaults to data/accounts.csv.
+    Yields:
+        BankAccount: Each valid account in file order.
+    """
+    accounts_path = accounts_path or accounts_csv_path
+
     try:
-        with open(accounts_csv_path, newline='') as csvfile:
-            reader = csv.DictReader(csvfile)
-            for row in reader:
-                try:
-                    account_number = int(row["account_number"])
-                    client_number = int(row["client_number"])
-                    balance = float(row["balance"])
-                    date_created = datetime.strptime(row["date_created"], "%Y-%m-%d").date()
-                    account_type = row["account_type"]
-
-                    # Optional fields
-                    overdraft_limit = float(row["overdraft_limit"]) if row["overdraft_limit"] != "Null" else None
-                    overdraft_rate = float(row["overdraft_rate"]) if row["overdraft_rate"] != "Null" else None
-                    minimum_balance = float(row["minimum_balance"]) if row["minimum_balance"] != "Null" else None
-                    management_fee = float(row["management_fee"]) if row["management_fee"] != "Null" else None
-
-                    service_charge_strategy = None  # Default or mock strategy
-
-                    if account_type == "ChequingAccount":
-                        account = ChequingAccount(account_number, client_number, balance, date_created, overdraft_limit, overdraft_rate)
-                    elif account_type == "SavingsAccount":
-                        account = SavingsAccount(account_number, client_number, balance, date_created, minimum_balance, service_charge_strategy)
-                    elif account_type == "InvestmentAccount":
-                        account = InvestmentAccount(account_number, client_number, balance, date_created, management_fee, service_charge_strategy)
-                    else:
-                        logging.error(f"Invalid account type for account {account_number}: {account_type}")
-                        continue
-
-                    if client_number in client_listing:
-                        accounts[account_number] = account
-                    else:
-                        logging.error(f"Bank Account: {account_number} contains invalid Client Number: {client_number}")
+        with open(accounts_path, newline='') as csvfile:
+            reader = csv.reader(csvfile)
+            yield from _parse_accounts(reader, next(reader, []), client_numbers)
 
-                except Exception as e:
+    except FileNotFoundError:
+        logging.error("accounts.csv file not found")
+
+
+def iter_accounts_parallel(client_numbers: Container[int] = None, accounts_path: str = None,
+                           workers: int = None, mp_context: BaseContext = None) -> Iterator[BankAccount]:
+    """
+    Yields the same accounts as iter_accounts, in the same order and with the same
+    errors logged, but parses the file in a pool of worker processes. The file is
+    split at line boundaries into one chunk per worker. Files containing quoted
+    fields are parsed serially, since a quoted field may contain a line break.
+    The registered account types and the account classes of the selected money
+    engine are sent to each worker, since a worker that is spawned rather than
+    forked starts from the module's defaults.
+    Args:
+        client_numbers (Container[int]): The valid client numbers, see iter_accounts.
+        accounts_path (str): Path to the accounts file. Defaults to data/accounts.csv.
+        workers (int): Number of worker processes. Defaults to the number of CPUs.
+        mp_context (BaseContext): The multiprocessing context that starts the workers,
+            e.g. multiprocessing.get_context("spawn"). Defaults to the platform's.
+    Yields:
+        BankAccount: Each valid account in file order.
+    """
+    accounts_path = accounts_path or accounts_csv_path
+    workers = workers or os.cpu_count() or 1
+
+    try:
+        chunks = _split_lines(accounts_path, workers)
+    except FileNotFoundError:
+        logging.error("accounts.csv file not found")
+        return
+
+    if client_numbers is not None:
+        client_numbers = frozenset(client_numbers)
+
+    with ProcessPoolExecutor(max_workers=workers, mp_context=mp_context, initializer=_init_account_worker,
+                             initargs=(dict(ACCOUNT_TYPES), account_classes)) as executor:
+        results = list(executor.map(_parse_account_chunk, repeat(accounts_path), chunks, repeat(client_numbers)))
+
+    if any(result is None for result in results):
+        yield from iter_accounts(client_numbers, accounts_path)
+        return
+
+    for accounts, errors in results:
+        for message in errors:
+            logging.error(message)
+        yield from accounts
+
+
+def load_accounts_lazy(client_numbers: Container[int] = None, accounts_path: str = None) -> LazyAccountListing:
+    """
+    Reads accounts.csv into a LazyAccountListing, which keeps each row as compact text
+    and only builds the account object when it is first accessed. The account number,
+    client number and account type are checked here, with the same errors logged as
+    by iter_accounts; the other fields are converted when the account is built.
+    Args:
+        client_numbers (Container[int]): The valid client numbers, see iter_accounts.
+        accounts_path (str): Path to the accounts file. Defaults to data/accounts.csv.
+    Returns:
+        LazyAccountListing: The accounts by account number.
+    """
+    accounts_path = accounts_path or accounts_csv_path
+
+    try:
+        with open(accounts_path, newline='') as csvfile:
+            reader = csv.reader(csvfile)
+            fieldnames = next(reader, [])
+            account_column = fieldnames.index("account_number")
+            client_column = fieldnames.index("client_number")
+            type_column = fieldnames.index("account_type")
+            accounts = LazyAccountListing(fieldnames, _create_account)
+
+            for values in reader:
+                if not values:
+                    continue
+                try:
+                    account_number = int(values[account_column])
+                    client_number = int(values[client_column])
+                except (IndexError, ValueError) as e:
                     logging.error(f"Unable to create bank account: {e}")
+                    continue
+
+                if values[type_column] not in ACCOUNT_TYPES:
+                    logging.error(f"Invalid account type for account {account_number}: {values[type_column]}")
+                    continue
+
+                if client_numbers is not None and client_number not in client_numbers:
+                    logging.error(f"Bank Account: {account_number} contains invalid Client Number: {client_number}")
+                    continue
+
+                accounts.add_row(account_number, client_number, values)
 
     except FileNotFoundError:
         logging.error("accounts.csv file not found")
+        return LazyAccountListing(["account_number", "client_number"], _create_account)
+
+    return accounts
+
+
+def _parse_accounts(rows: Iterable[list[str]], fieldnames: list[str], client_numbers: Container[int] = None,
+                    log_error: Callable[[str], None] = logging.error) -> Iterator[BankAccount]:
+    """
+    Turns rows of accounts.csv, as read by csv.reader, into validated accounts,
+    reporting rejected rows to log_error.
+    """
+    convert = ACCOUNTS_SCHEMA.compile(fieldnames)
+    for values in rows:
+        if not values:
+            continue  # csv.DictReader skips blank lines
+        try:
+            account = _account_from_values(convert(values), log_error)
+            if account is None:
+                continue
+
+            if client_numbers is not None and account.client_number not in client_numbers:
+                log_error(f"Bank Account: {account.account_number} contains invalid Client Number: {account.client_number}")
+                continue
+
+        except Exception as e:
+            log_error(f"Unable to create bank account: {e}")
+            continue
+        yield account
+
+
+def _split_lines(path: str, parts: int) -> list[tuple[list[str], int, int]]:
+    """
+    Splits a CSV file after its header into at most parts byte ranges that start and
+    end on line boundaries.
+    Returns:
+        list of (field names, start offset, end offset) tuples.
+    """
+    with open(path, newline='') as file:
+        fieldnames = next(csv.reader(file), [])
+
+    with open(path, 'rb') as file:
+        file.readline()
+        start = file.tell()
+        size = os.fstat(file.fileno()).st_size
+
+        boundaries = [start]
+        for part in range(1, parts):
+            file.seek(max(start + (size - start) * part // parts, boundaries[-1]))
+            if file.tell() > start:
+                file.readline()
+            boundaries.append(min(file.tell(), size))
+        boundaries.append(size)
+
+    return [(fieldnames, begin, end) for begin, end in zip(boundaries, boundaries[1:]) if end > begin]
+
+
+def _init_account_worker(account_types: dict[str, Callable[..., BankAccount]],
+                         classes: tuple[type, type, type]) -> None:
+    """Gives a worker process the account types and money engine of the process that started it."""
+    global account_classes
+    ACCOUNT_TYPES.clear()
+    for name, factory in account_types.items():
+        register_account_type(name, factory)
+    account_classes = classes
+
+
+def _parse_account_chunk(path: str, chunk: tuple[list[str], int, int],
+                         client_numbers: Container[int] = None) -> tuple[list[BankAccount], list[str]] | None:
+    """
+    Parses the accounts in one byte range of accounts.csv in a worker process.
+    Returns:
+        tuple containing the accounts and the error messages in file order, or None
+        if the range contains a quoted field and has to be parsed serially.
+    """
+    fieldnames, start, end = chunk
+    with open(path, 'rb') as file:
+        file.seek(start)
+        data = file.read(end - start)
+
+    if b'"' in data:
+        return None
+
+    errors = []
+    # Decode the same way as open() does in iter_accounts
+    rows = csv.reader(io.TextIOWrapper(io.BytesIO(data), newline=''))
+    return list(_parse_accounts(rows, fieldnames, client_numbers, errors.append)), errors
+
+
+def iter_clients_chunked(chunk_size: int = DEFAULT_CHUNK_SIZE, clients_path: str = None) -> Iterator[list[Client]]:
+    """
+    Yields lists of at most chunk_size validated clients from clients.csv.
+    Args:
+        chunk_size (int): The maximum number of clients per list.
+        clients_path (str): Path to the clients file. Defaults to data/clients.csv.
+    Yields:
+        list[Client]: The next chunk of clients in file order.
+    """
+    return _chunked(iter_clients(clients_path), chunk_size)
+
+
+def iter_accounts_chunked(chunk_size: int = DEFAULT_CHUNK_SIZE, client_numbers: Container[int] = None,
+                          accounts_path: str = None) -> Iterator[list[BankAccount]]:
+    """
+    Yields lists of at most chunk_size validated accounts from accounts.csv.
+    Args:
+        chunk_size (int): The maximum number of accounts per list.
+        client_numbers (Container[int]): The valid client numbers, see iter_accounts.
+        accounts_path (str): Path to the accounts file. Defaults to data/accounts.csv.
+    Yields:
+        list[BankAccount]: The next chunk of accounts in file order.
+    """
+    return _chunked(iter_accounts(client_numbers, accounts_path), chunk_size)
+
+
+def _chunked(items: Iterator, chunk_size: int) -> Iterator[list]:
+    """Groups the items of an iterator into lists of at most chunk_size items."""
+    if chunk_size < 1:
+        raise ValueError("Chunk size must be at least 1.")
+    while True:
+        chunk = list(islice(items, chunk_size))
+        if not chunk:
+            return
+        yield chunk
 
+
+def load_data(journal_path: str = None, use_snapshot: bool = True, workers: int = 1,
+              lazy: bool = False, summarize_errors: bool = True) -> tuple[dict, AccountListing | LazyAccountListing]:
+    """
+    Populates a client dictionary and an account dictionary with 
+    corresponding data from files within the data directory.
+    When the binary snapshot is newer than both CSV files it is read instead
+    of the CSV files; otherwise the CSV files are parsed and the snapshot is
+    rewritten, unless a client was rejected by the email deliverability check:
+    that check depends on DNS, and a snapshot would keep the rejection after the
+    lookups work again. Balances recorded in the transaction journal since the last
+    compaction are applied on top.
+    Args:
+        journal_path (str): Optional path to the journal claimed by this process, see
+            TransactionJournal.claim. Other processes' journals are never replayed.
+        use_snapshot (bool): Whether to read and write the binary snapshot.
+        workers (int): Number of processes that parse accounts.csv. With more
+            than one, the file is parsed by iter_accounts_parallel.
+        lazy (bool): Whether to return the accounts as a LazyAccountListing, which
+            builds each account on first access. The snapshot is not used in this mode.
+        summarize_errors (bool): Whether to log one summary of the rejected rows at the
+            end of the load instead of one error per row.
+    Returns:
+        tuple containing client dictionary and account dictionary. The account
+        dictionary is an AccountListing, which also indexes accounts by client.
+    """
+    with ErrorSummary("load_data") if summarize_errors else nullcontext():
+        return _load_data(journal_path, use_snapshot, workers, lazy)
+
+
+def _load_data(journal_path: str, use_snapshot: bool, workers: int,
+               lazy: bool) -> tuple[dict, AccountListing | LazyAccountListing]:
+    """Loads the data as described by load_data."""
+    if lazy:
+        client_listing = {client.client_number: client for client in iter_clients()}
+        accounts = load_accounts_lazy(client_listing)
+        _replay_journal(accounts, journal_path)
+        return client_listing, accounts
+
+    loaded = None
+    if use_snapshot and snapshot_is_fresh(snapshot_path, (clients_csv_path, accounts_csv_path)):
+        loaded = read_snapshot(snapshot_path, account_classes)
+
+    if loaded is not None:
+        client_listing, accounts = loaded[0], AccountListing(loaded[1])
+    else:
+        errors = []
+        client_listing = {client.client_number: client for client in iter_clients(errors=errors)}
+        if workers > 1:
+            account_iterator = iter_accounts_parallel(client_listing.keys(), workers=workers)
+        else:
+            account_iterator = iter_accounts(client_listing)
+        accounts = AccountListing((account.account_number, account) for account in account_iterator)
+        if use_snapshot and not any(isinstance(error, UndeliverableEmailError) for error in errors):
+            try:
+                write_snapshot(snapshot_path, client_listing.values(), accounts.values())
+            except OSError as e:
+                logging.error(f"Unable to write snapshot: {e}")
+
+    _replay_journal(accounts, journal_path)
     return client_listing, accounts
 
 
-def update_data(updated_account: ChequingAccount | SavingsAccount | InvestmentAccount) -> None:
+def _replay_journal(accounts: AccountListing | LazyAccountListing, journal_path: str = None) -> None:
+    """
+    Applies the balances recorded in the transaction journal to the loaded accounts,
+    except those journaled before accounts.csv was last written.
+    """
+    if journal_path is None:
+        return
+    for account_number, balance in replay_journal(journal_path, accounts_csv_path).items():
+        try:
+            accounts[account_number]._balance = balance
+        except KeyError:
+            continue
+
+
+def update_data(updated_account: ChequingAccount | SavingsAccount | InvestmentAccount,
+                offset_index: BalanceOffsetIndex = None, accounts_path: str = None) -> None:
     """
     Updates the accounts.csv file with the balance of the updated BankAccount.
+    When an offset index is given, the balance is written in place and the file is
+    only rewritten if the layout does not allow it.
     Args:
         updated_account (BankAccount): A bank account containing an updated balance.
+        offset_index (BalanceOffsetIndex): Optional index of the balance fields in the file.
+        accounts_path (str): Path to the accounts file. Defaults to data/accounts.csv.
     """
+    update_accounts([updated_account], offset_index, accounts_path)
+
+
+def update_accounts(updated_accounts: Iterable[BankAccount], offset_index: BalanceOffsetIndex = None,
+                    accounts_path: str = None) -> None:
+    """
+    Updates the accounts.csv file with the balances of several BankAccounts in one pass.
+    When an offset index is given, each balance is written in place and the file is
+    rewritten once for the balances that the layout does not allow to be written in place.
+    Args:
+        updated_accounts (Iterable[BankAccount]): Bank accounts containing updated balances.
+        offset_index (BalanceOffsetIndex): Optional index of the balance fields in the file.
+        accounts_path (str): Path to the accounts file. Defaults to data/accounts.csv.
+    """
+    write_balances({account.account_number: account.balance for account in updated_accounts},
+                   offset_index, accounts_path)
+
+
+def compact_journal(journal: TransactionJournal, offset_index: BalanceOffsetIndex = None,
+                    accounts_path: str = None) -> int:
+    """
+    Folds the balances recorded in a transaction journal into the accounts.csv file
+    and empties the journal. If the process stops part way through, the journal is
+    still intact and replaying it gives the same balances.
+    Args:
+        journal (TransactionJournal): The journal to compact.
+        offset_index (BalanceOffsetIndex): Optional index of the balance fields in the file.
+        accounts_path (str): Path to the accounts file. Defaults to data/accounts.csv.
+    Returns:
+        int: The number of account balances written.
+    """
+    accounts_path = accounts_path or accounts_csv_path
+    return journal.compact(lambda balances: write_balances(balances, offset_index, accounts_path), accounts_path)
+
+
+def write_balances(balances: dict[int, float], offset_index: BalanceOffsetIndex = None,
+                   accounts_path: str = None) -> None:
+    """
+    Writes balances by account number to the accounts.csv file, in place where the
+    offset index allows it and otherwise in a single rewrite of the file.
+    """
+    if offset_index is not None:
+        balances = {account_number: balance for account_number, balance in balances.items()
+                    if not offset_index.write_balance(account_number, balance)}
+
+    if not balances:
+        return
+
+    accounts_path = accounts_path or accounts_csv_path
     updated_rows = []
 
-    with open(accounts_csv_path, mode='r', newline='') as file:
+    with open(accounts_path, mode='r', newline='') as file:
         reader = csv.DictReader(file)
         fields = reader.fieldnames
 
         for row in reader:
             account_number = int(row['account_number'])
-            if account_number == updated_account.account_number:
-                row['balance'] = updated_account.balance
+            if account_number in balances:
+                if offset_index is not None:
+                    # Keep the field fixed-width so the next update can be written in place
+                    row['balance'] = offset_index.format_balance(balances[account_number])
+                else:
+                    row['balance'] = balances[account_number]
             updated_rows.append(row)
 
-    with open(accounts_csv_path, mode='w', newline='') as file:
+    with open(accounts_path, mode='w', newline='') as file:
         writer = csv.DictWriter(file, fieldnames=fields)
         writer.writeheader()
         writer.writerows(updated_rows)
 
+    if offset_index is not None:
+        offset_index.build()
+
 
 # GIVEN TESTING SECTION:
 if __name__ == "__main__":
@@ -160,7 +653,6 @@ if __name__ == "__main__":
     for client in clients.values():
         print(client)
         print(f"{client.client_number} Accounts\n=============")
-        for account in accounts.values():
-            if account.client_number == client.client_number:
-                print(f"{account}\n")
+        for account in accounts.for_client(client.client_number):
+            print(f"{account}\n")
         print("=========================================")
@@ -0,0 +1,141 @@
+"""
+Description: Moves log file writes off the calling thread through a queue, and condenses
+the errors logged during a data load into a single summary.
+Author: Sukhtab Singh Warya
+Date: 18/10/2026
+"""
+
+import atexit
+import logging
+import queue
+import re
+import threading
+from logging.handlers import QueueHandler, QueueListener
+
+# Quoted text and numbers vary between otherwise identical errors
+_VARIABLE_PARTS = re.compile(r"'[^']*'|\"[^\"]*\"|-?\d+(?:\.\d+)?")
+
+# Running listeners by the logger whose handlers they took over
+_listeners: dict[logging.Logger, QueueListener] = {}
+
+
+def start_queue_logging(logger: logging.Logger = None) -> QueueListener:
+    """
+    Replaces the handlers of a logger with a QueueHandler and hands the original
+    handlers to a QueueListener, which writes records on a background thread. Calling
+    code only pays for putting a record on the queue. The listener is stopped, and the
+    queue drained, when the interpreter exits.
+    Args:
+        logger (logging.Logger): The logger to change. Defaults to the root logger.
+    Returns:
+        QueueListener: The running listener.
+    """
+    logger = logger or logging.getLogger()
+    if logger in _listeners:
+        return _listeners[logger]
+
+    handlers = list(logger.handlers)
+    log_queue = queue.SimpleQueue()
+    for handler in handlers:
+        logger.removeHandler(handler)
+    logger.addHandler(QueueHandler(log_queue))
+
+    listener = QueueListener(log_queue, *handlers, respect_handler_level=True)
+    listener.start()
+    if not _listeners:
+        atexit.register(_stop_all)
+    _listeners[logger] = listener
+    return listener
+
+
+def stop_queue_logging(logger: logging.Logger = None) -> None:
+    """
+    Writes every queued record, stops the background listener and gives the logger
+    its original handlers back.
+    Args:
+        logger (logging.Logger): The logger passed to start_queue_logging. Defaults to the root logger.
+    """
+    logger = logger or logging.getLogger()
+    listener = _listeners.pop(logger, None)
+    if listener is None:
+        return
+
+    listener.stop()
+    for handler in list(logger.handlers):
+        if isinstance(handler, QueueHandler) and handler.queue is listener.queue:
+            logger.removeHandler(handler)
+    for handler in listener.handlers:
+        logger.addHandler(handler)
+    if not _listeners:
+        atexit.unregister(_stop_all)
+
+
+def _stop_all() -> None:
+    """Stops every listener so that no queued record is lost at exit."""
+    for logger in list(_listeners):
+        stop_queue_logging(logger)
+
+
+class ErrorSummary(logging.Filter):
+    """
+    A context manager that, while active, holds back the errors the current thread logs
+    to a logger and counts them by kind instead. Errors of the same kind differ only in
+    quoted text and numbers; the first few of each kind are kept as examples. When the
+    context exits, one error summarizing every kind is logged, so a file with thousands
+    of bad rows costs one log write.
+
+        with ErrorSummary("load_data") as summary:
+            ...
+        summary.total, summary.counts
+    """
+
+    def __init__(self, name: str, logger: logging.Logger = None, max_samples: int = 3):
+        """
+        Initializes the summary.
+        Args:
+            name (str): Names the operation in the summary message.
+            logger (logging.Logger): The logger whose errors are summarized. Defaults to the root logger.
+            max_samples (int): Number of example messages kept for each kind of error.
+        """
+        super().__init__()
+        self._operation = name
+        self._logger = logger or logging.getLogger()
+        self._max_samples = max_samples
+        self._thread = None
+        self.counts: dict[str, int] = {}
+        self.samples: dict[str, list[str]] = {}
+
+    @property
+    def total(self) -> int:
+        """Return the number of errors held back."""
+        return sum(self.counts.values())
+
+    def filter(self, record: logging.LogRecord) -> bool:
+        if record.levelno != logging.ERROR or record.thread != self._thread:
+            return True
+
+        message = record.getMessage()
+        kind = _VARIABLE_PARTS.sub("...", message)
+        count = self.counts.get(kind, 0)
+        self.counts[kind] = count + 1
+        if count < self._max_samples:
+            self.samples.setdefault(kind, []).append(message)
+        return False
+
+    def summary(self) -> str:
+        """Return the summary message, with the most frequent kinds of error first."""
+        lines = [f"{self._operation}: {self.total} errors"]
+        for kind, count in sorted(self.counts.items(), key=lambda item: -item[1]):
+            lines.append(f"  {count} x {kind}")
+            lines.extend(f"      e.g. {sample}" for sample in self.samples[kind])
+        return "\n".join(lines)
+
+    def __enter__(self) -> "ErrorSummary":
+        self._thread = threading.get_ident()
+        self._logger.addFilter(self)
+        return self
+
+    def __exit__(self, exc_type, exc_value, traceback) -> None:
+        self._logger.removeFilter(self)
+        if self.counts:
+            self._logger.error(self.summary())
@@ -0,0 +1,136 @@
+"""
+Description: Declares the columns of clients.csv and accounts.csv and compiles them into
+positional converters, so that each row is converted without building a dictionary.
+Author: Sukhtab Singh Warya
+Date: 18/10/2026
+"""
+
+import sys
+from datetime import date, datetime
+from functools import lru_cache
+from typing import Callable, Mapping, NamedTuple, Sequence
+
+# Text stored in accounts.csv for a missing optional value
+NULL = "Null"
+
+
+def text(value: str | None) -> str | None:
+    """Returns a text value unchanged; the converter for plain text fields."""
+    return value
+
+
+class Field(NamedTuple):
+    """A column of a data file and the converter applied to its text."""
+    name: str
+    converter: Callable = text
+
+
+class RowSchema:
+    """
+    An ordered list of fields. compile() maps the fields onto the columns named in a
+    file's header and returns a function that converts a row, given as the list
+    produced by csv.reader, into a list of values in field order.
+
+    Conversion follows csv.DictReader semantics, so that the same errors are raised:
+    fields missing from a short row are converted from None, a field missing from the
+    header raises KeyError with the field's name, extra columns are ignored, and fields
+    are converted in order so the first bad field is the one reported.
+    """
+
+    def __init__(self, fields: Sequence[Field]):
+        """
+        Initializes the schema.
+        Args:
+            fields (Sequence[Field]): The fields in the order they are converted.
+        """
+        self.fields = tuple(fields)
+        self.names = tuple(field.name for field in self.fields)
+
+    def compile(self, fieldnames: Sequence[str]) -> Callable[[list[str]], list]:
+        """
+        Builds the converter for rows of a file with the given header.
+        Args:
+            fieldnames (Sequence[str]): The column names from the file's header.
+        Returns:
+            Callable: Converts a row of text values into a list of field values.
+        """
+        # As with csv.DictReader, the last column of a repeated name wins
+        positions = {name: i for i, name in enumerate(fieldnames)}
+        width = len(fieldnames)
+        columns = [(positions[field.name], field.converter) if field.name in positions
+                   else (width, _missing_field(field.name)) for field in self.fields]
+        padding = [None] * (width + 1)
+
+        def convert(values: list[str]) -> list:
+            if len(values) <= width:
+                values = values + padding[:width + 1 - len(values)]
+            return [converter(values[i]) for i, converter in columns]
+
+        return convert
+
+    def convert_mapping(self, row: Mapping[str, str]) -> list:
+        """
+        Converts a row read by csv.DictReader into a list of field values.
+        Args:
+            row (Mapping[str, str]): The row.
+        Returns:
+            list: The field values in field order.
+        """
+        return [field.converter(row[field.name]) for field in self.fields]
+
+
+def nullable(converter: Callable) -> Callable:
+    """Returns a converter that maps the text Null to None and applies converter otherwise."""
+    def convert(value: str):
+        return None if value == NULL else converter(value)
+    return convert
+
+
+@lru_cache(maxsize=65536)
+def parse_iso_date(text: str) -> date:
+    """
+    Converts text in the form YYYY-MM-DD to a date, exactly as
+    datetime.strptime(text, "%Y-%m-%d").date() does. Zero-padded ISO dates are
+    converted directly; anything else, including invalid dates, goes through strptime
+    so that the same values are accepted and the same errors raised. Dates repeat a
+    lot in a data file, so results are cached.
+    """
+    if (isinstance(text, str) and len(text) == 10 and text[4] == "-" and text[7] == "-"
+            and text.isascii() and text[:4].isdigit() and text[5:7].isdigit() and text[8:].isdigit()):
+        try:
+            return date(int(text[:4]), int(text[5:7]), int(text[8:]))
+        except ValueError:
+            pass
+    return datetime.strptime(text, "%Y-%m-%d").date()
+
+
+def intern_text(text: str) -> str:
+    """Returns the interned copy of a repeated value such as an account type name."""
+    return sys.intern(text) if isinstance(text, str) else text
+
+
+def _missing_field(name: str) -> Callable:
+    """Returns a converter that fails as a csv.DictReader row does for a column missing from the header."""
+    def convert(_):
+        raise KeyError(name)
+    return convert
+
+
+CLIENTS_SCHEMA = RowSchema((
+    Field("client_number", int),
+    Field("first_name"),
+    Field("last_name"),
+    Field("email_address"),
+))
+
+ACCOUNTS_SCHEMA = RowSchema((
+    Field("account_number", int),
+    Field("client_number", int),
+    Field("balance", float),
+    Field("date_created", parse_iso_date),
+    Field("account_type", intern_text),
+    Field("overdraft_limit", nullable(float)),
+    Field("overdraft_rate", nullable(float)),
+    Field("minimum_balance", nullable(float)),
+    Field("management_fee", nullable(float)),
+))
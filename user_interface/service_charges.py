@@ -0,0 +1,127 @@
+"""
+Description: Calculates the month-end service charges of a whole book of accounts with a
+few batch calls, one for each group of accounts that share a charging rule.
+Author: Sukhtab Singh Warya
+Date: 18/10/2026
+"""
+
+from collections.abc import Mapping
+from datetime import date
+from typing import Iterable
+from bank_account import BankAccount, ChequingAccount, SavingsAccount, InvestmentAccount
+from patterns.strategy.service_charge_strategy import OverdraftStrategy
+from user_interface.account_store import AccountStore
+from user_interface.data_snapshot import ACCOUNT_TYPE_CODES
+
+try:
+    import numpy
+except ImportError:
+    numpy = None
+
+# Ordinal of the first day of datetime64[D]
+_EPOCH_ORDINAL = date(1970, 1, 1).toordinal()
+
+
+def portfolio_service_charges(accounts: Iterable[BankAccount]) -> dict[int, float]:
+    """
+    Calculates the service charge of every account. Accounts are grouped by the rule
+    their get_service_charges method applies (chequing accounts by overdraft strategy,
+    savings accounts by minimum balance, investment accounts by management fee) and
+    each group is charged with one get_service_charges_batch call. Accounts of any
+    other kind are charged one at a time. An AccountStore is charged straight from
+    its columns when it keeps them in NumPy arrays.
+    Args:
+        accounts (Iterable[BankAccount]): The accounts, or a mapping of them such as an
+            AccountListing or AccountStore.
+    Returns:
+        dict[int, float]: The service charge of each account, by account number.
+    """
+    if isinstance(accounts, AccountStore) and accounts.uses_numpy:
+        return _store_service_charges(accounts)
+    if isinstance(accounts, Mapping):
+        accounts = accounts.values()
+
+    charges: dict[int, float] = {}
+    groups: dict[tuple, list[BankAccount]] = {}
+    rules: dict[type, type | None] = {}
+    for account in accounts:
+        account_type = type(account)
+        rule = rules.get(account_type, False)
+        if rule is False:
+            rule = rules[account_type] = _charging_rule(account_type)
+
+        if rule is ChequingAccount:
+            strategy = account.service_charge_strategy
+            key = (rule, strategy.overdraft_limit, strategy.base_service_charge) \
+                if type(strategy) is OverdraftStrategy else None
+        elif rule is SavingsAccount:
+            key = (rule, account.minimum_balance, None)
+        elif rule is InvestmentAccount:
+            key = (rule, account.management_fee, None)
+        else:
+            key = None
+
+        if key is None:
+            charge_account = getattr(account, "get_service_charges", account.calculate_service_charges)
+            charges[account.account_number] = charge_account()
+        else:
+            groups.setdefault(key, []).append(account)
+
+    for (account_class, parameter, _), group in groups.items():
+        if account_class is InvestmentAccount:
+            dates_created = _dates([account.date_created for account in group])
+            group_charges = InvestmentAccount.get_service_charges_batch(dates_created, parameter)
+        elif account_class is ChequingAccount:
+            strategy = group[0].service_charge_strategy
+            group_charges = strategy.calculate_service_charges_batch([account.balance for account in group])
+        else:
+            group_charges = SavingsAccount.get_service_charges_batch([account.balance for account in group], parameter)
+        charges.update(zip([account.account_number for account in group], _to_list(group_charges)))
+    return charges
+
+
+def _charging_rule(account_type: type) -> type | None:
+    """
+    Returns the account class whose get_service_charges an account type inherits
+    unchanged, or None if a batch call cannot reproduce its charges.
+    """
+    charge_account = getattr(account_type, "get_service_charges", None)
+    for account_class in (ChequingAccount, SavingsAccount, InvestmentAccount):
+        if charge_account is account_class.get_service_charges:
+            return account_class
+    return None
+
+
+def _store_service_charges(store: AccountStore) -> dict[int, float]:
+    """Charges an AccountStore with one batch call for each account type and combination of terms."""
+    type_codes = store.column("type_code")
+    term_ids = store.column("terms")
+    balances = numpy.round(store.column("balance"), 2)
+    dates_created = (store.column("date_created") - _EPOCH_ORDINAL).astype("datetime64[D]")
+    charges = numpy.empty(len(store))
+
+    groups, group_of_row = numpy.unique(type_codes.astype("q") * len(store._terms) + term_ids, return_inverse=True)
+    for group, key in enumerate(groups.tolist()):
+        rows = group_of_row == group
+        type_code, term_id = divmod(key, len(store._terms))
+        overdraft_limit, _, minimum_balance, management_fee = store._terms[term_id]
+        if type_code == ACCOUNT_TYPE_CODES[ChequingAccount]:
+            charges[rows] = ChequingAccount.get_service_charges_batch(balances[rows], overdraft_limit)
+        elif type_code == ACCOUNT_TYPE_CODES[SavingsAccount]:
+            charges[rows] = SavingsAccount.get_service_charges_batch(balances[rows], minimum_balance)
+        else:
+            charges[rows] = InvestmentAccount.get_service_charges_batch(dates_created[rows], management_fee)
+    return dict(zip(store.column("account_number").tolist(), charges.tolist()))
+
+
+def _dates(dates: list[date]):
+    """Returns dates as a datetime64 array, converted through ordinals, which NumPy does much faster."""
+    if numpy is None:
+        return dates
+    ordinals = numpy.fromiter(map(date.toordinal, dates), dtype="q", count=len(dates))
+    return (ordinals - _EPOCH_ORDINAL).astype("datetime64[D]")
+
+
+def _to_list(charges) -> list[float]:
+    """Returns batch results as a list of floats."""
+    return charges.tolist() if hasattr(charges, "tolist") else list(charges)
@@ -0,0 +1,361 @@
+"""
+Description: Defines the TransactionJournal class, an append-only record of the deposits
+and withdrawals applied to bank accounts, used to recover balances after a crash.
+Author: Sukhtab Singh Warya
+Date: 18/10/2026
+"""
+
+import glob
+import logging
+import os
+import threading
+from typing import Callable, Mapping
+from datetime import datetime
+from bank_account.bank_account import BankAccount
+
+try:
+    import fcntl
+except ImportError:
+    fcntl = None
+    import msvcrt
+
+# Byte locked to claim a journal on Windows, far past any data so that reads are not blocked
+_CLAIM_OFFSET = 0x7FFFFFFF
+
+
+class JournalInUseError(Exception):
+    """Raised when a journal file is already claimed by another journal or process."""
+    pass
+
+
+class TransactionJournal:
+    """
+    Appends one line per transaction to a journal file. Each line holds the account
+    number, the kind of transaction, the amount, the resulting balance and a timestamp:
+
+        20001,withdraw,300.0,15000.0,2024-11-18T10:15:00.123
+
+    Because every line records the resulting balance, replaying the journal is
+    idempotent: the last line for an account is its current balance. Lines are written
+    sequentially through a file that stays open and handed to the operating system as
+    they are appended, so a crash of the application loses none of them. fsync is
+    called once every fsync_every appends, which bounds what a power failure can lose
+    without paying for a disk sync on every transaction. Once compaction_threshold
+    lines have been appended, needs_compaction becomes True so that the owner can fold
+    the journal into accounts.csv.
+
+    The journal records the accounts it is attached to as BankAccount.transaction_journal,
+    which is every account in the process. A journal file belongs to one process: it is
+    locked while the journal is open, so that no other process appends to it, replays
+    it or compacts it. Use claim() to give each running copy of the application a
+    journal of its own.
+    """
+
+    def __init__(self, journal_path: str, fsync_every: int = 32, compaction_threshold: int = 1000):
+        """
+        Initializes the journal and opens and locks the journal file for appending.
+        Args:
+            journal_path (str): Path to the journal file.
+            fsync_every (int): Number of appends between calls to fsync. 0 leaves
+                syncing to the operating system.
+            compaction_threshold (int): Number of appended lines after which
+                needs_compaction becomes True.
+        Raises:
+            JournalInUseError: If the journal file is claimed by another journal.
+        """
+        if fsync_every < 0:
+            raise ValueError("fsync interval must not be negative.")
+        if compaction_threshold < 1:
+            raise ValueError("Compaction threshold must be at least 1.")
+
+        self._journal_path = journal_path
+        self._fsync_every = fsync_every
+        self._compaction_threshold = compaction_threshold
+        self._lock = threading.RLock()
+        self._unsynced = 0
+        while True:
+            self._file = open(journal_path, "a", newline="")
+            if not _try_claim(self._file):
+                self._file.close()
+                raise JournalInUseError(f"{journal_path} is claimed by another journal.")
+            if _is_current(self._file, journal_path):
+                break
+            # The file was adopted and removed by another process while this one opened it
+            _release(self._file)
+            self._file.close()
+        _discard_partial_line(journal_path)
+        self._length = sum(1 for _ in read_journal(journal_path))
+
+    @classmethod
+    def claim(cls, journal_path: str, **options) -> "TransactionJournal":
+        """
+        Opens the first journal that no other process has claimed: journal_path itself,
+        or journal_path numbered 1, 2 and so on (journal.1.csv, journal.2.csv, ...). The
+        lines of numbered journals left behind by processes that stopped are moved into
+        the claimed journal, so that replaying it recovers them as well.
+        Args:
+            journal_path (str): Path to the first journal, e.g. data/journal.csv.
+            options: The other arguments of TransactionJournal.
+        Returns:
+            TransactionJournal: The journal claimed by this process.
+        """
+        root, extension = os.path.splitext(journal_path)
+        number = 0
+        while True:
+            path = f"{root}.{number}{extension}" if number else journal_path
+            try:
+                journal = cls(path, **options)
+                break
+            except JournalInUseError:
+                number += 1
+
+        for path in _numbered_journals(journal_path):
+            if path != journal.journal_path:
+                journal._adopt(path)
+        return journal
+
+    @property
+    def journal_path(self) -> str:
+        """Return the path to the journal file."""
+        return self._journal_path
+
+    @property
+    def needs_compaction(self) -> bool:
+        """Return True once the journal holds compaction_threshold lines or more."""
+        return self._length >= self._compaction_threshold
+
+    def append(self, account_number: int, amount: float, balance: float) -> None:
+        """
+        Records a transaction.
+        Args:
+            account_number (int): The account the transaction was applied to.
+            amount (float): The signed amount; positive for a deposit, negative for a withdrawal.
+            balance (float): The balance of the account after the transaction.
+        """
+        kind = "deposit" if amount >= 0 else "withdraw"
+        timestamp = datetime.now().isoformat(timespec="milliseconds")
+        line = f"{account_number},{kind},{abs(amount)!r},{balance!r},{timestamp}\n"
+
+        with self._lock:
+            self._file.write(line)
+            self._file.flush()
+            self._length += 1
+            self._unsynced += 1
+            if self._fsync_every and self._unsynced >= self._fsync_every:
+                self._sync()
+
+    def sync(self) -> None:
+        """Forces every appended line to disk."""
+        with self._lock:
+            self._sync()
+
+    def truncate(self) -> None:
+        """Empties the journal once its contents have been folded into accounts.csv."""
+        with self._lock:
+            self._file.truncate(0)
+            self._sync()
+            self._length = 0
+
+    def compact(self, write_balances: Callable[[dict[int, float]], None], newer_than: str = None) -> int:
+        """
+        Hands the latest balance of each journaled account to write_balances and then
+        empties the journal. Appends wait until compaction has finished, so no
+        transaction can be lost between reading and truncating the journal.
+        Args:
+            write_balances (Callable): Persists a dictionary of balances by account number.
+            newer_than (str): Optional path to the accounts file; balances journaled
+                before its last write are not written back (see replay_journal).
+        Returns:
+            int: The number of account balances written.
+        """
+        with self._lock:
+            self._sync()
+            balances = replay_journal(self._journal_path, newer_than)
+            if balances:
+                write_balances(balances)
+            self.truncate()
+            return len(balances)
+
+    def compact_accounts(self, accounts: Mapping[int, BankAccount],
+                         save_accounts: Callable[[list[BankAccount]], None], newer_than: str = None) -> int:
+        """
+        Hands the live account object of each journaled account to save_accounts and
+        then empties the journal. Use this instead of compact when the store merges
+        writes from other processes, as VersionedAccountWriter does: a merge updates the
+        account object, while the journal still holds the balance from before it, so
+        writing the journaled balance would undo the other process's change.
+        Args:
+            accounts (Mapping[int, BankAccount]): The loaded accounts by account number.
+            save_accounts (Callable): Persists a list of accounts.
+            newer_than (str): Optional path to the accounts file; accounts journaled
+                only before its last write are not written (see replay_journal).
+        Returns:
+            int: The number of accounts written.
+        """
+        with self._lock:
+            self._sync()
+            journaled = [accounts[account_number] for account_number in replay_journal(self._journal_path, newer_than)
+                         if account_number in accounts]
+            if journaled:
+                save_accounts(journaled)
+            self.truncate()
+            return len(journaled)
+
+    def close(self) -> None:
+        """Syncs, releases and closes the journal file."""
+        with self._lock:
+            if not self._file.closed:
+                self._sync()
+                _release(self._file)
+                self._file.close()
+
+    def _adopt(self, journal_path: str) -> None:
+        """Appends the lines of a journal no process has claimed and removes that journal."""
+        try:
+            file = open(journal_path, "r+", newline="")
+        except FileNotFoundError:
+            return
+        try:
+            if not _try_claim(file):
+                return  # A running process owns it
+            lines = [line for line in file if line.endswith("\n")]
+            with self._lock:
+                self._file.writelines(lines)
+                self._length += len(lines)
+                self._sync()
+            file.truncate(0)
+            if fcntl is not None:
+                _remove(journal_path)  # Removed while locked, so that no process claims it in between
+            _release(file)
+        finally:
+            file.close()
+        if fcntl is None:
+            _remove(journal_path)  # Windows cannot remove an open file
+
+    def _sync(self) -> None:
+        self._file.flush()
+        os.fsync(self._file.fileno())
+        self._unsynced = 0
+
+
+def _discard_partial_line(journal_path: str) -> None:
+    """Removes a last line that was cut short by a crash so that new lines start cleanly."""
+    try:
+        with open(journal_path, "rb+") as file:
+            contents = file.read()
+            if contents and not contents.endswith(b"\n"):
+                file.truncate(contents.rfind(b"\n") + 1)
+    except FileNotFoundError:
+        return
+
+
+def read_journal(journal_path: str):
+    """
+    Yields the complete lines of a journal file as tuples of
+    (account_number, kind, amount, balance, timestamp).
+    A last line without a line break was cut short by a crash and is ignored.
+    Args:
+        journal_path (str): Path to the journal file.
+    """
+    try:
+        with open(journal_path, newline="") as file:
+            for line in file:
+                if not line.endswith("\n"):
+                    break
+                try:
+                    account_number, kind, amount, balance, timestamp = line.rstrip("\r\n").split(",")
+                    yield int(account_number), kind, float(amount), float(balance), timestamp
+                except ValueError as e:
+                    logging.error(f"Unable to read journal entry: {line.strip()}: {e}")
+    except FileNotFoundError:
+        return
+
+
+def replay_journal(journal_path: str, newer_than: str = None) -> dict[int, float]:
+    """
+    Returns the latest balance of each account recorded in a journal file. Lines adopted
+    from another journal can follow newer lines, so the line with the latest timestamp
+    wins, and the later line of two with the same timestamp.
+
+    When newer_than names the file the balances are applied over, lines recorded before
+    that file was last written are skipped: the file was written after them, e.g. by a
+    billing run, a bulk apply or another process, so it holds the later balance.
+    Timestamps are compared to the millisecond, and a line recorded in the same
+    millisecond as the write is kept.
+    Args:
+        journal_path (str): Path to the journal file.
+        newer_than (str): Optional path to the accounts file, e.g. data/accounts.csv.
+    Returns:
+        dict[int, float]: The balance after the last journaled transaction, by account number.
+    """
+    written = _written_at(newer_than) if newer_than else None
+    latest: dict[int, tuple[int, float]] = {}
+    for account_number, _, _, balance, timestamp in read_journal(journal_path):
+        try:
+            recorded = round(datetime.fromisoformat(timestamp).timestamp() * 1000)
+        except ValueError as e:
+            logging.error(f"Unable to read journal entry timestamp for account {account_number}: {e}")
+            continue
+        if written is not None and recorded < written:
+            continue
+        if account_number not in latest or recorded >= latest[account_number][0]:
+            latest[account_number] = (recorded, balance)
+    return {account_number: balance for account_number, (_, balance) in latest.items()}
+
+
+def _written_at(path: str) -> int | None:
+    """Returns the time a file was last modified in whole milliseconds since the epoch, or None if it is missing."""
+    try:
+        return os.stat(path).st_mtime_ns // 1_000_000
+    except FileNotFoundError:
+        return None
+
+
+def _numbered_journals(journal_path: str) -> list[str]:
+    """Returns the numbered journals next to journal_path, e.g. journal.1.csv."""
+    root, extension = os.path.splitext(journal_path)
+    return sorted(path for path in glob.glob(f"{glob.escape(root)}.*{extension}")
+                  if path[len(root) + 1:len(path) - len(extension)].isdigit())
+
+
+def _try_claim(file) -> bool:
+    """Takes an exclusive lock on an open journal file without waiting. Returns False if it is held elsewhere."""
+    try:
+        if fcntl is not None:
+            # flock locks belong to the open file, so closing another handle on the file keeps them
+            fcntl.flock(file.fileno(), fcntl.LOCK_EX | fcntl.LOCK_NB)
+        else:
+            os.lseek(file.fileno(), _CLAIM_OFFSET, os.SEEK_SET)
+            msvcrt.locking(file.fileno(), msvcrt.LK_NBLCK, 1)
+    except OSError:
+        return False
+    finally:
+        if fcntl is None:
+            os.lseek(file.fileno(), 0, os.SEEK_SET)
+    return True
+
+
+def _release(file) -> None:
+    """Releases the lock taken by _try_claim."""
+    if fcntl is not None:
+        fcntl.flock(file.fileno(), fcntl.LOCK_UN)
+    else:
+        os.lseek(file.fileno(), _CLAIM_OFFSET, os.SEEK_SET)
+        msvcrt.locking(file.fileno(), msvcrt.LK_UNLCK, 1)
+
+
+def _is_current(file, path: str) -> bool:
+    """Returns True if path still names the open file."""
+    try:
+        named, opened = os.stat(path), os.fstat(file.fileno())
+    except FileNotFoundError:
+        return False
+    return (named.st_dev, named.st_ino) == (opened.st_dev, opened.st_ino)
+
+
+def _remove(journal_path: str) -> None:
+    """Removes an adopted journal, logging a failure."""
+    try:
+        os.remove(journal_path)
+    except OSError as e:
+        logging.error(f"Unable to remove adopted journal {journal_path}: {e}")
@@ -0,0 +1,342 @@
+"""
+Description: Writes bank account balances to accounts.csv safely from several processes at
+once, using advisory byte-range locks and a version number on every row.
+Author: Sukhtab Singh Warya
+Date: 18/10/2026
+"""
+
+import csv
+import os
+import threading
+from contextlib import contextmanager
+from typing import BinaryIO, Iterable
+from bank_account.bank_account import BankAccount
+from user_interface.balance_offset_index import BALANCE_FIELD_WIDTH
+
+try:
+    import fcntl
+except ImportError:
+    fcntl = None
+    import msvcrt
+
+# Width that version numbers are padded to
+VERSION_FIELD_WIDTH = 10
+
+# Length locked for "the whole file" where the platform cannot lock to the end of file
+_WHOLE_FILE = 0x7FFFFFFF
+
+
+class ConcurrentUpdateError(Exception):
+    """Raised when a balance cannot be written because another process changed the account."""
+    pass
+
+
+class VersionedAccountWriter:
+    """
+    Writes balances to an accounts file that has a fixed-width version column (see
+    prepare_versioned_file). Each write locks only the bytes of the account's row,
+    so processes updating different accounts do not wait for each other, then checks
+    the row's version against the version this writer last saw for the account.
+
+    If the versions match, the balance is written in place and the version is
+    incremented. If another process has written the account in the meantime, the
+    conflict is detected and the write is retried on top of the other process's
+    result: the change this writer made since it last saw the account is applied to
+    the balance now in the file. With merge_conflicts=False, a ConcurrentUpdateError
+    is raised instead.
+
+    A balance too wide for its field is written by rewriting the file under a lock on
+    the whole file. The rewrite goes through the locked file rather than a new file,
+    so the other processes' locks stay valid; they notice the new layout when the row
+    they locked no longer holds their account, and look the row up again.
+
+    Every writer to the file must go through this class: writes made by
+    manage_data.update_accounts do not change versions.
+    """
+
+    def __init__(self, accounts_path: str, merge_conflicts: bool = True, max_retries: int = 10):
+        """
+        Initializes the writer and records the current version of every account.
+        Args:
+            accounts_path (str): Path to an accounts file with a version column.
+            merge_conflicts (bool): Whether to retry conflicting writes on top of the
+                other process's result instead of raising ConcurrentUpdateError.
+            max_retries (int): Number of times a row that moved is looked up again.
+        """
+        self._accounts_path = accounts_path
+        self._merge_conflicts = merge_conflicts
+        self._max_retries = max_retries
+        self._lock = threading.RLock()
+        self._rows: dict[int, tuple[int, int]] = {}
+        self._known: dict[int, tuple[int, float]] = {}
+        self._conflicts = 0
+
+        with open(self._accounts_path, "rb") as file:
+            self._columns = _columns(file.readline())
+        if "version" not in self._columns:
+            raise ValueError(f"{accounts_path} has no version column.")
+        self._scan()
+
+    @property
+    def conflicts(self) -> int:
+        """Return the number of writes that found the account changed by another process."""
+        return self._conflicts
+
+    def track(self, accounts: Iterable[BankAccount], refresh: bool = False) -> None:
+        """
+        Records the version and balance now in the file for each account, as the
+        starting point for detecting changes made by other processes. Call it with
+        accounts refreshed from the file, e.g. by a DataFileWatcher, so that the
+        refreshed balance is not taken for a change of this writer's.
+        Args:
+            accounts (Iterable[BankAccount]): The accounts to track.
+            refresh (bool): Whether to also set each account's balance to the one in
+                the file. Otherwise a difference is treated as an unsaved change.
+        """
+        accounts = list(accounts)
+        with self._lock, open(self._accounts_path, "r+b", buffering=0) as file:
+            if any(account.account_number not in self._rows for account in accounts):
+                self._scan(file)  # Rows added since the last scan
+            for account in accounts:
+                state = self._with_row(file, account.account_number, lambda balance, version, _: (balance, version))
+                if state is None:
+                    continue
+                balance, version = state
+                self._known[account.account_number] = (version, balance)
+                if refresh:
+                    account._balance = balance
+
+    def save_accounts(self, accounts: Iterable[BankAccount]) -> None:
+        """
+        Persists the balances of several accounts. An account whose write was merged
+        with another process's change is given the merged balance.
+        Args:
+            accounts (Iterable[BankAccount]): Bank accounts containing updated balances.
+        """
+        accounts = list(accounts)
+        written = self.save_balances({account.account_number: account._balance for account in accounts})
+        for account in accounts:
+            if account.account_number in written:
+                account._balance = written[account.account_number]
+
+    def save_balances(self, balances: dict[int, float]) -> dict[int, float]:
+        """
+        Persists balances by account number.
+        Args:
+            balances (dict[int, float]): The new balance of each account.
+        Returns:
+            dict[int, float]: The balance written for each account found in the file,
+            which differs from the given one where a conflicting write was merged.
+        Raises:
+            ConcurrentUpdateError: If merging is disabled and an account was changed by
+                another process, or if a row kept moving for max_retries attempts.
+        """
+        written = {}
+        with self._lock, open(self._accounts_path, "r+b", buffering=0) as file:
+            for account_number, balance in balances.items():
+                if account_number not in self._rows:
+                    continue
+                result = self._with_row(file, account_number, lambda current, version, row:
+                                        self._write_row(file, row, account_number, balance, current, version))
+                if result is None:
+                    result = self._rewrite(file, account_number, balance)
+                if result is not None:
+                    written[account_number] = result
+        return written
+
+    def _with_row(self, file: BinaryIO, account_number: int, action):
+        """
+        Locks the row of an account, checks that it still holds the account and calls
+        action(balance, version, row). Returns the action's result, or None if the
+        account is not in the file or action returned None.
+        """
+        for _ in range(self._max_retries):
+            row = self._rows.get(account_number)
+            if row is None:
+                return None
+
+            start, length = row
+            # Lock the row together with the line break before it; the byte after the row is only
+            # read, so that neighbouring rows do not share a locked byte
+            with _locked(file, start - 1, length + 1):
+                file.seek(start - 1)
+                data = file.read(length + 2)
+                fields = self._parse_row(data, length, account_number)
+                if fields is not None:
+                    return action(*fields, row)
+            self._scan()
+
+        raise ConcurrentUpdateError(f"Account {account_number} kept moving while it was being written.")
+
+    def _parse_row(self, data: bytes, length: int, account_number: int) -> tuple[float, int] | None:
+        """Returns the balance and version of a locked row, or None if it no longer holds the account."""
+        if (data[:1] != b"\n" or b"\n" in data[1:length + 1]
+                or data[length + 1:length + 2] not in (b"\r", b"\n", b"")):
+            return None
+        values = data[1:length + 1].split(b",")
+        try:
+            if int(values[self._columns["account_number"]]) != account_number:
+                return None
+            return float(values[self._columns["balance"]]), int(values[self._columns["version"]])
+        except (IndexError, ValueError):
+            return None
+
+    def _merge(self, account_number: int, balance: float, current_balance: float, version: int) -> float:
+        """Returns the balance to write, applying this writer's change on top of a concurrent one."""
+        known_version, known_balance = self._known.get(account_number, (version, current_balance))
+        if version == known_version:
+            return balance
+
+        self._conflicts += 1
+        if not self._merge_conflicts:
+            raise ConcurrentUpdateError(
+                f"Account {account_number} was changed by another process (version {known_version} -> {version}).")
+        return current_balance + (balance - known_balance)
+
+    def _write_row(self, file: BinaryIO, row: tuple[int, int], account_number: int, balance: float,
+                   current_balance: float, version: int) -> float | None:
+        """Writes a balance and the next version into a locked row. Returns None if they do not fit."""
+        start, length = row
+        file.seek(start)
+        values = file.read(length).split(b",")
+        balance = self._merge(account_number, balance, current_balance, version)
+
+        balance_column, version_column = self._columns["balance"], self._columns["version"]
+        balance_text = f"{balance:.2f}".rjust(len(values[balance_column])).encode()
+        version_text = str(version + 1).rjust(len(values[version_column])).encode()
+        if len(balance_text) > len(values[balance_column]) or len(version_text) > len(values[version_column]):
+            return None
+
+        file.seek(start + sum(len(value) + 1 for value in values[:balance_column]))
+        file.write(balance_text)
+        file.seek(start + sum(len(value) + 1 for value in values[:version_column]))
+        file.write(version_text)
+        self._known[account_number] = (version + 1, balance)
+        return balance
+
+    def _rewrite(self, file: BinaryIO, account_number: int, balance: float) -> float | None:
+        """Writes a balance that does not fit in its field by rewriting the file under a whole-file lock."""
+        with _locked(file, 0, 0):
+            file.seek(0)
+            lines = file.read().splitlines(keepends=True)
+            balance_column, version_column = self._columns["balance"], self._columns["version"]
+            written = None
+
+            for i, line in enumerate(lines[1:], start=1):
+                content = line.rstrip(b"\r\n")
+                values = content.split(b",")
+                try:
+                    if int(values[self._columns["account_number"]]) != account_number:
+                        continue
+                    current_balance, version = float(values[balance_column]), int(values[version_column])
+                except (IndexError, ValueError):
+                    continue
+
+                written = self._merge(account_number, balance, current_balance, version)
+                values[balance_column] = f"{written:.2f}".rjust(BALANCE_FIELD_WIDTH).encode()
+                values[version_column] = str(version + 1).rjust(VERSION_FIELD_WIDTH).encode()
+                lines[i] = b",".join(values) + line[len(content):]
+                self._known[account_number] = (version + 1, written)
+                break
+
+            if written is not None:
+                file.seek(0)
+                file.write(b"".join(lines))
+                file.truncate()
+                self._scan(file)
+            return written
+
+    def _scan(self, file: BinaryIO = None) -> None:
+        """Records the offset and length of every row, and the version of accounts not seen before."""
+        if file is None:
+            with open(self._accounts_path, "rb") as file:
+                return self._scan(file)
+
+        file.seek(0)
+        lines = file.read().splitlines(keepends=True)
+        offset = len(lines[0]) if lines else 0
+        rows = {}
+        for line in lines[1:]:
+            content = line.rstrip(b"\r\n")
+            values = content.split(b",")
+            try:
+                account_number = int(values[self._columns["account_number"]])
+                state = int(values[self._columns["version"]]), float(values[self._columns["balance"]])
+            except (IndexError, ValueError):
+                offset += len(line)
+                continue
+            rows[account_number] = (offset, len(content))
+            self._known.setdefault(account_number, state)
+            offset += len(line)
+        self._rows = rows
+
+
+def prepare_versioned_file(accounts_path: str, width: int = BALANCE_FIELD_WIDTH) -> None:
+    """
+    Rewrites an accounts file once with fixed-width balances and a fixed-width version
+    column, starting at 0, so that VersionedAccountWriter can update rows in place.
+    Args:
+        accounts_path (str): Path to the accounts file.
+        width (int): The width to pad balances to.
+    """
+    with open(accounts_path, mode='r', newline='') as file:
+        reader = csv.DictReader(file)
+        fields = reader.fieldnames
+        rows = list(reader)
+
+    if "version" not in fields:
+        fields = fields + ["version"]
+
+    for row in rows:
+        try:
+            row['balance'] = f"{float(row['balance']):.2f}".rjust(width)
+        except (TypeError, ValueError):
+            pass  # Leave invalid balances for load_data to report
+        row['version'] = str(int(row.get('version') or 0)).rjust(VERSION_FIELD_WIDTH)
+
+    with open(accounts_path, mode='w', newline='') as file:
+        writer = csv.DictWriter(file, fieldnames=fields)
+        writer.writeheader()
+        writer.writerows(rows)
+
+
+def has_version_column(accounts_path: str) -> bool:
+    """Return True if the accounts file has a version column."""
+    try:
+        with open(accounts_path, "rb") as file:
+            return "version" in _columns(file.readline())
+    except FileNotFoundError:
+        return False
+
+
+@contextmanager
+def _locked(file: BinaryIO, offset: int, length: int):
+    """
+    Holds an exclusive advisory lock on a byte range of an open file. A length of 0
+    locks from offset to the end of the file, however far it grows.
+    """
+    if fcntl is not None:
+        fcntl.lockf(file.fileno(), fcntl.LOCK_EX, length, offset, os.SEEK_SET)
+        try:
+            yield
+        finally:
+            fcntl.lockf(file.fileno(), fcntl.LOCK_UN, length, offset, os.SEEK_SET)
+    else:
+        length = length or _WHOLE_FILE
+        file.seek(offset)
+        while True:
+            try:
+                msvcrt.locking(file.fileno(), msvcrt.LK_LOCK, length)
+                break
+            except OSError:
+                continue  # LK_LOCK gives up after 10 seconds; keep waiting
+        try:
+            yield
+        finally:
+            file.seek(offset)
+            msvcrt.locking(file.fileno(), msvcrt.LK_UNLCK, length)
+
+
+def _columns(header: bytes) -> dict[str, int]:
+    """Returns the position of each column named in a header line."""
+    return {name: i for i, name in enumerate(header.rstrip(b"\r\n").decode().split(","))}
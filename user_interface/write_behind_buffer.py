@@ -0,0 +1,138 @@
+"""
+Description: Collects updated bank accounts in memory and persists them together,
+so that many balance updates cost a single write to the accounts file.
+Author: Sukhtab Singh Warya
+Date: 18/10/2026
+"""
+
+import atexit
+import logging
+import threading
+from typing import Callable
+from bank_account.bank_account import BankAccount
+
+
+class WriteBehindBuffer:
+    """
+    A write-behind buffer for bank account balances. Accounts are marked dirty as
+    they change and are persisted in one pass when the number of dirty accounts
+    reaches max_pending, when the oldest dirty account has waited max_delay seconds,
+    when flush() is called and when the buffer is closed. Marking the same account
+    dirty several times before a flush results in a single write of its latest balance.
+    If a write fails, the accounts stay dirty and another write is tried max_delay
+    seconds later; a failed timed write is logged.
+    """
+
+    def __init__(self, persist: Callable[[list[BankAccount]], None], max_pending: int = 100,
+                 max_delay: float | None = 2.0):
+        """
+        Initializes the buffer.
+        Args:
+            persist (Callable): Writes a list of accounts, e.g. manage_data.update_accounts.
+            max_pending (int): Number of dirty accounts that triggers a flush.
+            max_delay (float): Seconds a dirty account may wait before a flush is triggered.
+                When None, only the count threshold, flush() and close() write.
+        """
+        if max_pending < 1:
+            raise ValueError("Maximum pending accounts must be at least 1.")
+        if max_delay is not None and max_delay <= 0:
+            raise ValueError("Maximum delay must be positive.")
+
+        self._persist = persist
+        self._max_pending = max_pending
+        self._max_delay = max_delay
+        self._dirty: dict[int, BankAccount] = {}
+        self._lock = threading.RLock()
+        self._timer: threading.Timer | None = None
+        self._closed = False
+        self._writes = 0
+
+        atexit.register(self.close)
+
+    @property
+    def pending(self) -> int:
+        """Return the number of dirty accounts waiting to be written."""
+        return len(self._dirty)
+
+    def __contains__(self, account_number: int) -> bool:
+        """Return True if the account has a change waiting to be written."""
+        return account_number in self._dirty
+
+    @property
+    def writes(self) -> int:
+        """Return the number of times the buffer has persisted accounts."""
+        return self._writes
+
+    def mark_dirty(self, account: BankAccount) -> None:
+        """
+        Records that an account's balance has changed.
+        Args:
+            account (BankAccount): The changed account. The balance it holds when the
+                buffer is flushed is the one that is written.
+        """
+        with self._lock:
+            if self._closed:
+                raise ValueError("Cannot update accounts through a closed buffer.")
+
+            if not self._dirty:
+                self._start_timer()
+            self._dirty[account.account_number] = account
+
+            if len(self._dirty) >= self._max_pending:
+                self.flush()
+
+    def flush(self) -> int:
+        """
+        Persists every dirty account in a single call to the persist function.
+        Returns:
+            int: The number of accounts written.
+        """
+        with self._lock:
+            self._cancel_timer()
+            if not self._dirty:
+                return 0
+
+            accounts = list(self._dirty.values())
+            try:
+                self._persist(accounts)
+            except Exception:
+                self._start_timer()
+                raise
+            self._dirty.clear()
+            self._writes += 1
+            return len(accounts)
+
+    def close(self) -> None:
+        """
+        Flushes the remaining dirty accounts and stops accepting updates. If the final
+        write fails, the buffer is closed all the same and the error is raised.
+        """
+        with self._lock:
+            if self._closed:
+                return
+            self._closed = True
+            try:
+                self.flush()
+            finally:
+                self._cancel_timer()
+                atexit.unregister(self.close)
+
+    def _start_timer(self) -> None:
+        """Schedules a flush max_delay seconds from now."""
+        if self._max_delay is None:
+            return
+        self._timer = threading.Timer(self._max_delay, self._on_timer)
+        self._timer.daemon = True
+        self._timer.start()
+
+    def _cancel_timer(self) -> None:
+        if self._timer is not None:
+            self._timer.cancel()
+            self._timer = None
+
+    def _on_timer(self) -> None:
+        """Flushes the buffer once the oldest dirty account has waited max_delay seconds."""
+        try:
+            self.flush()
+        except Exception as e:
+            logging.error(f"Unable to write {self.pending} buffered accounts: {e}")
@@ -0,0 +1,212 @@
+"""
+Description: Defines the EmailOutbox class, a long-lived writer for 'simulated' emails
+that keeps observer_emails.txt open and appends buffered messages in batches.
+Author: Sukhtab Singh Warya
+Date: 18/10/2026
+"""
+
+import atexit
+import logging
+import os
+import threading
+from typing import Optional, TextIO
+from utility.file_utils import EMAIL_DIRECTORY, EMAIL_FILENAME, format_email
+
+
+class EmailOutbox:
+    """
+    A buffered writer for 'simulated' emails. Messages are written in one append when
+    max_pending messages are waiting, when the oldest has waited max_delay seconds, when
+    flush() is called and when the outbox is closed. The file is opened on the first
+    write and kept open. When max_bytes is set, a file that would grow past it is
+    rotated to observer_emails.txt.1, .2, ... keeping backup_count old files. Each
+    message is written exactly as simulate_send_email writes it.
+    """
+
+    def __init__(self, path: str = os.path.join(EMAIL_DIRECTORY, EMAIL_FILENAME), max_pending: int = 100,
+                 max_delay: float | None = 1.0, max_bytes: int | None = None, backup_count: int = 5):
+        """
+        Initializes the outbox.
+        Args:
+            path (str): The file messages are appended to. A relative path is resolved
+                against the working directory at the first write.
+            max_pending (int): Number of waiting messages that triggers a write.
+            max_delay (float): Seconds a message may wait before a write is triggered.
+                When None, only the count threshold, flush() and close() write.
+            max_bytes (int): Size the file is rotated at, or None to never rotate.
+            backup_count (int): Number of rotated files kept.
+        """
+        if max_pending < 1:
+            raise ValueError("Maximum pending messages must be at least 1.")
+        if max_delay is not None and max_delay <= 0:
+            raise ValueError("Maximum delay must be positive.")
+        if max_bytes is not None and max_bytes < 1:
+            raise ValueError("Maximum file size must be positive.")
+        if backup_count < 1:
+            raise ValueError("Backup count must be at least 1.")
+
+        self._path = path
+        self._max_pending = max_pending
+        self._max_delay = max_delay
+        self._max_bytes = max_bytes
+        self._backup_count = backup_count
+        self._pending: list[str] = []
+        self._file: Optional[TextIO] = None
+        self._size = 0
+        self._lock = threading.RLock()
+        self._timer: threading.Timer | None = None
+        self._closed = False
+        self._writes = 0
+
+        atexit.register(self.close)
+
+    @property
+    def pending(self) -> int:
+        """Return the number of messages waiting to be written."""
+        return len(self._pending)
+
+    @property
+    def writes(self) -> int:
+        """Return the number of times the outbox has appended to the file."""
+        return self._writes
+
+    def send(self, email_address: str, subject: str, message: str) -> None:
+        """
+        Queues a 'simulated' email for the outbox file.
+        Args:
+            email_address (str): The email address to which the message is sent.
+            subject (str): The subject line for the message.
+            message (str): The message body.
+        """
+        text = format_email(email_address, subject, message)
+        with self._lock:
+            if self._closed:
+                raise ValueError("Cannot send email through a closed outbox.")
+
+            if not self._pending:
+                self._start_timer()
+            self._pending.append(text)
+
+            if len(self._pending) >= self._max_pending:
+                self.flush()
+
+    def flush(self) -> int:
+        """
+        Appends every waiting message to the file. Messages that cannot be written stay
+        waiting for the next flush.
+        Returns:
+            int: The number of messages written.
+        """
+        with self._lock:
+            self._cancel_timer()
+            if not self._pending:
+                return 0
+
+            count = len(self._pending)
+            try:
+                self._write_pending()
+            except OSError:
+                # Try the messages still waiting again after another delay
+                self._start_timer()
+                raise
+            self._writes += 1
+            return count
+
+    def close(self) -> None:
+        """
+        Writes the waiting messages, closes the file and stops accepting messages. If
+        the messages cannot be written, the outbox is closed all the same and the error
+        is raised.
+        """
+        with self._lock:
+            if self._closed:
+                return
+            self._closed = True
+            try:
+                self.flush()
+            finally:
+                self._cancel_timer()
+                if self._file is not None:
+                    self._file.close()
+                    self._file = None
+                atexit.unregister(self.close)
+
+    def _write_pending(self) -> None:
+        """Appends the waiting messages, rotating the file whenever it would exceed max_bytes."""
+        if self._file is None:
+            self._open()
+        batch = []
+        batch_size = 0
+        for text in list(self._pending):
+            size = len(text.encode(self._file.encoding))
+            if self._max_bytes is not None and self._size + batch_size + size > self._max_bytes \
+                    and self._size + batch_size > 0:
+                self._write(batch, batch_size)
+                self._rotate()
+                batch, batch_size = [], 0
+            batch.append(text)
+            batch_size += size
+        self._write(batch, batch_size)
+
+    def _open(self) -> None:
+        """Opens the file for appending, creating its directory if needed."""
+        self._path = os.path.abspath(self._path)
+        os.makedirs(os.path.dirname(self._path), exist_ok=True)
+        self._file = open(self._path, "a")
+        self._size = self._file.tell()
+
+    def _write(self, batch: list[str], batch_size: int) -> None:
+        """Appends a batch of messages in a single write and removes them from the waiting messages."""
+        if batch:
+            self._file.write("".join(batch))
+            self._file.flush()
+            self._size += batch_size
+            del self._pending[:len(batch)]
+
+    def _rotate(self) -> None:
+        """Moves the file to path.1, shifting older files up and removing the oldest."""
+        self._file.close()
+        self._file = None
+        for number in range(self._backup_count - 1, 0, -1):
+            source = f"{self._path}.{number}"
+            if os.path.exists(source):
+                os.replace(source, f"{self._path}.{number + 1}")
+        os.replace(self._path, f"{self._path}.1")
+        self._open()
+
+    def _start_timer(self) -> None:
+        """Schedules a flush max_delay seconds from now."""
+        if self._max_delay is None:
+            return
+        self._timer = threading.Timer(self._max_delay, self._on_timer)
+        self._timer.daemon = True
+        self._timer.start()
+
+    def _cancel_timer(self) -> None:
+        if self._timer is not None:
+            self._timer.cancel()
+            self._timer = None
+
+    def _on_timer(self) -> None:
+        """Flushes the outbox once the oldest message has waited max_delay seconds."""
+        try:
+            self.flush()
+        except OSError as e:
+            logging.error(f"Unable to write email outbox {self._path}: {e}")
+
+
+_shared_outbox: Optional[EmailOutbox] = None
+_shared_lock = threading.Lock()
+
+
+def shared_outbox() -> EmailOutbox:
+    """
+    Returns the outbox shared by every client, creating it on first use.
+    Returns:
+        EmailOutbox: The outbox for output/observer_emails.txt.
+    """
+    global _shared_outbox
+    with _shared_lock:
+        if _shared_outbox is None:
+            _shared_outbox = EmailOutbox()
+        return _shared_outbox
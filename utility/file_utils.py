@@ -1,5 +1,22 @@
 import os
 
+EMAIL_DIRECTORY = "output"
+EMAIL_FILENAME = "observer_emails.txt"
+
+
+def format_email(email_address, subject, message):
+        """
+        Returns a 'simulated' email message as it is written to the
+        'observer_emails.txt' file.
+        Args:
+            email_address (str):  The email address to which the 'simulated' message is sent.
+            subject (str):  The subject line for the 'simulated' message.
+            message (str): The message body for the 'simulated' message.
+        Returns:
+            str: The message text.
+        """
+        return f"---\nTo: {email_address}\nSubject: {subject}\nMessage: {message}\n---\n"
+
 @staticmethod
 def simulate_send_email(email_address, subject, message):
         """
@@ -11,9 +28,7 @@ def simulate_send_email(email_address, subject, message):
             subject (str):  The subject line for the 'simulated' message.
             message (str): The message body for the 'simulated' message.
         """
-        directory = "output"
-        filename = "observer_emails.txt"
-        path = os.path.join(directory, filename)
-        os.makedirs(directory, exist_ok=True)
+        path = os.path.join(EMAIL_DIRECTORY, EMAIL_FILENAME)
+        os.makedirs(EMAIL_DIRECTORY, exist_ok=True)
         with open(path, "a") as file:
-            file.write(f"---\nTo: {email_address}\nSubject: {subject}\nMessage: {message}\n---\n")
\ No newline at end of file
+            file.write(format_email(email_address, subject, message))
\ No newline at end of file
@@ -0,0 +1,37 @@
+"""
+Description: Converts amounts of money between float dollars and integer cents, for the
+accounts that keep their balances in cents.
+Author: Sukhtab Singh Warya
+Date: 18/10/2026
+"""
+
+from decimal import Decimal, ROUND_HALF_UP
+
+
+def to_cents(dollars: float) -> int:
+    """
+    Converts dollars to the nearest whole number of cents. An amount written with a
+    half cent, such as 1.005, is rounded up in magnitude, as it reads, although the
+    float closest to it lies just below.
+    Args:
+        dollars (float): The amount in dollars.
+    Returns:
+        int: The amount in cents.
+    """
+    scaled = dollars * 100
+    cents = round(scaled)
+    if abs(scaled - cents) > 0.499:
+        return int(Decimal(repr(dollars)).scaleb(2).quantize(Decimal(1), rounding=ROUND_HALF_UP))
+    return cents
+
+
+def from_cents(cents: int) -> float:
+    """
+    Converts cents to dollars. The result is the float closest to the exact amount,
+    the same value round(dollars, 2) gives.
+    Args:
+        cents (int): The amount in cents.
+    Returns:
+        float: The amount in dollars.
+    """
+    return cents / 100